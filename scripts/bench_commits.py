@@ -0,0 +1,117 @@
+# scripts/bench_commits.py
+"""
+API 호출 한 번당 실행되는 DB 커밋 수와 평균 지연을 측정합니다.
+
+실제 WSGI application을 디스크의 임시 SQLite 파일(create_db_engine 프로필)과
+가짜 하이퍼바이저로 구동하며, 커밋 수는 엔진의 'commit' 이벤트로 셉니다.
+create_vm은 요청 처리(BUILDING 기록)만 측정하며 백그라운드 프로비저닝은 제외합니다.
+
+사용법:
+    make bench name=commits
+"""
+import io
+import json
+import os
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from src import app
+from src.database.database import Base, create_db_engine
+from src.database import models
+from src.services.task_manager import TaskManager
+from src.utils.password_hasher import PasswordHasher
+
+CALLS = 200
+
+
+def build_session_factory(workdir):
+    engine = create_db_engine(f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = session_factory()
+    admin, member = models.Role(name="admin"), models.Role(name="member")
+    project = models.Project(name="default")
+    user = models.User(username="admin", password_hash=PasswordHasher(scrypt_n=2 ** 10, workers=0).hash("admin"))
+    db.add_all([admin, member, project, user, models.Image(name="bench-image", filepath="/dev/null", min_disk_gb=1, min_ram_mb=256)])
+    db.commit()
+    db.add(models.UserProjectRole(user_id=user.id, project_id=project.id, role_id=admin.id))
+    db.add_all([models.User(username=f"user-{i}", password_hash="x") for i in range(CALLS)])
+    db.commit()
+    db.close()
+    return engine, session_factory
+
+
+def call(method, path, body=None, token=None):
+    payload = json.dumps(body).encode("utf-8") if body is not None else b""
+    environ = {"REQUEST_METHOD": method, "PATH_INFO": path, "CONTENT_LENGTH": str(len(payload)), "wsgi.input": io.BytesIO(payload)}
+    if token:
+        environ["HTTP_X_AUTH_TOKEN"] = token
+    result = {}
+    response = app.application(environ, lambda status, headers: result.update(status=status))
+    try:
+        body = b"".join(response)
+    finally:
+        if hasattr(response, "close"):
+            response.close()
+    return result["status"], json.loads(body) if body else None
+
+
+def measure(name, commits, requests):
+    commits.clear()
+    start = time.perf_counter()
+    for method, path, body, token in requests:
+        status, data = call(method, path, body, token)
+        assert status.startswith("2"), (status, data)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} commits/call={len(commits) / len(requests):4.2f}  avg latency={elapsed / len(requests) * 1000:6.2f}ms")
+
+
+def main():
+    print(f"calls per API={CALLS}")
+    fake_conn = MagicMock()
+    fake_conn.getAllDomainStats.return_value = []
+    fake_conn.defineXML.return_value.create.return_value = 0
+    task_manager = TaskManager(max_workers=1, max_pending=CALLS * 2)
+
+    with tempfile.TemporaryDirectory(dir=".") as workdir:
+        engine, session_factory = build_session_factory(workdir)
+        commits = []
+        event.listen(engine, "commit", lambda conn: commits.append(1))
+
+        with patch.object(app, "SessionLocal", session_factory), \
+             patch.object(app, "task_manager", task_manager), \
+             patch.object(app, "run_in_background", lambda task, fn: None), \
+             patch("src.utils.libvirt_connection.libvirt.open", return_value=fake_conn), \
+             patch("src.services.image_service.ImageService.create_vm_disk", lambda self, name, path: "/nonexistent"), \
+             patch("src.services.image_service.ImageService.delete_vm_disk_by_name", lambda self, name: None):
+            _, data = call("POST", "/v1/auth/tokens", {"username": "admin", "password": "admin", "project_name": "default"})
+            token = data["token"]
+
+            measure("create_vm", commits, [
+                ("POST", "/v1/vms", {"vm_name": f"vm-{i}", "cpu_count": 1, "ram_mb": 512, "image_name": "bench-image"}, token)
+                for i in range(CALLS)
+            ])
+            measure("assign_role", commits, [
+                ("PUT", f"/v1/projects/1/users/{i + 2}/roles/member", None, token)
+                for i in range(CALLS)
+            ])
+            measure("list_vms", commits, [("GET", "/v1/vms", None, token)] * CALLS)
+            measure("delete_vm", commits, [("DELETE", f"/v1/vms/vm-{i}", None, token) for i in range(CALLS)])
+            measure("batch_create", commits, [
+                ("POST", "/v1/vms:batch", {"vms": [
+                    {"vm_name": f"batch-{i}-{j}", "cpu_count": 1, "ram_mb": 512, "image_name": "bench-image"} for j in range(10)
+                ]}, token)
+                for i in range(CALLS // 10)
+            ])
+            app.libvirt_manager.close()
+        task_manager.shutdown(wait=False)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
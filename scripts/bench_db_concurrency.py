@@ -0,0 +1,106 @@
+# scripts/bench_db_concurrency.py
+"""
+여러 스레드가 동시에 VM을 생성(INSERT)하고 목록을 조회할 때의 처리량과 잠금 오류율을
+엔진 프로필별로 측정합니다.
+
+- legacy: 기존 엔진 (check_same_thread=False만 지정, rollback journal, 기본 풀)
+- tuned:  create_db_engine() 프로필 (WAL, busy_timeout, synchronous=NORMAL, 크기가 정해진 풀)
+
+사용법:
+    make bench name=db_concurrency
+"""
+import itertools
+import os
+import random
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.database.database import Base, create_db_engine
+from src.database import models
+from src.repositories.sqlalchemy.sqlalchemy_vm_repository import SqlalchemyVMRepository
+
+THREADS = 16
+DURATION_SEC = 5
+INSERT_RATIO = 0.3
+LISTED_VMS = 50  # 목록 조회 대상 프로젝트의 VM 수 (생성은 다른 프로젝트에 쌓임)
+
+
+def run(engine):
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = session_factory()
+    listed, churn = models.Project(name="listed"), models.Project(name="churn")
+    db.add_all([listed, churn])
+    db.commit()
+    db.add_all([
+        models.VM(name=f"listed-{i}", uuid=f"listed-uuid-{i}", state="RUNNING", cpu_count=1, ram_mb=512, project_id=listed.id)
+        for i in range(LISTED_VMS)
+    ])
+    db.commit()
+    listed_id, churn_id = listed.id, churn.id
+    db.close()
+
+    counts = {"insert": 0, "list": 0, "locked": 0}
+    latencies = []
+    names = itertools.count()
+    lock = threading.Lock()
+    deadline = time.perf_counter() + DURATION_SEC
+
+    def worker():
+        while time.perf_counter() < deadline:
+            op = "insert" if random.random() < INSERT_RATIO else "list"
+            db = session_factory()
+            start = time.perf_counter()
+            try:
+                repo = SqlalchemyVMRepository(db)
+                if op == "insert":
+                    n = next(names)
+                    repo.create(models.VM(name=f"vm-{n}", uuid=f"uuid-{n}", state="RUNNING",
+                                          cpu_count=1, ram_mb=512, project_id=churn_id))
+                else:
+                    repo.list_by_project_id(listed_id)
+                outcome = op
+            except OperationalError as e:
+                if "locked" not in str(e):
+                    raise
+                db.rollback()
+                outcome = "locked"
+            finally:
+                db.close()
+            with lock:
+                counts[outcome] += 1
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    engine.dispose()
+
+    total = sum(counts.values())
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else 0.0
+    return total, counts, p99
+
+
+def main():
+    print(f"threads={THREADS}, duration={DURATION_SEC}s, insert ratio={INSERT_RATIO}, listed VMs={LISTED_VMS}")
+    profiles = {
+        "legacy": lambda url: create_engine(url, connect_args={"check_same_thread": False}),
+        "tuned": lambda url: create_db_engine(url),
+    }
+    for name, make_engine in profiles.items():
+        with tempfile.TemporaryDirectory(dir=".") as workdir:
+            total, counts, p99 = run(make_engine(f"sqlite:///{os.path.join(workdir, 'bench.db')}"))
+        print(f"[{name:<6}] {total / DURATION_SEC:8.1f} ops/s  inserts={counts['insert']:<6} lists={counts['list']:<6} "
+              f"locked={counts['locked']} ({counts['locked'] / max(total, 1):.1%})  p99={p99 * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
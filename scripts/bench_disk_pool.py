@@ -0,0 +1,91 @@
+# scripts/bench_disk_pool.py
+"""
+VM 디스크 생성 지연 시간을 웜 풀 사용 전후로 비교합니다.
+
+임시 디렉터리에 기반 이미지를 만들고, ImageService.create_vm_disk를 연속으로 호출합니다.
+- 풀 없음: 호출마다 qemu-img create 프로세스를 실행합니다.
+- 풀 사용: 백그라운드 스레드가 미리 만든 오버레이를 rename으로 옮깁니다. 풀이 비면 직접 만들며,
+  이 경우도 지연 시간에 포함됩니다. (요청 간격을 두어 풀이 다시 채워질 시간을 줍니다)
+qemu-img가 설치되어 있지 않으면 같은 크기의 프로세스 실행 비용을 내는 'true' 명령으로 대신합니다.
+(실제 서버는 sudo까지 거치므로 풀 없는 경우의 비용은 이보다 큽니다)
+
+사용법:
+    make bench name=disk_pool
+"""
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+from src.services.image_service import ImageService
+from src.utils.disk_pool import OverlayPool, PoolTarget
+
+VMS = 50
+REQUEST_INTERVAL_SEC = 0.05
+QEMU_IMG = shutil.which("qemu-img")
+
+
+def create_overlay(base_path, overlay_path):
+    if QEMU_IMG:
+        subprocess.run([QEMU_IMG, "create", "-q", "-f", "qcow2", "-F", "qcow2", "-b", base_path, overlay_path],
+                       check=True, capture_output=True)
+    else:
+        subprocess.run(["true"], check=True)
+        open(overlay_path, "wb").close()
+
+
+def build_base_image(path):
+    if QEMU_IMG:
+        subprocess.run([QEMU_IMG, "create", "-q", "-f", "qcow2", path, "1G"], check=True, capture_output=True)
+    else:
+        with open(path, "wb") as f:
+            f.write(b"\0" * 1024)
+
+
+def measure(service, base_path, label):
+    durations = []
+    for i in range(VMS):
+        started = time.perf_counter()
+        service.create_vm_disk(f"bench-{label}-{i}", base_path)
+        durations.append((time.perf_counter() - started) * 1000)
+        time.sleep(REQUEST_INTERVAL_SEC)
+    durations.sort()
+    return statistics.median(durations), durations[int(len(durations) * 0.95) - 1]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        base_path = os.path.join(workdir, "base.qcow2")
+        build_base_image(base_path)
+
+        # 풀 없이 매번 qemu-img 실행 (ImageService가 sudo 없이 같은 함수를 호출하도록 교체)
+        import src.services.image_service as image_service_module
+        image_service_module.create_overlay_disk = create_overlay
+        plain = ImageService(MagicMock())
+        plain.image_base_dir = workdir
+        p50_plain, p95_plain = measure(plain, base_path, "plain")
+
+        pool = OverlayPool(os.path.join(workdir, "pool"), create_overlay=create_overlay, delete_file=os.remove,
+                           move_file=os.rename, make_dir=lambda path: os.makedirs(path, exist_ok=True),
+                           check_interval=1.0)
+        pool.start({base_path: PoolTarget(high=8, low=4)})
+        while pool.ready_counts()[base_path] < 8:
+            time.sleep(0.01)
+        hits = []
+        take = pool.take
+        pool.take = lambda base, target: hits.append(take(base, target)) or hits[-1]
+        pooled = ImageService(MagicMock(), disk_pool=pool)
+        pooled.image_base_dir = workdir
+        p50_pool, p95_pool = measure(pooled, base_path, "pool")
+        pool.stop()
+
+        print(f"VM disks created:          {VMS} per run ({'qemu-img' if QEMU_IMG else 'fork of true'})")
+        print(f"create_vm_disk (no pool):  p50 {p50_plain:8.3f} ms   p95 {p95_plain:8.3f} ms")
+        print(f"create_vm_disk (pool):     p50 {p50_pool:8.3f} ms   p95 {p95_pool:8.3f} ms   hits {sum(hits)}/{VMS}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# scripts/bench_libvirt_connections.py
+"""
+요청 1,000건당 열리는 libvirt 연결 수를 측정합니다.
+
+인메모리 SQLite와 가짜 libvirt.open을 사용해 WSGI application을 직접 호출하며,
+토큰 발급(POST /v1/auth/tokens)과 VM 목록 조회(GET /v1/vms)를 번갈아 보냅니다.
+기존 구조는 요청마다 ComputeService가 libvirt.open을 호출했으므로
+요청 수와 같은 수의 연결이 열렸습니다.
+
+사용법:
+    make bench name=libvirt_connections
+"""
+import hashlib
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src import app
+from src.database.database import Base
+from src.database import models
+
+REQUESTS = 1_000
+
+
+def build_session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = session_factory()
+    role = models.Role(name="admin")
+    project = models.Project(name="default")
+    user = models.User(username="admin", password_hash=hashlib.sha256(b"admin").hexdigest())
+    db.add_all([role, project, user])
+    db.commit()
+    db.add(models.UserProjectRole(user_id=user.id, project_id=project.id, role_id=role.id))
+    db.add(models.VM(name="bench-vm", uuid="bench-uuid", state="RUNNING", cpu_count=1, ram_mb=1024, project_id=project.id))
+    db.commit()
+    db.close()
+    return session_factory
+
+
+def call(method, path, body=None, token=None):
+    payload = json.dumps(body).encode("utf-8") if body is not None else b""
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "CONTENT_LENGTH": str(len(payload)),
+        "wsgi.input": io.BytesIO(payload),
+    }
+    if token:
+        environ["HTTP_X_AUTH_TOKEN"] = token
+    result = {}
+    body = b"".join(app.application(environ, lambda status, headers: result.update(status=status)))
+    return result["status"], json.loads(body) if body else None
+
+
+def main():
+    fake_conn = MagicMock()
+    fake_conn.getAllDomainStats.return_value = []
+
+    with patch.object(app, "SessionLocal", build_session_factory()), \
+         patch("src.utils.libvirt_connection.libvirt.open", return_value=fake_conn) as mock_open:
+        credentials = {"username": "admin", "password": "admin", "project_name": "default"}
+        token = None
+        for i in range(REQUESTS):
+            if i % 2 == 0:
+                _, data = call("POST", "/v1/auth/tokens", credentials)
+                token = data["token"]
+            else:
+                call("GET", "/v1/vms", token=token)
+
+        print(f"requests sent:            {REQUESTS}")
+        print(f"libvirt.open (before):    {REQUESTS} (one per request)")
+        print(f"libvirt.open (after):     {mock_open.call_count}")
+        app.libvirt_manager.close()
+
+
+if __name__ == "__main__":
+    main()
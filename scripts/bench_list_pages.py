@@ -0,0 +1,81 @@
+# scripts/bench_list_pages.py
+"""
+VM이 많은 프로젝트에서 목록 조회 비용을 전체 조회와 키셋 페이지 조회로 비교합니다.
+
+- full:       list_by_project_id() 로 프로젝트의 모든 VM을 ORM 객체로 조회 (기존 GET /v1/vms)
+- first page: list_page_by_project_id() 첫 페이지
+- deep page:  목록 끝부분의 마커에서 시작하는 페이지 (OFFSET 방식이면 앞의 행을 모두 건너뛰어야 함)
+- projection: 같은 첫 페이지를 name 컬럼만 조회
+
+사용법:
+    make bench name=list_pages
+"""
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from src.database import models
+from src.database.database import create_db_engine
+from src.database.migrations import upgrade
+from src.repositories.sqlalchemy.sqlalchemy_vm_repository import SqlalchemyVMRepository
+
+PROJECT_VMS = 50_000
+OTHER_VMS = 50_000  # 다른 프로젝트의 VM (인덱스가 없으면 함께 스캔됨)
+PAGE_SIZE = 100
+REPEAT = 20
+COLUMNS = ["name", "uuid", "cpu_count", "ram_mb", "created_at"]
+
+
+def seed(session_factory):
+    db = session_factory()
+    db.add_all([models.Project(id=1, name="big"), models.Project(id=2, name="other")])
+    start = datetime(2024, 1, 1)
+    db.add_all(
+        models.VM(name=f"vm-{i}", uuid=f"uuid-{i}", state="RUNNING", cpu_count=1, ram_mb=512,
+                  project_id=1 if i < PROJECT_VMS else 2, created_at=start + timedelta(seconds=i))
+        for i in range(PROJECT_VMS + OTHER_VMS)
+    )
+    db.commit()
+    db.close()
+
+
+def measure(session_factory, fn):
+    elapsed = []
+    for _ in range(REPEAT):
+        db = session_factory()
+        try:
+            begin = time.perf_counter()
+            rows = fn(SqlalchemyVMRepository(db))
+            elapsed.append(time.perf_counter() - begin)
+        finally:
+            db.close()
+    return sorted(elapsed)[len(elapsed) // 2] * 1000, len(rows)
+
+
+def main():
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmp:
+        engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        upgrade(engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        seed(session_factory)
+        deep_marker = f"uuid-{PAGE_SIZE * 3}"  # 최신순이므로 목록의 거의 끝
+
+        cases = [
+            ("full", lambda repo: repo.list_by_project_id(1)),
+            ("first page", lambda repo: repo.list_page_by_project_id(1, PAGE_SIZE + 1, COLUMNS)),
+            ("deep page", lambda repo: repo.list_page_by_project_id(1, PAGE_SIZE + 1, COLUMNS, marker=deep_marker)),
+            ("projection", lambda repo: repo.list_page_by_project_id(1, PAGE_SIZE + 1, ["name"])),
+        ]
+        print(f"project VMs: {PROJECT_VMS}, other VMs: {OTHER_VMS}, page size: {PAGE_SIZE}")
+        print(f"{'case':>12} | {'median ms':>10} {'rows':>7}")
+        for name, fn in cases:
+            ms, rows = measure(session_factory, fn)
+            print(f"{name:>12} | {ms:>10.2f} {rows:>7}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# scripts/bench_list_vms.py
+"""
+list_vms의 하이퍼바이저 상태 조회 비용을 측정하는 벤치마크입니다.
+
+가짜 libvirt 연결(도메인 10,000개)을 사용하며, 하이퍼바이저 왕복(RPC) 한 번마다
+고정 지연을 부여하여 실제 원격 호출 비용을 흉내 냅니다.
+프로젝트의 VM 수(N)를 늘려가며 기존 방식(VM별 lookup + info)과
+스냅샷 방식(getAllDomainStats 한 번), 도메인 상태 캐시(백그라운드에서 동기화된 메모리 맵)의
+지연 시간과 왕복 횟수를 비교합니다. 캐시를 사용하면 요청 경로에는 하이퍼바이저 왕복이 없습니다.
+
+사용법:
+    make bench name=list_vms
+"""
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import libvirt
+
+from src.services.compute_service import ComputeService
+from src.utils.domain_state_cache import DomainStateCache
+
+TOTAL_DOMAINS = 10_000
+PROJECT_SIZES = [10, 100, 1_000, 10_000]
+RPC_LATENCY_SEC = 0.0002  # 하이퍼바이저 왕복 1회당 지연 (200µs)
+
+
+class FakeDomain:
+    def __init__(self, conn, uuid_str):
+        self._conn = conn
+        self._uuid = uuid_str
+
+    def UUIDString(self):
+        return self._uuid
+
+    def name(self):
+        return f"domain-{self._uuid}"
+
+    def info(self):
+        self._conn.rpc()
+        return [libvirt.VIR_DOMAIN_RUNNING, 2048, 2048, 1, 0]
+
+
+class FakeConnection:
+    """도메인 목록을 메모리에 들고 RPC 횟수를 세는 가짜 libvirt 연결."""
+    def __init__(self, domain_count):
+        self.rpc_count = 0
+        self.domains = {}
+        for _ in range(domain_count):
+            domain_uuid = str(uuid.uuid4())
+            self.domains[domain_uuid] = FakeDomain(self, domain_uuid)
+
+    def rpc(self):
+        self.rpc_count += 1
+        time.sleep(RPC_LATENCY_SEC)
+
+    def lookupByUUIDString(self, uuid_str):
+        self.rpc()
+        return self.domains[uuid_str]
+
+    def getAllDomainStats(self, stats, flags=0):
+        self.rpc()
+        return [(domain, {"state.state": libvirt.VIR_DOMAIN_RUNNING}) for domain in self.domains.values()]
+
+    def close(self):
+        return 0
+
+
+class FakeVMRepository:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def list_by_project_id(self, project_id):
+        return self.rows
+
+    def list_page_by_project_id(self, project_id, limit, columns, **filters):
+        return [{column: getattr(row, column) for column in columns} for row in self.rows[:limit]]
+
+
+def legacy_list_vms(service, project_id):
+    """리팩토링 이전의 VM별 조회 방식 (비교 기준)."""
+    result = []
+    for vm in service.vm_repo.list_by_project_id(project_id):
+        domain = service.conn.lookupByUUIDString(vm.uuid)
+        state_code, _, _, _, _ = domain.info()
+        result.append({"name": vm.name, "uuid": vm.uuid, "state": service._map_vm_state(state_code)})
+    return result
+
+
+def measure(fn, conn):
+    conn.rpc_count = 0
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000, conn.rpc_count
+
+
+def main():
+    conn = FakeConnection(TOTAL_DOMAINS)
+    domain_uuids = list(conn.domains)
+
+    print(f"hypervisor domains: {TOTAL_DOMAINS}, simulated RPC latency: {RPC_LATENCY_SEC * 1e6:.0f}us")
+    print(f"{'project VMs':>12} | {'legacy ms':>10} {'legacy rpc':>10} | {'snapshot ms':>11} {'snapshot rpc':>12} "
+          f"| {'cached ms':>9} {'cached rpc':>10}")
+
+    conn_manager = SimpleNamespace(get=lambda: conn)
+    state_cache = DomainStateCache(conn_manager)
+    state_cache.resync()  # 서버에서는 백그라운드 스레드가 수행
+
+    for size in PROJECT_SIZES:
+        rows = [
+            SimpleNamespace(name=f"vm-{i}", uuid=domain_uuids[i], cpu_count=1, ram_mb=1024, created_at=datetime.now())
+            for i in range(size)
+        ]
+        service = ComputeService(FakeVMRepository(rows), image_service=None, conn_manager=conn_manager)
+        cached = ComputeService(FakeVMRepository(rows), image_service=None, conn_manager=conn_manager,
+                                state_cache=state_cache)
+
+        legacy_ms, legacy_rpc = measure(lambda: legacy_list_vms(service, 1), conn)
+        snapshot_ms, snapshot_rpc = measure(lambda: list(service.list_vms(1, limit=size)), conn)
+        cached_ms, cached_rpc = measure(lambda: list(cached.list_vms(1, limit=size)), conn)
+        print(f"{size:>12} | {legacy_ms:>10.1f} {legacy_rpc:>10} | {snapshot_ms:>11.1f} {snapshot_rpc:>12} "
+              f"| {cached_ms:>9.1f} {cached_rpc:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# scripts/bench_password_hashing.py
+"""
+CI처럼 같은 자격 증명으로 토큰 요청이 몰릴 때의 비밀번호 검증 비용을 측정합니다.
+
+- 구버전: 솔트 없는 SHA-256 한 번
+- KDF: 설정된 scrypt 작업 계수로 매번 검증
+- KDF + 캐시: 검증 성공 캐시를 켠 경우 (최초 1회만 KDF 실행)
+
+사용법:
+    make bench name=password_hashing
+"""
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src import config
+from src.utils.password_hasher import PasswordHasher
+
+REQUESTS = 200
+CLIENTS = 16
+
+
+def bench(name, verify):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CLIENTS) as clients:
+        assert all(clients.map(lambda _: verify(), range(REQUESTS)))
+    elapsed = time.perf_counter() - start
+    print(f"[{name:<12}] {REQUESTS / elapsed:10,.1f} logins/s  ({elapsed / REQUESTS * 1000:7.2f} ms/login)")
+
+
+def main():
+    print(f"requests={REQUESTS}, clients={CLIENTS}, scrypt n={config.PASSWORD_SCRYPT_N}, "
+          f"workers={config.PASSWORD_HASH_WORKERS}")
+    legacy = hashlib.sha256(b"admin").hexdigest()
+    bench("sha256", lambda: hashlib.sha256(b"admin").hexdigest() == legacy)
+
+    for name, cache_ttl in (("kdf", 0.0), ("kdf + cache", 30.0)):
+        hasher = PasswordHasher(scrypt_n=config.PASSWORD_SCRYPT_N, workers=config.PASSWORD_HASH_WORKERS, cache_ttl=cache_ttl)
+        stored = hasher.hash("admin")
+        bench(name, lambda: hasher.verify("admin", stored))
+        hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
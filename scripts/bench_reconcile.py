@@ -0,0 +1,130 @@
+# scripts/bench_reconcile.py
+"""
+정합성 검사의 하이퍼바이저 왕복 횟수와 소요 시간을 기존 방식과 비교합니다.
+
+- legacy:    listAllDomains 후 유령 VM마다 lookupByUUIDString + info() (기존 reconcile_vms, 유령 VM만 검사)
+- reconcile: getAllDomainStats 한 번으로 받은 도메인 객체로 양방향 + 상태 불일치 검사 (ReconcileService)
+
+하이퍼바이저 왕복(RPC) 한 번마다 고정 지연을 부여하며, DB는 임시 SQLite 파일을 사용합니다.
+
+사용법:
+    make bench name=reconcile
+"""
+import os
+import tempfile
+import time
+
+import libvirt
+from sqlalchemy.orm import sessionmaker
+
+from src.database import models
+from src.database.database import create_db_engine
+from src.database.migrations import upgrade
+from src.database.unit_of_work import UnitOfWork
+from src.repositories.sqlalchemy.sqlalchemy_drift_repository import SqlalchemyVMDriftRepository
+from src.repositories.sqlalchemy.sqlalchemy_vm_repository import SqlalchemyVMRepository
+from src.services.reconcile_service import ReconcileService
+from src.utils.domain_state_cache import domain_state_name
+
+DB_VMS = 10_000
+GHOST_COUNTS = [10, 100, 1_000]
+RPC_LATENCY_SEC = 0.0002  # 하이퍼바이저 왕복 1회당 지연 (200µs)
+
+
+class FakeDomain:
+    def __init__(self, conn, name, uuid):
+        self._conn = conn
+        self._name = name
+        self._uuid = uuid
+
+    def name(self):
+        return self._name
+
+    def UUIDString(self):
+        return self._uuid
+
+    def info(self):
+        self._conn.rpc()
+        return [libvirt.VIR_DOMAIN_RUNNING, 1024, 1024, 1, 0]
+
+
+class FakeConnection:
+    def __init__(self, domains):
+        self.rpc_count = 0
+        self.domains = {domain_uuid: FakeDomain(self, name, domain_uuid) for name, domain_uuid in domains}
+
+    def rpc(self):
+        self.rpc_count += 1
+        time.sleep(RPC_LATENCY_SEC)
+
+    def listAllDomains(self, flags=0):
+        self.rpc()
+        return list(self.domains.values())
+
+    def lookupByUUIDString(self, uuid):
+        self.rpc()
+        return self.domains[uuid]
+
+    def getAllDomainStats(self, stats, flags=0):
+        self.rpc()
+        return [(domain, {"state.state": libvirt.VIR_DOMAIN_RUNNING}) for domain in self.domains.values()]
+
+
+class FakeConnManager:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def get(self):
+        return self.conn
+
+
+def legacy_reconcile(vm_repo, conn):
+    """기존 reconcile_vms (비교 기준)."""
+    libvirt_uuids = {domain.UUIDString() for domain in conn.listAllDomains(0)}
+    ghosts = []
+    for vm_uuid in libvirt_uuids - set(vm_repo.list_all_uuids()):
+        domain = conn.lookupByUUIDString(vm_uuid)
+        ghosts.append({"name": domain.name(), "uuid": vm_uuid, "state": domain_state_name(domain.info()[0])})
+    return ghosts
+
+
+def main():
+    print(f"DB VMs: {DB_VMS}, simulated RPC latency: {RPC_LATENCY_SEC * 1e6:.0f}us")
+    print(f"{'ghosts':>7} | {'legacy ms':>10} {'legacy rpc':>10} | {'reconcile ms':>12} {'reconcile rpc':>13}")
+    for ghosts in GHOST_COUNTS:
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmp:
+            engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            upgrade(engine)
+            with engine.begin() as db:
+                db.execute(models.Project.__table__.insert(), [{"id": 1, "name": "bench"}])
+                db.execute(models.VM.__table__.insert(), [
+                    {"name": f"vm-{i}", "uuid": f"uuid-{i}", "state": "RUNNING", "cpu_count": 1, "ram_mb": 512,
+                     "project_id": 1}
+                    for i in range(DB_VMS)
+                ])
+            session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            conn = FakeConnection([(f"vm-{i}", f"uuid-{i}") for i in range(DB_VMS)] +
+                                  [(f"ghost-{i}", f"ghost-uuid-{i}") for i in range(ghosts)])
+
+            with UnitOfWork(session_factory) as unit_of_work:
+                conn.rpc_count = 0
+                begin = time.perf_counter()
+                legacy_reconcile(SqlalchemyVMRepository(unit_of_work.session), conn)
+                legacy_ms, legacy_rpc = (time.perf_counter() - begin) * 1000, conn.rpc_count
+
+            with UnitOfWork(session_factory) as unit_of_work:
+                service = ReconcileService(
+                    SqlalchemyVMRepository(unit_of_work.session), SqlalchemyVMDriftRepository(unit_of_work.session),
+                    FakeConnManager(conn), unit_of_work,
+                )
+                conn.rpc_count = 0
+                begin = time.perf_counter()
+                service.reconcile()
+                reconcile_ms, reconcile_rpc = (time.perf_counter() - begin) * 1000, conn.rpc_count
+
+            print(f"{ghosts:>7} | {legacy_ms:>10.1f} {legacy_rpc:>10} | {reconcile_ms:>12.1f} {reconcile_rpc:>13}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
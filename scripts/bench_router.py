@@ -0,0 +1,83 @@
+# scripts/bench_router.py
+"""
+라우트 디스패치 비용(ns/op)을 16개 라우트 각각에 대해 측정합니다.
+
+기존 방식(요청마다 라우트 목록을 만들고 re.match로 순차 검사)과
+Router(모듈 로드 시 컴파일, 메서드/고정 세그먼트 인덱스)를 비교합니다.
+
+사용법:
+    make bench name=router
+"""
+import re
+import timeit
+
+from src import app
+
+ITERATIONS = 100_000
+
+SAMPLE_REQUESTS = [
+    ('GET', '/v1/vms'),
+    ('POST', '/v1/vms'),
+    ('DELETE', '/v1/vms/test-vm-01'),
+    ('POST', '/v1/actions/reconcile'),
+    ('POST', '/v1/auth/tokens'),
+    ('POST', '/v1/projects'),
+    ('GET', '/v1/projects'),
+    ('GET', '/v1/projects/12'),
+    ('DELETE', '/v1/projects/12'),
+    ('GET', '/v1/projects/12/users'),
+    ('PUT', '/v1/projects/12/users/34/roles/admin'),
+    ('DELETE', '/v1/projects/12/users/34/roles/admin'),
+    ('POST', '/v1/users'),
+    ('GET', '/v1/users'),
+    ('GET', '/v1/users/34'),
+    ('DELETE', '/v1/users/34'),
+]
+
+
+def legacy_dispatch(method, path):
+    """리팩토링 이전 application()의 라우팅 로직 (비교 기준)."""
+    routes = [
+        ('GET', r'^/v1/vms$', app.list_vms_handler),
+        ('POST', r'^/v1/vms$', app.create_vm_handler),
+        ('DELETE', r'^/v1/vms/([a-zA-Z0-9_-]+)$', app.delete_vm_handler),
+        ('POST', r'^/v1/actions/reconcile$', app.reconcile_vms_handler),
+        ('POST', r'^/v1/auth/tokens$', app.auth_tokens_handler),
+        ('POST', r'^/v1/projects$', app.create_project_handler),
+        ('GET', r'^/v1/projects$', app.list_projects_handler),
+        ('GET', r'^/v1/projects/([0-9]+)$', app.get_project_handler),
+        ('DELETE', r'^/v1/projects/([0-9]+)$', app.delete_project_handler),
+        ('GET', r'^/v1/projects/([0-9]+)/users$', app.list_project_members_handler),
+        ('PUT', r'^/v1/projects/([0-9]+)/users/([0-9]+)/roles/([a-zA-Z]+)$', app.assign_role_handler),
+        ('DELETE', r'^/v1/projects/([0-9]+)/users/([0-9]+)/roles/([a-zA-Z]+)$', app.revoke_role_handler),
+        ('POST', r'^/v1/users$', app.create_user_handler),
+        ('GET', r'^/v1/users$', app.list_users_handler),
+        ('GET', r'^/v1/users/([0-9]+)$', app.get_user_handler),
+        ('DELETE', r'^/v1/users/([0-9]+)$', app.delete_user_handler),
+    ]
+    for route_method, pattern, route_handler in routes:
+        if method == route_method and (match := re.match(pattern, path)):
+            return route_handler, match.groups()
+    return None
+
+
+def ns_per_op(fn, method, path):
+    return timeit.timeit(lambda: fn(method, path), number=ITERATIONS) / ITERATIONS * 1e9
+
+
+def main():
+    print(f"{'route':<48} | {'legacy ns/op':>12} | {'router ns/op':>12}")
+    legacy_total = router_total = 0.0
+    for method, path in SAMPLE_REQUESTS:
+        assert legacy_dispatch(method, path) == app.ROUTER.match(method, path)
+        legacy_ns = ns_per_op(legacy_dispatch, method, path)
+        router_ns = ns_per_op(app.ROUTER.match, method, path)
+        legacy_total += legacy_ns
+        router_total += router_ns
+        print(f"{method + ' ' + path:<48} | {legacy_ns:>12.0f} | {router_ns:>12.0f}")
+    count = len(SAMPLE_REQUESTS)
+    print(f"{'mean':<48} | {legacy_total / count:>12.0f} | {router_total / count:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
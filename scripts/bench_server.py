@@ -0,0 +1,195 @@
+# scripts/bench_server.py
+"""
+생성/조회가 섞인 부하에서 서버 모드별 처리량(requests/s)과 p99 지연을 측정합니다.
+
+실제 WSGI application을 임시 SQLite 파일과 가짜 하이퍼바이저로 구동합니다.
+가짜 하이퍼바이저는 디스크 생성(qemu-img)과 domain.create()에 고정 지연을 주어
+느린 create_vm 요청이 조회 요청을 얼마나 막는지를 재현합니다.
+
+사용법:
+    make bench name=server
+"""
+import hashlib
+import http.client
+import itertools
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import libvirt
+
+from src import app
+from src.database.database import Base
+from src.database import models
+from src.services.task_manager import TaskManager
+from src.utils.wsgi_server import ThreadPoolWSGIServer
+
+DURATION_SEC = 10
+CLIENTS = 32
+CREATE_RATIO = 0.1
+DISK_LATENCY_SEC = 0.3     # qemu-img create
+BOOT_LATENCY_SEC = 0.2     # domain.create()
+WORKERS = 16
+
+
+class FakeDomain:
+    def __init__(self, uuid_str):
+        self._uuid = uuid_str
+
+    def UUIDString(self):
+        return self._uuid
+
+    def create(self):
+        time.sleep(BOOT_LATENCY_SEC)
+        return 0
+
+    def isActive(self):
+        return True
+
+
+class FakeHypervisor:
+    def __init__(self):
+        self.domains = {}
+
+    def isAlive(self):
+        return 1
+
+    def defineXML(self, xml):
+        uuid_str = xml.split("<uuid>", 1)[1].split("</uuid>", 1)[0]
+        domain = self.domains[uuid_str] = FakeDomain(uuid_str)
+        return domain
+
+    def getAllDomainStats(self, stats, flags=0):
+        return [(domain, {"state.state": libvirt.VIR_DOMAIN_RUNNING}) for domain in list(self.domains.values())]
+
+    def close(self):
+        return 0
+
+
+def build_session_factory(workdir):
+    engine = create_engine(f"sqlite:///{workdir}/bench.db", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    image_path = os.path.join(workdir, "base.qcow2")
+    open(image_path, "wb").close()
+
+    db = session_factory()
+    role = models.Role(name="admin")
+    project = models.Project(name="default")
+    user = models.User(username="admin", password_hash=hashlib.sha256(b"admin").hexdigest())
+    db.add_all([role, project, user, models.Image(name="bench-image", filepath=image_path, min_disk_gb=1, min_ram_mb=256)])
+    db.commit()
+    db.add(models.UserProjectRole(user_id=user.id, project_id=project.id, role_id=role.id))
+    db.commit()
+    db.close()
+    return session_factory
+
+
+def fake_create_vm_disk(self, vm_name, source_filepath):
+    time.sleep(DISK_LATENCY_SEC)
+    return f"/tmp/{vm_name}.qcow2"
+
+
+def get_token(port):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    conn.request("POST", "/v1/auth/tokens", body=json.dumps({"username": "admin", "password": "admin", "project_name": "default"}))
+    token = json.loads(conn.getresponse().read())["token"]
+    conn.close()
+    return token
+
+
+def run_clients(port, token):
+    latencies = {"create": [], "list": []}
+    errors = []
+    names = itertools.count()
+    deadline = time.perf_counter() + DURATION_SEC
+    lock = threading.Lock()
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        headers = {"X-Auth-Token": token, "Content-Type": "application/json"}
+        while time.perf_counter() < deadline:
+            if random.random() < CREATE_RATIO:
+                op = "create"
+                body = json.dumps({"vm_name": f"bench-vm-{next(names)}", "cpu_count": 1, "ram_mb": 512, "image_name": "bench-image"})
+                method, path = "POST", "/v1/vms"
+            else:
+                op, body, method, path = "list", None, "GET", "/v1/vms"
+            start = time.perf_counter()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                ok = response.status < 400
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies[op].append(elapsed)
+                if not ok:
+                    errors.append(op)
+        conn.close()
+
+    threads = [threading.Thread(target=client) for _ in range(CLIENTS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, len(errors)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def bench(mode, server):
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        latencies, errors = run_clients(port, get_token(port))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    total = sum(len(v) for v in latencies.values())
+    print(f"[{mode}] {total / DURATION_SEC:.1f} req/s, errors: {errors}")
+    for op, values in latencies.items():
+        print(f"    {op:<6} n={len(values):<6} p50={percentile(values, 0.50) * 1000:8.1f}ms  p99={percentile(values, 0.99) * 1000:8.1f}ms")
+
+
+def main():
+    print(f"clients={CLIENTS}, duration={DURATION_SEC}s, create ratio={CREATE_RATIO}, "
+          f"fake disk={DISK_LATENCY_SEC}s, fake boot={BOOT_LATENCY_SEC}s")
+    for mode in ("simple", "threaded"):
+        task_manager = TaskManager(max_workers=8, max_pending=1000)
+        with tempfile.TemporaryDirectory() as workdir, \
+             patch.object(app, "SessionLocal", build_session_factory(workdir)), \
+             patch.object(app, "task_manager", task_manager), \
+             patch("src.utils.libvirt_connection.libvirt.open", return_value=FakeHypervisor()), \
+             patch("src.services.image_service.ImageService.create_vm_disk", fake_create_vm_disk), \
+             patch.object(WSGIRequestHandler, "log_message", lambda *args: None):
+            app.libvirt_manager.close()
+            if mode == "simple":
+                server = make_server("127.0.0.1", 0, app.application)
+            else:
+                server = ThreadPoolWSGIServer(("127.0.0.1", 0), app.application, workers=WORKERS, max_pending=CLIENTS * 2)
+            bench(mode, server)
+            # 백그라운드 프로비저닝이 임시 DB를 쓰는 동안 패치가 풀리지 않도록 대기
+            task_manager.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    main()
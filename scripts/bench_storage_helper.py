@@ -0,0 +1,110 @@
+# scripts/bench_storage_helper.py
+"""
+디스크 생성/삭제 1,000쌍의 처리량을 작업마다 프로세스를 띄우는 방식과 권한 헬퍼 방식으로 비교합니다.
+
+- subprocess: 기존 방식처럼 작업마다 qemu-img create / rm -f 프로세스를 실행합니다.
+  (sudo 없이 실행하므로 실제 서버의 sudo 인증, PAM 비용은 포함되지 않음)
+- helper, 순차: 헬퍼에 요청을 하나씩 보내고 응답을 기다립니다.
+- helper, 파이프라인: 생성 요청 1,000개를 한 번에 보내 헬퍼가 동시에 처리하게 한 뒤, 삭제도 같은 방식으로 보냅니다.
+
+헬퍼는 같은 프로세스의 스레드로 임시 디렉터리의 Unix 소켓에서 실행합니다.
+qemu-img가 설치되어 있지 않으면 빈 파일을 만드는 셸 스크립트로 대신합니다.
+
+사용법:
+    make bench name=storage_helper
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+from src.utils.storage_helper import StorageHelperClient, StorageHelperServer
+
+PAIRS = 1000
+WORKERS = 8
+
+FAKE_QEMU_IMG = """#!/bin/sh
+for last; do :; done
+: > "$last"
+"""
+
+
+def prepare_qemu_img(workdir):
+    qemu_img = shutil.which("qemu-img")
+    if qemu_img:
+        return qemu_img
+    path = os.path.join(workdir, "qemu-img")
+    with open(path, "w") as f:
+        f.write(FAKE_QEMU_IMG)
+    os.chmod(path, 0o755)
+    return path
+
+
+def build_base_image(path):
+    if shutil.which("qemu-img"):
+        subprocess.run(["qemu-img", "create", "-q", "-f", "qcow2", path, "1G"], check=True, capture_output=True)
+    else:
+        with open(path, "wb") as f:
+            f.write(b"\0" * 1024)
+
+
+def run_subprocess(qemu_img, base_path, images):
+    for i in range(PAIRS):
+        disk = os.path.join(images, f"sub-{i}.qcow2")
+        subprocess.run([qemu_img, "create", "-q", "-f", "qcow2", "-F", "qcow2", "-b", base_path, disk],
+                       check=True, capture_output=True, text=True)
+        subprocess.run(["rm", "-f", disk], check=True)
+
+
+def run_sequential(client, base_path, images):
+    for i in range(PAIRS):
+        disk = os.path.join(images, f"seq-{i}.qcow2")
+        client.create_overlay(base_path, disk)
+        client.delete(disk)
+
+
+def run_pipelined(client, base_path, images):
+    disks = [os.path.join(images, f"pipe-{i}.qcow2") for i in range(PAIRS)]
+    creates = client.submit_batch([("create_overlay", {"source": base_path, "target": disk}) for disk in disks])
+    for future in creates:
+        future.result(120)
+    deletes = client.submit_batch([("delete", {"path": disk}) for disk in disks])
+    for future in deletes:
+        future.result(120)
+
+
+def measure(label, fn, *args):
+    started = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<24} {elapsed:8.2f} s   {PAIRS / elapsed:8.1f} pairs/s")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        images = os.path.join(workdir, "images")
+        os.makedirs(images)
+        qemu_img = prepare_qemu_img(workdir)
+        base_path = os.path.join(images, "base.qcow2")
+        build_base_image(base_path)
+
+        socket_path = os.path.join(workdir, "helper.sock")
+        server = StorageHelperServer(socket_path, [images], workers=WORKERS, qemu_img=qemu_img)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = StorageHelperClient(socket_path)
+
+        qemu_label = "qemu-img" if shutil.which("qemu-img") else "fake qemu-img script"
+        print(f"create/delete pairs:     {PAIRS} ({qemu_label}, helper workers {WORKERS})")
+        measure("subprocess per op", run_subprocess, qemu_img, base_path, images)
+        measure("helper, sequential", run_sequential, client, base_path, images)
+        measure("helper, pipelined", run_pipelined, client, base_path, images)
+
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
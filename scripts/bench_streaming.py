@@ -0,0 +1,98 @@
+# scripts/bench_streaming.py
+"""
+큰 VM 목록 응답을 한 번에 직렬화할 때와 스트리밍할 때의 최대 메모리 사용량과
+첫 바이트까지의 시간을 비교합니다.
+
+- buffered:  페이지 전체를 리스트로 만든 뒤 json.dumps(...).encode() (기존 응답 방식)
+- streaming: iter_json_page()로 커서에서 읽는 대로 64KiB 청크를 내보냄
+
+최대 메모리는 tracemalloc으로 측정하며, 응답 바이트는 전송된 것으로 보고 바로 버립니다.
+
+사용법:
+    make bench name=streaming
+"""
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy.orm import sessionmaker
+
+from src.database import models
+from src.database.database import create_db_engine
+from src.database.migrations import upgrade
+from src.repositories.sqlalchemy.sqlalchemy_vm_repository import SqlalchemyVMRepository
+from src.services.compute_service import ComputeService
+from src.utils.streaming import iter_json_page
+
+SIZES = [1_000, 10_000, 50_000]
+
+
+class FakeConnection:
+    def getAllDomainStats(self, stats, flags=0):
+        return []
+
+
+def seed(engine, count):
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(models.Project.__table__.insert(), [{"id": 1, "name": "big"}])
+        conn.execute(models.VM.__table__.insert(), [
+            {"name": f"vm-{i}", "uuid": f"00000000-0000-0000-0000-{i:012d}", "state": "RUNNING",
+             "cpu_count": 2, "ram_mb": 2048, "project_id": 1, "created_at": start + timedelta(seconds=i)}
+            for i in range(count)
+        ])
+
+
+def buffered(service, limit):
+    page = service.list_vms(1, limit=limit)
+    body = json.dumps(page.to_dict("vms")).encode("utf-8")
+    return len(body), None
+
+
+def streaming(service, limit):
+    size, first_chunk_at = 0, None
+    for chunk in iter_json_page("vms", service.list_vms(1, limit=limit)):
+        if first_chunk_at is None:
+            first_chunk_at = time.perf_counter()
+        size += len(chunk)
+    return size, first_chunk_at
+
+
+def measure(session_factory, fn, limit):
+    db = session_factory()
+    try:
+        service = ComputeService(SqlalchemyVMRepository(db), image_service=None,
+                                 conn_manager=SimpleNamespace(get=FakeConnection))
+        tracemalloc.start()
+        begin = time.perf_counter()
+        size, first_chunk_at = fn(service, limit)
+        end = time.perf_counter()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        db.close()
+    first_byte_ms = ((first_chunk_at or end) - begin) * 1000
+    return size, peak / (1024 * 1024), first_byte_ms, (end - begin) * 1000
+
+
+def main():
+    print(f"{'VMs':>7} {'mode':>10} | {'body MiB':>8} {'peak MiB':>8} {'first byte ms':>13} {'total ms':>9}")
+    for count in SIZES:
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmp:
+            engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            upgrade(engine)
+            seed(engine, count)
+            session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            for name, fn in (("buffered", buffered), ("streaming", streaming)):
+                size, peak, first_byte_ms, total_ms = measure(session_factory, fn, count)
+                print(f"{count:>7} {name:>10} | {size / (1024 * 1024):>8.2f} {peak:>8.2f} "
+                      f"{first_byte_ms:>13.1f} {total_ms:>9.1f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# scripts/bench_token_store.py
+"""
+살아 있는 토큰 1,000,000개가 있을 때 validate_token 처리량(검증/s)을 저장소별로 측정합니다.
+
+- memory: 프로세스 메모리 저장소 (LRU + TTL 힙)
+- sqlite: 워커 프로세스 간에 공유되는 SQLite(WAL, mmap) 저장소
+
+각 저장소를 채운 뒤 무작위 토큰을 IdentityService.validate_token으로 검증합니다.
+
+사용법:
+    make bench name=token_store
+"""
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from src.repositories.memory.memory_token_repository import MemoryTokenRepository
+from src.repositories.sqlite.sqlite_token_repository import SqliteTokenRepository
+from src.services.identity_service import IdentityService
+
+LIVE_TOKENS = 1_000_000
+VALIDATIONS = 200_000
+
+
+def seed_sqlite(db_path, tokens, expires_at):
+    # 벤치마크 준비 시간 단축을 위해 하나의 트랜잭션으로 직접 적재
+    conn = sqlite3.connect(db_path)
+    data = json.dumps({"user_id": 1, "project_id": 1})
+    with conn:
+        conn.executemany(
+            "INSERT INTO tokens (token, expires_at, data) VALUES (?, ?, ?)",
+            ((token, expires_at.timestamp(), data) for token in tokens),
+        )
+    conn.close()
+
+
+def bench(name, token_repo, tokens):
+    service = IdentityService(MagicMock(), MagicMock(), MagicMock(), MagicMock(), token_repo=token_repo)
+    sample = [random.choice(tokens) for _ in range(VALIDATIONS)]
+
+    start = time.perf_counter()
+    for token in sample:
+        service.validate_token(token)
+    elapsed = time.perf_counter() - start
+    print(f"[{name:<6}] {VALIDATIONS / elapsed:12,.0f} validations/s  ({elapsed / VALIDATIONS * 1e6:.2f} us/op, stored={token_repo.count():,})")
+
+
+def main():
+    tokens = [str(uuid.uuid4()) for _ in range(LIVE_TOKENS)]
+    expires_at = datetime.now() + timedelta(hours=1)
+    print(f"live tokens={LIVE_TOKENS:,}, validations={VALIDATIONS:,}")
+
+    memory_repo = MemoryTokenRepository(max_entries=LIVE_TOKENS)
+    for token in tokens:
+        memory_repo.save(token, {"user_id": 1, "project_id": 1, "expires_at": expires_at})
+    bench("memory", memory_repo, tokens)
+    del memory_repo
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "tokens.db")
+        sqlite_repo = SqliteTokenRepository(db_path)
+        seed_sqlite(db_path, tokens, expires_at)
+        bench("sqlite", sqlite_repo, tokens)
+        sqlite_repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# scripts/bench_token_validation.py
+"""
+요청 한 건당 토큰 검증 비용을 토큰 방식별로 측정합니다.
+
+- dict:   기존 방식과 같은 프로세스 메모리 딕셔너리 조회 (MemoryTokenRepository)
+- sqlite: 워커 프로세스 간 공유 저장소 조회 (SqliteTokenRepository)
+- signed: 저장소 없이 HMAC 서명, 만료, 폐기 목록만 확인 (TokenSigner)
+
+사용법:
+    make bench name=token_validation
+"""
+import hashlib
+import os
+import tempfile
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from src.database import models
+from src.repositories.interfaces import LoginContext
+from src.repositories.memory.memory_token_repository import MemoryTokenRepository
+from src.repositories.sqlite.sqlite_token_repository import SqliteTokenRepository
+from src.services.identity_service import IdentityService
+from src.utils.signed_token import RevocationList, TokenSigner
+
+LIVE_TOKENS = 10_000
+VALIDATIONS = 200_000
+
+
+def build_service(**kwargs):
+    user = models.User(id=1, username="admin", password_hash=hashlib.sha256(b"admin").hexdigest())
+    user_repo = MagicMock()
+    user_repo.find_login_context.return_value = LoginContext(user, models.Project(id=1, name="default"), ["admin"])
+    return IdentityService(user_repo, MagicMock(), MagicMock(), MagicMock(), token_ttl=timedelta(hours=1), **kwargs)
+
+
+def bench(name, service):
+    tokens = [service.authenticate("admin", "admin", "default")["token"] for _ in range(LIVE_TOKENS)]
+    start = time.perf_counter()
+    for i in range(VALIDATIONS):
+        service.validate_token(tokens[i % LIVE_TOKENS])
+    elapsed = time.perf_counter() - start
+    print(f"[{name:<6}] {elapsed / VALIDATIONS * 1e6:6.2f} us/validation  ({VALIDATIONS / elapsed:10,.0f}/s)")
+
+
+def main():
+    print(f"live tokens={LIVE_TOKENS:,}, validations={VALIDATIONS:,}")
+    bench("dict", build_service(token_repo=MemoryTokenRepository()))
+    with tempfile.TemporaryDirectory() as workdir:
+        sqlite_repo = SqliteTokenRepository(os.path.join(workdir, "tokens.db"))
+        bench("sqlite", build_service(token_repo=sqlite_repo))
+        sqlite_repo.close()
+    bench("signed", build_service(token_signer=TokenSigner(os.urandom(32)), revocation_list=RevocationList()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,176 @@
 # src/app.py
 from wsgiref.simple_server import make_server
 import json
+import logging
+import secrets
+import signal
 import sys
-import re
+import threading
+import time
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs
 
 # SQLAlchemy 및 의존성 임포트
+from src.database import models
 from src.database.database import SessionLocal
+from src.database.unit_of_work import UnitOfWork
 from src.repositories.sqlalchemy.sqlalchemy_vm_repository import SqlalchemyVMRepository
+from src.repositories.sqlalchemy.sqlalchemy_drift_repository import SqlalchemyVMDriftRepository
 from src.repositories.sqlalchemy.sqlalchemy_image_repository import SqlalchemyImageRepository
 from src.repositories.sqlalchemy.sqlalchemy_project_repository import SqlalchemyProjectRepository
+from src.repositories.sqlalchemy.sqlalchemy_quota_repository import SqlalchemyQuotaRepository
 from src.repositories.sqlalchemy.sqlalchemy_user_repository import SqlalchemyUserRepository
 from src.repositories.sqlalchemy.sqlalchemy_role_repository import SqlalchemyRoleRepository
+from src.repositories.memory.memory_token_repository import MemoryTokenRepository
+from src.repositories.sqlite.sqlite_token_repository import SqliteTokenRepository
 from src.services.compute_service import ComputeService
-from src.services.image_service import ImageService
+from src.services.image_service import ImageService, create_overlay_disk, make_disk_dir, move_disk_file, remove_disk_file
 from src.services.identity_service import IdentityService
+from src.services.quota_service import QuotaService
+from src.services.reconcile_service import ReconcileLoop, ReconcileService, ReconcileStats
+from src.services.scheduler import ComputeHost, Scheduler, discover_capacity
+from src.services.task_manager import TaskManager
 from src.services.exceptions import *
+from src.utils.disk_pool import OverlayPool, PoolTarget
+from src.utils.domain_state_cache import DomainStateCache, LibvirtEventSource
+from src.utils.image_cache import ImageCatalogCache
+from src.utils.libvirt_connection import LibvirtConnectionManager
+from src.utils import metrics, tracing
+from src.utils.pagination import normalize_limit
+from src.utils.password_hasher import PasswordHasher
+from src.utils.router import Router, MethodNotAllowedError
+from src.utils.signed_token import RevocationList, TokenSigner
+from src.utils.storage_helper import StorageHelperClient
+from src.utils.streaming import StreamingBody, iter_json_page
+from src.utils.wsgi_server import ThreadPoolWSGIServer
+from src import config
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------------------
+## 프로세스 전역 자원 (서버 시작 시 한 번만 생성)
+# --------------------------------------------------------------------------
+
+# libvirt 연결은 요청마다 새로 열지 않고, 호스트마다 하나씩 프로세스 전체에서 공유합니다.
+# 실제 연결은 compute 라우트가 처음 호출되거나 도메인 상태 캐시가 처음 동기화할 때 열립니다.
+compute_hosts = [ComputeHost(**host) for host in config.COMPUTE_HOSTS]
+host_connections = {host.name: LibvirtConnectionManager(host.uri) for host in compute_hosts}
+# 첫 번째(기본) 호스트의 연결. 도메인 상태 캐시와 정합성 검사는 이 호스트를 대상으로 합니다.
+libvirt_manager = host_connections[compute_hosts[0].name]
+
+# 새 VM의 호스트는 프로세스 전역 용량 인덱스에서 고릅니다. 사용량은 서버 시작 시 DB에서 다시 계산합니다.
+scheduler = Scheduler(
+    compute_hosts,
+    cpu_allocation_ratio=config.CPU_ALLOCATION_RATIO,
+    ram_allocation_ratio=config.RAM_ALLOCATION_RATIO,
+    disk_allocation_ratio=config.DISK_ALLOCATION_RATIO,
+    ram_weight=config.SCHEDULER_RAM_WEIGHT,
+    cpu_weight=config.SCHEDULER_CPU_WEIGHT,
+    anti_affinity=config.SCHEDULER_ANTI_AFFINITY,
+)
+
+# VM 목록의 실시간 상태는 요청마다 하이퍼바이저에 묻지 않고, 서버 시작 시 동기화를 시작하는
+# 프로세스 전역 캐시에서 읽습니다. (동기화 전에는 요청마다 스냅샷을 가져옴)
+if config.STATE_CACHE_MODE == "off":
+    domain_state_cache = None
+else:
+    # LibvirtEventSource는 생성 시 이벤트 루프 구현을 등록하므로, 어떤 libvirt 연결보다 먼저 만들어야 함
+    domain_state_cache = DomainStateCache(
+        libvirt_manager,
+        event_source=LibvirtEventSource() if config.STATE_CACHE_MODE == "events" else None,
+        resync_interval=config.STATE_CACHE_RESYNC_SEC,
+    )
+
+# 이미지 카탈로그는 거의 바뀌지 않으므로 VM 생성마다 DB와 파일 시스템을 확인하지 않고 캐시에서 읽습니다.
+image_cache = None
+if config.IMAGE_CACHE_TTL_SEC > 0:
+    image_cache = ImageCatalogCache(ttl=config.IMAGE_CACHE_TTL_SEC, file_ttl=config.IMAGE_FILE_CHECK_TTL_SEC)
+    image_cache.invalidate_on_change(models.Image)
+
+# 권한 헬퍼가 설정되어 있으면 디스크 작업마다 sudo 프로세스를 띄우지 않고 헬퍼에 요청합니다.
+storage_helper = None
+if config.STORAGE_HELPER_SOCKET:
+    storage_helper = StorageHelperClient(config.STORAGE_HELPER_SOCKET, timeout=config.STORAGE_HELPER_TIMEOUT_SEC)
+
+# 자주 쓰는 이미지의 VM 디스크는 요청마다 qemu-img를 실행하지 않고, 백그라운드에서 미리 만들어 둔
+# 오버레이를 옮겨서 만듭니다. (대상 이미지의 경로는 서버 시작 시 DB에서 찾음)
+disk_pool = None
+if config.DISK_POOL_IMAGES:
+    disk_pool = OverlayPool(
+        config.DISK_POOL_DIR,
+        create_overlay=storage_helper.create_overlay if storage_helper else create_overlay_disk,
+        delete_file=storage_helper.delete if storage_helper else remove_disk_file,
+        move_file=storage_helper.rename if storage_helper else move_disk_file,
+        make_dir=storage_helper.make_dir if storage_helper else make_disk_dir,
+        check_interval=config.DISK_POOL_CHECK_INTERVAL_SEC,
+    )
+
+# 프로젝트별 한도가 없는 자원에 적용할 기본 쿼터
+QUOTA_DEFAULTS = {
+    "instances": config.QUOTA_INSTANCES,
+    "vcpus": config.QUOTA_VCPUS,
+    "ram_mb": config.QUOTA_RAM_MB,
+    "disk_gb": config.QUOTA_DISK_GB,
+}
+
+# 토큰은 요청마다 새로 만들어지는 IdentityService가 아닌 프로세스 전역 저장소에 보관합니다.
+# 'sqlite' 저장소는 여러 워커 프로세스가 토큰을 공유하고, 재시작 후에도 토큰을 유지합니다.
+if config.TOKEN_STORE == "sqlite":
+    token_repo = SqliteTokenRepository(config.TOKEN_DB_PATH)
+else:
+    token_repo = MemoryTokenRepository(max_entries=config.TOKEN_MAX_ENTRIES)
+
+# 'signed' 모드에서는 토큰 검증이 저장소 조회 없이 서명 확인만으로 끝납니다.
+# 로그아웃한 토큰은 만료될 때까지 이 프로세스의 폐기 목록에 보관됩니다.
+token_signer = None
+if config.TOKEN_FORMAT == "signed":
+    token_signer = TokenSigner(config.TOKEN_SECRET.encode("utf-8") or secrets.token_bytes(32))
+revocation_list = RevocationList()
+
+# 비밀번호 KDF는 요청 스레드 수와 무관하게 제한된 워커 풀에서 실행됩니다.
+password_hasher = PasswordHasher(
+    algorithm=config.PASSWORD_HASH_ALGORITHM,
+    scrypt_n=config.PASSWORD_SCRYPT_N, scrypt_r=config.PASSWORD_SCRYPT_R, scrypt_p=config.PASSWORD_SCRYPT_P,
+    pbkdf2_iterations=config.PASSWORD_PBKDF2_ITERATIONS,
+    workers=config.PASSWORD_HASH_WORKERS,
+    cache_ttl=config.PASSWORD_CACHE_TTL_SEC, cache_max_entries=config.PASSWORD_CACHE_MAX_ENTRIES,
+)
+
+# 요청과 백그라운드 작업은 각각 하나의 추적이 되며, 핸들러 -> 서비스 -> 리포지토리/하이퍼바이저 호출이
+# span으로 기록됩니다. 표본으로 뽑힌 추적은 내보내고, 느린 요청은 span 구성 전체를 로그로 남깁니다.
+tracer = tracing.Tracer(
+    exporter=tracing.JsonLinesExporter(config.TRACE_FILE) if config.TRACE_EXPORTER == "jsonl" else None,
+    sample_rate=config.TRACE_SAMPLE_RATE,
+    slow_threshold_ms=config.SLOW_REQUEST_MS,
+)
+
+# VM 프로비저닝처럼 오래 걸리는 작업은 요청 스레드가 아닌 제한된 워커 풀에서 실행합니다.
+task_manager = TaskManager(max_workers=config.TASK_WORKERS, max_pending=config.TASK_MAX_PENDING, tracer=tracer)
+
+# 정합성 검사 결과(실행 횟수, 소요 시간, 불일치 건수)는 요청과 주기적 검사가 함께 집계합니다.
+reconcile_stats = ReconcileStats()
+
+# 요청 처리 시간은 라우트(핸들러 이름) 단위로 집계하여, 경로 파라미터 값이 레이블을 늘리지 않게 합니다.
+# 스트리밍 응답은 본문 전송이 끝난 시점까지를 잽니다.
+HTTP_REQUEST_SECONDS = metrics.histogram(
+    "iaas_http_request_duration_seconds", "Latency of HTTP requests by route and status.",
+    ("method", "route", "status"),
+)
+metrics.gauge("iaas_tasks_active", "Background tasks queued or running.", fn=lambda: task_manager.active_count())
+metrics.gauge("iaas_libvirt_connections_opened_total", "Hypervisor connections opened since start.",
+              fn=lambda: sum(manager.opened_count for manager in host_connections.values()))
+metrics.gauge("iaas_scheduler_free_ram_mb", "Allocatable RAM left on each compute host.", ("host",),
+              fn=lambda: {(host["name"],): host["free_ram_mb"] for host in scheduler.hosts()})
+metrics.gauge("iaas_scheduler_free_vcpus", "Allocatable vCPUs left on each compute host.", ("host",),
+              fn=lambda: {(host["name"],): host["free_vcpus"] for host in scheduler.hosts()})
+if disk_pool is not None:
+    metrics.gauge("iaas_disk_pool_ready", "Pre-built overlay disks ready per base image.", ("image",),
+                  fn=lambda: {(path,): count for path, count in disk_pool.ready_counts().items()})
+if domain_state_cache is not None:
+    metrics.gauge("iaas_state_cache_domains", "Domains held in the hypervisor state cache.",
+                  fn=lambda: len(domain_state_cache))
+    metrics.gauge("iaas_state_cache_age_seconds", "Seconds since the state cache was last known to be current.",
+                  fn=lambda: None if domain_state_cache.as_of() is None else time.time() - domain_state_cache.as_of())
 
 # --------------------------------------------------------------------------
 ## 요청 처리 유틸리티 함수
@@ -27,6 +183,24 @@ def get_request_data(environ):
     except (ValueError, json.JSONDecodeError):
         raise ValueError("Invalid or missing JSON body.")
 
+def get_query_params(environ):
+    """쿼리 문자열을 {이름: 값} 딕셔너리로 변환합니다. (같은 이름이 반복되면 마지막 값을 사용)"""
+    query = parse_qs(environ.get("QUERY_STRING", ""), keep_blank_values=True)
+    return {name: values[-1] for name, values in query.items()}
+
+def get_list_params(params):
+    """목록 조회 공통 파라미터(limit, marker, fields)를 서비스 인자로 변환합니다."""
+    try:
+        limit = int(params["limit"]) if "limit" in params else None
+    except ValueError:
+        raise ValueError("'limit' must be an integer.")
+    fields = [field for field in params.get("fields", "").split(",") if field]
+    return {
+        "limit": normalize_limit(limit, config.LIST_DEFAULT_LIMIT, config.LIST_MAX_LIMIT),
+        "marker": params.get("marker") or None,
+        "fields": fields or None,
+    }
+
 def authorize_and_get_token_data(environ):
     auth_token = environ.get('HTTP_X_AUTH_TOKEN')
     if not auth_token:
@@ -34,6 +208,22 @@ def authorize_and_get_token_data(environ):
     identity_service = environ['services']['identity']
     return identity_service.validate_token(auth_token)
 
+class ServiceContainer(dict):
+    """
+    요청 단위의 서비스 컨테이너입니다.
+
+    서비스는 핸들러가 처음 접근하는 시점에 생성되므로, compute 라우트가 아닌
+    요청(예: 토큰 발급)은 ComputeService와 libvirt를 전혀 건드리지 않습니다.
+    """
+    def __init__(self, factories):
+        super().__init__()
+        self._factories = factories
+
+    def __missing__(self, name):
+        service = self._factories[name]()
+        self[name] = service
+        return service
+
 def handle_exception(e):
     error_map = {
         TokenInvalidError: "401 Unauthorized",
@@ -43,11 +233,19 @@ def handle_exception(e):
         UserNotFoundError: "404 Not Found",
         RoleNotFoundError: "404 Not Found",
         ImageNotFoundError: "404 Not Found",
+        ImageRequirementError: "400 Bad Request",
+        ImageAlreadyExistsError: "400 Bad Request",
+        ImageUploadConflictError: "409 Conflict",
         ValueError: "400 Bad Request",
         VmAlreadyExistsError: "400 Bad Request",
         ProjectCreationError: "400 Bad Request",
         UserCreationError: "400 Bad Request",
         ProjectNotEmptyError: "400 Bad Request",
+        QuotaExceededError: "403 Forbidden",
+        TaskNotFoundError: "404 Not Found",
+        MethodNotAllowedError: "405 Method Not Allowed",
+        TaskQueueFullError: "503 Service Unavailable",
+        NoValidHostError: "503 Service Unavailable",
     }
     status = error_map.get(type(e), "500 Internal Server Error")
     return status, json.dumps({"error": str(e)})
@@ -56,108 +254,316 @@ def handle_exception(e):
 ## WSGI 애플리케이션 (의존성 주입 및 라우팅)
 # --------------------------------------------------------------------------
 
+def build_services(unit_of_work):
+    """
+    트랜잭션(UnitOfWork) 하나에 묶인 리포지토리와 서비스들을 구성합니다. (Repositories -> Services)
+
+    서비스는 지연 생성되도록 팩토리만 등록합니다. HTTP 요청뿐 아니라
+    백그라운드 작업도 자신만의 트랜잭션으로 이 함수를 호출해 서비스를 얻습니다.
+    """
+    db_session = unit_of_work.session
+    vm_repo = SqlalchemyVMRepository(db_session)
+    image_repo = SqlalchemyImageRepository(db_session)
+    project_repo = SqlalchemyProjectRepository(db_session)
+    user_repo = SqlalchemyUserRepository(db_session)
+    role_repo = SqlalchemyRoleRepository(db_session)
+
+    services = ServiceContainer({
+        'image': lambda: ImageService(image_repo, cache=image_cache, disk_pool=disk_pool,
+                                      storage=storage_helper, import_dirs=config.IMAGE_IMPORT_DIRS,
+                                      upload_chunk_bytes=config.IMAGE_UPLOAD_CHUNK_BYTES,
+                                      image_dir=config.IMAGE_DIR, upload_dir=config.IMAGE_UPLOAD_DIR),
+        'quota': lambda: QuotaService(SqlalchemyQuotaRepository(db_session), project_repo, QUOTA_DEFAULTS),
+        'identity': lambda: IdentityService(
+            user_repo, project_repo, role_repo, vm_repo,
+            token_repo=token_repo, token_ttl=timedelta(seconds=config.TOKEN_TTL_SEC),
+            token_signer=token_signer, revocation_list=revocation_list,
+            password_hasher=password_hasher,
+        ),
+        'compute': lambda: ComputeService(vm_repo, services['image'], libvirt_manager, unit_of_work,
+                                          state_cache=domain_state_cache, scheduler=scheduler,
+                                          host_connections=host_connections, quota_service=services['quota']),
+        'reconcile': lambda: ReconcileService(
+            vm_repo, SqlalchemyVMDriftRepository(db_session), libvirt_manager, unit_of_work,
+            host=scheduler.default_host, quota_service=services['quota'],
+            ghost_policy=config.RECONCILE_GHOST_POLICY, missing_policy=config.RECONCILE_MISSING_POLICY,
+            state_policy=config.RECONCILE_STATE_POLICY, adopt_project_id=config.RECONCILE_ADOPT_PROJECT_ID,
+            batch_size=config.RECONCILE_BATCH_SIZE, stats=reconcile_stats,
+        ),
+    })
+    return services
+
+def run_in_background(task, fn, on_start_failure=None):
+    """
+    작업을 워커 풀에서 실행합니다. 작업은 요청과 별도의 트랜잭션으로 서비스를 구성하여
+    fn(services, progress)를 호출하고, 정상 종료되면 한 번 커밋합니다.
+
+    요청 트랜잭션의 커밋 후 콜백에서 호출되므로 예외를 던지지 않습니다. 작업을 시작하지 못하면
+    (예: 종료 중이라 워커 풀이 닫힘) 작업은 FAILED로 기록되고, on_start_failure가 있으면 별도의
+    트랜잭션에서 on_start_failure(services)를 호출하여 요청이 확보한 자원을 정리합니다.
+    """
+    def job(progress):
+        with UnitOfWork(SessionLocal) as unit_of_work:
+            return fn(build_services(unit_of_work), progress)
+
+    try:
+        task_manager.start(task, job)
+    except Exception as e:
+        logger.error("Could not start task %s (%s): %s", task.id, task.action, e)
+        if on_start_failure is None:
+            return
+        try:
+            with UnitOfWork(SessionLocal) as unit_of_work:
+                on_start_failure(build_services(unit_of_work))
+        except Exception:
+            logger.exception("Cleanup after task %s failed to start did not complete.", task.id)
+
+def run_scheduled_reconcile():
+    """주기적 정합성 검사 한 번을 요청과 별도의 트랜잭션으로 실행합니다."""
+    with tracer.start_trace("reconcile"), UnitOfWork(SessionLocal) as unit_of_work:
+        build_services(unit_of_work)['reconcile'].reconcile()
+
+def load_scheduler_state():
+    """
+    용량 인덱스를 채웁니다. (서버 시작 시)
+
+    용량이 설정되지 않은 호스트는 하이퍼바이저에서 조회하며, 연결할 수 없는 호스트는 용량 0으로 남아
+    배치 대상에서 빠집니다. 사용량은 DB에 기록된 VM들(ERROR 제외)로 다시 계산합니다.
+    """
+    for host in compute_hosts:
+        if host.vcpus is not None and host.ram_mb is not None and host.disk_gb is not None:
+            continue
+        try:
+            scheduler.set_capacity(discover_capacity(host, host_connections[host.name].get()))
+        except Exception as e:
+            logger.warning("Could not read capacity of compute host '%s': %s", host.name, e)
+    with UnitOfWork(SessionLocal) as unit_of_work:
+        scheduler.load_usage(SqlalchemyVMRepository(unit_of_work.session).usage_by_host(exclude_states=("ERROR",)))
+
+def start_disk_pool():
+    """설정된 이미지 이름을 기반 이미지 경로로 바꿔 웜 풀을 시작합니다. (서버 시작 시)"""
+    with UnitOfWork(SessionLocal) as unit_of_work:
+        images = SqlalchemyImageRepository(unit_of_work.session).find_by_names(list(config.DISK_POOL_IMAGES))
+        paths = {image.name: image.filepath for image in images}
+    targets = {}
+    for name, value in config.DISK_POOL_IMAGES.items():
+        if name not in paths:
+            logger.warning("Disk pool image '%s' is not registered; skipping.", name)
+            continue
+        targets[paths[name]] = PoolTarget.from_config(value)
+    disk_pool.start(targets)
+
 def application(environ, start_response):
-    db_session = SessionLocal()
+    headers = [("Content-Type", "application/json")]
+    method = environ.get("REQUEST_METHOD", "")
+    route_name = "not_found"
+    # 요청 전체를 덮는 최상위 span. 스트리밍 응답이면 본문 전송이 끝난 뒤(close)에 닫음
+    request_span = tracer.start_trace("http", method=method, path=environ.get("PATH_INFO", "")).__enter__()
     try:
-        # 1. 의존성 생성 (Repositories -> Services)
-        vm_repo = SqlalchemyVMRepository(db_session)
-        image_repo = SqlalchemyImageRepository(db_session)
-        project_repo = SqlalchemyProjectRepository(db_session)
-        user_repo = SqlalchemyUserRepository(db_session)
-        role_repo = SqlalchemyRoleRepository(db_session)
-
-        image_service = ImageService(image_repo)
-        identity_service = IdentityService(user_repo, project_repo, role_repo, vm_repo)
-        compute_service = ComputeService(vm_repo, image_service)
-
-        # 2. 생성된 서비스 객체들을 environ을 통해 핸들러에 전달
-        environ['services'] = {
-            'compute': compute_service,
-            'image': image_service,
-            'identity': identity_service
-        }
-
-        # 3. 라우팅 및 핸들러 실행
-        path = environ.get("PATH_INFO", "")
-        method = environ.get("REQUEST_METHOD", "")
-        
-        routes = [
-            ('GET', r'^/v1/vms$', list_vms_handler),
-            ('POST', r'^/v1/vms$', create_vm_handler),
-            ('DELETE', r'^/v1/vms/([a-zA-Z0-9_-]+)$', delete_vm_handler),
-            ('POST', r'^/v1/actions/reconcile$', reconcile_vms_handler),
-            ('POST', r'^/v1/auth/tokens$', auth_tokens_handler),
-            ('POST', r'^/v1/projects$', create_project_handler),
-            ('GET', r'^/v1/projects$', list_projects_handler),
-            ('GET', r'^/v1/projects/([0-9]+)$', get_project_handler),
-            ('DELETE', r'^/v1/projects/([0-9]+)$', delete_project_handler),
-            ('GET', r'^/v1/projects/([0-9]+)/users$', list_project_members_handler),
-            ('PUT', r'^/v1/projects/([0-9]+)/users/([0-9]+)/roles/([a-zA-Z]+)$', assign_role_handler),
-            ('DELETE', r'^/v1/projects/([0-9]+)/users/([0-9]+)/roles/([a-zA-Z]+)$', revoke_role_handler),
-            ('POST', r'^/v1/users$', create_user_handler),
-            ('GET', r'^/v1/users$', list_users_handler),
-            ('GET', r'^/v1/users/([0-9]+)$', get_user_handler),
-            ('DELETE', r'^/v1/users/([0-9]+)$', delete_user_handler),
-        ]
-
-        handler, path_args = None, []
-        for route_method, pattern, route_handler in routes:
-            if method == route_method and (match := re.match(pattern, path)):
-                handler, path_args = route_handler, match.groups()
-                break
-        
-        if handler:
-            status, response_body = handler(environ, *path_args)
+        # 요청 하나가 트랜잭션 하나: 핸들러가 성공하면 한 번 커밋하고, 예외가 나면 롤백
+        unit_of_work = UnitOfWork(SessionLocal).__enter__()
+        try:
+            # 1. 의존성 생성 후 environ을 통해 핸들러에 전달
+            environ['unit_of_work'] = unit_of_work
+            environ['services'] = build_services(unit_of_work)
+
+            # 3. 라우팅 및 핸들러 실행
+            path = environ.get("PATH_INFO", "")
+
+            route = ROUTER.match(method, path)
+            if route:
+                handler, path_args = route
+                route_name = handler.__name__.removesuffix("_handler")
+                status, response_body, *extra_headers = handler(environ, *path_args)
+                if extra_headers:
+                    # 세 번째 값은 Content-Type 등 기본값을 덮어쓸 응답 헤더 딕셔너리
+                    overrides = extra_headers[0]
+                    headers = [(name, value) for name, value in headers if name not in overrides]
+                    headers.extend(overrides.items())
+            else:
+                status, response_body = '404 Not Found', json.dumps({'error': 'Not Found'})
+        except BaseException as e:
+            unit_of_work.__exit__(type(e), e, e.__traceback__)
+            raise
+
+        if isinstance(response_body, str):
+            unit_of_work.__exit__(None, None, None)
         else:
-            status, response_body = '404 Not Found', json.dumps({'error': 'Not Found'})
-
+            # 스트리밍 본문은 커서에서 행을 읽으므로, 서버가 본문을 다 보낸 뒤(close) 작업 단위를 끝냄
+            def finish_stream(error, status=status):
+                try:
+                    unit_of_work.__exit__(type(error) if error else None, error, None)
+                finally:
+                    finish_request(request_span, route_name, status, error)
+            response_body = StreamingBody(response_body, finish_stream)
+
+    except MethodNotAllowedError as e:
+        status, response_body = handle_exception(e)
+        headers.append(("Allow", ", ".join(e.allowed_methods)))
     except Exception as e:
         status, response_body = handle_exception(e)
     finally:
-        db_session.close()
-
-    start_response(status, [("Content-Type", "application/json")])
-    return [response_body.encode("utf-8")]
+        request_span.detach()
+
+    start_response(status, headers)
+    if isinstance(response_body, str):
+        finish_request(request_span, route_name, status)
+        return [response_body.encode("utf-8")]
+    return response_body
+
+def finish_request(request_span, route_name, status, error=None):
+    """요청의 최상위 span을 닫고, 처리 시간을 라우트와 상태 코드(예: '200') 레이블로 기록합니다."""
+    method = request_span.attributes["method"]
+    status_code = status.split(" ", 1)[0]
+    request_span.name = f"{method} {route_name}"
+    request_span.set(status=status_code)
+    request_span.end(type(error) if error else None)
+    HTTP_REQUEST_SECONDS.labels(method, route_name, status_code).observe(request_span.duration)
 
 # --------------------------------------------------------------------------
 ## 핸들러 함수 (전체 리팩토링 완료)
 # --------------------------------------------------------------------------
+# 핸들러는 (상태, JSON 문자열)을 반환합니다. 결과가 클 수 있는 목록 핸들러는 문자열 대신
+# bytes 청크 이터러블을 반환하여, 응답 전체를 메모리에 만들지 않고 스트리밍합니다.
 
 def list_vms_handler(environ, *args):
     token_data = authorize_and_get_token_data(environ)
-    vms = environ['services']['compute'].list_vms(token_data['project_id'])
-    return '200 OK', json.dumps({'vms': vms})
+    params = get_query_params(environ)
+    created_after = None
+    if params.get('created_after'):
+        try:
+            created_after = datetime.fromisoformat(params['created_after'])
+        except ValueError:
+            raise ValueError("'created_after' must be an ISO 8601 datetime.")
+    page = environ['services']['compute'].list_vms(
+        token_data['project_id'], state=params.get('state') or None, name_prefix=params.get('name_prefix') or None,
+        created_after=created_after, **get_list_params(params),
+    )
+    return '200 OK', iter_json_page('vms', page)
 
 def create_vm_handler(environ, *args):
     token_data = authorize_and_get_token_data(environ)
     data = get_request_data(environ)
-    vm_name, vm_uuid = environ['services']['compute'].create_vm(
-        project_id=token_data['project_id'], **data
-    )
-    return '201 Created', json.dumps({"message": f"VM {vm_name} created.", "uuid": vm_uuid})
+    compute_service = environ['services']['compute']
+
+    # 대기열 자리를 먼저 확보해야, 작업을 받을 수 없을 때 VM 기록이 'BUILDING'으로 남지 않음
+    task = task_manager.create('create_vm', token_data['project_id'])
+    environ['unit_of_work'].after_rollback(lambda: task_manager.discard(task))
+    vm, source_filepath = compute_service.reserve_vm(project_id=token_data['project_id'], **data)
+
+    task.resource_id = vm.uuid
+    vm_uuid = vm.uuid
+    # 백그라운드 작업은 별도 세션에서 VM 기록을 읽으므로, 요청 트랜잭션이 커밋된 뒤에 시작
+    environ['unit_of_work'].after_commit(lambda: run_in_background(
+        task, lambda services, progress: services['compute'].provision_vm(vm_uuid, source_filepath, progress),
+        on_start_failure=lambda services: services['compute'].fail_provisioning(vm_uuid),
+    ))
+    return '202 Accepted', json.dumps({"message": f"VM {vm.name} is being created.", "uuid": vm_uuid, "task_id": task.id})
+
+def get_batch_items(data, key):
+    items = data.get(key)
+    if not isinstance(items, list) or not items:
+        raise ValueError(f"'{key}' must be a non-empty list.")
+    if len(items) > config.BATCH_MAX_SIZE:
+        raise ValueError(f"A batch can contain at most {config.BATCH_MAX_SIZE} items.")
+    return items
+
+def batch_create_vms_handler(environ, *args):
+    token_data = authorize_and_get_token_data(environ)
+    vm_specs = get_batch_items(get_request_data(environ), 'vms')
+    results = environ['services']['compute'].create_vms(token_data['project_id'], vm_specs, config.BATCH_CONCURRENCY)
+    return '200 OK', json.dumps({"results": results})
+
+def batch_delete_vms_handler(environ, *args):
+    token_data = authorize_and_get_token_data(environ)
+    vm_names = get_batch_items(get_request_data(environ), 'names')
+    results = environ['services']['compute'].destroy_vms(token_data['project_id'], vm_names, config.BATCH_CONCURRENCY)
+    return '200 OK', json.dumps({"results": results})
 
 def delete_vm_handler(environ, vm_name):
     token_data = authorize_and_get_token_data(environ)
     environ['services']['compute'].destroy_vm(token_data['project_id'], vm_name)
     return '200 OK', json.dumps({"message": f"VM '{vm_name}' deleted."})
 
+def create_image_handler(environ, *args):
+    token_data = authorize_and_get_token_data(environ)
+    data = get_request_data(environ)
+    image_service = environ['services']['image']
+    source_path = data.pop('source_path', None)
+    if source_path is None:
+        image = image_service.create_image(**data)
+        return '201 Created', json.dumps(image)
+
+    # 서버의 로컬 파일 가져오기는 이미지 크기만큼 걸리므로 백그라운드 작업으로 실행
+    image_service.check_import_path(source_path)
+    task = task_manager.create('import_image', token_data['project_id'])
+    environ['unit_of_work'].after_rollback(lambda: task_manager.discard(task))
+    image = image_service.create_image(**data)
+    image_id = image['id']
+    task.resource_id = str(image_id)
+    environ['unit_of_work'].after_commit(lambda: run_in_background(
+        task, lambda services, progress: services['image'].import_image_file(image_id, source_path, progress)
+    ))
+    return '202 Accepted', json.dumps({**image, "task_id": task.id})
+
+def get_image_handler(environ, image_id):
+    authorize_and_get_token_data(environ)
+    image = environ['services']['image'].get_image(int(image_id))
+    return '200 OK', json.dumps(image)
+
+def upload_image_file_handler(environ, image_id):
+    # 본문은 이미지 파일 자체이므로 JSON으로 읽지 않고 wsgi.input에서 청크 단위로 스트리밍
+    authorize_and_get_token_data(environ)
+    params = get_query_params(environ)
+    try:
+        length = int(environ.get("CONTENT_LENGTH") or "")
+        offset = int(params.get("offset", 0))
+    except ValueError:
+        raise ValueError("A 'Content-Length' header and an integer 'offset' are required.")
+    if length < 0 or offset < 0:
+        raise ValueError("'Content-Length' and 'offset' must not be negative.")
+    image = environ['services']['image'].upload_image_file(
+        int(image_id), environ['wsgi.input'], length, offset=offset, complete=params.get('complete') != 'false',
+    )
+    return '200 OK', json.dumps(image)
+
+def get_task_handler(environ, task_id):
+    token_data = authorize_and_get_token_data(environ)
+    task = task_manager.get(task_id, token_data['project_id'])
+    return '200 OK', json.dumps(task)
+
 def reconcile_vms_handler(environ, *args):
-    ghost_vms = environ['services']['compute'].reconcile_vms()
-    return '200 OK', json.dumps({"ghost_vms": ghost_vms})
+    result = environ['services']['reconcile'].reconcile()
+    return '200 OK', json.dumps(result)
+
+def reconcile_stats_handler(environ, *args):
+    return '200 OK', json.dumps(reconcile_stats.to_dict())
+
+def metrics_handler(environ, *args):
+    # Prometheus가 수집하는 엔드포인트이므로 인증하지 않음 (운영 환경에서는 내부망에서만 노출)
+    return '200 OK', metrics.REGISTRY.render(), {"Content-Type": metrics.CONTENT_TYPE}
 
 def auth_tokens_handler(environ, *args):
     data = get_request_data(environ)
     token = environ['services']['identity'].authenticate(**data)
     return '201 Created', json.dumps(token)
 
+def revoke_token_handler(environ, *args):
+    auth_token = environ.get('HTTP_X_AUTH_TOKEN')
+    if not auth_token:
+        raise TokenInvalidError("Missing 'X-Auth-Token' header.")
+    environ['services']['identity'].revoke_token(auth_token)
+    return '200 OK', json.dumps({"message": "Token revoked."})
+
 def create_project_handler(environ, *args):
     data = get_request_data(environ)
     project = environ['services']['identity'].create_project(data.get('name'))
     return '201 Created', json.dumps(project)
 
 def list_projects_handler(environ, *args):
-    projects = environ['services']['identity'].list_projects()
-    return '200 OK', json.dumps({"projects": projects})
+    params = get_query_params(environ)
+    page = environ['services']['identity'].list_projects(name_prefix=params.get('name_prefix') or None, **get_list_params(params))
+    return '200 OK', iter_json_page('projects', page)
 
 def get_project_handler(environ, project_id):
     project = environ['services']['identity'].get_project(int(project_id))
@@ -167,14 +573,27 @@ def delete_project_handler(environ, project_id):
     environ['services']['identity'].delete_project(int(project_id))
     return '204 No Content', ''
 
+def get_project_quotas_handler(environ, project_id):
+    quotas = environ['services']['quota'].get_quotas(int(project_id))
+    return '200 OK', json.dumps(quotas)
+
+def update_project_quotas_handler(environ, project_id):
+    data = get_request_data(environ)
+    limits = data.get('quotas')
+    if not isinstance(limits, dict):
+        raise ValueError("'quotas' must be an object of resource limits.")
+    quotas = environ['services']['quota'].set_quotas(int(project_id), limits)
+    return '200 OK', json.dumps(quotas)
+
 def create_user_handler(environ, *args):
     data = get_request_data(environ)
     user = environ['services']['identity'].create_user(**data)
     return '201 Created', json.dumps(user)
 
 def list_users_handler(environ, *args):
-    users = environ['services']['identity'].list_users()
-    return '200 OK', json.dumps({"users": users})
+    params = get_query_params(environ)
+    page = environ['services']['identity'].list_users(username_prefix=params.get('username_prefix') or None, **get_list_params(params))
+    return '200 OK', iter_json_page('users', page)
 
 def get_user_handler(environ, user_id):
     user = environ['services']['identity'].get_user(int(user_id))
@@ -196,14 +615,104 @@ def revoke_role_handler(environ, project_id, user_id, role_name):
     environ['services']['identity'].revoke_role(int(user_id), int(project_id), role_name)
     return '204 No Content', ''
 
+# --------------------------------------------------------------------------
+## 라우팅 테이블 (모듈 로드 시 한 번만 컴파일)
+# --------------------------------------------------------------------------
+
+ROUTER = Router([
+    ('GET', r'^/v1/vms$', list_vms_handler),
+    ('POST', r'^/v1/vms$', create_vm_handler),
+    ('POST', r'^/v1/vms:batch$', batch_create_vms_handler),
+    ('DELETE', r'^/v1/vms:batch$', batch_delete_vms_handler),
+    ('DELETE', r'^/v1/vms/([a-zA-Z0-9_-]+)$', delete_vm_handler),
+    ('POST', r'^/v1/images$', create_image_handler),
+    ('GET', r'^/v1/images/([0-9]+)$', get_image_handler),
+    ('PUT', r'^/v1/images/([0-9]+)/file$', upload_image_file_handler),
+    ('GET', r'^/v1/tasks/([a-f0-9-]+)$', get_task_handler),
+    ('POST', r'^/v1/actions/reconcile$', reconcile_vms_handler),
+    ('GET', r'^/v1/actions/reconcile$', reconcile_stats_handler),
+    ('POST', r'^/v1/auth/tokens$', auth_tokens_handler),
+    ('DELETE', r'^/v1/auth/tokens$', revoke_token_handler),
+    ('POST', r'^/v1/projects$', create_project_handler),
+    ('GET', r'^/v1/projects$', list_projects_handler),
+    ('GET', r'^/v1/projects/([0-9]+)$', get_project_handler),
+    ('DELETE', r'^/v1/projects/([0-9]+)$', delete_project_handler),
+    ('GET', r'^/v1/projects/([0-9]+)/quotas$', get_project_quotas_handler),
+    ('PUT', r'^/v1/projects/([0-9]+)/quotas$', update_project_quotas_handler),
+    ('GET', r'^/v1/projects/([0-9]+)/users$', list_project_members_handler),
+    ('PUT', r'^/v1/projects/([0-9]+)/users/([0-9]+)/roles/([a-zA-Z]+)$', assign_role_handler),
+    ('DELETE', r'^/v1/projects/([0-9]+)/users/([0-9]+)/roles/([a-zA-Z]+)$', revoke_role_handler),
+    ('POST', r'^/v1/users$', create_user_handler),
+    ('GET', r'^/v1/users$', list_users_handler),
+    ('GET', r'^/v1/users/([0-9]+)$', get_user_handler),
+    ('DELETE', r'^/v1/users/([0-9]+)$', delete_user_handler),
+    ('GET', r'^/metrics$', metrics_handler),
+])
+
 # --------------------------------------------------------------------------
 ## 서버 실행
 # --------------------------------------------------------------------------
 
+def serve():
+    """
+    설정된 모드로 HTTP 서버를 실행합니다.
+
+    SIGINT/SIGTERM을 받으면 새 요청 수락을 멈추고, 처리 중인 요청이 끝난 뒤
+    libvirt 연결 등 프로세스 전역 자원을 정리하고 종료합니다.
+    """
+    if config.SERVER_MODE == "threaded":
+        httpd = ThreadPoolWSGIServer(
+            (config.SERVER_HOST, config.SERVER_PORT), application,
+            workers=config.SERVER_WORKERS,
+            max_pending=config.SERVER_MAX_PENDING,
+            keepalive_timeout=config.SERVER_KEEPALIVE_TIMEOUT,
+        )
+        mode = f"threaded, {config.SERVER_WORKERS} workers"
+    else:
+        httpd = make_server(config.SERVER_HOST, config.SERVER_PORT, application)
+        mode = "simple"
+
+    def request_shutdown(signum, frame):
+        # shutdown()은 serve_forever 루프가 끝날 때까지 블록하므로 별도 스레드에서 호출
+        threading.Thread(target=httpd.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGINT, request_shutdown)
+    signal.signal(signal.SIGTERM, request_shutdown)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    load_scheduler_state()
+    if disk_pool is not None:
+        start_disk_pool()
+    if domain_state_cache is not None:
+        domain_state_cache.start()
+    reconcile_loop = None
+    if config.RECONCILE_INTERVAL_SEC > 0:
+        reconcile_loop = ReconcileLoop(run_scheduled_reconcile, config.RECONCILE_INTERVAL_SEC)
+        reconcile_loop.start()
+
+    try:
+        print(f"Serving IaaS Monolith Prototype on port {config.SERVER_PORT} ({mode})...")
+        httpd.serve_forever()
+    finally:
+        print("Shutting down...")
+        httpd.server_close()
+        if reconcile_loop is not None:
+            reconcile_loop.stop()
+        task_manager.shutdown(wait=True)
+        if disk_pool is not None:
+            disk_pool.stop()
+        if domain_state_cache is not None:
+            domain_state_cache.stop()
+        for manager in host_connections.values():
+            manager.close()
+        if storage_helper is not None:
+            storage_helper.close()
+        token_repo.close()
+        password_hasher.shutdown()
+        tracer.close()
+
 if __name__ == "__main__":
     try:
-        with make_server("", 8000, application) as httpd:
-            print("Serving IaaS Monolith Prototype on port 8000...")
-            httpd.serve_forever()
+        serve()
     except Exception as e:
-        print(f"Error starting server: {e}", file=sys.stderr)
\ No newline at end of file
+        print(f"Error starting server: {e}", file=sys.stderr)
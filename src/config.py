@@ -0,0 +1,199 @@
+# src/config.py
+"""
+애플리케이션 전역 설정값을 정의합니다.
+
+모든 값은 환경 변수로 덮어쓸 수 있으며, 값이 없으면 개발 환경(Dev-VM) 기준의
+기본값을 사용합니다. 코드 수정 없이 배포 환경을 바꿀 수 있도록 설정값은
+이 모듈에서만 읽어오고, 각 계층에서는 이 모듈을 참조합니다.
+"""
+import json
+import os
+
+
+def _env_str(name: str, default: str) -> str:
+    return os.environ.get(name, default)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Environment variable '{name}' must be an integer, got '{value}'.")
+
+
+def _env_json(name: str, default):
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return json.loads(value)
+    except ValueError:
+        raise ValueError(f"Environment variable '{name}' must be valid JSON, got '{value}'.")
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Environment variable '{name}' must be a number, got '{value}'.")
+
+
+# --- Server ---
+# 'simple': 개발용 wsgiref 단일 스레드 서버, 'threaded': 운영용 스레드 풀 서버
+SERVER_MODE = _env_str("IAAS_SERVER_MODE", "simple")
+SERVER_HOST = _env_str("IAAS_SERVER_HOST", "")
+SERVER_PORT = _env_int("IAAS_SERVER_PORT", 8000)
+SERVER_WORKERS = _env_int("IAAS_SERVER_WORKERS", 16)
+SERVER_MAX_PENDING = _env_int("IAAS_SERVER_MAX_PENDING", 64)
+SERVER_KEEPALIVE_TIMEOUT = _env_float("IAAS_SERVER_KEEPALIVE_TIMEOUT", 5.0)
+
+# --- Database ---
+DATABASE_URL = _env_str("IAAS_DATABASE_URL", "sqlite:///iaas_metadata.db")
+# SQLite 엔진 프로필 (커넥션이 열릴 때 PRAGMA로 적용)
+DB_JOURNAL_MODE = _env_str("IAAS_DB_JOURNAL_MODE", "WAL")
+DB_SYNCHRONOUS = _env_str("IAAS_DB_SYNCHRONOUS", "NORMAL")
+DB_BUSY_TIMEOUT_MS = _env_int("IAAS_DB_BUSY_TIMEOUT_MS", 5000)
+DB_CACHE_SIZE_KB = _env_int("IAAS_DB_CACHE_SIZE_KB", 64 * 1024)
+DB_MMAP_SIZE = _env_int("IAAS_DB_MMAP_SIZE", 256 * 1024 * 1024)
+# 커넥션 풀: 서버 워커 수 이상으로 두어야 요청이 커넥션을 기다리지 않음
+DB_POOL_SIZE = _env_int("IAAS_DB_POOL_SIZE", 16)
+DB_MAX_OVERFLOW = _env_int("IAAS_DB_MAX_OVERFLOW", 8)
+DB_POOL_TIMEOUT = _env_float("IAAS_DB_POOL_TIMEOUT", 10.0)
+
+# --- Hypervisor ---
+LIBVIRT_URI = _env_str("IAAS_LIBVIRT_URI", "qemu:///system")
+# 도메인 상태 캐시: 'events'는 라이프사이클 이벤트 구독 + 주기적 전체 동기화,
+# 'poll'은 주기적 전체 동기화만, 'off'는 목록 조회마다 하이퍼바이저 스냅샷을 가져옴
+STATE_CACHE_MODE = _env_str("IAAS_STATE_CACHE", "events")
+STATE_CACHE_RESYNC_SEC = _env_float("IAAS_STATE_CACHE_RESYNC_SEC", 30.0)
+
+# --- Scheduler ---
+# VM을 배치할 하이퍼바이저 목록. JSON 배열: [{"name": "node1", "uri": "qemu+ssh://node1/system",
+# "vcpus": 32, "ram_mb": 131072, "disk_gb": 2000}, ...]. 용량을 생략하면 서버 시작 시 하이퍼바이저에서 조회합니다.
+# 첫 번째 호스트는 도메인 상태 캐시와 정합성 검사의 대상이며, 호스트가 기록되지 않은 기존 VM의 호스트로 간주됩니다.
+COMPUTE_HOSTS = _env_json("IAAS_COMPUTE_HOSTS", [{"name": "local", "uri": LIBVIRT_URI}])
+# 물리 용량 대비 할당 가능한 배수 (overcommit)
+CPU_ALLOCATION_RATIO = _env_float("IAAS_CPU_ALLOCATION_RATIO", 4.0)
+RAM_ALLOCATION_RATIO = _env_float("IAAS_RAM_ALLOCATION_RATIO", 1.0)
+DISK_ALLOCATION_RATIO = _env_float("IAAS_DISK_ALLOCATION_RATIO", 1.0)
+# 호스트 가중치 = RAM 배수 x 여유 RAM(GB) + CPU 배수 x 여유 vCPU. 양수면 분산(spread), 음수면 채우기(stack)
+SCHEDULER_RAM_WEIGHT = _env_float("IAAS_SCHEDULER_RAM_WEIGHT", 1.0)
+SCHEDULER_CPU_WEIGHT = _env_float("IAAS_SCHEDULER_CPU_WEIGHT", 0.0)
+# 같은 프로젝트 VM의 분산: 'off', 'soft'(가능하면 다른 호스트), 'hard'(반드시 다른 호스트)
+SCHEDULER_ANTI_AFFINITY = _env_str("IAAS_SCHEDULER_ANTI_AFFINITY", "soft")
+
+# --- Image Catalog Cache ---
+# 이미지 메타데이터를 재사용할 시간(초). 0이면 캐시하지 않고 VM 생성마다 DB를 조회합니다.
+# (이 프로세스에서 이미지 레코드가 바뀌면 TTL과 관계없이 즉시 무효화됩니다)
+IMAGE_CACHE_TTL_SEC = _env_float("IAAS_IMAGE_CACHE_TTL_SEC", 300.0)
+# 이미지 파일 존재 확인 결과를 재사용할 시간(초)
+IMAGE_FILE_CHECK_TTL_SEC = _env_float("IAAS_IMAGE_FILE_CHECK_TTL_SEC", 30.0)
+
+# --- Image Upload ---
+# 이미지와 VM 디스크 파일을 두는 디렉터리. root 소유이므로 이 디렉터리의 파일 작업은 권한 헬퍼나 sudo로 수행합니다.
+IMAGE_DIR = _env_str("IAAS_IMAGE_DIR", "/var/lib/libvirt/images")
+# 업로드/가져오기 중인 이미지 파일을 쓰는 디렉터리. 서버 프로세스가 쓸 수 있어야 하며, 다 받은 파일은
+# IMAGE_DIR로 옮깁니다. 권한 헬퍼를 쓰면 이 디렉터리도 헬퍼의 허용 디렉터리(--allow)에 포함해야 합니다.
+IMAGE_UPLOAD_DIR = _env_str("IAAS_IMAGE_UPLOAD_DIR", "image-uploads")
+# 이미지 파일을 받거나 복사할 때 한 번에 처리하는 크기(바이트)
+IMAGE_UPLOAD_CHUNK_BYTES = _env_int("IAAS_IMAGE_UPLOAD_CHUNK_BYTES", 1024 * 1024)
+# 서버의 로컬 파일을 이미지로 가져올 수 있는 디렉터리 목록. JSON 배열: ["/srv/images"]
+# 비어 있으면 POST /v1/images의 source_path(로컬 파일 가져오기)를 허용하지 않습니다.
+IMAGE_IMPORT_DIRS = _env_json("IAAS_IMAGE_IMPORT_DIRS", [])
+
+# --- Warm Disk Pool ---
+# 미리 만들어 둘 오버레이 디스크 수. JSON 객체: {"Ubuntu-Base-22.04": {"high": 4, "low": 2}, ...}
+# 남은 오버레이가 low개보다 적어지면 high개까지 다시 채웁니다. 비어 있으면 풀을 사용하지 않습니다.
+DISK_POOL_IMAGES = _env_json("IAAS_DISK_POOL_IMAGES", {})
+# 준비된 오버레이를 보관할 디렉터리. VM 디스크 디렉터리와 같은 파일 시스템이어야 합니다(rename으로 옮김).
+# 디렉터리 생성과 오버레이 이동은 디스크 생성과 같은 권한 경로(권한 헬퍼 또는 sudo)로 수행하므로,
+# 헬퍼를 쓰면 이 디렉터리가 헬퍼의 허용 디렉터리(--allow) 안에 있어야 합니다.
+DISK_POOL_DIR = _env_str("IAAS_DISK_POOL_DIR", os.path.join(IMAGE_DIR, ".warm-pool"))
+# 요청이 없어도 기반 이미지 변경과 부족분을 확인하는 주기(초)
+DISK_POOL_CHECK_INTERVAL_SEC = _env_float("IAAS_DISK_POOL_CHECK_INTERVAL_SEC", 30.0)
+
+# --- Storage Helper ---
+# 디스크 작업(오버레이 생성, 삭제)을 대신 수행하는 권한 헬퍼의 Unix 소켓 경로 (`make storage-helper`로 실행).
+# 비어 있으면 작업마다 sudo로 qemu-img/rm을 실행합니다.
+STORAGE_HELPER_SOCKET = _env_str("IAAS_STORAGE_HELPER_SOCKET", "")
+# 디스크 작업 하나의 응답을 기다릴 최대 시간(초)
+STORAGE_HELPER_TIMEOUT_SEC = _env_float("IAAS_STORAGE_HELPER_TIMEOUT_SEC", 120.0)
+
+# --- Quotas ---
+# 프로젝트별 한도가 설정되지 않은 자원의 기본 한도 (-1은 무제한). 프로젝트별 한도는 PUT /v1/projects/{id}/quotas로 설정합니다.
+QUOTA_INSTANCES = _env_int("IAAS_QUOTA_INSTANCES", 10)
+QUOTA_VCPUS = _env_int("IAAS_QUOTA_VCPUS", 20)
+QUOTA_RAM_MB = _env_int("IAAS_QUOTA_RAM_MB", 51200)
+QUOTA_DISK_GB = _env_int("IAAS_QUOTA_DISK_GB", -1)
+
+# --- Auth Tokens ---
+# 'memory': 프로세스 메모리(재시작 시 소멸), 'sqlite': 모든 워커 프로세스가 공유하는 SQLite 파일
+TOKEN_STORE = _env_str("IAAS_TOKEN_STORE", "memory")
+TOKEN_DB_PATH = _env_str("IAAS_TOKEN_DB_PATH", "iaas_tokens.db")
+TOKEN_TTL_SEC = _env_int("IAAS_TOKEN_TTL_SEC", 3600)
+# 메모리 저장소에 보관할 최대 토큰 수 (초과 시 가장 오래 사용되지 않은 토큰부터 제거)
+TOKEN_MAX_ENTRIES = _env_int("IAAS_TOKEN_MAX_ENTRIES", 100_000)
+# 'opaque': 저장소에 보관하는 무작위 토큰, 'signed': 저장소 없이 검증하는 HMAC 서명 토큰
+TOKEN_FORMAT = _env_str("IAAS_TOKEN_FORMAT", "opaque")
+# 서명 토큰의 비밀 키. 모든 워커 프로세스가 같은 값을 사용해야 하며,
+# 비어 있으면 프로세스 시작 시 무작위 키를 생성합니다. (재시작하면 기존 토큰은 무효)
+TOKEN_SECRET = _env_str("IAAS_TOKEN_SECRET", "")
+
+# --- Passwords ---
+# 새 비밀번호 해시에 사용할 KDF: 'scrypt' 또는 'pbkdf2_sha256'. 작업 계수는 해시 문자열에 함께 기록되며,
+# 설정과 다른 해시(구버전 SHA-256 포함)는 다음 로그인 성공 시 다시 해시됩니다.
+PASSWORD_HASH_ALGORITHM = _env_str("IAAS_PASSWORD_HASH_ALGORITHM", "scrypt")
+PASSWORD_SCRYPT_N = _env_int("IAAS_PASSWORD_SCRYPT_N", 2 ** 14)
+PASSWORD_SCRYPT_R = _env_int("IAAS_PASSWORD_SCRYPT_R", 8)
+PASSWORD_SCRYPT_P = _env_int("IAAS_PASSWORD_SCRYPT_P", 1)
+PASSWORD_PBKDF2_ITERATIONS = _env_int("IAAS_PASSWORD_PBKDF2_ITERATIONS", 600_000)
+# 동시에 실행할 수 있는 최대 KDF 수
+PASSWORD_HASH_WORKERS = _env_int("IAAS_PASSWORD_HASH_WORKERS", 4)
+# 검증에 성공한 자격 증명을 캐시할 시간(초)과 최대 개수. 0이면 캐시하지 않습니다.
+PASSWORD_CACHE_TTL_SEC = _env_float("IAAS_PASSWORD_CACHE_TTL_SEC", 0.0)
+PASSWORD_CACHE_MAX_ENTRIES = _env_int("IAAS_PASSWORD_CACHE_MAX_ENTRIES", 1024)
+
+# --- Batch API ---
+# 일괄 생성/삭제 요청 하나에 담을 수 있는 최대 VM 수와, 동시에 프로비저닝할 최대 VM 수
+BATCH_MAX_SIZE = _env_int("IAAS_BATCH_MAX_SIZE", 100)
+BATCH_CONCURRENCY = _env_int("IAAS_BATCH_CONCURRENCY", 8)
+
+# --- List API ---
+# 목록 조회(GET /v1/vms, /v1/users, /v1/projects)의 기본 페이지 크기와 최대 페이지 크기
+# (목록 응답은 스트리밍되므로 페이지가 커도 서버의 메모리 사용량은 일정합니다)
+LIST_DEFAULT_LIMIT = _env_int("IAAS_LIST_DEFAULT_LIMIT", 100)
+LIST_MAX_LIMIT = _env_int("IAAS_LIST_MAX_LIMIT", 100_000)
+
+# --- Background Tasks ---
+# VM 프로비저닝 등 비동기 작업을 실행할 워커 수와, 동시에 대기/실행할 수 있는 최대 작업 수
+TASK_WORKERS = _env_int("IAAS_TASK_WORKERS", 8)
+TASK_MAX_PENDING = _env_int("IAAS_TASK_MAX_PENDING", 256)
+
+# --- Reconcile ---
+# DB와 하이퍼바이저의 정합성 검사 주기(초). 0이면 주기적으로 실행하지 않습니다. (POST /v1/actions/reconcile로만 실행)
+RECONCILE_INTERVAL_SEC = _env_float("IAAS_RECONCILE_INTERVAL_SEC", 300.0)
+# 불일치 종류별 조치 정책
+# - 하이퍼바이저에만 있는 도메인: 'report', 'adopt'(RECONCILE_ADOPT_PROJECT_ID 프로젝트에 등록), 'destroy'
+# - DB에만 있는 VM: 'report', 'mark_error'
+# - 상태 불일치: 'report', 'sync'(DB의 상태를 실제 상태로 갱신)
+RECONCILE_GHOST_POLICY = _env_str("IAAS_RECONCILE_GHOST_POLICY", "report")
+RECONCILE_MISSING_POLICY = _env_str("IAAS_RECONCILE_MISSING_POLICY", "report")
+RECONCILE_STATE_POLICY = _env_str("IAAS_RECONCILE_STATE_POLICY", "sync")
+RECONCILE_ADOPT_PROJECT_ID = _env_int("IAAS_RECONCILE_ADOPT_PROJECT_ID", 0)
+# 한 번에 커밋할 VM 상태 변경 수
+RECONCILE_BATCH_SIZE = _env_int("IAAS_RECONCILE_BATCH_SIZE", 500)
+
+# --- Tracing ---
+# 요청과 백그라운드 작업의 span 구성을 내보낼 곳: 'jsonl'(TRACE_FILE에 한 줄에 추적 하나), 'off'
+TRACE_EXPORTER = _env_str("IAAS_TRACE_EXPORTER", "jsonl")
+TRACE_FILE = _env_str("IAAS_TRACE_FILE", "iaas_traces.jsonl")
+# 내보낼 추적의 비율 (0.0 ~ 1.0). 느린 요청 로그는 표본 여부와 관계없이 남습니다.
+TRACE_SAMPLE_RATE = _env_float("IAAS_TRACE_SAMPLE_RATE", 0.01)
+# 이 시간(ms) 이상 걸린 요청/작업은 span 구성 전체를 경고 로그로 남깁니다. 0이면 남기지 않습니다.
+SLOW_REQUEST_MS = _env_float("IAAS_SLOW_REQUEST_MS", 1000.0)
@@ -1,16 +1,111 @@
-from sqlalchemy import create_engine
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
-# 데이터베이스 연결 문자열 (여기서는 SQLite 사용)
-# 실제 애플리케이션에서는 이 부분을 설정 파일로 분리하는 것이 좋습니다.
-SQLALCHEMY_DATABASE_URL = "sqlite:///iaas_metadata.db"
+from src import config
+from src.utils import metrics, tracing
 
-# SQLAlchemy 엔진 생성
-# connect_args는 SQLite에서만 필요합니다. (thread-safe 설정)
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+# 데이터베이스 연결 문자열은 설정(IAAS_DATABASE_URL)에서 읽어옵니다. (기본값: SQLite 파일)
+SQLALCHEMY_DATABASE_URL = config.DATABASE_URL
+
+_QUERY_SECONDS = metrics.histogram(
+    "iaas_db_query_duration_seconds", "Latency of SQL statements by statement type.", ("statement",)
 )
+_QUERY_TIMERS = {statement: _QUERY_SECONDS.labels(statement)
+                 for statement in ("SELECT", "INSERT", "UPDATE", "DELETE", "OTHER")}
+
+
+def create_db_engine(
+    url: str = SQLALCHEMY_DATABASE_URL,
+    journal_mode: str = config.DB_JOURNAL_MODE,
+    synchronous: str = config.DB_SYNCHRONOUS,
+    busy_timeout_ms: int = config.DB_BUSY_TIMEOUT_MS,
+    cache_size_kb: int = config.DB_CACHE_SIZE_KB,
+    mmap_size: int = config.DB_MMAP_SIZE,
+    pool_size: int = config.DB_POOL_SIZE,
+    max_overflow: int = config.DB_MAX_OVERFLOW,
+    pool_timeout: float = config.DB_POOL_TIMEOUT,
+) -> Engine:
+    """
+    설정된 엔진 프로필로 SQLAlchemy 엔진을 생성합니다.
+
+    SQLite 파일 DB이면 크기가 정해진 커넥션 풀을 사용하고, 커넥션이 새로 열릴 때마다
+    아래 PRAGMA를 적용합니다.
+    - journal_mode=WAL: 읽기가 쓰기에 막히지 않고, 쓰기 커밋 비용이 줄어듭니다.
+    - busy_timeout: 다른 커넥션이 쓰는 중이면 즉시 'database is locked'를 내지 않고 기다립니다.
+    - synchronous=NORMAL: WAL 모드에서 안전한 수준으로 커밋마다의 fsync를 줄입니다.
+    - cache_size, mmap_size: 커넥션별 페이지 캐시와 메모리 매핑 크기.
+
+    Args:
+        url: 데이터베이스 연결 문자열.
+        journal_mode, synchronous, busy_timeout_ms, cache_size_kb, mmap_size: SQLite PRAGMA 값.
+        pool_size, max_overflow, pool_timeout: 커넥션 풀 크기, 초과 허용 수, 커넥션 대기 시간(초).
+    """
+    if not url.startswith("sqlite"):
+        return _track_query_durations(
+            create_engine(url, pool_size=pool_size, max_overflow=max_overflow, pool_timeout=pool_timeout)
+        )
+
+    if url in ("sqlite://", "sqlite:///:memory:"):
+        # 인메모리 DB는 커넥션마다 별도의 DB이므로 풀/저널 설정을 적용하지 않음
+        return _track_query_durations(create_engine(url, connect_args={"check_same_thread": False}))
+
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False, "timeout": busy_timeout_ms / 1000},
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+            cursor.execute(f"PRAGMA synchronous={synchronous}")
+            cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+            cursor.execute(f"PRAGMA cache_size={-int(cache_size_kb)}")  # 음수는 KiB 단위
+            cursor.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        finally:
+            cursor.close()
+
+    return _track_query_durations(engine)
+
+
+def _track_query_durations(engine: Engine) -> Engine:
+    """
+    엔진이 실행하는 SQL 문의 소요 시간을 문장 종류(SELECT, INSERT, ...)별 히스토그램에 기록하고,
+    진행 중인 추적이 있으면 'db.<종류>' span으로도 남깁니다.
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _observe(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        elapsed = time.perf_counter() - started
+        keyword = statement.lstrip()[:6].upper()
+        (_QUERY_TIMERS.get(keyword) or _QUERY_TIMERS["OTHER"]).observe(elapsed)
+        tracing.record_span(f"db.{keyword.lower() if keyword in _QUERY_TIMERS else 'other'}", started, elapsed,
+                            statement=statement[:200])
+
+    @event.listens_for(engine, "handle_error")
+    def _discard_timer(context):
+        # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 버림
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
+
+    return engine
+
+
+# SQLAlchemy 엔진 생성
+engine = create_db_engine()
 
 # 데이터베이스 세션 생성을 위한 SessionLocal 클래스
 # autocommit=False, autoflush=False로 설정하여, 명시적으로 commit을 호출해야 DB에 반영됩니다.
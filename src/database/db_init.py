@@ -1,6 +1,8 @@
-import hashlib
-from .database import engine, SessionLocal, Base
+from .database import engine, SessionLocal
+from .migrations import upgrade
 from .models import *
+from src import config
+from src.utils.password_hasher import PasswordHasher
 
 def initialize_db():
     """
@@ -9,9 +11,9 @@ def initialize_db():
     """
     print("DB 초기화 중 (SQLAlchemy 사용)...")
 
-    # 모든 테이블을 생성합니다. (이미 존재하면 생성하지 않음)
-    Base.metadata.create_all(bind=engine)
-    print("테이블 생성 완료.")
+    # 테이블을 생성하거나, 기존 DB 파일이면 최신 스키마 버전으로 마이그레이션합니다.
+    version = upgrade(engine)
+    print(f"테이블 생성/마이그레이션 완료. (스키마 버전 {version})")
 
     db = SessionLocal()
     try:
@@ -34,7 +36,12 @@ def initialize_db():
 
         # User
         password = 'admin'
-        password_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
+        password_hash = PasswordHasher(
+            algorithm=config.PASSWORD_HASH_ALGORITHM,
+            scrypt_n=config.PASSWORD_SCRYPT_N, scrypt_r=config.PASSWORD_SCRYPT_R, scrypt_p=config.PASSWORD_SCRYPT_P,
+            pbkdf2_iterations=config.PASSWORD_PBKDF2_ITERATIONS,
+            workers=0,
+        ).hash(password)
         admin_user = User(username='admin', password_hash=password_hash)
         db.add(admin_user)
         
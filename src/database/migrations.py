@@ -0,0 +1,126 @@
+# src/database/migrations.py
+from typing import List, Tuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from .database import Base, engine as default_engine
+from . import models  # noqa: F401  (모든 모델을 Base.metadata에 등록)
+
+# 스키마 버전은 SQLite 파일 헤더의 PRAGMA user_version에 기록합니다.
+# 버전 0은 마이그레이션 도입 이전에 create_all()로 만들어진 스키마입니다.
+#
+# 각 항목은 (설명, SQL 목록)이며, i번째 항목을 적용하면 버전 i+1이 됩니다.
+# 이미 배포된 항목은 수정하지 말고, 스키마를 바꿀 때는 항목을 뒤에 추가하고 모델도 함께 고칩니다.
+# (SQL은 당시 스키마 기준으로 고정해야 하므로 모델에서 생성하지 않습니다)
+MIGRATIONS: List[Tuple[str, List[str]]] = [
+    ("vms: 프로젝트별 고유 이름, project_id 복합 인덱스 / user_project_roles: project_id 인덱스", [
+        "DROP INDEX IF EXISTS ix_vms_name",
+        "CREATE UNIQUE INDEX ix_vms_project_id_name ON vms (project_id, name)",
+        "CREATE INDEX ix_vms_project_id_created_at ON vms (project_id, created_at)",
+        "CREATE INDEX ix_user_project_roles_project_id ON user_project_roles (project_id)",
+    ]),
+    ("vm_drifts: 정합성 검사에서 발견한 불일치 기록", [
+        "CREATE TABLE vm_drifts ("
+        " id INTEGER NOT NULL, vm_uuid VARCHAR NOT NULL, vm_name VARCHAR, kind VARCHAR NOT NULL,"
+        " db_state VARCHAR, hypervisor_state VARCHAR, action VARCHAR NOT NULL,"
+        " detected_at DATETIME NOT NULL, last_seen_at DATETIME NOT NULL, resolved_at DATETIME,"
+        " PRIMARY KEY (id))",
+        "CREATE INDEX ix_vm_drifts_resolved_at ON vm_drifts (resolved_at)",
+    ]),
+    ("vms: 배치된 컴퓨트 호스트와 확보한 디스크 용량", [
+        "ALTER TABLE vms ADD COLUMN host VARCHAR",
+        "ALTER TABLE vms ADD COLUMN disk_gb INTEGER",
+        "CREATE INDEX ix_vms_host ON vms (host)",
+    ]),
+    ("project_quotas, project_usage: 프로젝트별 쿼터와 사용량 카운터 (기존 VM으로 사용량 채움)", [
+        "CREATE TABLE project_quotas ("
+        " project_id INTEGER NOT NULL, instances INTEGER, vcpus INTEGER, ram_mb INTEGER, disk_gb INTEGER,"
+        " PRIMARY KEY (project_id), FOREIGN KEY(project_id) REFERENCES projects (id))",
+        "CREATE TABLE project_usage ("
+        " project_id INTEGER NOT NULL, instances INTEGER NOT NULL, vcpus INTEGER NOT NULL,"
+        " ram_mb INTEGER NOT NULL, disk_gb INTEGER NOT NULL,"
+        " PRIMARY KEY (project_id), FOREIGN KEY(project_id) REFERENCES projects (id))",
+        "INSERT INTO project_usage (project_id, instances, vcpus, ram_mb, disk_gb)"
+        " SELECT project_id, COUNT(*), SUM(cpu_count), SUM(ram_mb), COALESCE(SUM(disk_gb), 0)"
+        " FROM vms GROUP BY project_id",
+    ]),
+    ("images: 업로드 상태, 파일 크기, sha256 체크섬, 디스크 형식 (기존 이미지는 'active')", [
+        "ALTER TABLE images ADD COLUMN status VARCHAR DEFAULT 'active' NOT NULL",
+        "ALTER TABLE images ADD COLUMN size_bytes INTEGER",
+        "ALTER TABLE images ADD COLUMN checksum VARCHAR",
+        "ALTER TABLE images ADD COLUMN disk_format VARCHAR",
+    ]),
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(engine: Engine = default_engine) -> int:
+    """DB 파일에 기록된 스키마 버전을 반환합니다."""
+    raw = engine.raw_connection()
+    try:
+        return raw.driver_connection.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        raw.close()
+
+
+def upgrade(engine: Engine = default_engine) -> int:
+    """
+    DB 스키마를 최신 버전(SCHEMA_VERSION)으로 올리고, 적용 후 버전을 반환합니다.
+
+    - 테이블이 없는 새 DB는 현재 모델로 테이블과 인덱스를 만들고 최신 버전으로 기록합니다.
+    - 기존 DB는 기록된 버전 이후의 마이그레이션을 순서대로 적용합니다.
+
+    전체 작업은 BEGIN IMMEDIATE 트랜잭션 하나에서 실행됩니다. SQLite의 DDL은 트랜잭션에
+    포함되므로 중간에 실패하면 스키마와 버전이 함께 롤백되고, 여러 프로세스가 동시에
+    실행해도 한 프로세스만 마이그레이션을 적용합니다.
+
+    Raises:
+        RuntimeError: DB의 스키마 버전이 이 코드가 아는 최신 버전보다 높을 때.
+    """
+    raw = engine.raw_connection()
+    conn = raw.driver_connection
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None  # BEGIN/COMMIT을 직접 관리 (pysqlite의 암묵적 트랜잭션 비활성화)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version > SCHEMA_VERSION:
+                raise RuntimeError(
+                    f"Database schema version {version} is newer than this code supports ({SCHEMA_VERSION})."
+                )
+
+            has_tables = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' LIMIT 1"
+            ).fetchone() is not None
+            if not has_tables:
+                _create_current_schema(conn, engine)
+            else:
+                for _, statements in MIGRATIONS[version:]:
+                    for statement in statements:
+                        conn.execute(statement)
+
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return SCHEMA_VERSION
+    finally:
+        conn.isolation_level = isolation_level
+        raw.close()
+
+
+def _create_current_schema(conn, engine: Engine):
+    for table in Base.metadata.sorted_tables:
+        conn.execute(str(CreateTable(table).compile(dialect=engine.dialect)))
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            conn.execute(str(CreateIndex(index).compile(dialect=engine.dialect)))
+
+
+if __name__ == '__main__':
+    before = get_schema_version()
+    after = upgrade()
+    print(f"DB 스키마 버전: {before} -> {after}")
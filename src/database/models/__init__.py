@@ -4,3 +4,5 @@ from .role import Role
 from .vm import VM
 from .image import Image
 from .association import UserProjectRole
+from .drift import VMDrift
+from .quota import ProjectQuota, ProjectUsage, QUOTA_RESOURCES
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 
@@ -9,6 +9,8 @@ class UserProjectRole(Base):
     어떤 사용자가 어떤 프로젝트에서 어떤 역할을 가지는지를 명시적으로 정의합니다.
     """
     __tablename__ = 'user_project_roles'
+    # 기본 키는 user_id로 시작하므로, 프로젝트 멤버 조회(project_id 조건)를 위한 인덱스를 따로 둡니다.
+    __table_args__ = (Index('ix_user_project_roles_project_id', 'project_id'),)
     user_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
     project_id = Column(Integer, ForeignKey('projects.id'), primary_key=True)
     role_id = Column(Integer, ForeignKey('roles.id'), primary_key=True)
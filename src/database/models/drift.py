@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from ..database import Base
+
+class VMDrift(Base):
+    """
+    정합성 검사(reconcile)에서 발견한 DB와 하이퍼바이저 사이의 불일치 기록입니다.
+
+    - kind: 'ghost'(하이퍼바이저에만 있는 도메인), 'missing'(DB에만 있는 VM), 'state'(상태 불일치)
+    - action: 적용한 조치. 'reported'는 아직 해소되지 않은 불일치이며, 다음 검사에서도 발견되면
+      새 행을 만들지 않고 last_seen_at만 갱신합니다. 조치했거나 더 이상 발견되지 않으면 resolved_at이 기록됩니다.
+    """
+    __tablename__ = "vm_drifts"
+    # 미해결 불일치(resolved_at IS NULL)를 검사마다 조회합니다.
+    __table_args__ = (Index("ix_vm_drifts_resolved_at", "resolved_at"),)
+    id = Column(Integer, primary_key=True)
+    vm_uuid = Column(String, nullable=False)
+    vm_name = Column(String)
+    kind = Column(String, nullable=False)
+    db_state = Column(String)
+    hypervisor_state = Column(String)
+    action = Column(String, nullable=False)
+    detected_at = Column(DateTime, nullable=False)
+    last_seen_at = Column(DateTime, nullable=False)
+    resolved_at = Column(DateTime)
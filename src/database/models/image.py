@@ -6,6 +6,8 @@ class Image(Base):
     VM을 생성할 때 사용하는 부팅 가능한 디스크 템플릿을 정의합니다.
     (예: 'Ubuntu-22.04-Base').
     OpenStack의 'Image' 또는 AWS의 'AMI'와 동일한 개념입니다.
+
+    API로 등록한 이미지는 파일 업로드가 끝날 때까지 'queued' 상태이며, 'active' 이미지만 VM 생성에 사용합니다.
     """
     __tablename__ = "images"
     id = Column(Integer, primary_key=True, index=True)
@@ -14,3 +16,7 @@ class Image(Base):
     min_disk_gb = Column(Integer)
     min_ram_mb = Column(Integer)
     created_at = Column(DateTime, server_default=func.now())
+    status = Column(String, nullable=False, default="active", server_default="active")
+    size_bytes = Column(Integer)
+    checksum = Column(String)  # 파일 내용의 sha256 (16진수)
+    disk_format = Column(String)
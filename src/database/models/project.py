@@ -14,3 +14,5 @@ class Project(Base):
 
     vms = relationship("VM", back_populates="project", cascade="all, delete-orphan")
     user_associations = relationship("UserProjectRole", back_populates="project", cascade="all, delete-orphan")
+    quota = relationship("ProjectQuota", uselist=False, cascade="all, delete-orphan")
+    usage = relationship("ProjectUsage", uselist=False, cascade="all, delete-orphan")
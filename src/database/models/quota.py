@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from ..database import Base
+
+# 쿼터를 적용하는 자원 (ProjectQuota와 ProjectUsage의 컬럼 이름)
+QUOTA_RESOURCES = ("instances", "vcpus", "ram_mb", "disk_gb")
+
+class ProjectQuota(Base):
+    """
+    프로젝트별 자원 한도입니다. 값이 NULL인 자원은 설정(config)의 기본 한도를, -1은 무제한을 뜻합니다.
+    행이 없는 프로젝트는 모든 자원에 기본 한도를 사용합니다.
+    """
+    __tablename__ = "project_quotas"
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    instances = Column(Integer)
+    vcpus = Column(Integer)
+    ram_mb = Column(Integer)
+    disk_gb = Column(Integer)
+
+class ProjectUsage(Base):
+    """
+    프로젝트가 현재 사용 중인 자원의 합계입니다.
+
+    쿼터 검사가 vms 테이블을 집계하지 않도록, VM을 기록하거나 삭제하는 트랜잭션 안에서 함께 갱신합니다.
+    생성 중이거나 'ERROR' 상태인 VM도 삭제될 때까지 사용량에 포함됩니다.
+    """
+    __tablename__ = "project_usage"
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    instances = Column(Integer, nullable=False, default=0)
+    vcpus = Column(Integer, nullable=False, default=0)
+    ram_mb = Column(Integer, nullable=False, default=0)
+    disk_gb = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from ..database import Base
 
@@ -9,8 +9,16 @@ class VM(Base):
     OpenStack의 'Server' 또는 AWS의 'EC2 Instance'에 해당합니다.
     """
     __tablename__ = "vms"
+    __table_args__ = (
+        # VM 이름은 프로젝트 안에서만 고유하며, 이름 조회는 이 인덱스를 탐색합니다.
+        Index("ix_vms_project_id_name", "project_id", "name", unique=True),
+        # 프로젝트별 목록(created_at 내림차순)과 개수 조회를 정렬 없이 인덱스 범위 탐색으로 처리합니다.
+        Index("ix_vms_project_id_created_at", "project_id", "created_at"),
+        # 서버 시작 시 호스트별 사용량 집계와 호스트 단위 정합성 검사에 사용합니다.
+        Index("ix_vms_host", "host"),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True, nullable=False, index=True)
+    name = Column(String, nullable=False)
     uuid = Column(String, unique=True, nullable=False)
     state = Column(String, nullable=False)
     cpu_count = Column(Integer, nullable=False)
@@ -18,4 +26,8 @@ class VM(Base):
     created_at = Column(DateTime, server_default=func.now())
 
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    # 스케줄러가 배치한 컴퓨트 호스트 이름 (NULL이면 스케줄러 도입 이전의 VM으로, 기본 호스트에 있음)
+    host = Column(String)
+    # 스케줄러가 호스트에서 확보한 디스크 용량(GB)
+    disk_gb = Column(Integer)
     project = relationship("Project", back_populates="vms")
@@ -0,0 +1,87 @@
+from typing import Callable, List
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.utils import tracing
+
+
+class UnitOfWork:
+    """
+    요청(또는 백그라운드 작업) 하나의 DB 트랜잭션 경계입니다.
+
+    리포지토리는 변경 사항을 flush만 하고, 커밋과 롤백은 UnitOfWork가 수행합니다.
+    with 블록이 예외 없이 끝나면 한 번 커밋하고, 예외가 발생하면 롤백하므로
+    여러 리포지토리 호출로 이루어진 작업도 하나의 트랜잭션으로 원자적으로 반영됩니다.
+
+    - after_commit()으로 등록한 콜백은 커밋이 성공한 뒤에 실행됩니다.
+      (예: 커밋된 레코드를 다른 세션에서 읽는 백그라운드 작업 시작)
+    - after_rollback()으로 등록한 콜백은 롤백 시 실행됩니다. (예: 확보한 자원 반납)
+
+    쓰기(flush 또는 UPDATE/DELETE 문)가 없었던 트랜잭션은 커밋하지 않고 읽기 트랜잭션만 종료합니다.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]):
+        self._session_factory = session_factory
+        self.session: Session = None
+        self._after_commit: List[Callable[[], None]] = []
+        self._after_rollback: List[Callable[[], None]] = []
+        self._has_writes = False
+
+    def __enter__(self) -> "UnitOfWork":
+        self.session = self._session_factory()
+        event.listen(self.session, "after_flush", self._mark_writes)
+        event.listen(self.session, "do_orm_execute", self._mark_bulk_writes)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.session.close()
+        return False
+
+    def commit(self):
+        """
+        지금까지 flush된 변경 사항을 커밋합니다.
+
+        요청 도중에 호출하면 그 시점까지의 작업을 확정하는 체크포인트가 되며,
+        이후의 변경은 다음 커밋(보통 요청 종료 시)에 반영됩니다.
+        """
+        try:
+            if self._has_writes or self.session.new or self.session.dirty or self.session.deleted:
+                with tracing.span("db.commit"):
+                    self.session.commit()
+            else:
+                self.session.rollback()
+        except Exception:
+            self.rollback()
+            raise
+        self._has_writes = False
+        callbacks, self._after_commit, self._after_rollback = self._after_commit, [], []
+        for callback in callbacks:
+            callback()
+
+    def rollback(self):
+        """커밋하지 않은 변경 사항을 모두 되돌립니다."""
+        self.session.rollback()
+        self._has_writes = False
+        callbacks, self._after_commit, self._after_rollback = self._after_rollback, [], []
+        for callback in callbacks:
+            callback()
+
+    def after_commit(self, callback: Callable[[], None]):
+        self._after_commit.append(callback)
+
+    def after_rollback(self, callback: Callable[[], None]):
+        self._after_rollback.append(callback)
+
+    def _mark_writes(self, session, flush_context):
+        self._has_writes = True
+
+    def _mark_bulk_writes(self, orm_execute_state):
+        if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+            self._has_writes = True
@@ -1,5 +1,8 @@
 from .vm import IVMRepository
 from .image import IImageRepository
 from .project import IProjectRepository
-from .user import IUserRepository
+from .user import IUserRepository, LoginContext
 from .role import IRoleRepository
+from .token import ITokenRepository
+from .drift import IVMDriftRepository
+from .quota import IQuotaRepository
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+from src.database import models
+
+class IVMDriftRepository(ABC):
+    @abstractmethod
+    def list_open(self) -> List[models.VMDrift]:
+        """아직 해소되지 않은(resolved_at이 없는) 불일치 기록을 조회합니다."""
+        pass
+
+    @abstractmethod
+    def create_many(self, drifts: List[models.VMDrift]) -> List[models.VMDrift]:
+        """여러 불일치 기록을 한 번에 생성합니다."""
+        pass
+
+    @abstractmethod
+    def mark_seen(self, drifts: List[models.VMDrift], seen_at: datetime) -> int:
+        """이번 검사에서도 발견된 미해결 불일치의 마지막 발견 시각을 갱신합니다."""
+        pass
+
+    @abstractmethod
+    def resolve(self, drift: models.VMDrift, action: str, resolved_at: datetime) -> models.VMDrift:
+        """불일치 기록을 적용한 조치와 함께 해소 처리합니다."""
+        pass
@@ -1,9 +1,29 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from src.database import models
 
 class IImageRepository(ABC):
+    @abstractmethod
+    def create(self, image_model: models.Image) -> models.Image:
+        """새 이미지를 저장합니다."""
+        pass
+
+    @abstractmethod
+    def find_by_id(self, image_id: int) -> Optional[models.Image]:
+        """ID로 특정 이미지를 조회합니다."""
+        pass
+
     @abstractmethod
     def find_by_name(self, name: str) -> Optional[models.Image]:
         """이름으로 특정 이미지를 조회합니다."""
         pass
+
+    @abstractmethod
+    def find_by_names(self, names: List[str]) -> List[models.Image]:
+        """여러 이름에 해당하는 이미지들을 한 번의 조회로 가져옵니다."""
+        pass
+
+    @abstractmethod
+    def mark_active(self, image: models.Image, size_bytes: int, checksum: str, disk_format: str) -> models.Image:
+        """업로드가 끝난 이미지의 파일 정보를 기록하고 'active' 상태로 바꿉니다."""
+        pass
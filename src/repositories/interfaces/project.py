@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Sequence
 from src.database import models
 
 class IProjectRepository(ABC):
@@ -18,6 +18,19 @@ class IProjectRepository(ABC):
         """이름으로 특정 프로젝트를 조회합니다."""
         pass
 
+    @abstractmethod
+    def list_page(self, limit: int, columns: Sequence[str], marker: Optional[str] = None,
+                  name_prefix: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        프로젝트를 name 오름차순으로 최대 limit개 조회합니다. 결과는 순회할 때 커서에서 읽습니다.
+
+        Args:
+            columns: 조회할 컬럼 이름 목록. 결과 딕셔너리에는 이 컬럼만 들어 있습니다.
+            marker: 이전 페이지의 마지막 name. 주어지면 그 다음부터 조회합니다. (키셋 페이지네이션)
+            name_prefix: name 접두사 필터.
+        """
+        pass
+
     @abstractmethod
     def list_all(self) -> List[models.Project]:
         """모든 프로젝트의 목록을 조회합니다."""
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Mapping, Optional
+from src.database import models
+
+class IQuotaRepository(ABC):
+    @abstractmethod
+    def get_quota(self, project_id: int) -> Optional[models.ProjectQuota]:
+        """프로젝트별 한도를 조회합니다. 설정된 적이 없으면 None을 반환합니다."""
+        pass
+
+    @abstractmethod
+    def set_quota(self, project_id: int, limits: Mapping[str, Optional[int]]) -> models.ProjectQuota:
+        """프로젝트별 한도를 설정합니다. limits에 없는 자원은 기존 값을 유지합니다."""
+        pass
+
+    @abstractmethod
+    def get_usage(self, project_id: int) -> Dict[str, int]:
+        """프로젝트의 자원 사용량을 조회합니다. 기록이 없으면 모든 자원이 0입니다."""
+        pass
+
+    @abstractmethod
+    def add_usage(self, project_id: int, delta: Mapping[str, int],
+                  limits: Optional[Mapping[str, int]] = None) -> bool:
+        """
+        사용량에 delta를 더합니다. 한도 검사와 갱신은 하나의 조건부 UPDATE 문으로 처리됩니다.
+
+        Args:
+            delta: 자원 이름 -> 증감량. (음수이면 반납)
+            limits: 자원 이름 -> 한도. 주어지면 증가하는 자원이 한도를 넘을 때 갱신하지 않습니다. (-1은 무제한)
+
+        Returns:
+            갱신했으면 True, 한도를 넘어 갱신하지 않았으면 False.
+        """
+        pass
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+class ITokenRepository(ABC):
+    """
+    인증 토큰 저장소 인터페이스입니다.
+
+    토큰 데이터는 'expires_at'(datetime)을 포함한 딕셔너리이며, 저장소는 만료된 토큰을
+    주기적으로 정리하여 토큰이 무한히 쌓이지 않도록 해야 합니다.
+    """
+
+    @abstractmethod
+    def save(self, token: str, token_data: Dict[str, Any]) -> None:
+        """토큰과 토큰 데이터를 저장합니다."""
+        pass
+
+    @abstractmethod
+    def find(self, token: str) -> Optional[Dict[str, Any]]:
+        """토큰 데이터를 조회합니다. 없으면 None을 반환합니다. (만료 여부는 호출자가 확인)"""
+        pass
+
+    @abstractmethod
+    def delete(self, token: str) -> bool:
+        """토큰을 삭제합니다. 삭제한 토큰이 있으면 True를 반환합니다."""
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """만료된 토큰을 모두 삭제하고, 삭제한 개수를 반환합니다."""
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        """저장된 토큰 수를 반환합니다. (만료되었지만 아직 정리되지 않은 토큰 포함)"""
+        pass
+
+    def close(self) -> None:
+        """저장소가 사용하는 자원을 정리합니다."""
+        pass
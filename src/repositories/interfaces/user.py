@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence
 from src.database import models
 
+class LoginContext(NamedTuple):
+    """로그인에 필요한 사용자, 요청한 프로젝트(없으면 None), 그 프로젝트에서의 역할 이름 목록"""
+    user: models.User
+    project: Optional[models.Project]
+    roles: List[str]
+
 class IUserRepository(ABC):
     @abstractmethod
     def create(self, user_model: models.User) -> models.User:
@@ -18,11 +24,37 @@ class IUserRepository(ABC):
         """사용자 이름으로 특정 사용자를 조회합니다."""
         pass
 
+    @abstractmethod
+    def find_login_context(self, username: str, project_name: str) -> Optional[LoginContext]:
+        """
+        사용자, 프로젝트, 해당 프로젝트에서의 역할을 한 번의 쿼리로 조회합니다.
+        사용자가 없으면 None을, 멤버가 아니면 roles가 빈 목록인 LoginContext를 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    def list_page(self, limit: int, columns: Sequence[str], marker: Optional[str] = None,
+                  username_prefix: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        사용자를 username 오름차순으로 최대 limit개 조회합니다. 결과는 순회할 때 커서에서 읽습니다.
+
+        Args:
+            columns: 조회할 컬럼 이름 목록. 결과 딕셔너리에는 이 컬럼만 들어 있습니다.
+            marker: 이전 페이지의 마지막 username. 주어지면 그 다음부터 조회합니다. (키셋 페이지네이션)
+            username_prefix: username 접두사 필터.
+        """
+        pass
+
     @abstractmethod
     def list_all(self) -> List[models.User]:
         """모든 사용자의 목록을 조회합니다."""
         pass
 
+    @abstractmethod
+    def update(self, user: models.User) -> models.User:
+        """변경된 사용자 정보(예: 비밀번호 해시)를 저장합니다."""
+        pass
+
     @abstractmethod
     def delete(self, user: models.User) -> bool:
         """특정 사용자를 데이터베이스에서 삭제합니다."""
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from src.database import models
 
 class IVMRepository(ABC):
@@ -8,26 +9,112 @@ class IVMRepository(ABC):
         """새로운 VM 정보를 데이터베이스에 생성합니다."""
         pass
 
+    @abstractmethod
+    def create_many(self, vm_models: List[models.VM]) -> List[models.VM]:
+        """여러 VM 정보를 하나의 트랜잭션으로 데이터베이스에 생성합니다."""
+        pass
+
     @abstractmethod
     def find_by_name_and_project_id(self, name: str, project_id: int) -> Optional[models.VM]:
         """프로젝트 내에서 이름으로 특정 VM을 조회합니다."""
         pass
 
+    @abstractmethod
+    def find_by_names_and_project_id(self, names: List[str], project_id: int) -> List[models.VM]:
+        """프로젝트 내에서 여러 이름에 해당하는 VM들을 한 번의 조회로 가져옵니다."""
+        pass
+
+    @abstractmethod
+    def find_by_uuid(self, uuid: str) -> Optional[models.VM]:
+        """UUID로 특정 VM을 조회합니다."""
+        pass
+
+    @abstractmethod
+    def update_state(self, vm: models.VM, state: str) -> models.VM:
+        """VM의 상태(예: 'BUILDING', 'RUNNING', 'ERROR')를 변경합니다."""
+        pass
+
+    @abstractmethod
+    def update_states(self, states: Dict[str, str]) -> int:
+        """
+        여러 VM의 상태를 하나의 트랜잭션으로 변경합니다.
+
+        Args:
+            states: VM UUID를 키로, 새 상태를 값으로 하는 딕셔너리.
+
+        Returns:
+            변경된 행의 개수.
+        """
+        pass
+
+    @abstractmethod
+    def compare_and_set_states(self, changes: Dict[str, Tuple[str, str]]) -> int:
+        """
+        여러 VM의 상태를, 현재 상태가 예상한 값일 때만 변경합니다.
+        (조회 이후 다른 요청이 상태를 바꾼 VM은 덮어쓰지 않음)
+
+        Args:
+            changes: VM UUID를 키로, (예상 현재 상태, 새 상태)를 값으로 하는 딕셔너리.
+
+        Returns:
+            변경된 행의 개수.
+        """
+        pass
+
     @abstractmethod
     def list_by_project_id(self, project_id: int) -> List[models.VM]:
         """특정 프로젝트에 속한 모든 VM의 목록을 조회합니다."""
         pass
 
+    @abstractmethod
+    def list_page_by_project_id(self, project_id: int, limit: int, columns: Sequence[str],
+                                marker: Optional[str] = None, state: Optional[str] = None,
+                                name_prefix: Optional[str] = None,
+                                created_after: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """
+        특정 프로젝트의 VM을 최신순(created_at, id 내림차순)으로 최대 limit개 조회합니다.
+        결과는 순회할 때 커서에서 읽으므로, 세션이 열려 있는 동안 순회해야 합니다.
+
+        Args:
+            columns: 조회할 컬럼 이름 목록. 결과 딕셔너리에는 이 컬럼만 들어 있습니다.
+            marker: 이전 페이지의 마지막 VM UUID. 주어지면 그 VM 다음부터 조회합니다. (키셋 페이지네이션)
+            state, name_prefix, created_after: 상태 일치, 이름 접두사, 생성 시각 이후 필터.
+        """
+        pass
+
     @abstractmethod
     def list_all_uuids(self) -> List[str]:
         """데이터베이스에 있는 모든 VM의 UUID 목록을 조회합니다."""
         pass
 
+    @abstractmethod
+    def iter_states(self, hosts: Optional[Sequence[Optional[str]]] = None) -> Iterator[Tuple[str, str, str]]:
+        """
+        VM의 (UUID, 이름, 상태)를 내보냅니다. hosts가 주어지면 그 호스트들에 배치된 VM만 내보내며,
+        목록의 None은 호스트가 기록되지 않은 VM을 뜻합니다.
+        결과는 순회할 때 커서에서 읽으므로 VM 수와 무관하게 메모리 사용량이 일정하며,
+        세션이 열려 있는 동안 순회해야 합니다.
+        """
+        pass
+
+    @abstractmethod
+    def usage_by_host(self, exclude_states: Sequence[str] = ()) -> List[Tuple[Optional[str], int, int, int, int, int]]:
+        """
+        (호스트, 프로젝트 ID)별 (vCPU 합계, RAM(MB) 합계, 디스크(GB) 합계, VM 수)를 한 번의 집계 쿼리로 반환합니다.
+        반환 행은 (호스트, 프로젝트 ID, vCPU, RAM, 디스크, VM 수) 튜플입니다.
+        """
+        pass
+
     @abstractmethod
     def delete(self, vm: models.VM) -> bool:
         """특정 VM 정보를 데이터베이스에서 삭제합니다."""
         pass
 
+    @abstractmethod
+    def delete_many(self, vms: List[models.VM]) -> int:
+        """여러 VM 정보를 하나의 트랜잭션으로 데이터베이스에서 삭제합니다."""
+        pass
+
     @abstractmethod
     def count_by_project_id(self, project_id: int) -> int:
         """특정 프로젝트에 속한 VM의 개수를 조회합니다."""
@@ -0,0 +1,76 @@
+import heapq
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.repositories.interfaces import ITokenRepository
+
+class MemoryTokenRepository(ITokenRepository):
+    """
+    프로세스 메모리에 토큰을 보관하는 저장소입니다.
+
+    - 조회는 해시 테이블 한 번으로 끝나며(O(1)), 조회된 토큰은 LRU 순서의 맨 뒤로 옮겨집니다.
+    - 만료 시각 기준 힙(TTL 인덱스)을 함께 유지하여, 저장할 때마다 만료된 토큰을
+      최대 sweep_batch개씩 정리합니다. (정리 비용을 저장 요청에 분산)
+    - 토큰 수가 max_entries를 넘으면 가장 오래 사용되지 않은 토큰부터 제거합니다.
+    """
+
+    def __init__(self, max_entries: int = 100_000, sweep_batch: int = 64):
+        """
+        Args:
+            max_entries: 보관할 최대 토큰 수.
+            sweep_batch: 저장 한 번에 정리할 만료 토큰의 최대 개수.
+        """
+        self.max_entries = max_entries
+        self.sweep_batch = sweep_batch
+        self._tokens: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def save(self, token: str, token_data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._tokens[token] = token_data
+            self._tokens.move_to_end(token)
+            heapq.heappush(self._expiry_heap, (token_data['expires_at'].timestamp(), token))
+
+            self._sweep(datetime.now().timestamp(), self.sweep_batch)
+            while len(self._tokens) > self.max_entries:
+                self._tokens.popitem(last=False)
+            self._compact_heap()
+
+    def find(self, token: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            token_data = self._tokens.get(token)
+            if token_data is not None:
+                self._tokens.move_to_end(token)
+            return token_data
+
+    def delete(self, token: str) -> bool:
+        with self._lock:
+            return self._tokens.pop(token, None) is not None
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self._sweep(datetime.now().timestamp(), limit=None)
+
+    def count(self) -> int:
+        return len(self._tokens)
+
+    def _sweep(self, now: float, limit: Optional[int]) -> int:
+        """힙의 앞쪽에서 만료된 토큰을 꺼내 삭제합니다. 이미 삭제/갱신된 토큰의 항목은 건너뜁니다."""
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now and (limit is None or removed < limit):
+            expires_at, token = heapq.heappop(heap)
+            token_data = self._tokens.get(token)
+            if token_data is not None and token_data['expires_at'].timestamp() == expires_at:
+                del self._tokens[token]
+                removed += 1
+        return removed
+
+    def _compact_heap(self):
+        """LRU 제거나 삭제로 남은 오래된 힙 항목이 토큰 수의 두 배를 넘으면 힙을 다시 만듭니다."""
+        if len(self._expiry_heap) > 2 * len(self._tokens) + self.sweep_batch:
+            self._expiry_heap = [(data['expires_at'].timestamp(), token) for token, data in self._tokens.items()]
+            heapq.heapify(self._expiry_heap)
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import List
+from sqlalchemy.orm import Session
+from src.database import models
+from src.repositories.interfaces import IVMDriftRepository
+
+class SqlalchemyVMDriftRepository(IVMDriftRepository):
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def list_open(self) -> List[models.VMDrift]:
+        return self.db.query(models.VMDrift).filter(models.VMDrift.resolved_at.is_(None)).all()
+
+    def create_many(self, drifts: List[models.VMDrift]) -> List[models.VMDrift]:
+        self.db.add_all(drifts)
+        self.db.flush()
+        return drifts
+
+    def mark_seen(self, drifts: List[models.VMDrift], seen_at: datetime) -> int:
+        if not drifts:
+            return 0
+        drift_ids = [drift.id for drift in drifts]
+        return self.db.query(models.VMDrift).filter(models.VMDrift.id.in_(drift_ids)).update(
+            {models.VMDrift.last_seen_at: seen_at}, synchronize_session=False
+        )
+
+    def resolve(self, drift: models.VMDrift, action: str, resolved_at: datetime) -> models.VMDrift:
+        drift.action = action
+        drift.last_seen_at = resolved_at
+        drift.resolved_at = resolved_at
+        self.db.flush()
+        return drift
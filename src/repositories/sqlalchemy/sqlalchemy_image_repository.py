@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from src.database import models
 from src.repositories.interfaces import IImageRepository
@@ -7,5 +7,26 @@ class SqlalchemyImageRepository(IImageRepository):
     def __init__(self, db_session: Session):
         self.db = db_session
 
+    def create(self, image_model: models.Image) -> models.Image:
+        self.db.add(image_model)
+        self.db.flush()
+        return image_model
+
+    def find_by_id(self, image_id: int) -> Optional[models.Image]:
+        return self.db.query(models.Image).filter(models.Image.id == image_id).first()
+
     def find_by_name(self, name: str) -> Optional[models.Image]:
         return self.db.query(models.Image).filter(models.Image.name == name).first()
+
+    def find_by_names(self, names: List[str]) -> List[models.Image]:
+        if not names:
+            return []
+        return self.db.query(models.Image).filter(models.Image.name.in_(names)).all()
+
+    def mark_active(self, image: models.Image, size_bytes: int, checksum: str, disk_format: str) -> models.Image:
+        image.size_bytes = size_bytes
+        image.checksum = checksum
+        image.disk_format = disk_format
+        image.status = "active"
+        self.db.flush()
+        return image
@@ -1,16 +1,19 @@
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Sequence
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 from src.database import models
 from src.repositories.interfaces import IProjectRepository
 
+# 목록 페이지를 커서에서 한 번에 가져올 행 수 (전체 결과를 한꺼번에 메모리에 올리지 않음)
+_PAGE_BATCH_SIZE = 500
+
 class SqlalchemyProjectRepository(IProjectRepository):
     def __init__(self, db_session: Session):
         self.db = db_session
 
     def create(self, project_model: models.Project) -> models.Project:
         self.db.add(project_model)
-        self.db.commit()
-        self.db.refresh(project_model)
+        self.db.flush()
         return project_model
 
     def find_by_id(self, project_id: int) -> Optional[models.Project]:
@@ -19,13 +22,25 @@ class SqlalchemyProjectRepository(IProjectRepository):
     def find_by_name(self, name: str) -> Optional[models.Project]:
         return self.db.query(models.Project).filter(models.Project.name == name).first()
 
+    def list_page(self, limit: int, columns: Sequence[str], marker: Optional[str] = None,
+                  name_prefix: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        project = models.Project
+        query = select(*[getattr(project, column) for column in columns])
+        if marker is not None:
+            query = query.where(project.name > marker)
+        if name_prefix:
+            query = query.where(project.name.startswith(name_prefix, autoescape=True))
+        query = query.order_by(project.name.asc()).limit(limit)
+        result = self.db.execute(query.execution_options(yield_per=_PAGE_BATCH_SIZE))
+        return (dict(row) for row in result.mappings())
+
     def list_all(self) -> List[models.Project]:
         return self.db.query(models.Project).order_by(models.Project.name.asc()).all()
 
     def delete(self, project: models.Project) -> bool:
         if project:
             self.db.delete(project)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
 
@@ -46,7 +61,7 @@ class SqlalchemyProjectRepository(IProjectRepository):
     def assign_role_to_user(self, user: models.User, project: models.Project, role: models.Role):
         association = models.UserProjectRole(user_id=user.id, project_id=project.id, role_id=role.id)
         self.db.merge(association) # INSERT OR IGNORE와 유사한 동작
-        self.db.commit()
+        self.db.flush()
 
     def revoke_role_from_user(self, user: models.User, project: models.Project, role: models.Role):
         association = self.db.query(models.UserProjectRole).filter(
@@ -56,4 +71,4 @@ class SqlalchemyProjectRepository(IProjectRepository):
         ).first()
         if association:
             self.db.delete(association)
-            self.db.commit()
+            self.db.flush()
@@ -0,0 +1,49 @@
+from typing import Dict, Mapping, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from src.database import models
+from src.repositories.interfaces import IQuotaRepository
+
+class SqlalchemyQuotaRepository(IQuotaRepository):
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def get_quota(self, project_id: int) -> Optional[models.ProjectQuota]:
+        return self.db.get(models.ProjectQuota, project_id)
+
+    def set_quota(self, project_id: int, limits: Mapping[str, Optional[int]]) -> models.ProjectQuota:
+        quota = self.db.get(models.ProjectQuota, project_id)
+        if quota is None:
+            quota = models.ProjectQuota(project_id=project_id)
+            self.db.add(quota)
+        for resource, limit in limits.items():
+            setattr(quota, resource, limit)
+        self.db.flush()
+        return quota
+
+    def get_usage(self, project_id: int) -> Dict[str, int]:
+        usage = models.ProjectUsage.__table__
+        row = self.db.execute(
+            select(*[usage.c[resource] for resource in models.QUOTA_RESOURCES]).where(usage.c.project_id == project_id)
+        ).first()
+        return dict(row._mapping) if row else dict.fromkeys(models.QUOTA_RESOURCES, 0)
+
+    def add_usage(self, project_id: int, delta: Mapping[str, int],
+                  limits: Optional[Mapping[str, int]] = None) -> bool:
+        usage = models.ProjectUsage.__table__
+        statement = usage.update().where(usage.c.project_id == project_id).values(
+            {usage.c[resource]: usage.c[resource] + amount for resource, amount in delta.items()}
+        )
+        # 증가하는 자원만 한도와 비교 (반납은 항상 허용)
+        for resource, limit in (limits or {}).items():
+            if limit >= 0 and delta.get(resource, 0) > 0:
+                statement = statement.where(usage.c[resource] + delta[resource] <= limit)
+        if self.db.execute(statement).rowcount:
+            return True
+
+        exists = self.db.execute(select(usage.c.project_id).where(usage.c.project_id == project_id)).first()
+        if exists:
+            return False
+        # 사용량 행이 아직 없는 프로젝트: 0으로 만든 뒤 한 번 더 시도
+        self.db.execute(usage.insert().values(project_id=project_id, **dict.fromkeys(models.QUOTA_RESOURCES, 0)))
+        return bool(self.db.execute(statement).rowcount)
@@ -1,7 +1,11 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 from src.database import models
-from src.repositories.interfaces import IUserRepository
+from src.repositories.interfaces import IUserRepository, LoginContext
+
+# 목록 페이지를 커서에서 한 번에 가져올 행 수 (전체 결과를 한꺼번에 메모리에 올리지 않음)
+_PAGE_BATCH_SIZE = 500
 
 class SqlalchemyUserRepository(IUserRepository):
     def __init__(self, db_session: Session):
@@ -9,8 +13,7 @@ class SqlalchemyUserRepository(IUserRepository):
 
     def create(self, user_model: models.User) -> models.User:
         self.db.add(user_model)
-        self.db.commit()
-        self.db.refresh(user_model)
+        self.db.flush()
         return user_model
 
     def find_by_id(self, user_id: int) -> Optional[models.User]:
@@ -19,12 +22,48 @@ class SqlalchemyUserRepository(IUserRepository):
     def find_by_username(self, username: str) -> Optional[models.User]:
         return self.db.query(models.User).filter(models.User.username == username).first()
 
+    def find_login_context(self, username: str, project_name: str) -> Optional[LoginContext]:
+        # users.username, projects.name(unique 인덱스)과 user_project_roles의 기본 키(user_id, project_id, ...)로
+        # 조회하므로 멤버십 수와 무관하게 인덱스 탐색만으로 끝남. 역할마다 한 행이 반환됨
+        rows = (
+            self.db.query(models.User, models.Project, models.Role.name)
+            .select_from(models.User)
+            .outerjoin(models.Project, models.Project.name == project_name)
+            .outerjoin(models.UserProjectRole, and_(
+                models.UserProjectRole.user_id == models.User.id,
+                models.UserProjectRole.project_id == models.Project.id,
+            ))
+            .outerjoin(models.Role, models.Role.id == models.UserProjectRole.role_id)
+            .filter(models.User.username == username)
+            .all()
+        )
+        if not rows:
+            return None
+        user, project, _ = rows[0]
+        return LoginContext(user, project, sorted(role for _, _, role in rows if role is not None))
+
+    def list_page(self, limit: int, columns: Sequence[str], marker: Optional[str] = None,
+                  username_prefix: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        user = models.User
+        query = select(*[getattr(user, column) for column in columns])
+        if marker is not None:
+            query = query.where(user.username > marker)
+        if username_prefix:
+            query = query.where(user.username.startswith(username_prefix, autoescape=True))
+        query = query.order_by(user.username.asc()).limit(limit)
+        result = self.db.execute(query.execution_options(yield_per=_PAGE_BATCH_SIZE))
+        return (dict(row) for row in result.mappings())
+
     def list_all(self) -> List[models.User]:
         return self.db.query(models.User).order_by(models.User.username.asc()).all()
 
+    def update(self, user: models.User) -> models.User:
+        self.db.flush()
+        return user
+
     def delete(self, user: models.User) -> bool:
         if user:
             self.db.delete(user)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
@@ -1,36 +1,129 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import bindparam, func, or_, select, tuple_
 from sqlalchemy.orm import Session
 from src.database import models
 from src.repositories.interfaces import IVMRepository
 
+# 목록 페이지를 커서에서 한 번에 가져올 행 수 (전체 결과를 한꺼번에 메모리에 올리지 않음)
+_PAGE_BATCH_SIZE = 500
+
 class SqlalchemyVMRepository(IVMRepository):
     def __init__(self, db_session: Session):
         self.db = db_session
 
     def create(self, vm_model: models.VM) -> models.VM:
         self.db.add(vm_model)
-        self.db.commit()
-        self.db.refresh(vm_model)
+        self.db.flush()
         return vm_model
 
+    def create_many(self, vm_models: List[models.VM]) -> List[models.VM]:
+        self.db.add_all(vm_models)
+        self.db.flush()
+        return vm_models
+
     def find_by_name_and_project_id(self, name: str, project_id: int) -> Optional[models.VM]:
         return self.db.query(models.VM).filter(
             models.VM.name == name, 
             models.VM.project_id == project_id
         ).first()
 
+    def find_by_names_and_project_id(self, names: List[str], project_id: int) -> List[models.VM]:
+        if not names:
+            return []
+        return self.db.query(models.VM).filter(
+            models.VM.project_id == project_id,
+            models.VM.name.in_(names)
+        ).all()
+
+    def find_by_uuid(self, uuid: str) -> Optional[models.VM]:
+        return self.db.query(models.VM).filter(models.VM.uuid == uuid).first()
+
+    def update_state(self, vm: models.VM, state: str) -> models.VM:
+        vm.state = state
+        self.db.flush()
+        return vm
+
+    def update_states(self, states: Dict[str, str]) -> int:
+        if not states:
+            return 0
+        vms = models.VM.__table__
+        statement = vms.update().where(vms.c.uuid == bindparam("b_uuid")).values(state=bindparam("b_state"))
+        result = self.db.execute(statement, [{"b_uuid": uuid, "b_state": state} for uuid, state in states.items()])
+        return result.rowcount
+
+    def compare_and_set_states(self, changes: Dict[str, Tuple[str, str]]) -> int:
+        if not changes:
+            return 0
+        vms = models.VM.__table__
+        statement = vms.update().where(
+            vms.c.uuid == bindparam("b_uuid"), vms.c.state == bindparam("b_expected")
+        ).values(state=bindparam("b_state"))
+        result = self.db.execute(statement, [
+            {"b_uuid": uuid, "b_expected": expected, "b_state": state} for uuid, (expected, state) in changes.items()
+        ])
+        return result.rowcount
+
     def list_by_project_id(self, project_id: int) -> List[models.VM]:
         return self.db.query(models.VM).filter(models.VM.project_id == project_id).order_by(models.VM.created_at.desc()).all()
 
+    def list_page_by_project_id(self, project_id: int, limit: int, columns: Sequence[str],
+                                marker: Optional[str] = None, state: Optional[str] = None,
+                                name_prefix: Optional[str] = None,
+                                created_after: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        vm = models.VM
+        query = select(*[getattr(vm, column) for column in columns]).where(vm.project_id == project_id)
+        if marker is not None:
+            # 마커 VM의 정렬 키를 서브쿼리로 읽어 비교하므로 저장된 값 그대로 비교되고,
+            # (project_id, created_at) 인덱스의 범위 탐색으로 처리됨
+            marker_key = select(vm.created_at, vm.id).where(vm.uuid == marker).scalar_subquery()
+            query = query.where(tuple_(vm.created_at, vm.id) < marker_key)
+        if state is not None:
+            query = query.where(vm.state == state)
+        if name_prefix:
+            query = query.where(vm.name.startswith(name_prefix, autoescape=True))
+        if created_after is not None:
+            query = query.where(vm.created_at > created_after)
+        query = query.order_by(vm.created_at.desc(), vm.id.desc()).limit(limit)
+        result = self.db.execute(query.execution_options(yield_per=_PAGE_BATCH_SIZE))
+        return (dict(row) for row in result.mappings())
+
     def list_all_uuids(self) -> List[str]:
         return [row[0] for row in self.db.query(models.VM.uuid).all()]
 
+    def iter_states(self, hosts: Optional[Sequence[Optional[str]]] = None) -> Iterator[Tuple[str, str, str]]:
+        query = select(models.VM.uuid, models.VM.name, models.VM.state)
+        if hosts is not None:
+            named = [host for host in hosts if host is not None]
+            conditions = [models.VM.host.in_(named)] if named else []
+            if None in hosts:
+                conditions.append(models.VM.host.is_(None))
+            query = query.where(or_(*conditions))
+        result = self.db.execute(query.execution_options(yield_per=_PAGE_BATCH_SIZE))
+        return (tuple(row) for row in result)
+
+    def usage_by_host(self, exclude_states: Sequence[str] = ()) -> List[Tuple[Optional[str], int, int, int, int, int]]:
+        query = select(
+            models.VM.host, models.VM.project_id, func.sum(models.VM.cpu_count), func.sum(models.VM.ram_mb),
+            func.coalesce(func.sum(models.VM.disk_gb), 0), func.count(),
+        ).group_by(models.VM.host, models.VM.project_id)
+        if exclude_states:
+            query = query.where(models.VM.state.not_in(exclude_states))
+        return [tuple(row) for row in self.db.execute(query)]
+
     def delete(self, vm: models.VM) -> bool:
         if vm:
             self.db.delete(vm)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
 
+    def delete_many(self, vms: List[models.VM]) -> int:
+        if not vms:
+            return 0
+        vm_ids = [vm.id for vm in vms]
+        deleted = self.db.query(models.VM).filter(models.VM.id.in_(vm_ids)).delete(synchronize_session=False)
+        return deleted
+
     def count_by_project_id(self, project_id: int) -> int:
         return self.db.query(models.VM).filter(models.VM.project_id == project_id).count()
\ No newline at end of file
@@ -0,0 +1,112 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.repositories.interfaces import ITokenRepository
+
+class SqliteTokenRepository(ITokenRepository):
+    """
+    SQLite 파일에 토큰을 보관하는 저장소입니다.
+
+    같은 파일을 여는 모든 워커 프로세스가 토큰을 공유하며, 서버를 재시작해도 토큰이 유지됩니다.
+    - WAL 모드와 mmap을 사용하여 조회가 쓰기에 막히지 않고, 페이지를 공유 메모리로 읽습니다.
+    - 토큰은 WITHOUT ROWID 테이블의 기본 키이므로 조회는 인덱스 탐색 한 번으로 끝납니다.
+    - expires_at 인덱스(TTL 인덱스)를 두고, sweep_interval번 저장할 때마다
+      만료된 토큰을 최대 sweep_batch개씩 정리합니다.
+
+    SQLite 연결은 스레드 간에 공유하지 않고 스레드마다 하나씩 엽니다.
+    """
+
+    def __init__(self, db_path: str, mmap_size: int = 256 * 1024 * 1024,
+                 sweep_interval: int = 256, sweep_batch: int = 1000):
+        """
+        Args:
+            db_path: 토큰 DB 파일 경로.
+            mmap_size: SQLite가 메모리 매핑할 최대 바이트 수.
+            sweep_interval: 만료 토큰 정리를 수행할 저장 횟수 간격.
+            sweep_batch: 한 번에 정리할 만료 토큰의 최대 개수.
+        """
+        self.db_path = db_path
+        self.mmap_size = mmap_size
+        self.sweep_interval = sweep_interval
+        self.sweep_batch = sweep_batch
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._saves = 0
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tokens (
+                token TEXT PRIMARY KEY,
+                expires_at REAL NOT NULL,
+                data TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS ix_tokens_expires_at ON tokens (expires_at);
+        """)
+
+    def save(self, token: str, token_data: Dict[str, Any]) -> None:
+        data = {key: value for key, value in token_data.items() if key != 'expires_at'}
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tokens (token, expires_at, data) VALUES (?, ?, ?)",
+                (token, token_data['expires_at'].timestamp(), json.dumps(data)),
+            )
+
+        with self._lock:
+            self._saves += 1
+            should_sweep = self._saves % self.sweep_interval == 0
+        if should_sweep:
+            self._sweep(self.sweep_batch)
+
+    def find(self, token: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute("SELECT expires_at, data FROM tokens WHERE token = ?", (token,)).fetchone()
+        if row is None:
+            return None
+        token_data = json.loads(row[1])
+        token_data['expires_at'] = datetime.fromtimestamp(row[0])
+        return token_data
+
+    def delete(self, token: str) -> bool:
+        conn = self._conn()
+        with conn:
+            return conn.execute("DELETE FROM tokens WHERE token = ?", (token,)).rowcount > 0
+
+    def purge_expired(self) -> int:
+        conn = self._conn()
+        with conn:
+            return conn.execute("DELETE FROM tokens WHERE expires_at <= ?", (datetime.now().timestamp(),)).rowcount
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def _sweep(self, limit: int) -> int:
+        conn = self._conn()
+        with conn:
+            return conn.execute(
+                "DELETE FROM tokens WHERE token IN "
+                "(SELECT token FROM tokens WHERE expires_at <= ? ORDER BY expires_at LIMIT ?)",
+                (datetime.now().timestamp(), limit),
+            ).rowcount
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
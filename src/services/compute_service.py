@@ -1,35 +1,148 @@
 import libvirt
+import logging
 import uuid
 import os
 import subprocess
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
 
 from src.database import models
+from src.database.unit_of_work import UnitOfWork
 from src.repositories.interfaces import IVMRepository
 from src.utils.vm_xml_generator import generate_vm_xml
+from src.utils import metrics, tracing
+from src.utils.libvirt_connection import LibvirtConnectionManager, libvirt_call_timer
+from src.utils.domain_state_cache import DomainStateCache, domain_state_name
+from src.utils.pagination import Page, select_fields
 from src.services.image_service import ImageService
+from src.services.quota_service import QuotaService
+from src.services.scheduler import Claim, PlacementRequest, Scheduler
 from src.services.exceptions import (
     VmNotFoundError,
     VmAlreadyExistsError,
     VmCreationError,
+    NoValidHostError,
+    QuotaExceededError,
 )
 
+# list_vms가 반환할 수 있는 필드 ('state'는 DB가 아닌 하이퍼바이저의 실시간 상태)
+VM_LIST_FIELDS = ("name", "uuid", "cpu_count", "ram_mb", "created_at", "state")
+
+# VM 생성 시간이 어느 단계에서 쓰이는지 (디스크 생성, 도메인 정의, 도메인 시작)
+_PROVISION_STEP_SECONDS = metrics.histogram(
+    "iaas_vm_provision_step_duration_seconds", "Duration of each VM provisioning step.", ("step",)
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _provision_step(step: str) -> tracing.Span:
+    """프로비저닝 단계 하나의 소요 시간을 메트릭과 추적 span('provision.<step>')으로 기록하는 with 블록을 반환합니다."""
+    return tracing.span(f"provision.{step}", observe=_PROVISION_STEP_SECONDS.labels(step).observe)
+
+
 class ComputeService:
-    def __init__(self, vm_repo: IVMRepository, image_service: ImageService, uri="qemu:///system"):
+    def __init__(self, vm_repo: IVMRepository, image_service: ImageService, conn_manager: LibvirtConnectionManager,
+                 unit_of_work: Optional[UnitOfWork] = None, state_cache: Optional[DomainStateCache] = None,
+                 scheduler: Optional[Scheduler] = None,
+                 host_connections: Optional[Dict[str, LibvirtConnectionManager]] = None,
+                 quota_service: Optional[QuotaService] = None):
+        """
+        ComputeService를 초기화합니다.
+
+        Args:
+            vm_repo: VM 데이터에 접근하기 위한 리포지토리.
+            image_service: 이미지 검증 및 디스크 생성을 담당하는 서비스.
+            conn_manager: 프로세스 전체에서 공유하는 libvirt 연결 관리자. (기본 호스트)
+            unit_of_work: 리포지토리가 속한 트랜잭션. 하이퍼바이저 작업처럼 되돌릴 수 없는 작업의 결과는
+                          요청이 실패하더라도 DB에 남아야 하므로, 그 시점에 중간 커밋하는 데 사용합니다.
+            state_cache: 도메인 상태 캐시. 동기화된 상태이면 목록 조회에서 하이퍼바이저 대신 캐시를 읽습니다.
+            scheduler: VM을 배치할 호스트를 고르고 용량을 확보하는 스케줄러. 없으면 모든 VM을 기본 호스트에 만듭니다.
+            host_connections: 호스트 이름별 libvirt 연결 관리자. VM의 도메인은 배치된 호스트의 연결로 다룹니다.
+            quota_service: 프로젝트 쿼터를 검사하고 사용량을 기록하는 서비스. 없으면 쿼터를 적용하지 않습니다.
+        """
         self.vm_repo = vm_repo
         self.image_service = image_service # ImageService도 의존성으로 주입
-        try:
-            self.conn = libvirt.open(uri)
-        except libvirt.libvirtError:
-            # TODO: 로깅 시스템 도입 후 로그 남기기
-            raise ConnectionError("Failed to open connection to the hypervisor.")
+        self.conn_manager = conn_manager
+        self.unit_of_work = unit_of_work
+        self.state_cache = state_cache
+        self.scheduler = scheduler
+        self.host_connections = host_connections or {}
+        self.quota_service = quota_service
+
+    @property
+    def conn(self):
+        """기본 호스트의 정상 상태 libvirt 연결. 실제로 필요한 시점에만 연결 관리자에서 가져옵니다."""
+        return self.conn_manager.get()
+
+    def _manager_for(self, host: Optional[str]) -> LibvirtConnectionManager:
+        """VM이 배치된 호스트의 연결 관리자를 반환합니다. (호스트가 없거나 모르는 호스트이면 기본 호스트)"""
+        manager = self.host_connections.get(host) if host else None
+        return manager or self.conn_manager
+
+    def _conn_for(self, host: Optional[str]):
+        """VM이 배치된 호스트의 libvirt 연결을 반환합니다. (호스트가 없거나 모르는 호스트이면 기본 호스트)"""
+        return self._manager_for(host).get()
+
+    def _disk_size(self, image_name: str) -> int:
+        """VM이 차지할 디스크 크기(GB). 디스크는 기반 이미지의 오버레이이므로 이미지의 최소 디스크 크기를 사용합니다."""
+        image = self.image_service.find_images([image_name]).get(image_name)
+        return (image.min_disk_gb if image else None) or 0
+
+    def _reserve_quota(self, project_id: int, cpu_count: int, ram_mb: int, disk_gb: int):
+        """
+        VM 하나의 자원을 프로젝트 사용량에 더합니다. (현재 트랜잭션에 속하며, 롤백되면 함께 취소됨)
+
+        Raises:
+            QuotaExceededError: 프로젝트 쿼터를 넘을 때.
+        """
+        if self.quota_service is not None:
+            self.quota_service.reserve(project_id, instances=1, vcpus=cpu_count, ram_mb=ram_mb, disk_gb=disk_gb)
+
+    def _release_quota(self, project_id: int, vms: List[models.VM]):
+        """삭제할 VM들의 자원을 프로젝트 사용량에서 한 번에 뺍니다. (삭제와 같은 트랜잭션에서 호출)"""
+        if self.quota_service is not None and vms:
+            self.quota_service.release(
+                project_id, instances=len(vms), vcpus=sum(vm.cpu_count for vm in vms),
+                ram_mb=sum(vm.ram_mb for vm in vms), disk_gb=sum(vm.disk_gb or 0 for vm in vms),
+            )
+
+    def _claim_capacity(self, project_id: int, cpu_count: int, ram_mb: int, disk_gb: int) -> Optional[Claim]:
+        """
+        스케줄러로 VM을 배치할 호스트를 골라 용량을 확보합니다. 스케줄러가 없으면 None을 반환합니다.
+
+        Raises:
+            NoValidHostError: VM을 받을 수 있는 호스트가 없을 때.
+        """
+        if self.scheduler is None:
+            return None
+        return self.scheduler.select(PlacementRequest(project_id, cpu_count, ram_mb, disk_gb))
+
+    def _capacity_of(self, vm: models.VM) -> Optional[Claim]:
+        """VM이 배치된 호스트에서 차지하고 있는 용량을 반환합니다. (ERROR 상태의 VM은 용량을 차지하지 않음)"""
+        if self.scheduler is None or vm.state == "ERROR":
+            return None
+        return Claim(vm.host or self.scheduler.default_host, vm.project_id, vm.cpu_count, vm.ram_mb, vm.disk_gb or 0)
+
+    def _release_capacity(self, claim: Optional[Claim]):
+        """확보했던 호스트 용량을 반납합니다. (생성 실패 또는 삭제 시)"""
+        if claim is not None:
+            self.scheduler.release(claim)
+
+    def _checkpoint(self):
+        """지금까지의 DB 변경을 확정합니다. (이후 예외가 발생해도 롤백되지 않음)"""
+        if self.unit_of_work:
+            self.unit_of_work.commit()
 
     def create_vm(self, project_id: int, vm_name: str, cpu_count: int, ram_mb: int, image_name: str):
         """
-        새로운 가상 머신을 생성하고 시작합니다.
+        새로운 가상 머신을 생성하고 시작합니다. (동기 방식)
 
-        VM 생성 전체 과정을 관리하며, 디스크 생성, libvirt VM 정의, VM 시작,
-        DB 메타데이터 저장을 포함합니다. 실패 시 생성된 리소스를 정리하는 롤백 로직이 동작합니다.
+        reserve_vm으로 DB에 'BUILDING' 상태의 VM을 기록한 뒤, 같은 스레드에서
+        프로비저닝(디스크 생성, libvirt VM 정의, VM 시작)까지 완료합니다.
+        실패 시 생성된 리소스를 정리하는 롤백 로직이 동작하고 VM은 'ERROR' 상태가 됩니다.
 
         Args:
             project_id: VM이 속할 프로젝트의 ID.
@@ -46,91 +159,403 @@ class ComputeService:
             VmAlreadyExistsError: 동일한 이름의 VM이 프로젝트 내에 이미 존재할 때.
             VmCreationError: VM 생성 과정(libvirt, 디스크 등) 중 오류가 발생했을 때.
         """
+        vm, source_filepath = self.reserve_vm(project_id, vm_name, cpu_count, ram_mb, image_name)
+        return self._provision(vm, source_filepath)
+
+    def reserve_vm(self, project_id: int, vm_name: str, cpu_count: int, ram_mb: int, image_name: str):
+        """
+        VM 생성 요청을 검증하고, DB에 'BUILDING' 상태의 VM을 기록합니다.
+
+        실제 프로비저닝은 provision_vm으로 (주로 백그라운드 작업에서) 이어서 수행합니다.
+
+        Returns:
+            (생성된 VM 모델, 기반 이미지 파일 경로) 튜플.
+
+        Raises:
+            ImageNotFoundError: 요청된 이미지를 찾을 수 없을 때.
+            VmAlreadyExistsError: 동일한 이름의 VM이 프로젝트 내에 이미 존재할 때.
+            QuotaExceededError: 프로젝트 쿼터를 넘을 때.
+            NoValidHostError: VM을 받을 수 있는 호스트가 없을 때.
+        """
         # 1. 요청 유효성 검사 (VM 중복, 이미지 존재 여부)
-        source_filepath = self.image_service.validate_image_and_get_path(image_name)
+        with tracing.span("image.validate", image=image_name):
+            source_filepath = self.image_service.validate_image_and_get_path(image_name, ram_mb=ram_mb)
         if self.vm_repo.find_by_name_and_project_id(vm_name, project_id):
             raise VmAlreadyExistsError(f"VM name '{vm_name}' already exists in this project.")
 
-        vm_disk_filepath = None
-        domain = None
-        vm_uuid = str(uuid.uuid4())
+        # 2. 프로젝트 쿼터 확보 후, 배치할 호스트를 고르고 용량 확보 (트랜잭션이 롤백되면 둘 다 반납)
+        disk_gb = self._disk_size(image_name)
+        self._reserve_quota(project_id, cpu_count, ram_mb, disk_gb)
+        claim = self._claim_capacity(project_id, cpu_count, ram_mb, disk_gb)
+        if claim is not None and self.unit_of_work:
+            self.unit_of_work.after_rollback(lambda: self._release_capacity(claim))
+
+        # 3. DB에 VM 메타데이터를 'BUILDING' 상태로 먼저 저장
+        new_vm = models.VM(
+            name=vm_name,
+            uuid=str(uuid.uuid4()),
+            state="BUILDING",
+            cpu_count=cpu_count,
+            ram_mb=ram_mb,
+            project_id=project_id,
+            host=claim.host if claim else None,
+            disk_gb=disk_gb,
+        )
+        self.vm_repo.create(new_vm)
+        return new_vm, source_filepath
+
+    def provision_vm(self, vm_uuid: str, source_filepath: str, progress: Optional[Callable[[str], None]] = None):
+        """
+        reserve_vm으로 기록된 VM의 디스크를 만들고, libvirt에 정의한 뒤 시작합니다.
+
+        성공하면 VM 상태를 'RUNNING'으로, 실패하면 생성된 리소스를 롤백하고 'ERROR'로 변경합니다.
+
+        Args:
+            vm_uuid: 프로비저닝할 VM의 UUID.
+            source_filepath: 기반 이미지 파일 경로.
+            progress: 진행 단계 이름을 전달받는 콜백 (비동기 작업의 진행 상황 보고용).
+
+        Returns:
+            생성된 VM의 이름과 UUID를 담은 튜플 (vm_name, vm_uuid).
+
+        Raises:
+            VmNotFoundError: 해당 UUID의 VM 기록이 없을 때.
+            VmCreationError: VM 생성 과정(libvirt, 디스크 등) 중 오류가 발생했을 때.
+        """
+        vm = self.vm_repo.find_by_uuid(vm_uuid)
+        if not vm:
+            raise VmNotFoundError(f"VM with uuid '{vm_uuid}' not found.")
+        return self._provision(vm, source_filepath, progress)
 
+    def fail_provisioning(self, vm_uuid: str):
+        """
+        프로비저닝을 시작하지 못한 VM을 프로비저닝 실패와 같이 처리합니다. ('ERROR'로 바꾸고 호스트 용량 반납)
+
+        Raises:
+            VmNotFoundError: 해당 UUID의 VM 기록이 없을 때.
+        """
+        vm = self.vm_repo.find_by_uuid(vm_uuid)
+        if not vm:
+            raise VmNotFoundError(f"VM with uuid '{vm_uuid}' not found.")
+        self._mark_provision_failed(vm)
+
+    def _mark_provision_failed(self, vm: models.VM):
+        self._release_capacity(self._capacity_of(vm))
+        self.vm_repo.update_state(vm, "ERROR")
+
+    def _provision(self, vm: models.VM, source_filepath: str, progress: Optional[Callable[[str], None]] = None):
         try:
-            # 2. VM 디스크 생성
-            vm_disk_filepath = self.image_service.create_vm_disk(vm_name, source_filepath)
+            domain, vm_disk_filepath = self._build_domain(vm.name, vm.uuid, vm.cpu_count, vm.ram_mb, source_filepath,
+                                                          progress, host=vm.host)
+        except VmCreationError:
+            self._mark_provision_failed(vm)
+            self._checkpoint()
+            raise
 
-            # 3. VM XML 설정 생성 및 Libvirt VM 정의
-            xml_config = generate_vm_xml(vm_name, vm_uuid, cpu_count, ram_mb, vm_disk_filepath)
-            domain = self.conn.defineXML(xml_config)
+        try:
+            # DB의 VM 상태 갱신
+            self.vm_repo.update_state(vm, "RUNNING")
+            self._record_domain_state(vm.uuid, vm.name, "RUNNING")
+        except Exception as e:
+            logger.warning("VM '%s' creation failed: %s. Starting rollback...", vm.name, e)
+            self._rollback_vm_creation(domain, vm_disk_filepath)
+            # 실패한 상태 갱신을 되돌린 뒤, 도메인 생성 실패와 같이 'ERROR'로 기록하고 용량을 반납
+            if self.unit_of_work:
+                self.unit_of_work.rollback()
+            self._mark_provision_failed(vm)
+            self._checkpoint()
+            raise VmCreationError(f"Failed to create VM '{vm.name}'. Original error: {e}") from e
+        return vm.name, vm.uuid
+
+    def _build_domain(self, vm_name: str, vm_uuid: str, cpu_count: int, ram_mb: int, source_filepath: str,
+                      progress: Optional[Callable[[str], None]] = None, host: Optional[str] = None):
+        """
+        VM 디스크를 만들고 libvirt 도메인을 정의한 뒤 시작합니다.
 
-            # 4. VM 시작
-            if domain.create() < 0:
-                raise VmCreationError("Failed to start the VM after definition.")
+        도메인은 host(없으면 기본 호스트)에 정의합니다. DB 세션을 사용하지 않으므로
+        여러 스레드에서 동시에 호출할 수 있습니다. 실패하면 이 호출에서 만든 리소스를 롤백한 뒤 VmCreationError를 던집니다.
 
-            # 5. DB에 VM 메타데이터 저장 (리포지토리 사용)
-            new_vm = models.VM(
-                name=vm_name,
-                uuid=vm_uuid,
-                state="RUNNING",
-                cpu_count=cpu_count,
-                ram_mb=ram_mb,
-                project_id=project_id
-            )
-            self.vm_repo.create(new_vm)
+        Returns:
+            (libvirt 도메인, VM 디스크 경로) 튜플.
+        """
+        report = progress or (lambda step: None)
+        vm_disk_filepath = None
+        domain = None
+
+        try:
+            # 1. VM 디스크 생성
+            report("creating_disk")
+            with _provision_step("creating_disk"):
+                vm_disk_filepath = self.image_service.create_vm_disk(vm_name, source_filepath)
+
+            # 2. VM XML 설정 생성 및 Libvirt VM 정의
+            report("defining_domain")
+            with _provision_step("defining_domain"):
+                xml_config = generate_vm_xml(vm_name, vm_uuid, cpu_count, ram_mb, vm_disk_filepath)
+                conn = self._conn_for(host)
+                with libvirt_call_timer("defineXML"):
+                    domain = conn.defineXML(xml_config)
+
+            # 3. VM 시작
+            report("starting_domain")
+            with _provision_step("starting_domain"), libvirt_call_timer("create"):
+                started = domain.create()
+            if started < 0:
+                raise VmCreationError("Failed to start the VM after definition.")
 
-            return vm_name, vm_uuid
+            return domain, vm_disk_filepath
 
         except (libvirt.libvirtError, VmCreationError, Exception) as e:
-            print(f"VM '{vm_name}' creation failed: {e}. Starting rollback...")
+            logger.warning("VM '%s' creation failed: %s. Starting rollback...", vm_name, e)
             self._rollback_vm_creation(domain, vm_disk_filepath)
             raise VmCreationError(f"Failed to create VM '{vm_name}'. Original error: {e}") from e
 
+    def create_vms(self, project_id: int, vm_specs: List[Dict[str, Any]], concurrency: int) -> List[Dict[str, Any]]:
+        """
+        여러 VM을 한 번에 생성합니다. (일괄 생성)
+
+        이미지 검증과 이름 중복 검사는 배치 전체에 대해 각각 한 번의 쿼리로 수행하고,
+        통과한 VM들은 하나의 트랜잭션으로 'BUILDING' 상태로 기록합니다.
+        디스크 생성과 도메인 정의/시작은 최대 concurrency개씩 병렬로 실행하며,
+        최종 상태('RUNNING' 또는 'ERROR')도 한 번에 갱신합니다.
+
+        Args:
+            project_id: VM들이 속할 프로젝트의 ID.
+            vm_specs: 각 VM의 vm_name, cpu_count, ram_mb, image_name을 담은 딕셔너리 목록.
+            concurrency: 동시에 프로비저닝할 최대 VM 수.
+
+        Returns:
+            요청 순서와 같은 순서의 항목별 결과 목록.
+            (예: [{'name': 'vm-1', 'uuid': '...', 'status': 'created'},
+                  {'name': 'vm-2', 'status': 'failed', 'error': '...'}])
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(vm_specs)
+
+        # 1. 요청 형식 및 배치 내 이름 중복 검사
+        candidates = []
+        seen_names = set()
+        for index, spec in enumerate(vm_specs):
+            try:
+                vm_name, image_name = spec['vm_name'], spec['image_name']
+                cpu_count, ram_mb = int(spec['cpu_count']), int(spec['ram_mb'])
+                if not isinstance(vm_name, str) or not isinstance(image_name, str):
+                    raise TypeError("vm_name and image_name must be strings.")
+            except (KeyError, TypeError, ValueError):
+                name = spec.get('vm_name') if isinstance(spec, dict) else None
+                name = name if isinstance(name, str) else None
+                results[index] = self._failed_result(name, "Each VM requires vm_name, cpu_count, ram_mb and image_name.")
+                continue
+            if vm_name in seen_names:
+                results[index] = self._failed_result(vm_name, f"VM name '{vm_name}' is duplicated in this batch.")
+                continue
+            seen_names.add(vm_name)
+            candidates.append((index, vm_name, cpu_count, ram_mb, image_name))
+
+        # 2. 이미지 검증과 이름 중복 검사를 각각 한 번의 쿼리로 수행
+        image_paths, image_errors = self.image_service.validate_images_and_get_paths([c[4] for c in candidates])
+        existing_names = {vm.name for vm in self.vm_repo.find_by_names_and_project_id([c[1] for c in candidates], project_id)}
+
+        new_vms, jobs, claims = [], [], {}
+        for index, vm_name, cpu_count, ram_mb, image_name in candidates:
+            if image_name in image_errors:
+                results[index] = self._failed_result(vm_name, image_errors[image_name])
+            elif requirement_error := self.image_service.check_requirements(image_name, ram_mb=ram_mb):
+                results[index] = self._failed_result(vm_name, requirement_error)
+            elif vm_name in existing_names:
+                results[index] = self._failed_result(vm_name, f"VM name '{vm_name}' already exists in this project.")
+            else:
+                disk_gb = self._disk_size(image_name)
+                try:
+                    self._reserve_quota(project_id, cpu_count, ram_mb, disk_gb)
+                except QuotaExceededError as e:
+                    results[index] = self._failed_result(vm_name, str(e))
+                    continue
+                try:
+                    claim = self._claim_capacity(project_id, cpu_count, ram_mb, disk_gb)
+                except NoValidHostError as e:
+                    # 이 VM 몫으로 더한 쿼터 사용량을 되돌림 (배치의 다른 VM은 계속 기록)
+                    if self.quota_service is not None:
+                        self.quota_service.release(project_id, instances=1, vcpus=cpu_count, ram_mb=ram_mb, disk_gb=disk_gb)
+                    results[index] = self._failed_result(vm_name, str(e))
+                    continue
+                vm_uuid = str(uuid.uuid4())
+                if claim is not None:
+                    claims[vm_uuid] = claim
+                    if self.unit_of_work:
+                        self.unit_of_work.after_rollback(lambda claim=claim: self._release_capacity(claim))
+                new_vms.append(models.VM(
+                    name=vm_name, uuid=vm_uuid, state="BUILDING",
+                    cpu_count=cpu_count, ram_mb=ram_mb, project_id=project_id,
+                    host=claim.host if claim else None, disk_gb=disk_gb,
+                ))
+                jobs.append((index, vm_name, vm_uuid, cpu_count, ram_mb, image_paths[image_name],
+                             claim.host if claim else None))
+
+        if not jobs:
+            return results
+
+        # 3. 검증을 통과한 VM들을 하나의 트랜잭션으로 기록
+        #    (오래 걸리는 프로비저닝 동안 DB 쓰기 잠금을 잡고 있지 않도록 먼저 커밋)
+        self.vm_repo.create_many(new_vms)
+        self._checkpoint()
+
+        # 4. 디스크 생성 및 도메인 정의/시작을 병렬로 실행 (DB 세션은 이 스레드에서만 사용)
+        states = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(jobs)))) as executor:
+            futures = {
+                executor.submit(tracing.propagate(self._build_domain), vm_name, vm_uuid, cpu_count, ram_mb,
+                                source_filepath, host=host): (index, vm_name, vm_uuid)
+                for index, vm_name, vm_uuid, cpu_count, ram_mb, source_filepath, host in jobs
+            }
+            for future in as_completed(futures):
+                index, vm_name, vm_uuid = futures[future]
+                try:
+                    future.result()
+                    states[vm_uuid] = "RUNNING"
+                    self._record_domain_state(vm_uuid, vm_name, "RUNNING")
+                    results[index] = {"name": vm_name, "uuid": vm_uuid, "status": "created"}
+                except VmCreationError as e:
+                    states[vm_uuid] = "ERROR"
+                    self._release_capacity(claims.get(vm_uuid))
+                    results[index] = {"name": vm_name, "uuid": vm_uuid, "status": "failed", "error": str(e)}
+
+        # 5. 최종 상태를 한 번에 갱신
+        self.vm_repo.update_states(states)
+        return results
+
+    @staticmethod
+    def _failed_result(vm_name: Optional[str], error: str) -> Dict[str, Any]:
+        return {"name": vm_name, "status": "failed", "error": error}
+
     def _rollback_vm_creation(self, domain, disk_path):
         if domain:
             try:
                 if domain.isActive():
-                    domain.destroy()
-                domain.undefine()
+                    with libvirt_call_timer("destroy"):
+                        domain.destroy()
+                with libvirt_call_timer("undefine"):
+                    domain.undefine()
             except libvirt.libvirtError as e:
-                print(f"Rollback Warning: Failed to clean up libvirt domain: {e}")
+                logger.warning("Rollback: failed to clean up libvirt domain: %s", e)
 
         if disk_path and os.path.exists(disk_path):
             self.image_service.delete_vm_disk(disk_path)
 
-    def list_vms(self, project_id: int):
+    def list_vms(self, project_id: int, limit: int, marker: Optional[str] = None, state: Optional[str] = None,
+                 name_prefix: Optional[str] = None, created_after: Optional[datetime] = None,
+                 fields: Optional[List[str]] = None) -> Page:
         """
-        특정 프로젝트에 속한 VM 목록을 조회하고, 하이퍼바이저에서 실시간 상태를 가져옵니다.
+        특정 프로젝트에 속한 VM 목록을 한 페이지 조회하고, 하이퍼바이저에서 실시간 상태를 가져옵니다.
 
-        DB에 저장된 VM 정보와 libvirt를 통해 확인한 실시간 상태를 조합하여 반환합니다.
-        만약 VM이 하이퍼바이저에 존재하지 않으면 상태는 'UNKNOWN'으로 표시됩니다.
+        VM은 최신순으로 최대 limit개를 반환하며, 다음 페이지는 페이지의 next_marker를 marker로
+        넘겨 조회합니다. (키셋 페이지네이션이므로 페이지가 깊어져도 조회 비용이 일정합니다)
+        DB에서는 요청한 필드에 필요한 컬럼만 조회하고, 실시간 상태는 VM이 배치된 호스트 기준으로 읽습니다.
+        기본 호스트의 VM은 도메인 상태 캐시에서 읽으며, 캐시가 없거나 아직 동기화되지 않았거나 다른 호스트의
+        VM이면 VM 개수와 무관하게 호스트마다 한 번의 스냅샷 호출로 가져와 메모리에서 조인합니다.
+        'state' 필드를 요청하지 않으면 하이퍼바이저를 조회하지 않습니다.
+        하이퍼바이저에 없는 VM의 상태는 'UNKNOWN'이며, 상태를 포함한 페이지의 meta['state_as_of']에는
+        상태가 하이퍼바이저와 일치하는 시각(ISO 8601, UTC)이 기록됩니다.
+
+        쿼리 실행과 검증은 이 메서드에서 끝나고, VM 행은 반환된 페이지를 순회할 때 커서에서
+        하나씩 읽어 변환합니다. (응답을 스트리밍할 때 결과 크기와 무관하게 메모리 사용량이 일정)
 
         Args:
             project_id: 조회할 VM들이 속한 프로젝트의 ID.
+            limit: 페이지 크기.
+            marker: 이전 페이지의 마지막 VM UUID.
+            state: DB에 기록된 상태(예: 'BUILDING', 'ERROR')가 일치하는 VM만 조회합니다.
+            name_prefix: 이름이 이 접두사로 시작하는 VM만 조회합니다.
+            created_after: 이 시각 이후에 생성된 VM만 조회합니다.
+            fields: 응답에 포함할 필드 목록. (기본값: VM_LIST_FIELDS 전체)
 
         Returns:
-            VM의 상세 정보(이름, UUID, CPU, RAM, 생성일, 상태 등)가 포함된
-            딕셔너리의 리스트.
-        """
-        vms_from_db = self.vm_repo.list_by_project_id(project_id)
-        
-        vms_with_realtime_state = []
-        for vm in vms_from_db:
-            vm_data = {
-                "name": vm.name,
-                "uuid": vm.uuid,
-                "cpu_count": vm.cpu_count,
-                "ram_mb": vm.ram_mb,
-                "created_at": vm.created_at.isoformat()
-            }
-            try:
-                domain = self.conn.lookupByUUIDString(vm.uuid)
-                state_code, _, _, _, _ = domain.info()
-                vm_data["state"] = self._map_vm_state(state_code)
-            except libvirt.libvirtError:
-                vm_data["state"] = "UNKNOWN"
-            vms_with_realtime_state.append(vm_data)
-            
-        return vms_with_realtime_state
+            VM 정보 딕셔너리를 내보내는 Page. 순회가 끝나면 next_marker에 다음 페이지 마커가 설정됩니다.
+
+        Raises:
+            ValueError: 알 수 없는 필드를 요청했거나, marker에 해당하는 VM이 프로젝트에 없을 때.
+        """
+        fields = select_fields(fields, VM_LIST_FIELDS)
+        if marker is not None:
+            marker_vm = self.vm_repo.find_by_uuid(marker)
+            if marker_vm is None or marker_vm.project_id != project_id:
+                raise ValueError(f"Marker '{marker}' not found.")
+
+        # 상태는 VM이 배치된 호스트에서 읽으므로, 'state'를 요청하면 호스트 컬럼도 조회
+        extra_columns = ["uuid", "host"] if "state" in fields else ["uuid"]
+        columns = list(dict.fromkeys([field for field in fields if field != "state"] + extra_columns))
+        rows = self.vm_repo.list_page_by_project_id(
+            project_id, limit + 1, columns, marker=marker, state=state,
+            name_prefix=name_prefix, created_after=created_after,
+        )
+        get_state, state_as_of = self._domain_state_reader() if "state" in fields else (None, None)
+
+        def to_vm(row: Dict[str, Any]) -> Dict[str, Any]:
+            vm = {}
+            for field in fields:
+                if field == "state":
+                    vm[field] = get_state(row["uuid"], row.get("host"))
+                elif field == "created_at":
+                    vm[field] = row[field].isoformat() if row[field] else None
+                else:
+                    vm[field] = row[field]
+            return vm
+
+        page = Page(rows, limit, "uuid", to_vm)
+        if state_as_of is not None:
+            page.meta["state_as_of"] = datetime.fromtimestamp(state_as_of, timezone.utc).isoformat()
+        return page
+
+    def _domain_state_reader(self):
+        """
+        (VM UUID, 호스트) -> 상태 조회 함수와, 그 상태가 하이퍼바이저와 일치하는 시각(Unix 시간)을 반환합니다.
+
+        도메인 상태 캐시는 기본 호스트만 동기화하므로, 동기화된 캐시가 있으면 기본 호스트의 VM은 캐시에서
+        읽습니다. 나머지 VM은 호스트마다 처음 조회할 때 그 호스트의 스냅샷을 한 번 가져와 읽으므로,
+        하이퍼바이저 호출은 VM 개수가 아니라 페이지에 나온 호스트 수만큼만 발생합니다.
+        """
+        cache = self.state_cache if self.state_cache is not None and self.state_cache.is_ready() else None
+        as_of = cache.as_of() if cache is not None else time.time()
+        snapshots: Dict[LibvirtConnectionManager, Dict[str, str]] = {}
+
+        def get_state(vm_uuid: str, host: Optional[str]) -> str:
+            manager = self._manager_for(host)
+            if cache is not None and manager is self.conn_manager:
+                return cache.get(vm_uuid, "UNKNOWN")
+            if manager not in snapshots:
+                snapshots[manager] = self._fetch_domain_states(manager, host)
+            return snapshots[manager].get(vm_uuid, "UNKNOWN")
+
+        return get_state, as_of
+
+    def _fetch_domain_states(self, manager: LibvirtConnectionManager, host: Optional[str] = None) -> Dict[str, str]:
+        """
+        호스트에 정의된 모든 도메인의 상태를 한 번의 벌크 호출로 가져옵니다.
+
+        VM마다 lookupByUUIDString + info()를 호출하면 VM 개수만큼 하이퍼바이저
+        왕복이 발생하므로, getAllDomainStats로 전체 스냅샷을 받아 메모리에서 조인합니다.
+        하이퍼바이저에 연결할 수 없거나 조회에 실패하면 빈 스냅샷을 반환하여 그 호스트의 VM이 모두
+        'UNKNOWN'으로 표시됩니다.
+
+        Args:
+            manager: 상태를 가져올 호스트의 연결 관리자.
+            host: 로그에 남길 호스트 이름.
+
+        Returns:
+            도메인 UUID를 키로, 상태 문자열을 값으로 하는 딕셔너리.
+        """
+        try:
+            conn = manager.get()
+            with libvirt_call_timer("getAllDomainStats"):
+                all_stats = conn.getAllDomainStats(libvirt.VIR_DOMAIN_STATS_STATE)
+        except (libvirt.libvirtError, ConnectionError) as e:
+            # 목록은 스트리밍 중에 호스트별로 조회하므로, 연결할 수 없는 호스트도 예외 대신 'UNKNOWN'으로 표시
+            logger.warning("Failed to fetch domain state snapshot from host '%s': %s", host or "default", e)
+            return {}
+
+        return {
+            domain.UUIDString(): domain_state_name(stats.get("state.state"))
+            for domain, stats in all_stats
+        }
 
     def destroy_vm(self, project_id: int, vm_name: str):
         """
@@ -153,78 +578,100 @@ class ComputeService:
         if not vm_to_delete:
             raise VmNotFoundError(f"VM '{vm_name}' not found in project '{project_id}'.")
 
+        capacity = self._capacity_of(vm_to_delete)
         try:
-            # Libvirt 리소스 정리
-            try:
-                domain = self.conn.lookupByUUIDString(vm_to_delete.uuid)
-                if domain.isActive():
-                    domain.destroy()
-                domain.undefine()
-            except libvirt.libvirtError as e:
-                print(f"Libvirt Warning: Failed to clean up domain for VM '{vm_name}': {e}. Proceeding cleanup.")
-
-            # 디스크 리소스 정리
-            self.image_service.delete_vm_disk_by_name(vm_name)
-
+            self._release_vm_resources(vm_to_delete.name, vm_to_delete.uuid, vm_to_delete.host)
         finally:
-            # 최종적으로 DB에서 VM 기록 삭제
+            # 최종적으로 DB에서 VM 기록 삭제 (리소스 정리 중 예외가 나도 삭제는 확정)
+            self._release_quota(project_id, [vm_to_delete])
             self.vm_repo.delete(vm_to_delete)
-            print(f"DB Info: Record for VM '{vm_name}' in project '{project_id}' deleted.")
+            self._checkpoint()
+            self._release_capacity(capacity)
+            logger.info("Record for VM '%s' in project '%s' deleted.", vm_name, project_id)
 
         return True
 
-    def reconcile_vms(self):
+    def destroy_vms(self, project_id: int, vm_names: List[str], concurrency: int) -> List[Dict[str, Any]]:
         """
-        하이퍼바이저와 DB의 상태를 비교하여 불일치하는 VM을 찾아냅니다.
+        여러 VM을 한 번에 삭제합니다. (일괄 삭제)
 
-        DB에는 없지만 libvirt에만 존재하는 '유령(Ghost) VM'의 목록을 반환합니다.
-        이는 시스템 외부에서 비정상적으로 생성되었거나, DB 오류로 기록이 누락된 VM일 수 있습니다.
+        대상 VM들은 한 번의 쿼리로 조회하고, libvirt 도메인과 디스크 정리는 최대
+        concurrency개씩 병렬로 실행한 뒤, DB 기록은 하나의 트랜잭션으로 삭제합니다.
+        단일 삭제와 마찬가지로 리소스 정리에 실패해도 DB 기록은 삭제합니다.
 
-        Returns:
-            유령 VM의 정보(이름, UUID, 상태)가 포함된 딕셔너리의 리스트.
+        Args:
+            project_id: 삭제할 VM들이 속한 프로젝트의 ID.
+            vm_names: 삭제할 VM 이름 목록.
+            concurrency: 동시에 정리할 최대 VM 수.
 
-        Raises:
-            ConnectionError: libvirt에 연결할 수 없을 때.
+        Returns:
+            요청한 이름 순서대로의 항목별 결과 목록.
+            (예: [{'name': 'vm-1', 'status': 'deleted'}, {'name': 'vm-2', 'status': 'failed', 'error': '...'}])
         """
+        names = list(dict.fromkeys(vm_names))
+        vms = {vm.name: vm for vm in self.vm_repo.find_by_names_and_project_id(names, project_id)}
+        targets = [(vm.name, vm.uuid, vm.host) for vm in vms.values()]
+        capacities = [self._capacity_of(vm) for vm in vms.values()]
+
+        warnings = {}
+        if targets:
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(targets)))) as executor:
+                futures = {
+                    executor.submit(tracing.propagate(self._release_vm_resources), name, vm_uuid, host): name
+                    for name, vm_uuid, host in targets
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        warnings[futures[future]] = str(e)
+
+            self._release_quota(project_id, list(vms.values()))
+            self.vm_repo.delete_many(list(vms.values()))
+            # 호스트 용량은 삭제가 커밋된 뒤에 반납 (롤백되면 VM 기록이 남으므로)
+            for capacity in capacities:
+                if self.unit_of_work:
+                    self.unit_of_work.after_commit(lambda capacity=capacity: self._release_capacity(capacity))
+                else:
+                    self._release_capacity(capacity)
+
+        results = []
+        for name in names:
+            if name not in vms:
+                results.append(self._failed_result(name, f"VM '{name}' not found in project '{project_id}'."))
+            elif name in warnings:
+                results.append({"name": name, "status": "deleted", "warning": warnings[name]})
+            else:
+                results.append({"name": name, "status": "deleted"})
+        return results
+
+    def _release_vm_resources(self, vm_name: str, vm_uuid: str, host: Optional[str] = None):
+        """VM의 libvirt 도메인과 디스크를 정리합니다. DB 세션을 사용하지 않으므로 병렬 호출이 가능합니다."""
+        # Libvirt 리소스 정리
         try:
-            all_domains = self.conn.listAllDomains(0)
-            libvirt_uuids = {domain.UUIDString() for domain in all_domains}
+            conn = self._conn_for(host)
+            with libvirt_call_timer("lookupByUUIDString"):
+                domain = conn.lookupByUUIDString(vm_uuid)
+            if domain.isActive():
+                with libvirt_call_timer("destroy"):
+                    domain.destroy()
+            with libvirt_call_timer("undefine"):
+                domain.undefine()
+            self._forget_domain(vm_uuid)
         except libvirt.libvirtError as e:
-            raise ConnectionError(f"Error fetching domains from libvirt: {e}")
+            logger.warning("Failed to clean up domain for VM '%s': %s. Proceeding cleanup.", vm_name, e)
 
-        db_uuids = set(self.vm_repo.list_all_uuids())
-        ghost_vm_uuids = libvirt_uuids - db_uuids
+        # 디스크 리소스 정리
+        self.image_service.delete_vm_disk_by_name(vm_name)
 
-        ghost_vms = []
-        for uuid in ghost_vm_uuids:
-            try:
-                domain = self.conn.lookupByUUIDString(uuid)
-                ghost_vms.append({
-                    "name": domain.name(),
-                    "uuid": uuid,
-                    "state": self._map_vm_state(domain.info()[0])
-                })
-            except libvirt.libvirtError:
-                continue
-        
-        return ghost_vms
+    def _record_domain_state(self, vm_uuid: str, vm_name: str, state: str):
+        """이 프로세스가 바꾼 도메인 상태를 이벤트를 기다리지 않고 캐시에 반영합니다."""
+        if self.state_cache is not None:
+            self.state_cache.update(vm_uuid, vm_name, state)
 
-    def _map_vm_state(self, state_code):
-        state_map = {
-            libvirt.VIR_DOMAIN_NOSTATE: 'NOSTATE',
-            libvirt.VIR_DOMAIN_RUNNING: 'RUNNING',
-            libvirt.VIR_DOMAIN_BLOCKED: 'BLOCKED',
-            libvirt.VIR_DOMAIN_PAUSED: 'PAUSED',
-            libvirt.VIR_DOMAIN_SHUTDOWN: 'SHUTDOWN',
-            libvirt.VIR_DOMAIN_SHUTOFF: 'SHUTOFF',
-            libvirt.VIR_DOMAIN_CRASHED: 'CRASHED',
-            libvirt.VIR_DOMAIN_PMSUSPENDED: 'PMSUSPENDED',
-        }
-        return state_map.get(state_code, 'UNKNOWN')
+    def _forget_domain(self, vm_uuid: str):
+        if self.state_cache is not None:
+            self.state_cache.discard(vm_uuid)
 
-    def __del__(self):
-        if self.conn:
-            try:
-                self.conn.close()
-            except libvirt.libvirtError:
-                pass # 이미 닫혔거나 할 수 없는 경우 무시
+    def _map_vm_state(self, state_code):
+        return domain_state_name(state_code)
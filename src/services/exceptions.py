@@ -21,6 +21,10 @@ class ImageNotFoundError(Exception):
     """이미지를 찾을 수 없을 때"""
     pass
 
+class TaskNotFoundError(Exception):
+    """비동기 작업을 찾을 수 없을 때"""
+    pass
+
 # --- Creation/Validation Exceptions ---
 class VmAlreadyExistsError(Exception):
     """VM 이름이 이미 존재할 때"""
@@ -42,6 +46,31 @@ class VmCreationError(Exception):
     """VM 생성 과정(디스크, libvirt 등)에서 오류 발생 시"""
     pass
 
+class ImageRequirementError(Exception):
+    """VM 사양이 이미지의 최소 RAM/디스크 요구 사항에 못 미칠 때"""
+    pass
+
+class ImageAlreadyExistsError(Exception):
+    """이미지 이름이 이미 존재할 때"""
+    pass
+
+class ImageUploadConflictError(Exception):
+    """이미지 파일 업로드가 현재 상태와 맞지 않을 때 (이미 활성 상태, 오프셋 불일치, 동시 업로드)"""
+    pass
+
+# --- Capacity Exceptions ---
+class TaskQueueFullError(Exception):
+    """비동기 작업 대기열이 가득 차 새 작업을 받을 수 없을 때"""
+    pass
+
+class NoValidHostError(Exception):
+    """요청한 VM을 받을 수 있는 컴퓨트 호스트가 없을 때"""
+    pass
+
+class QuotaExceededError(Exception):
+    """요청한 자원이 프로젝트의 쿼터를 넘을 때"""
+    pass
+
 # --- Auth Exceptions ---
 class TokenInvalidError(Exception):
     """토큰이 유효하지 않거나 없을 때"""
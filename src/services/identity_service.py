@@ -1,23 +1,32 @@
-import hashlib
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from src.database import models
 from src.repositories.interfaces import (
-    IProjectRepository, IUserRepository, IRoleRepository, IVMRepository
+    IProjectRepository, IUserRepository, IRoleRepository, IVMRepository, ITokenRepository
 )
+from src.repositories.memory.memory_token_repository import MemoryTokenRepository
+from src.utils.pagination import Page, select_fields
+from src.utils.password_hasher import PasswordHasher
+from src.utils.signed_token import RevocationList, TokenSignatureError, TokenSigner
 from src.services.exceptions import (
     ProjectCreationError, UserCreationError, ProjectNotEmptyError, 
     ProjectNotFoundError, UserNotFoundError, RoleNotFoundError, 
     AuthenticationError, TokenInvalidError
 )
 
+# 목록 조회에서 반환할 수 있는 필드
+PROJECT_LIST_FIELDS = ("id", "name")
+USER_LIST_FIELDS = ("id", "username")
+
 class IdentityService:
     """프로젝트, 사용자, 역할, 인증 등 신원 및 접근 관리 서비스를 제공합니다."""
-    _token_cache = {}
 
-    def __init__(self, user_repo: IUserRepository, project_repo: IProjectRepository, role_repo: IRoleRepository, vm_repo: IVMRepository):
+    def __init__(self, user_repo: IUserRepository, project_repo: IProjectRepository, role_repo: IRoleRepository, vm_repo: IVMRepository,
+                 token_repo: Optional[ITokenRepository] = None, token_ttl: timedelta = timedelta(hours=1),
+                 token_signer: Optional[TokenSigner] = None, revocation_list: Optional[RevocationList] = None,
+                 password_hasher: Optional[PasswordHasher] = None):
         """
         IdentityService를 초기화합니다.
 
@@ -26,11 +35,23 @@ class IdentityService:
             project_repo: 프로젝트 데이터에 접근하기 위한 리포지토리.
             role_repo: 역할 데이터에 접근하기 위한 리포지토리.
             vm_repo: VM 데이터에 접근하기 위한 리포지토리 (프로젝트 삭제 시 검증용).
+            token_repo: 발급한 토큰을 보관하는 저장소. 요청마다 서비스가 새로 만들어지므로
+                        프로세스 전역 저장소를 주입해야 하며, 생략하면 이 인스턴스 전용 메모리 저장소를 사용합니다.
+            token_ttl: 발급한 토큰의 유효 기간.
+            token_signer: 지정하면 저장소 대신 HMAC 서명 토큰을 발급/검증합니다. (서명 토큰 모드)
+            revocation_list: 서명 토큰 모드에서 폐기된 토큰을 보관하는 목록. 프로세스 전역 객체를 주입해야 합니다.
+            password_hasher: 비밀번호 해시/검증기. 워커 풀과 검증 캐시를 공유하도록 프로세스 전역 객체를 주입해야 하며,
+                             생략하면 호출 스레드에서 KDF를 실행하는 기본 설정을 사용합니다.
         """
         self.user_repo = user_repo
         self.project_repo = project_repo
         self.role_repo = role_repo
         self.vm_repo = vm_repo
+        self.token_repo = token_repo or MemoryTokenRepository()
+        self.token_ttl = token_ttl
+        self.token_signer = token_signer
+        self.revocation_list = revocation_list if revocation_list is not None else RevocationList()
+        self.password_hasher = password_hasher or PasswordHasher(workers=0)
 
     def create_project(self, name: str) -> Dict[str, Any]:
         """
@@ -51,10 +72,24 @@ class IdentityService:
         created_project = self.project_repo.create(new_project)
         return {"id": created_project.id, "name": created_project.name}
 
-    def list_projects(self) -> List[Dict[str, Any]]:
-        """모든 프로젝트의 목록을 조회합니다."""
-        projects = self.project_repo.list_all()
-        return [{"id": p.id, "name": p.name} for p in projects]
+    def list_projects(self, limit: int, marker: Optional[str] = None, name_prefix: Optional[str] = None,
+                      fields: Optional[List[str]] = None) -> Page:
+        """
+        프로젝트 목록을 이름순으로 한 페이지 조회합니다.
+
+        Args:
+            limit: 페이지 크기.
+            marker: 이전 페이지의 마지막 프로젝트 이름. (응답의 next_marker)
+            name_prefix: 이름이 이 접두사로 시작하는 프로젝트만 조회합니다.
+            fields: 응답에 포함할 필드 목록. (기본값: 'id', 'name')
+
+        Returns:
+            프로젝트 정보 딕셔너리를 내보내는 Page. 순회가 끝나면 next_marker에 다음 페이지 마커가 설정됩니다.
+        """
+        fields = select_fields(fields, PROJECT_LIST_FIELDS)
+        columns = list(dict.fromkeys(fields + ["name"]))
+        rows = self.project_repo.list_page(limit + 1, columns, marker=marker, name_prefix=name_prefix)
+        return Page(rows, limit, "name", lambda row: {field: row[field] for field in fields})
 
     def get_project(self, project_id: int) -> Dict[str, Any]:
         """
@@ -96,15 +131,29 @@ class IdentityService:
         if self.user_repo.find_by_username(username):
             raise UserCreationError(f"User with username '{username}' already exists.")
         
-        password_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
+        password_hash = self.password_hasher.hash(password)
         new_user = models.User(username=username, password_hash=password_hash)
         created_user = self.user_repo.create(new_user)
         return {"id": created_user.id, "username": created_user.username}
 
-    def list_users(self) -> List[Dict[str, Any]]:
-        """모든 사용자의 목록을 조회합니다. (비밀번호 제외)"""
-        users = self.user_repo.list_all()
-        return [{"id": u.id, "username": u.username} for u in users]
+    def list_users(self, limit: int, marker: Optional[str] = None, username_prefix: Optional[str] = None,
+                   fields: Optional[List[str]] = None) -> Page:
+        """
+        사용자 목록을 사용자 이름순으로 한 페이지 조회합니다. (비밀번호 제외)
+
+        Args:
+            limit: 페이지 크기.
+            marker: 이전 페이지의 마지막 사용자 이름. (응답의 next_marker)
+            username_prefix: 사용자 이름이 이 접두사로 시작하는 사용자만 조회합니다.
+            fields: 응답에 포함할 필드 목록. (기본값: 'id', 'username')
+
+        Returns:
+            사용자 정보 딕셔너리를 내보내는 Page. 순회가 끝나면 next_marker에 다음 페이지 마커가 설정됩니다.
+        """
+        fields = select_fields(fields, USER_LIST_FIELDS)
+        columns = list(dict.fromkeys(fields + ["username"]))
+        rows = self.user_repo.list_page(limit + 1, columns, marker=marker, username_prefix=username_prefix)
+        return Page(rows, limit, "username", lambda row: {field: row[field] for field in fields})
 
     def get_user(self, user_id: int) -> Dict[str, Any]:
         """
@@ -188,32 +237,47 @@ class IdentityService:
         """
         자격증명을 검증하고, 성공 시 프로젝트 범위의 인증 토큰을 발급합니다.
 
+        사용자, 프로젝트, 멤버십(역할)은 한 번의 쿼리로 조회하며,
+        프로젝트에서의 역할 목록은 토큰에 담겨 이후 권한 확인에 추가 조회가 필요 없습니다.
+
         Raises:
             AuthenticationError: 사용자, 프로젝트, 멤버십 검증에 실패했을 때.
         """
-        user = self.user_repo.find_by_username(username)
-        if not user:
+        context = self.user_repo.find_login_context(username, project_name)
+        if not context:
+            # 없는 사용자도 같은 KDF를 실행하여 응답 시간으로 사용자 이름의 존재 여부가 드러나지 않게 함
+            self.password_hasher.verify(password, self.password_hasher.dummy_hash())
             raise AuthenticationError("Invalid username or password.")
+        user, project, roles = context
 
-        password_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
-        if user.password_hash != password_hash:
+        if not self.password_hasher.verify(password, user.password_hash):
             raise AuthenticationError("Invalid username or password.")
 
-        project = self.project_repo.find_by_name(project_name)
         if not project:
             raise AuthenticationError(f"Project '{project_name}' not found.")
 
-        is_member = any(assoc.project_id == project.id for assoc in user.project_associations)
-        if not is_member:
+        if not roles:
             raise AuthenticationError(f"User '{username}' is not a member of project '{project_name}'.")
 
+        self._rehash_password_if_needed(user, password)
+
+        if self.token_signer:
+            # 서명 토큰은 검증에 필요한 정보를 모두 담으므로 저장하지 않음
+            expires_at = datetime.fromtimestamp(int((datetime.now() + self.token_ttl).timestamp()))
+            token = self.token_signer.sign({
+                'u': user.id, 'p': project.id, 'r': roles,
+                'e': int(expires_at.timestamp()), 'j': uuid.uuid4().hex,
+            })
+            return {"token": token, "expires_at": expires_at.isoformat()}
+
         token = str(uuid.uuid4())
-        expires_at = datetime.now() + timedelta(hours=1)
-        self._token_cache[token] = {
+        expires_at = datetime.now() + self.token_ttl
+        self.token_repo.save(token, {
             'user_id': user.id,
             'project_id': project.id,
+            'roles': roles,
             'expires_at': expires_at
-        }
+        })
         return {"token": token, "expires_at": expires_at.isoformat()}
 
     def validate_token(self, token: str) -> Dict[str, Any]:
@@ -223,12 +287,55 @@ class IdentityService:
         Raises:
             TokenInvalidError: 토큰을 찾을 수 없거나 만료되었을 때.
         """
-        token_data = self._token_cache.get(token)
+        if self.token_signer:
+            return self._validate_signed_token(token)
+
+        token_data = self.token_repo.find(token)
         if not token_data:
             raise TokenInvalidError("Token not found or invalid.")
 
         if datetime.now() > token_data['expires_at']:
-            del self._token_cache[token]
+            self.token_repo.delete(token)
             raise TokenInvalidError("Token has expired.")
             
-        return token_data
\ No newline at end of file
+        return token_data
+
+    def _rehash_password_if_needed(self, user: models.User, password: str):
+        """구버전 해시나 이전 작업 계수로 저장된 비밀번호를 로그인에 성공한 시점에 현재 설정으로 다시 해시합니다."""
+        if self.password_hasher.needs_rehash(user.password_hash):
+            user.password_hash = self.password_hasher.hash(password)
+            self.user_repo.update(user)
+
+    def revoke_token(self, token: str) -> bool:
+        """
+        인증 토큰을 만료 전에 폐기합니다. (로그아웃)
+
+        Raises:
+            TokenInvalidError: 토큰이 이미 유효하지 않을 때.
+        """
+        token_data = self.validate_token(token)
+        if self.token_signer:
+            self.revocation_list.revoke(token_data['jti'], token_data['expires_at'].timestamp())
+        else:
+            self.token_repo.delete(token)
+        return True
+
+    def _validate_signed_token(self, token: str) -> Dict[str, Any]:
+        """서명 토큰을 공유 상태 없이 검증합니다. (서명 확인, 만료 확인, 폐기 목록 확인)"""
+        try:
+            payload = self.token_signer.verify(token)
+            token_data = {
+                'user_id': payload['u'],
+                'project_id': payload['p'],
+                'roles': payload.get('r', []),
+                'expires_at': datetime.fromtimestamp(payload['e']),
+                'jti': payload['j'],
+            }
+        except (TokenSignatureError, KeyError, TypeError, ValueError):
+            raise TokenInvalidError("Token not found or invalid.")
+
+        if datetime.now() > token_data['expires_at']:
+            raise TokenInvalidError("Token has expired.")
+        if self.revocation_list.is_revoked(token_data['jti']):
+            raise TokenInvalidError("Token has been revoked.")
+        return token_data
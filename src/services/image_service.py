@@ -1,27 +1,111 @@
+import fcntl
+import hashlib
+import re
 import subprocess
 import os
-from typing import Optional
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
+from src.database import models
 from src.repositories.interfaces import IImageRepository
-from src.services.exceptions import ImageNotFoundError
+from src.services.exceptions import (
+    ImageAlreadyExistsError, ImageNotFoundError, ImageRequirementError, ImageUploadConflictError,
+)
+from src.utils import metrics, tracing
+from src.utils.disk_pool import OverlayPool
+from src.utils.file_transfer import DEFAULT_CHUNK_BYTES, copy_file, hash_file, write_stream
+from src.utils.image_cache import ImageCatalogCache, ImageInfo
+from src.utils.storage_helper import StorageHelperClient, StorageHelperError
+
+# 등록할 수 있는 디스크 형식. VM 디스크는 qcow2를 backing file로 하는 오버레이(-F qcow2)로 만들기 때문
+SUPPORTED_DISK_FORMATS = ("qcow2",)
+_QCOW2_MAGIC = b"QFI\xfb"
+_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+_SUBPROCESS_SECONDS = metrics.histogram(
+    "iaas_subprocess_duration_seconds", "Duration of external commands run by the image service.", ("command",)
+)
+
+
+def _subprocess_timer(command: str) -> tracing.Span:
+    """외부 명령 실행 시간을 메트릭과 추적 span('subprocess.<command>')으로 기록하는 with 블록을 반환합니다."""
+    return tracing.span(f"subprocess.{command}", observe=_SUBPROCESS_SECONDS.labels(command).observe)
+
+
+def create_overlay_disk(source_filepath: str, target_filepath: str):
+    """
+    source_filepath를 backing file로 하는 qcow2 오버레이 디스크를 만듭니다.
+
+    Raises:
+        subprocess.CalledProcessError: qemu-img가 실패했을 때.
+        FileNotFoundError: qemu-img(또는 sudo)를 찾을 수 없을 때.
+    """
+    command = [
+        'sudo', 'qemu-img', 'create',
+        '-f', 'qcow2',
+        '-F', 'qcow2',
+        '-b', source_filepath,
+        target_filepath
+    ]
+    with _subprocess_timer("qemu-img create"):
+        subprocess.run(command, check=True, capture_output=True, text=True)
+
+
+def remove_disk_file(disk_filepath: str):
+    """디스크 파일을 삭제합니다. (이미지 디렉터리는 root 소유이므로 sudo로 실행)"""
+    with _subprocess_timer("rm"):
+        subprocess.run(['sudo', 'rm', '-f', disk_filepath], check=True)
+
+
+def move_disk_file(source_filepath: str, target_filepath: str):
+    """디스크 파일을 target_filepath로 옮깁니다. (같은 파일 시스템이면 rename이므로 원자적, sudo로 실행)"""
+    with _subprocess_timer("mv"):
+        subprocess.run(['sudo', 'mv', '-T', source_filepath, target_filepath], check=True, capture_output=True)
+
+
+def make_disk_dir(dirpath: str):
+    """디스크를 보관할 디렉터리를 만듭니다. 서버 프로세스가 목록을 읽을 수 있도록 755 권한으로 만듭니다. (sudo로 실행)"""
+    with _subprocess_timer("mkdir"):
+        subprocess.run(['sudo', 'mkdir', '-p', '-m', '755', dirpath], check=True, capture_output=True)
+
 
 class ImageService:
-    def __init__(self, image_repo: IImageRepository):
+    def __init__(self, image_repo: IImageRepository, cache: Optional[ImageCatalogCache] = None,
+                 disk_pool: Optional[OverlayPool] = None, storage: Optional[StorageHelperClient] = None,
+                 import_dirs: Sequence[str] = (), upload_chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                 image_dir: str = "/var/lib/libvirt/images", upload_dir: Optional[str] = None):
         """
         ImageService를 초기화합니다.
 
         Args:
             image_repo: 이미지 데이터에 접근하기 위한 리포지토리 객체.
+            cache: 프로세스 전역 이미지 카탈로그 캐시. 없으면 매번 DB와 파일 시스템을 확인합니다.
+            disk_pool: 미리 만들어 둔 오버레이 디스크의 웜 풀. 있으면 VM 디스크를 풀에서 먼저 가져옵니다.
+            storage: 권한 헬퍼 클라이언트. 있으면 디스크 생성/삭제를 sudo 프로세스 대신 헬퍼에 요청합니다.
+            import_dirs: 서버의 로컬 파일을 이미지로 가져올 수 있는 디렉터리 목록. 비어 있으면 가져오기를 허용하지 않습니다.
+            upload_chunk_bytes: 이미지 파일을 받거나 복사할 때 한 번에 처리하는 크기(바이트).
+            image_dir: 이미지와 VM 디스크 파일을 두는 디렉터리. (root 소유이므로 쓰기는 헬퍼나 sudo로 수행)
+            upload_dir: 업로드/가져오기 중인 이미지 파일('.part')을 쓰는 디렉터리. 서버 프로세스가 쓸 수 있어야 하며,
+                        다 받은 파일은 헬퍼나 sudo로 image_dir에 옮깁니다. 없으면 image_dir에 씁니다.
         """
         self.image_repo = image_repo
-        self.image_base_dir = "/var/lib/libvirt/images"
+        self.cache = cache
+        self.disk_pool = disk_pool
+        self.storage = storage
+        self.import_dirs = [os.path.realpath(path) for path in import_dirs]
+        self.upload_chunk_bytes = upload_chunk_bytes
+        self.image_base_dir = image_dir
+        self.upload_dir = os.path.abspath(upload_dir) if upload_dir else None
 
-    def validate_image_and_get_path(self, image_name: str) -> str:
+    def validate_image_and_get_path(self, image_name: str, ram_mb: Optional[int] = None,
+                                    disk_gb: Optional[int] = None) -> str:
         """
-        DB에서 이미지를 찾아 유효성을 검사하고, 존재하면 파일 경로를 반환합니다.
+        이미지를 찾아 유효성을 검사하고, 존재하면 파일 경로를 반환합니다.
 
         Args:
             image_name: 검증할 이미지의 이름.
+            ram_mb, disk_gb: VM에 할당할 RAM(MB)과 디스크(GB). 주어지면 이미지의 최소 요구 사항과 비교합니다.
 
         Returns:
             이미지의 실제 파일 시스템 경로.
@@ -29,23 +113,96 @@ class ImageService:
         Raises:
             ImageNotFoundError: DB에서 해당 이름의 이미지를 찾지 못했을 때.
             FileNotFoundError: DB에는 기록이 있으나 실제 이미지 파일이 없을 때.
+            ImageRequirementError: VM 사양이 이미지의 최소 요구 사항에 못 미칠 때.
         """
-        image = self.image_repo.find_by_name(image_name)
+        image = self._find_images([image_name]).get(image_name)
         if not image:
             raise ImageNotFoundError(f"Image '{image_name}' not found in database.")
         
-        if not os.path.exists(image.filepath):
+        if not self._file_exists(image.filepath):
             # DB에는 있지만 실제 파일이 없는 경우
             raise FileNotFoundError(f"Source image file not found on disk: {image.filepath}")
-            
+
+        error = self._requirement_error(image, ram_mb, disk_gb)
+        if error:
+            raise ImageRequirementError(error)
         return image.filepath
 
+    def check_requirements(self, image_name: str, ram_mb: Optional[int] = None,
+                           disk_gb: Optional[int] = None) -> Optional[str]:
+        """
+        VM 사양이 이미지의 최소 RAM/디스크 요구 사항을 만족하지 않으면 오류 메시지를, 아니면 None을 반환합니다.
+        (일괄 생성에서 VM마다 호출하며, 캐시가 있으면 DB를 조회하지 않습니다. 없는 이미지는 검사하지 않음)
+        """
+        image = self._find_images([image_name]).get(image_name)
+        return self._requirement_error(image, ram_mb, disk_gb) if image else None
+
+    @staticmethod
+    def _requirement_error(image: ImageInfo, ram_mb: Optional[int], disk_gb: Optional[int]) -> Optional[str]:
+        if ram_mb is not None and image.min_ram_mb and ram_mb < image.min_ram_mb:
+            return f"Image '{image.name}' requires at least {image.min_ram_mb} MB of RAM (requested {ram_mb} MB)."
+        if disk_gb is not None and image.min_disk_gb and disk_gb < image.min_disk_gb:
+            return f"Image '{image.name}' requires at least {image.min_disk_gb} GB of disk (requested {disk_gb} GB)."
+        return None
+
+    def find_images(self, image_names: List[str]) -> Dict[str, ImageInfo]:
+        """이름별 이미지 메타데이터를 반환합니다. 없는 이름은 결과에 포함되지 않습니다."""
+        return self._find_images(list(dict.fromkeys(image_names)))
+
+    def _find_images(self, names: List[str]) -> Dict[str, ImageInfo]:
+        if self.cache is None:
+            return {image.name: ImageInfo.from_model(image) for image in self._query_images(names)}
+
+        images, missing = self.cache.get_many(names)
+        if missing:
+            loaded = [ImageInfo.from_model(image) for image in self._query_images(missing)]
+            self.cache.put_many(loaded)
+            images.update((image.name, image) for image in loaded)
+        return images
+
+    def _query_images(self, names: List[str]):
+        if len(names) == 1:
+            image = self.image_repo.find_by_name(names[0])
+            images = [image] if image else []
+        else:
+            images = self.image_repo.find_by_names(names)
+        # 파일 업로드가 끝나지 않은 이미지는 VM 생성에 사용할 수 없음 (캐시에도 넣지 않음)
+        return [image for image in images if image.status != "queued"]
+
+    def _file_exists(self, path: str) -> bool:
+        return self.cache.file_exists(path) if self.cache is not None else os.path.exists(path)
+
+    def validate_images_and_get_paths(self, image_names: List[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        여러 이미지를 한 번의 DB 조회로 검증합니다. (일괄 VM 생성용)
+
+        Args:
+            image_names: 검증할 이미지 이름 목록. 중복이 있어도 됩니다.
+
+        Returns:
+            (이미지 이름 -> 파일 경로, 이미지 이름 -> 오류 메시지) 튜플.
+            모든 이름은 두 딕셔너리 중 정확히 한 곳에 포함됩니다.
+        """
+        unique_names = list(dict.fromkeys(image_names))
+        images = self._find_images(unique_names)
+
+        paths, errors = {}, {}
+        for name in unique_names:
+            image = images.get(name)
+            if not image:
+                errors[name] = f"Image '{name}' not found in database."
+            elif not self._file_exists(image.filepath):
+                errors[name] = f"Source image file not found on disk: {image.filepath}"
+            else:
+                paths[name] = image.filepath
+        return paths, errors
+
     def create_vm_disk(self, vm_name: str, source_filepath: str) -> str:
         """
         CoW(Copy-on-Write) 방식으로 새 VM 디스크를 생성합니다.
 
-        qemu-img 유틸리티를 사용하여 원본 이미지를 backing file으로 하는
-        새로운 qcow2 디스크 이미지를 생성합니다.
+        웜 풀에 이 이미지의 오버레이가 준비되어 있으면 그 파일을 VM 디스크 경로로 옮기고,
+        없으면 qemu-img 유틸리티로 원본 이미지를 backing file으로 하는 새 qcow2 디스크 이미지를 생성합니다.
 
         Args:
             vm_name: 생성할 VM의 이름. 새 디스크 파일명에 사용됩니다.
@@ -60,15 +217,16 @@ class ImageService:
         target_filename = f"{vm_name}.qcow2"
         target_filepath = os.path.join(self.image_base_dir, target_filename)
 
+        if self.disk_pool is not None and self.disk_pool.take(source_filepath, target_filepath):
+            return target_filepath
+
         try:
-            command = [
-                'sudo', 'qemu-img', 'create', 
-                '-f', 'qcow2', 
-                '-F', 'qcow2',
-                '-b', source_filepath, 
-                target_filepath
-            ]
-            subprocess.run(command, check=True, capture_output=True, text=True)
+            if self.storage is not None:
+                self.storage.create_overlay(source_filepath, target_filepath)
+            else:
+                create_overlay_disk(source_filepath, target_filepath)
+        except StorageHelperError as e:
+            raise Exception(f"Failed to create CoW disk for {vm_name}: {e}")
         except subprocess.CalledProcessError as e:
             raise Exception(f"Failed to create CoW disk for {vm_name}: {e.stderr}")
         except FileNotFoundError:
@@ -93,9 +251,14 @@ class ImageService:
             print(f"Disk file not found, skipping delete: {disk_filepath}")
             return True
         try:
-            subprocess.run(['sudo', 'rm', '-f', disk_filepath], check=True)
+            if self.storage is not None:
+                self.storage.delete(disk_filepath)
+            else:
+                remove_disk_file(disk_filepath)
             print(f"Disk file successfully deleted: {disk_filepath}")
             return True
+        except StorageHelperError as e:
+            raise Exception(f"Failed to delete disk file '{disk_filepath}': {e}")
         except subprocess.CalledProcessError as e:
             raise Exception(f"Failed to delete disk file '{disk_filepath}': {e.stderr}")
 
@@ -111,3 +274,230 @@ class ImageService:
         """
         disk_filepath = os.path.join(self.image_base_dir, f"{vm_name}.qcow2")
         return self.delete_vm_disk(disk_filepath)
+
+    # --- 이미지 등록과 파일 업로드 ---
+
+    def create_image(self, name: str, disk_format: str = "qcow2", min_disk_gb: Optional[int] = None,
+                     min_ram_mb: Optional[int] = None, checksum: Optional[str] = None) -> Dict[str, Any]:
+        """
+        새 이미지를 'queued' 상태로 등록합니다. 파일은 upload_image_file 또는 import_image_file로 채웁니다.
+
+        Args:
+            name: 이미지 이름. (고유)
+            disk_format: 디스크 형식. 현재는 'qcow2'만 지원합니다.
+            min_disk_gb, min_ram_mb: 이 이미지로 VM을 만들 때 필요한 최소 디스크(GB)와 RAM(MB).
+            checksum: 파일 내용의 sha256(16진수). 주어지면 업로드가 끝날 때 실제 내용과 비교합니다.
+
+        Returns:
+            등록된 이미지 정보 딕셔너리.
+
+        Raises:
+            ValueError: 입력값이 올바르지 않을 때.
+            ImageAlreadyExistsError: 같은 이름의 이미지가 이미 있을 때.
+        """
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("'name' must be a non-empty string.")
+        if disk_format not in SUPPORTED_DISK_FORMATS:
+            raise ValueError(f"Unsupported disk format '{disk_format}'. Allowed: {', '.join(SUPPORTED_DISK_FORMATS)}.")
+        for field, value in (("min_disk_gb", min_disk_gb), ("min_ram_mb", min_ram_mb)):
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 0):
+                raise ValueError(f"'{field}' must be a non-negative integer.")
+        if checksum is not None and (not isinstance(checksum, str) or not _SHA256_PATTERN.match(checksum)):
+            raise ValueError("'checksum' must be a lowercase hex sha256 digest.")
+        if self.image_repo.find_by_name(name):
+            raise ImageAlreadyExistsError(f"Image with name '{name}' already exists.")
+
+        image = models.Image(
+            name=name,
+            filepath=os.path.join(self.image_base_dir, f"{uuid.uuid4().hex}.{disk_format}"),
+            min_disk_gb=min_disk_gb,
+            min_ram_mb=min_ram_mb,
+            status="queued",
+            checksum=checksum,
+            disk_format=disk_format,
+        )
+        self.image_repo.create(image)
+        return self._image_to_dict(image)
+
+    def get_image(self, image_id: int) -> Dict[str, Any]:
+        """
+        이미지 정보를 조회합니다. 업로드 중인 이미지는 지금까지 받은 크기(uploaded_bytes)를 포함합니다.
+
+        Raises:
+            ImageNotFoundError: 해당 ID의 이미지를 찾을 수 없을 때.
+        """
+        return self._image_to_dict(self._get_image(image_id))
+
+    def upload_image_file(self, image_id: int, stream, length: int, offset: int = 0,
+                          complete: bool = True) -> Dict[str, Any]:
+        """
+        요청 본문 스트림을 이미지 파일의 offset 위치부터 씁니다.
+
+        본문 전체를 메모리에 올리지 않고 upload_chunk_bytes 단위로 읽어 업로드 디렉터리의 '.part' 파일에 씁니다.
+        연결이 끊겨 일부만 받았으면 받은 만큼 남겨 두므로, 클라이언트는 get_image의 uploaded_bytes를
+        offset으로 하여 나머지를 다시 보낼 수 있습니다. 여러 요청으로 나누어 보낼 때는 마지막 요청 외에는
+        complete=False로 보냅니다.
+
+        complete이면 마지막 요청의 본문을 쓰면서 sha256을 함께 계산하고(이전 요청에서 받은 부분은 먼저 읽어서 해시),
+        형식과 체크섬을 확인한 뒤 파일을 이미지 경로로 옮기고 'active'로 바꿉니다.
+
+        Args:
+            stream: read(size) 또는 readinto(buffer)를 지원하는 본문 스트림. (wsgi.input)
+            length: 이번 요청에서 받을 바이트 수. (Content-Length)
+            offset: 이번 본문이 시작하는 위치. 이미 받은 크기와 같아야 합니다.
+            complete: 이번 요청으로 업로드가 끝나는지 여부.
+
+        Returns:
+            이미지 정보 딕셔너리.
+
+        Raises:
+            ImageNotFoundError: 해당 ID의 이미지를 찾을 수 없을 때.
+            ImageUploadConflictError: 이미 활성 상태이거나, offset이 받은 크기와 다르거나, 다른 업로드가 진행 중일 때.
+            ValueError: 본문을 다 받지 못했거나, 파일이 비었거나, 형식 또는 체크섬이 맞지 않을 때.
+        """
+        image = self._get_queued_image(image_id)
+        with self._locked_part_file(image) as fd:
+            received = os.fstat(fd).st_size
+            if offset != received:
+                raise ImageUploadConflictError(
+                    f"Upload of image {image_id} must continue at offset {received}, got {offset}."
+                )
+            hasher = None
+            if complete:
+                hasher = hashlib.sha256()
+                hash_file(fd, hasher, offset, chunk_size=self.upload_chunk_bytes)
+
+            with tracing.span("image.upload", bytes=length):
+                try:
+                    written = write_stream(stream, fd, length, offset, hasher, self.upload_chunk_bytes)
+                except OSError:
+                    written = None  # 클라이언트 연결이 끊겼거나 디스크 쓰기에 실패함
+            if written != length:
+                received = os.fstat(fd).st_size
+                raise ValueError(
+                    f"Upload of image {image_id} was interrupted at {received} of {offset + length} bytes; "
+                    f"resume with offset={received}."
+                )
+            if complete:
+                self._activate_image(image, fd, offset + length, hasher.hexdigest())
+        return self._image_to_dict(image)
+
+    def check_import_path(self, source_path: str) -> str:
+        """
+        가져올 로컬 파일이 허용된 디렉터리 안의 일반 파일인지 확인하고, 심볼릭 링크를 푼 실제 경로를 반환합니다.
+
+        Raises:
+            ValueError: 가져오기가 허용되지 않았거나, 허용된 디렉터리 밖이거나, 일반 파일이 아닐 때.
+        """
+        if not self.import_dirs:
+            raise ValueError("Importing images from a local path is not enabled on this server.")
+        if not isinstance(source_path, str) or not os.path.isabs(source_path):
+            raise ValueError("'source_path' must be an absolute path.")
+        real_path = os.path.realpath(source_path)
+        if not any(real_path != allowed and os.path.commonpath([real_path, allowed]) == allowed
+                   for allowed in self.import_dirs):
+            raise ValueError(f"'{source_path}' is outside the directories images can be imported from.")
+        if not os.path.isfile(real_path):
+            raise ValueError(f"'{source_path}' is not a regular file.")
+        return real_path
+
+    def import_image_file(self, image_id: int, source_path: str,
+                          progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """
+        서버의 로컬 파일을 이미지 파일로 복사합니다. (백그라운드 작업에서 실행)
+
+        복사는 copy_file_range(안 되면 sendfile)로 커널 안에서 처리하므로 데이터가 이 프로세스를 거치지 않습니다.
+        그래서 sha256은 복사 중에 계산할 수 없고, 복사가 끝난 뒤 저장된 파일을 한 번 읽어 계산합니다.
+
+        Raises:
+            ImageNotFoundError, ImageUploadConflictError: upload_image_file과 같음.
+            ValueError: 가져올 수 없는 경로이거나, 형식 또는 체크섬이 맞지 않을 때.
+        """
+        image = self._get_queued_image(image_id)
+        real_path = self.check_import_path(source_path)
+        progress = progress or (lambda step: None)
+        with open(real_path, "rb") as source, self._locked_part_file(image) as fd:
+            length = os.fstat(source.fileno()).st_size
+            os.ftruncate(fd, 0)
+            progress("copying")
+            with tracing.span("image.import.copy", bytes=length) as span:
+                span.set(method=copy_file(source.fileno(), fd, length, self.upload_chunk_bytes))
+            progress("verifying")
+            hasher = hashlib.sha256()
+            with tracing.span("image.import.checksum"):
+                hash_file(fd, hasher, length, chunk_size=self.upload_chunk_bytes)
+            self._activate_image(image, fd, length, hasher.hexdigest())
+        return self._image_to_dict(image)
+
+    def _get_image(self, image_id: int) -> models.Image:
+        image = self.image_repo.find_by_id(image_id)
+        if not image:
+            raise ImageNotFoundError(f"Image with id '{image_id}' not found.")
+        return image
+
+    def _get_queued_image(self, image_id: int) -> models.Image:
+        image = self._get_image(image_id)
+        if image.status != "queued":
+            raise ImageUploadConflictError(f"Image {image_id} is already {image.status}; its file cannot be replaced.")
+        return image
+
+    def _part_path(self, image: models.Image) -> str:
+        """업로드 중인 이미지 파일의 경로."""
+        return os.path.join(self.upload_dir or self.image_base_dir, f"{os.path.basename(image.filepath)}.part")
+
+    @contextmanager
+    def _locked_part_file(self, image: models.Image) -> Iterator[int]:
+        # 같은 이미지에 대한 동시 업로드는 파일 잠금으로 막음 (여러 워커 프로세스 사이에서도 유효)
+        if self.upload_dir:
+            os.makedirs(self.upload_dir, exist_ok=True)
+        fd = os.open(self._part_path(image), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                raise ImageUploadConflictError(f"Another upload of image {image.id} is in progress.")
+            yield fd
+        finally:
+            os.close(fd)
+
+    def _activate_image(self, image: models.Image, fd: int, size: int, checksum: str):
+        # 형식이나 체크섬이 틀리면 받은 내용을 버려 처음부터 다시 올리게 함
+        if size == 0:
+            raise ValueError("Image file is empty.")
+        if os.pread(fd, len(_QCOW2_MAGIC), 0) != _QCOW2_MAGIC:
+            os.ftruncate(fd, 0)
+            raise ValueError(f"Uploaded file is not a {image.disk_format} image.")
+        if image.checksum and image.checksum != checksum:
+            os.ftruncate(fd, 0)
+            raise ValueError(f"Checksum mismatch for image {image.id}: expected {image.checksum}, got {checksum}.")
+        os.fsync(fd)
+        # 이미지 디렉터리는 root 소유이므로 디스크 생성과 같은 권한 경로(헬퍼 또는 sudo)로 옮김
+        try:
+            if self.storage is not None:
+                self.storage.rename(self._part_path(image), image.filepath)
+            else:
+                move_disk_file(self._part_path(image), image.filepath)
+        except StorageHelperError as e:
+            raise Exception(f"Failed to move image file for image {image.id} into place: {e}")
+        except subprocess.CalledProcessError as e:
+            raise Exception(f"Failed to move image file for image {image.id} into place: {e.stderr}")
+        self.image_repo.mark_active(image, size, checksum, image.disk_format)
+
+    def _image_to_dict(self, image: models.Image) -> Dict[str, Any]:
+        data = {
+            "id": image.id,
+            "name": image.name,
+            "status": image.status,
+            "disk_format": image.disk_format,
+            "size_bytes": image.size_bytes,
+            "checksum": image.checksum,
+            "min_disk_gb": image.min_disk_gb,
+            "min_ram_mb": image.min_ram_mb,
+            "created_at": image.created_at.isoformat() if image.created_at else None,
+        }
+        if image.status == "queued":
+            try:
+                data["uploaded_bytes"] = os.path.getsize(self._part_path(image))
+            except OSError:
+                data["uploaded_bytes"] = 0
+        return data
@@ -0,0 +1,111 @@
+from typing import Any, Dict, Mapping, Optional
+
+from src.database import models
+from src.repositories.interfaces import IProjectRepository, IQuotaRepository
+from src.services.exceptions import ProjectNotFoundError, QuotaExceededError
+
+# 쿼터를 적용하는 자원: instances(VM 수), vcpus, ram_mb, disk_gb
+QUOTA_RESOURCES = models.QUOTA_RESOURCES
+
+
+class QuotaService:
+    """
+    프로젝트별 자원 쿼터를 검사하고 사용량을 기록합니다.
+
+    사용량은 project_usage 테이블의 카운터로 관리하며, 검사는 vms 테이블을 집계하지 않고
+    프로젝트 ID로 행 하나를 갱신하는 조건부 UPDATE 한 번으로 끝납니다.
+    확보(reserve)한 사용량은 호출한 트랜잭션에 속하므로, VM 기록과 함께 커밋되고 롤백되면 함께 취소됩니다.
+    같은 프로젝트에 동시에 들어온 생성 요청은 이 행의 쓰기 잠금에서 직렬화되므로, 한도를 함께 넘지 못합니다.
+    """
+
+    def __init__(self, quota_repo: IQuotaRepository, project_repo: IProjectRepository,
+                 defaults: Mapping[str, int]):
+        """
+        Args:
+            quota_repo: 프로젝트별 한도와 사용량에 접근하기 위한 리포지토리.
+            project_repo: 프로젝트 존재 여부 확인용 리포지토리.
+            defaults: 자원 이름 -> 기본 한도. 프로젝트별 한도가 없는 자원에 적용됩니다. (-1은 무제한)
+        """
+        self.quota_repo = quota_repo
+        self.project_repo = project_repo
+        self.defaults = dict(defaults)
+
+    def get_limits(self, project_id: int) -> Dict[str, int]:
+        """프로젝트에 적용되는 자원별 한도를 반환합니다. (-1은 무제한)"""
+        quota = self.quota_repo.get_quota(project_id)
+        limits = {}
+        for resource in QUOTA_RESOURCES:
+            limit = getattr(quota, resource) if quota is not None else None
+            limits[resource] = limit if limit is not None else self.defaults.get(resource, -1)
+        return limits
+
+    def get_quotas(self, project_id: int) -> Dict[str, Any]:
+        """
+        프로젝트의 자원별 한도와 사용량을 조회합니다.
+
+        Returns:
+            {'project_id': 1, 'quotas': {'instances': {'limit': 10, 'in_use': 3}, ...}} 형태의 딕셔너리.
+
+        Raises:
+            ProjectNotFoundError: 해당 ID의 프로젝트를 찾을 수 없을 때.
+        """
+        if not self.project_repo.find_by_id(project_id):
+            raise ProjectNotFoundError(f"Project with id '{project_id}' not found.")
+        limits = self.get_limits(project_id)
+        usage = self.quota_repo.get_usage(project_id)
+        return {
+            "project_id": project_id,
+            "quotas": {resource: {"limit": limits[resource], "in_use": usage[resource]} for resource in QUOTA_RESOURCES},
+        }
+
+    def set_quotas(self, project_id: int, limits: Mapping[str, Optional[int]]) -> Dict[str, Any]:
+        """
+        프로젝트별 한도를 설정합니다. None은 기본 한도로, -1은 무제한으로 되돌립니다.
+
+        이미 사용 중인 양보다 낮게 설정할 수 있으며, 이 경우 사용량이 한도 아래로 내려갈 때까지 새 자원을 만들 수 없습니다.
+
+        Raises:
+            ProjectNotFoundError: 해당 ID의 프로젝트를 찾을 수 없을 때.
+            ValueError: 알 수 없는 자원이거나 한도가 -1 이상의 정수가 아닐 때.
+        """
+        if not self.project_repo.find_by_id(project_id):
+            raise ProjectNotFoundError(f"Project with id '{project_id}' not found.")
+        for resource, limit in limits.items():
+            if resource not in QUOTA_RESOURCES:
+                raise ValueError(f"Unknown quota resource '{resource}'. Allowed: {', '.join(QUOTA_RESOURCES)}.")
+            if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < -1):
+                raise ValueError(f"Quota for '{resource}' must be an integer >= -1 or null.")
+        self.quota_repo.set_quota(project_id, limits)
+        return self.get_quotas(project_id)
+
+    def reserve(self, project_id: int, instances: int = 1, vcpus: int = 0, ram_mb: int = 0, disk_gb: int = 0):
+        """
+        VM 생성에 필요한 자원을 사용량에 더합니다. 호출한 트랜잭션이 롤백되면 함께 취소됩니다.
+
+        Raises:
+            QuotaExceededError: 하나 이상의 자원이 한도를 넘을 때.
+        """
+        delta = {"instances": instances, "vcpus": vcpus, "ram_mb": ram_mb, "disk_gb": disk_gb}
+        limits = self.get_limits(project_id)
+        if self.quota_repo.add_usage(project_id, delta, limits):
+            return
+        # 실패한 경우에만 어떤 자원이 넘었는지 알려주기 위해 사용량을 읽음
+        usage = self.quota_repo.get_usage(project_id)
+        exceeded = [
+            f"{resource} (limit {limits[resource]}, in use {usage[resource]}, requested {delta[resource]})"
+            for resource in QUOTA_RESOURCES
+            if limits[resource] >= 0 and delta[resource] > 0 and usage[resource] + delta[resource] > limits[resource]
+        ]
+        raise QuotaExceededError(f"Quota exceeded for project '{project_id}': {', '.join(exceeded) or 'resources'}.")
+
+    def release(self, project_id: int, instances: int = 1, vcpus: int = 0, ram_mb: int = 0, disk_gb: int = 0):
+        """삭제한 VM의 자원을 사용량에서 뺍니다. (VM 삭제와 같은 트랜잭션에서 호출)"""
+        self.quota_repo.add_usage(project_id, {
+            "instances": -instances, "vcpus": -vcpus, "ram_mb": -ram_mb, "disk_gb": -disk_gb,
+        })
+
+    def add_existing(self, project_id: int, instances: int = 1, vcpus: int = 0, ram_mb: int = 0, disk_gb: int = 0):
+        """한도와 관계없이 이미 존재하는 VM의 자원을 사용량에 더합니다. (정합성 검사에서 도메인을 등록할 때)"""
+        self.quota_repo.add_usage(project_id, {
+            "instances": instances, "vcpus": vcpus, "ram_mb": ram_mb, "disk_gb": disk_gb,
+        })
@@ -0,0 +1,352 @@
+# src/services/reconcile_service.py
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import libvirt
+
+from src.database import models
+from src.database.unit_of_work import UnitOfWork
+from src.repositories.interfaces import IVMDriftRepository, IVMRepository
+from src.utils import metrics
+from src.utils.domain_state_cache import domain_state_name
+from src.utils.libvirt_connection import LibvirtConnectionManager, libvirt_call_timer
+from src.services.quota_service import QuotaService
+
+logger = logging.getLogger(__name__)
+
+# 불일치 종류별로 선택할 수 있는 조치 정책
+GHOST_POLICIES = ("report", "adopt", "destroy")   # 하이퍼바이저에만 있는 도메인
+MISSING_POLICIES = ("report", "mark_error")       # DB에만 있는 VM
+STATE_POLICIES = ("report", "sync")               # DB의 상태와 실제 상태가 다른 VM
+
+# 프로비저닝 중이거나(BUILDING) 이미 실패 처리된(ERROR) VM은 도메인이 없거나 상태가 다른 것이 정상입니다.
+_UNCHECKED_DB_STATES = ("BUILDING", "ERROR")
+# 하이퍼바이저 상태 중 DB에 기록할 때 같은 값으로 보는 상태 (BLOCKED는 실행 중인 VM의 일시적인 상태)
+_DB_STATE_ALIASES = {"BLOCKED": "RUNNING"}
+# 일시적이거나 알 수 없는 상태는 불일치로 보지 않습니다.
+_TRANSIENT_STATES = ("NOSTATE", "UNKNOWN")
+
+_SNAPSHOT_STATS = libvirt.VIR_DOMAIN_STATS_STATE | libvirt.VIR_DOMAIN_STATS_VCPU | libvirt.VIR_DOMAIN_STATS_BALLOON
+
+_RUN_SECONDS = metrics.histogram("iaas_reconcile_duration_seconds", "Duration of reconcile passes.")
+_FAILURES = metrics.counter("iaas_reconcile_failures_total", "Reconcile passes that failed.")
+_DRIFTS = metrics.counter("iaas_reconcile_drifts_total", "Drift detected by reconcile passes.", ("kind",))
+_ACTIONS = metrics.counter("iaas_reconcile_actions_total", "Actions applied to detected drift.", ("action",))
+_LAST_DRIFTS = metrics.gauge("iaas_reconcile_last_drifts", "Drift detected by the last reconcile pass.", ("kind",))
+
+
+class _Domain(NamedTuple):
+    domain: Any
+    name: str
+    state: str
+    stats: Dict[str, Any]
+
+
+class _Drift(NamedTuple):
+    kind: str
+    uuid: str
+    name: Optional[str]
+    db_state: Optional[str]
+    hypervisor_state: Optional[str]
+
+
+class ReconcileStats:
+    """정합성 검사의 실행 횟수, 소요 시간, 불일치 건수를 프로세스 단위로 집계합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.failures = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration_ms: Optional[float] = None
+        self.last_drifts: Dict[str, int] = {}
+        self.drifts_total: Dict[str, int] = {}
+        self.actions_total: Dict[str, int] = {}
+
+    def record_run(self, duration_ms: float, drifts: Dict[str, int], actions: Dict[str, int]):
+        with self._lock:
+            self.runs += 1
+            self.last_run_at = datetime.now()
+            self.last_duration_ms = duration_ms
+            self.last_drifts = dict(drifts)
+            for key, count in drifts.items():
+                self.drifts_total[key] = self.drifts_total.get(key, 0) + count
+            for key, count in actions.items():
+                self.actions_total[key] = self.actions_total.get(key, 0) + count
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "failures": self.failures,
+                "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+                "last_duration_ms": self.last_duration_ms,
+                "last_drifts": dict(self.last_drifts),
+                "drifts_total": dict(self.drifts_total),
+                "actions_total": dict(self.actions_total),
+            }
+
+
+class ReconcileService:
+    """
+    DB와 하이퍼바이저를 양방향으로 비교하여 불일치를 찾고, 정책에 따라 조치한 뒤 기록합니다.
+
+    - 하이퍼바이저는 getAllDomainStats 한 번으로 전체 도메인(상태, vCPU, 메모리)을 가져오고,
+      DB의 VM은 커서로 하나씩 읽으며 스냅샷에서 꺼내 비교합니다. 스냅샷에 남은 도메인이 유령 VM입니다.
+    - 불일치는 vm_drifts 테이블에 기록합니다. 해소되지 않은 불일치는 검사마다 새로 기록하지 않고
+      마지막 발견 시각만 갱신하며, 더 이상 발견되지 않으면 'cleared'로 해소 처리합니다.
+    - 되돌릴 수 없는 조치(adopt, destroy, mark_error)는 같은 불일치가 연속된 두 번의 검사에서
+      발견되었을 때만 적용합니다. (VM 생성/삭제 도중에 스냅샷과 DB 조회 시점이 엇갈려 생기는
+      일시적인 불일치에 조치하지 않기 위함)
+    - 상태 변경은 batch_size개씩 나누어 커밋하며, 조회 이후 다른 요청이 상태를 바꾼 VM은 덮어쓰지 않습니다.
+    """
+
+    # 동시에 여러 검사가 실행되면 같은 불일치가 중복 기록되므로 프로세스 안에서 직렬화합니다.
+    _run_lock = threading.Lock()
+
+    def __init__(self, vm_repo: IVMRepository, drift_repo: IVMDriftRepository,
+                 conn_manager: LibvirtConnectionManager, unit_of_work: Optional[UnitOfWork] = None,
+                 ghost_policy: str = "report", missing_policy: str = "report", state_policy: str = "sync",
+                 adopt_project_id: Optional[int] = None, batch_size: int = 500,
+                 stats: Optional[ReconcileStats] = None, host: Optional[str] = None, include_unplaced: bool = True,
+                 quota_service: Optional[QuotaService] = None):
+        """
+        Args:
+            conn_manager: 검사할 하이퍼바이저의 libvirt 연결 관리자.
+            ghost_policy: 하이퍼바이저에만 있는 도메인에 대한 정책.
+                          'adopt'는 adopt_project_id 프로젝트의 VM으로 등록하고, 'destroy'는 도메인을 종료 후 정의 해제합니다.
+            missing_policy: DB에만 있는 VM에 대한 정책. 'mark_error'는 VM 상태를 'ERROR'로 바꿉니다.
+            state_policy: 상태 불일치에 대한 정책. 'sync'는 DB의 상태를 실제 상태로 갱신합니다.
+            adopt_project_id: 유령 VM을 등록할 프로젝트 ID.
+            batch_size: 한 번에 커밋할 상태 변경 수.
+            stats: 검사 결과를 집계할 ReconcileStats.
+            host: conn_manager가 가리키는 컴퓨트 호스트 이름. 주어지면 이 호스트에 배치된 VM만 비교하고,
+                  등록하는 유령 VM도 이 호스트에 배치된 것으로 기록합니다. None이면 모든 VM을 비교합니다.
+            include_unplaced: 호스트가 기록되지 않은 VM(스케줄러 도입 이전의 VM)도 이 호스트의 VM으로 볼지 여부.
+            quota_service: 등록한 유령 VM의 자원을 프로젝트 사용량에 더하는 데 사용합니다. (쿼터 한도는 적용하지 않음)
+
+        Raises:
+            ValueError: 알 수 없는 정책이거나, 'adopt' 정책에 adopt_project_id가 없을 때.
+        """
+        for name, value, allowed in (("ghost", ghost_policy, GHOST_POLICIES),
+                                     ("missing", missing_policy, MISSING_POLICIES),
+                                     ("state", state_policy, STATE_POLICIES)):
+            if value not in allowed:
+                raise ValueError(f"Unknown {name} reconcile policy '{value}'. Allowed: {', '.join(allowed)}.")
+        if ghost_policy == "adopt" and not adopt_project_id:
+            raise ValueError("The 'adopt' reconcile policy requires a project to adopt VMs into.")
+
+        self.vm_repo = vm_repo
+        self.drift_repo = drift_repo
+        self.conn_manager = conn_manager
+        self.unit_of_work = unit_of_work
+        self.ghost_policy = ghost_policy
+        self.missing_policy = missing_policy
+        self.state_policy = state_policy
+        self.adopt_project_id = adopt_project_id
+        self.batch_size = batch_size
+        self.stats = stats
+        self.host = host
+        self.quota_service = quota_service
+        self._host_filter = None if host is None else ([host, None] if include_unplaced else [host])
+
+    def reconcile(self) -> Dict[str, Any]:
+        """
+        정합성 검사를 한 번 실행합니다.
+
+        Returns:
+            불일치 종류별 목록('ghost_vms', 'missing_vms', 'state_drift')과 소요 시간(duration_ms).
+            각 항목에는 name, uuid, db_state, hypervisor_state, action이 들어 있습니다.
+
+        Raises:
+            ConnectionError: 하이퍼바이저에서 도메인 목록을 가져올 수 없을 때.
+        """
+        with self._run_lock:
+            started = time.perf_counter()
+            try:
+                result, actions = self._reconcile()
+            except Exception:
+                _FAILURES.inc()
+                if self.stats:
+                    self.stats.record_failure()
+                raise
+            elapsed = time.perf_counter() - started
+            result["duration_ms"] = round(elapsed * 1000, 3)
+
+            drifts = {key: len(result[key]) for key in ("ghost_vms", "missing_vms", "state_drift")}
+            _RUN_SECONDS.observe(elapsed)
+            for kind, count in drifts.items():
+                _DRIFTS.labels(kind).inc(count)
+                _LAST_DRIFTS.labels(kind).set(count)
+            for action, count in actions.items():
+                _ACTIONS.labels(action).inc(count)
+            if self.stats:
+                self.stats.record_run(result["duration_ms"], drifts, actions)
+            return result
+
+    def _reconcile(self) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        now = datetime.now()
+        domains = self._fetch_domains()
+
+        # 1. DB의 VM을 커서로 읽으며 스냅샷과 비교 (VM 수와 무관하게 불일치 목록만 메모리에 보관)
+        drifts: List[_Drift] = []
+        for vm_uuid, name, db_state in self.vm_repo.iter_states(self._host_filter):
+            domain = domains.pop(vm_uuid, None)
+            if db_state in _UNCHECKED_DB_STATES:
+                continue
+            if domain is None:
+                drifts.append(_Drift("missing", vm_uuid, name, db_state, None))
+                continue
+            actual = _DB_STATE_ALIASES.get(domain.state, domain.state)
+            if actual not in _TRANSIENT_STATES and actual != db_state:
+                drifts.append(_Drift("state", vm_uuid, name, db_state, actual))
+        # 2. DB에서 찾지 못한 도메인은 유령 VM
+        drifts.extend(_Drift("ghost", vm_uuid, domain.name, None, domain.state) for vm_uuid, domain in domains.items())
+
+        # 3. 정책에 따라 조치하고 불일치 기록을 갱신
+        open_drifts = {(drift.vm_uuid, drift.kind): drift for drift in self.drift_repo.list_open()}
+        state_changes: Dict[str, Tuple[str, str]] = {}
+        new_records, seen_records = [], []
+        result = {"ghost_vms": [], "missing_vms": [], "state_drift": []}
+        actions: Dict[str, int] = {}
+
+        for drift in drifts:
+            record = open_drifts.pop((drift.uuid, drift.kind), None)
+            action = self._remediate(drift, domains.get(drift.uuid), confirmed=record is not None, state_changes=state_changes)
+            actions[action] = actions.get(action, 0) + 1
+            result[{"ghost": "ghost_vms", "missing": "missing_vms", "state": "state_drift"}[drift.kind]].append({
+                "name": drift.name, "uuid": drift.uuid, "db_state": drift.db_state,
+                "hypervisor_state": drift.hypervisor_state, "action": action,
+            })
+
+            if record is None:
+                new_records.append(models.VMDrift(
+                    vm_uuid=drift.uuid, vm_name=drift.name, kind=drift.kind, db_state=drift.db_state,
+                    hypervisor_state=drift.hypervisor_state, action=action, detected_at=now, last_seen_at=now,
+                    resolved_at=None if action == "reported" else now,
+                ))
+            elif action == "reported":
+                seen_records.append(record)
+            else:
+                self.drift_repo.resolve(record, action, now)
+
+        # 이번 검사에서 발견되지 않은 미해결 불일치는 외부에서 해소된 것
+        for record in open_drifts.values():
+            self.drift_repo.resolve(record, "cleared", now)
+        self.drift_repo.create_many(new_records)
+        self.drift_repo.mark_seen(seen_records, now)
+
+        # 4. 상태 변경을 batch_size개씩 커밋 (쓰기 잠금을 오래 잡지 않도록)
+        changes = list(state_changes.items())
+        for start in range(0, len(changes), self.batch_size):
+            self.vm_repo.compare_and_set_states(dict(changes[start:start + self.batch_size]))
+            self._checkpoint()
+        return result, actions
+
+    def _remediate(self, drift: _Drift, domain: Optional[_Domain], confirmed: bool,
+                   state_changes: Dict[str, Tuple[str, str]]) -> str:
+        """불일치에 정책을 적용하고, 적용한 조치 이름을 반환합니다. 조치하지 않았으면 'reported'입니다."""
+        if drift.kind == "state":
+            if self.state_policy == "sync":
+                state_changes[drift.uuid] = (drift.db_state, drift.hypervisor_state)
+                return "state_synced"
+        elif drift.kind == "missing":
+            if self.missing_policy == "mark_error" and confirmed:
+                state_changes[drift.uuid] = (drift.db_state, "ERROR")
+                return "marked_error"
+        elif self.ghost_policy == "destroy" and confirmed:
+            if self._destroy_domain(domain):
+                return "destroyed"
+        elif self.ghost_policy == "adopt" and confirmed:
+            if self._adopt_domain(drift.uuid, domain):
+                return "adopted"
+        return "reported"
+
+    def _fetch_domains(self) -> Dict[str, _Domain]:
+        try:
+            conn = self.conn_manager.get()
+            with libvirt_call_timer("getAllDomainStats"):
+                all_stats = conn.getAllDomainStats(_SNAPSHOT_STATS)
+        except libvirt.libvirtError as e:
+            raise ConnectionError(f"Error fetching domains from libvirt: {e}")
+        return {
+            domain.UUIDString(): _Domain(domain, domain.name(), domain_state_name(stats.get("state.state")), stats)
+            for domain, stats in all_stats
+        }
+
+    def _destroy_domain(self, domain: _Domain) -> bool:
+        try:
+            if domain.domain.isActive():
+                with libvirt_call_timer("destroy"):
+                    domain.domain.destroy()
+            with libvirt_call_timer("undefine"):
+                domain.domain.undefine()
+            return True
+        except libvirt.libvirtError as e:
+            logger.warning("Failed to destroy orphan domain '%s': %s", domain.name, e)
+            return False
+
+    def _adopt_domain(self, vm_uuid: str, domain: _Domain) -> bool:
+        if self.vm_repo.find_by_name_and_project_id(domain.name, self.adopt_project_id):
+            logger.warning("Cannot adopt domain '%s': name already exists in the project.", domain.name)
+            return False
+        vm = models.VM(
+            name=domain.name,
+            uuid=vm_uuid,
+            state=_DB_STATE_ALIASES.get(domain.state, domain.state),
+            cpu_count=domain.stats.get("vcpu.current") or domain.stats.get("vcpu.maximum") or 1,
+            ram_mb=(domain.stats.get("balloon.maximum") or 0) // 1024,
+            project_id=self.adopt_project_id,
+            host=self.host,
+        )
+        self.vm_repo.create(vm)
+        if self.quota_service is not None:
+            # 이미 실행 중인 도메인이므로 한도를 넘더라도 등록하고 사용량에 반영
+            self.quota_service.add_existing(vm.project_id, vcpus=vm.cpu_count, ram_mb=vm.ram_mb)
+        return True
+
+    def _checkpoint(self):
+        if self.unit_of_work:
+            self.unit_of_work.commit()
+
+
+class ReconcileLoop:
+    """정합성 검사를 interval초마다 백그라운드 스레드에서 실행합니다."""
+
+    def __init__(self, run: Callable[[], Any], interval: float):
+        """
+        Args:
+            run: 검사 한 번을 자신의 트랜잭션으로 실행하는 함수.
+            interval: 검사 주기(초).
+        """
+        self._run_once = run
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="reconcile-loop", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 30.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._run_once()
+            except Exception:
+                logger.exception("Scheduled reconcile failed.")
@@ -0,0 +1,267 @@
+# src/services/scheduler.py
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.services.exceptions import NoValidHostError
+from src.utils import metrics
+
+# 동일 프로젝트 VM 분산 정책: 'off', 'soft'(가능하면 프로젝트 VM이 없는 호스트 선택), 'hard'(없는 호스트만 선택)
+ANTI_AFFINITY_POLICIES = ("off", "soft", "hard")
+
+_PLACEMENTS = metrics.counter("iaas_scheduler_placements_total", "Placement decisions.", ("result",))
+_PLACED = _PLACEMENTS.labels("placed")
+_NO_VALID_HOST = _PLACEMENTS.labels("no_valid_host")
+
+
+class ComputeHost(NamedTuple):
+    """
+    VM을 배치할 수 있는 하이퍼바이저 하나의 정의입니다.
+
+    vcpus/ram_mb/disk_gb는 물리 용량이며, 비어 있으면(None) 시작 시 하이퍼바이저에서 조회합니다.
+    """
+    name: str
+    uri: str
+    vcpus: Optional[int] = None
+    ram_mb: Optional[int] = None
+    disk_gb: Optional[int] = None
+
+
+def discover_capacity(host: ComputeHost, conn) -> ComputeHost:
+    """
+    비어 있는 용량을 하이퍼바이저에서 조회해 채운 호스트 정의를 반환합니다.
+
+    Args:
+        conn: 호스트의 libvirt 연결. getInfo()의 [1]은 메모리(MB), [2]는 활성 CPU 수이며,
+              디스크는 'default' 스토리지 풀의 용량을 사용합니다. (풀이 없으면 디스크를 검사하지 않음)
+    """
+    vcpus, ram_mb, disk_gb = host.vcpus, host.ram_mb, host.disk_gb
+    if vcpus is None or ram_mb is None:
+        info = conn.getInfo()
+        ram_mb = info[1] if ram_mb is None else ram_mb
+        vcpus = info[2] if vcpus is None else vcpus
+    if disk_gb is None:
+        try:
+            disk_gb = conn.storagePoolLookupByName("default").info()[1] // 1024 ** 3
+        except Exception:
+            disk_gb = 0
+    return host._replace(vcpus=vcpus, ram_mb=ram_mb, disk_gb=disk_gb)
+
+
+class PlacementRequest(NamedTuple):
+    project_id: int
+    vcpus: int
+    ram_mb: int
+    disk_gb: int = 0
+
+
+class HostState:
+    """용량 인덱스 안의 호스트 하나의 용량과 사용량입니다. (Scheduler의 락 아래에서만 변경)"""
+
+    def __init__(self, host: ComputeHost, cpu_ratio: float, ram_ratio: float, disk_ratio: float):
+        self.name = host.name
+        self.uri = host.uri
+        self.total_vcpus = (host.vcpus or 0) * cpu_ratio
+        self.total_ram_mb = (host.ram_mb or 0) * ram_ratio
+        self.total_disk_gb = (host.disk_gb or 0) * disk_ratio
+        self.used_vcpus = 0
+        self.used_ram_mb = 0
+        self.used_disk_gb = 0
+        self.project_vms: Dict[int, int] = {}  # 프로젝트 ID -> 이 호스트의 VM 수
+
+    @property
+    def free_vcpus(self) -> float:
+        return self.total_vcpus - self.used_vcpus
+
+    @property
+    def free_ram_mb(self) -> float:
+        return self.total_ram_mb - self.used_ram_mb
+
+    @property
+    def free_disk_gb(self) -> float:
+        return self.total_disk_gb - self.used_disk_gb
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "free_vcpus": self.free_vcpus, "free_ram_mb": self.free_ram_mb, "free_disk_gb": self.free_disk_gb,
+            "used_vcpus": self.used_vcpus, "used_ram_mb": self.used_ram_mb, "used_disk_gb": self.used_disk_gb,
+            "vms": sum(self.project_vms.values()),
+        }
+
+
+# --- 필터: 요청을 받을 수 없는 호스트를 제외합니다. (host, request) -> bool ---
+
+def ram_filter(host: HostState, request: PlacementRequest) -> bool:
+    return host.free_ram_mb >= request.ram_mb
+
+
+def cpu_filter(host: HostState, request: PlacementRequest) -> bool:
+    return host.free_vcpus >= request.vcpus
+
+
+def disk_filter(host: HostState, request: PlacementRequest) -> bool:
+    # 디스크 용량을 모르는 호스트(0)는 디스크를 검사하지 않음
+    return not host.total_disk_gb or host.free_disk_gb >= request.disk_gb
+
+
+DEFAULT_FILTERS: Tuple[Callable[[HostState, PlacementRequest], bool], ...] = (ram_filter, cpu_filter, disk_filter)
+
+
+class Claim(NamedTuple):
+    """호스트에서 확보한 용량입니다. VM이 생성되지 못하거나 삭제되면 Scheduler.release로 반납합니다."""
+    host: str
+    project_id: int
+    vcpus: int
+    ram_mb: int
+    disk_gb: int
+
+
+class Scheduler:
+    """
+    여러 하이퍼바이저 중 VM을 배치할 호스트를 고르고, 선택한 호스트의 용량을 확보합니다.
+
+    호스트들은 가중치(weigher 점수) 순으로 정렬된 용량 인덱스에 들어 있습니다. 가중치는 호스트의 여유 용량만으로
+    정해지므로(RAM은 GB, CPU는 vCPU 단위에 배수를 곱한 합), 배치는 가중치가 가장 높은 호스트부터 필터를 통과하는
+    첫 호스트를 고르고, 용량을 확보한 뒤 그 호스트만 인덱스에서 다시 이진 탐색으로 제자리에 넣습니다.
+    배수가 양수이면 여유가 많은 호스트로 분산(spread)하고, 음수이면 한 호스트를 먼저 채웁니다(stack).
+
+    호스트 선택과 용량 확보는 하나의 락 안에서 일어나므로, 동시에 들어온 생성 요청이 같은 호스트의
+    남은 용량을 중복으로 확보하지 않습니다.
+    """
+
+    def __init__(self, hosts: Iterable[ComputeHost], cpu_allocation_ratio: float = 4.0,
+                 ram_allocation_ratio: float = 1.0, disk_allocation_ratio: float = 1.0,
+                 ram_weight: float = 1.0, cpu_weight: float = 0.0, anti_affinity: str = "soft",
+                 filters: Sequence[Callable[[HostState, PlacementRequest], bool]] = DEFAULT_FILTERS):
+        """
+        Args:
+            hosts: 배치 대상 호스트 목록. 첫 번째 호스트는 호스트가 기록되지 않은 기존 VM의 호스트로 간주됩니다.
+            cpu_allocation_ratio, ram_allocation_ratio, disk_allocation_ratio: 물리 용량 대비 할당 가능한 배수.
+            ram_weight, cpu_weight: 여유 RAM(GB)과 여유 vCPU에 곱할 가중치 배수.
+            anti_affinity: 같은 프로젝트 VM의 분산 정책. ('off', 'soft', 'hard')
+            filters: 호스트가 요청을 받을 수 있는지 검사하는 함수 목록.
+
+        Raises:
+            ValueError: 호스트가 없거나 이름이 중복되었거나, 알 수 없는 분산 정책일 때.
+        """
+        hosts = list(hosts)
+        if not hosts:
+            raise ValueError("The scheduler requires at least one compute host.")
+        if len({host.name for host in hosts}) != len(hosts):
+            raise ValueError("Compute host names must be unique.")
+        if anti_affinity not in ANTI_AFFINITY_POLICIES:
+            raise ValueError(f"Unknown anti-affinity policy '{anti_affinity}'. "
+                             f"Allowed: {', '.join(ANTI_AFFINITY_POLICIES)}.")
+
+        self.default_host = hosts[0].name
+        self.ram_weight = ram_weight
+        self.cpu_weight = cpu_weight
+        self.anti_affinity = anti_affinity
+        self.filters = tuple(filters)
+        self._ratios = (cpu_allocation_ratio, ram_allocation_ratio, disk_allocation_ratio)
+        self._hosts: Dict[str, HostState] = {}
+        self._index: List[Tuple[float, str]] = []  # (-가중치, 호스트 이름) 오름차순 = 가중치 내림차순
+        self._lock = threading.Lock()
+        for host in hosts:
+            self._hosts[host.name] = HostState(host, *self._ratios)
+            bisect.insort(self._index, self._key(self._hosts[host.name]))
+
+    @property
+    def host_names(self) -> List[str]:
+        return list(self._hosts)
+
+    def set_capacity(self, host: ComputeHost):
+        """호스트의 물리 용량을 (다시) 설정합니다. 사용량은 유지됩니다. (예: 시작 시 하이퍼바이저에서 조회한 값)"""
+        with self._lock:
+            state = self._hosts[host.name]
+            self._index.remove(self._key(state))
+            fresh = HostState(host, *self._ratios)
+            state.total_vcpus, state.total_ram_mb, state.total_disk_gb = (
+                fresh.total_vcpus, fresh.total_ram_mb, fresh.total_disk_gb
+            )
+            bisect.insort(self._index, self._key(state))
+
+    def load_usage(self, rows: Iterable[Tuple[Optional[str], int, int, int, int, int]]):
+        """
+        DB에 기록된 VM들로 사용량을 다시 계산합니다. (서버 시작 시)
+
+        Args:
+            rows: (호스트, 프로젝트 ID, vCPU 합계, RAM(MB) 합계, 디스크(GB) 합계, VM 수) 목록.
+                  호스트가 없는(None) 행은 기본 호스트로, 모르는 호스트의 행은 무시합니다.
+        """
+        with self._lock:
+            for state in self._hosts.values():
+                state.used_vcpus = state.used_ram_mb = state.used_disk_gb = 0
+                state.project_vms = {}
+            for host, project_id, vcpus, ram_mb, disk_gb, count in rows:
+                state = self._hosts.get(host or self.default_host)
+                if state is None:
+                    continue
+                state.used_vcpus += vcpus or 0
+                state.used_ram_mb += ram_mb or 0
+                state.used_disk_gb += disk_gb or 0
+                state.project_vms[project_id] = state.project_vms.get(project_id, 0) + count
+            self._index = sorted(self._key(state) for state in self._hosts.values())
+
+    def select(self, request: PlacementRequest) -> Claim:
+        """
+        요청을 받을 호스트를 골라 용량을 확보합니다.
+
+        가중치가 높은 호스트부터 필터를 검사하므로, 대부분의 요청은 앞쪽 몇 개 호스트만 보고 끝납니다.
+        'soft' 분산 정책에서는 같은 프로젝트 VM이 없는 호스트를 우선하고, 모든 후보에 있으면
+        필터를 통과한 첫 호스트를 고릅니다.
+
+        Raises:
+            NoValidHostError: 필터를 통과하는 호스트가 없을 때.
+        """
+        with self._lock:
+            chosen = fallback = None
+            for _, name in self._index:
+                state = self._hosts[name]
+                if not all(check(state, request) for check in self.filters):
+                    continue
+                if self.anti_affinity == "off" or not state.project_vms.get(request.project_id):
+                    chosen = state
+                    break
+                if self.anti_affinity == "soft" and fallback is None:
+                    fallback = state
+            chosen = chosen or fallback
+            if chosen is None:
+                _NO_VALID_HOST.inc()
+                raise NoValidHostError(
+                    f"No compute host can fit {request.vcpus} vCPU / {request.ram_mb} MB RAM / {request.disk_gb} GB disk."
+                )
+            claim = Claim(chosen.name, request.project_id, request.vcpus, request.ram_mb, request.disk_gb)
+            self._apply(chosen, claim, 1)
+        _PLACED.inc()
+        return claim
+
+    def release(self, claim: Claim):
+        """확보했던 용량을 반납합니다. (VM 생성 실패 또는 삭제 시)"""
+        with self._lock:
+            state = self._hosts.get(claim.host)
+            if state is not None:
+                self._apply(state, claim, -1)
+
+    def hosts(self) -> List[Dict[str, object]]:
+        """가중치 순서대로 호스트별 용량과 사용량을 반환합니다."""
+        with self._lock:
+            return [self._hosts[name].to_dict() for _, name in self._index]
+
+    def _apply(self, state: HostState, claim: Claim, sign: int):
+        # 가중치가 바뀌므로 인덱스에서 빼고 다시 넣음 (위치는 이진 탐색)
+        del self._index[bisect.bisect_left(self._index, self._key(state))]
+        state.used_vcpus += sign * claim.vcpus
+        state.used_ram_mb += sign * claim.ram_mb
+        state.used_disk_gb += sign * claim.disk_gb
+        count = state.project_vms.get(claim.project_id, 0) + sign
+        if count > 0:
+            state.project_vms[claim.project_id] = count
+        else:
+            state.project_vms.pop(claim.project_id, None)
+        bisect.insort(self._index, self._key(state))
+
+    def _key(self, state: HostState) -> Tuple[float, str]:
+        weight = self.ram_weight * state.free_ram_mb / 1024 + self.cpu_weight * state.free_vcpus
+        return -weight, state.name
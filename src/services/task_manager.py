@@ -0,0 +1,178 @@
+# src/services/task_manager.py
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from src.services.exceptions import TaskNotFoundError, TaskQueueFullError
+from src.utils import tracing
+
+
+class Task:
+    """백그라운드에서 실행되는 작업 하나의 상태를 나타냅니다."""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+    def __init__(self, action: str, project_id: int, resource_id: Optional[str] = None):
+        self.id = str(uuid.uuid4())
+        self.action = action
+        self.project_id = project_id
+        self.resource_id = resource_id
+        self.status = Task.PENDING
+        self.step = None
+        self.steps_done = []
+        self.error = None
+        self.created_at = datetime.now()
+        self.updated_at = self.created_at
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (Task.SUCCEEDED, Task.FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "action": self.action,
+            "resource_id": self.resource_id,
+            "status": self.status,
+            "step": self.step,
+            "steps_done": list(self.steps_done),
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+
+class TaskManager:
+    """
+    오래 걸리는 작업(예: VM 프로비저닝)을 제한된 워커 풀에서 비동기로 실행하고,
+    진행 상황을 조회할 수 있도록 작업 상태를 보관하는 프로세스 전역 관리자입니다.
+
+    작업은 create()로 대기열 자리를 먼저 확보한 뒤 start()로 실행합니다.
+    대기 중이거나 실행 중인 작업이 max_pending에 도달하면 새 작업은 거절되므로,
+    요청 스레드는 작업 완료를 기다리지 않고 즉시 응답할 수 있습니다.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, max_finished: int = 1000,
+                 tracer: Optional[tracing.Tracer] = None):
+        """
+        Args:
+            max_workers: 작업을 실행할 워커 스레드 수.
+            max_pending: 동시에 대기/실행할 수 있는 최대 작업 수.
+            max_finished: 조회를 위해 보관할 완료된 작업의 최대 개수.
+            tracer: 작업마다 추적('task.<action>')을 시작할 Tracer. 작업을 요청한 추적의 ID가 속성으로 남습니다.
+        """
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self.tracer = tracer
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-worker")
+        self._tasks: "OrderedDict[str, Task]" = OrderedDict()
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def create(self, action: str, project_id: int, resource_id: Optional[str] = None) -> Task:
+        """
+        새 작업을 만들고 대기열 자리를 확보합니다.
+
+        Raises:
+            TaskQueueFullError: 대기/실행 중인 작업이 이미 max_pending개일 때.
+        """
+        task = Task(action, project_id, resource_id)
+        with self._lock:
+            if self._active >= self.max_pending:
+                raise TaskQueueFullError("Too many pending tasks. Please retry later.")
+            self._active += 1
+            self._tasks[task.id] = task
+        return task
+
+    def start(self, task: Task, fn: Callable[[Callable[[str], None]], Any]):
+        """
+        작업을 워커 풀에서 실행합니다.
+
+        Args:
+            task: create()로 만든 작업.
+            fn: 실행할 함수. 진행 단계 이름을 보고하는 콜백 하나를 인자로 받습니다.
+
+        Raises:
+            RuntimeError: 워커 풀이 이미 종료되어 작업을 실행할 수 없을 때.
+                          작업은 FAILED로 기록되고 확보한 대기열 자리는 반납됩니다.
+        """
+        try:
+            self._executor.submit(self._run, task, fn, tracing.current_trace_id())
+        except Exception as e:
+            self._update(task, status=Task.FAILED, error=f"Task could not be started: {e}")
+            self._release(task)
+            raise
+
+    def active_count(self) -> int:
+        """대기 중이거나 실행 중인 작업 수를 반환합니다."""
+        return self._active
+
+    def discard(self, task: Task):
+        """시작하지 않은 작업을 취소하고 확보한 대기열 자리를 반납합니다."""
+        with self._lock:
+            if self._tasks.pop(task.id, None) is not None:
+                self._active -= 1
+
+    def get(self, task_id: str, project_id: int) -> Dict[str, Any]:
+        """
+        작업 상태를 조회합니다. 다른 프로젝트의 작업은 조회할 수 없습니다.
+
+        Raises:
+            TaskNotFoundError: 작업이 없거나 다른 프로젝트의 작업일 때.
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if not task or task.project_id != project_id:
+                raise TaskNotFoundError(f"Task '{task_id}' not found.")
+            return task.to_dict()
+
+    def shutdown(self, wait: bool = True):
+        """새 작업 실행을 멈추고, wait=True이면 실행 중인 작업이 끝날 때까지 기다립니다."""
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, task: Task, fn, request_trace_id: Optional[str] = None):
+        self._update(task, status=Task.RUNNING)
+        try:
+            if self.tracer is None:
+                fn(lambda step: self._update(task, step=step))
+            else:
+                with self.tracer.start_trace(f"task.{task.action}", task_id=task.id,
+                                             request_trace_id=request_trace_id):
+                    fn(lambda step: self._update(task, step=step))
+            self._update(task, status=Task.SUCCEEDED)
+        except Exception as e:
+            self._update(task, status=Task.FAILED, error=str(e))
+        finally:
+            self._release(task)
+
+    def _release(self, task: Task):
+        # 끝난 작업의 대기열 자리를 반납하고, 보관 한도를 넘은 완료 작업을 정리함
+        with self._lock:
+            self._active -= 1
+            self._evict_finished()
+
+    def _update(self, task: Task, status: Optional[str] = None, step: Optional[str] = None, error: Optional[str] = None):
+        with self._lock:
+            if step is not None:
+                if task.step is not None:
+                    task.steps_done.append(task.step)
+                task.step = step
+            if status is not None:
+                task.status = status
+                if task.finished and task.step is not None and status == Task.SUCCEEDED:
+                    task.steps_done.append(task.step)
+                    task.step = None
+            if error is not None:
+                task.error = error
+            task.updated_at = datetime.now()
+
+    def _evict_finished(self):
+        finished = [task_id for task_id, task in self._tasks.items() if task.finished]
+        for task_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._tasks[task_id]
@@ -0,0 +1,233 @@
+# src/utils/disk_pool.py
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+_TAKES = metrics.counter("iaas_disk_pool_takes_total", "VM disk requests served from the warm overlay pool.",
+                         ("result",))
+_HIT = _TAKES.labels("hit")
+_EMPTY = _TAKES.labels("empty")
+_STALE = _TAKES.labels("stale")
+_ERROR = _TAKES.labels("error")
+
+# 기반 이미지 파일의 식별 정보 (장치, inode, 수정 시각). 파일이 교체되거나 수정되면 달라짐
+FileSignature = Tuple[int, int, int]
+
+
+def file_signature(path: str) -> Optional[FileSignature]:
+    """파일의 (장치, inode, 수정 시각)을 반환합니다. 파일이 없으면 None입니다."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns
+
+
+class PoolTarget(NamedTuple):
+    """
+    기반 이미지 하나에 대해 미리 만들어 둘 오버레이 수입니다.
+
+    남은 오버레이가 low개보다 적어지면 백그라운드에서 high개까지 다시 채웁니다.
+    """
+    high: int
+    low: int
+
+    @classmethod
+    def from_config(cls, value: Dict[str, int]) -> "PoolTarget":
+        """{'high': 4, 'low': 2} 형식의 설정값으로 만듭니다. low를 생략하면 high의 절반(최소 1)입니다."""
+        high = int(value["high"])
+        low = int(value.get("low", max(1, high // 2)))
+        if high < 1 or not 1 <= low <= high:
+            raise ValueError(f"Invalid disk pool watermarks high={high}, low={low}: require 1 <= low <= high.")
+        return cls(high, low)
+
+
+class OverlayPool:
+    """
+    자주 쓰는 기반 이미지마다 CoW 오버레이 디스크를 미리 만들어 두는 웜 풀입니다.
+
+    VM 디스크를 만들 때 qemu-img 프로세스를 띄우는 대신, 준비된 오버레이 하나를 VM 디스크 경로로
+    rename합니다. rename은 같은 파일 시스템 안에서 원자적이므로, staging_dir는 VM 디스크 디렉터리와
+    같은 파일 시스템에 있어야 합니다. (다르면 rename이 실패하고 호출자가 직접 디스크를 만듦)
+    디렉터리 생성과 이동은 오버레이 생성과 같은 권한 경로(권한 헬퍼 또는 sudo)로 수행하도록 함수를 받으므로,
+    서버 프로세스는 staging_dir를 읽을 수만 있으면 됩니다.
+
+    - 채우기와 삭제는 하나의 백그라운드 스레드가 담당하며, 요청 스레드는 이동만 합니다.
+    - 오버레이마다 만들 당시 기반 이미지의 식별 정보를 기록해 두고, 기반 이미지가 바뀌었으면
+      그 오버레이는 내주지 않고 폐기한 뒤 새 이미지로 다시 만듭니다.
+    - 이전 실행에서 남은 오버레이는 어떤 이미지로 만들었는지 알 수 없으므로 시작할 때 지웁니다.
+    """
+
+    def __init__(self, staging_dir: str, create_overlay: Callable[[str, str], None],
+                 delete_file: Callable[[str], None], move_file: Callable[[str, str], None],
+                 make_dir: Callable[[str], None], check_interval: float = 30.0):
+        """
+        Args:
+            staging_dir: 준비된 오버레이를 보관할 디렉터리.
+            create_overlay: (기반 이미지 경로, 만들 오버레이 경로)를 받아 오버레이를 만드는 함수.
+            delete_file: 오버레이 파일을 삭제하는 함수.
+            move_file: (오버레이 경로, VM 디스크 경로)를 받아 오버레이를 옮기는 함수.
+            make_dir: staging_dir가 없으면 만드는 함수.
+            check_interval: 요청이 없어도 기반 이미지 변경과 부족분을 확인하는 주기(초).
+        """
+        self.staging_dir = staging_dir
+        self.check_interval = check_interval
+        self._create_overlay = create_overlay
+        self._delete_file = delete_file
+        self._move_file = move_file
+        self._make_dir = make_dir
+        self._prepared = False
+        self._targets: Dict[str, PoolTarget] = {}
+        self._ready: Dict[str, Deque[Tuple[str, FileSignature]]] = {}  # 기반 이미지 경로 -> (오버레이 경로, 식별 정보)
+        self._discarded: List[str] = []  # 백그라운드에서 삭제할 오버레이
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, targets: Dict[str, PoolTarget]):
+        """
+        기반 이미지 경로별 목표 수를 설정하고 채우기 스레드를 시작합니다.
+
+        staging_dir 생성과 이전 실행에서 남은 오버레이 정리는 채우기 스레드가 수행하며,
+        실패하면(예: 권한 헬퍼가 아직 뜨지 않음) 다음 확인 주기에 다시 시도합니다.
+        """
+        self._targets = dict(targets)
+        self._ready = {base_path: deque() for base_path in self._targets}
+        self._thread = threading.Thread(target=self._run, name="disk-pool", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """채우기 스레드를 멈춥니다. 준비된 오버레이는 다음 시작 때 정리됩니다."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def ready_counts(self) -> Dict[str, int]:
+        """기반 이미지 경로별로 바로 내줄 수 있는 오버레이 수를 반환합니다."""
+        with self._lock:
+            return {base_path: len(queue) for base_path, queue in self._ready.items()}
+
+    def take(self, base_path: str, target_path: str) -> bool:
+        """
+        준비된 오버레이를 target_path로 옮깁니다.
+
+        Returns:
+            옮겼으면 True. 풀 대상이 아닌 이미지이거나, 준비된 오버레이가 없거나, 기반 이미지가 바뀌었거나,
+            이동에 실패하면 False이며, 이때 호출자는 직접 디스크를 만들어야 합니다.
+        """
+        queue = self._ready.get(base_path)
+        if queue is None:
+            return False
+
+        signature = file_signature(base_path)
+        with self._lock:
+            stale = self._drop_stale(base_path, signature)
+            entry = queue.popleft() if queue else None
+            running_low = len(queue) < self._targets[base_path].low
+        if stale or running_low:
+            self._wake.set()
+
+        if entry is None:
+            (_STALE if stale else _EMPTY).inc()
+            return False
+        try:
+            self._move_file(entry[0], target_path)
+        except Exception as e:
+            logger.warning("Could not move pooled overlay '%s' to '%s': %s", entry[0], target_path, e)
+            with self._lock:
+                self._discarded.append(entry[0])
+            _ERROR.inc()
+            return False
+        _HIT.inc()
+        return True
+
+    def refill(self):
+        """
+        폐기할 오버레이를 지우고, 기반 이미지가 바뀐 오버레이를 버린 뒤, low개보다 적은 이미지를 high개까지 채웁니다.
+
+        백그라운드 스레드가 호출하며, 테스트에서는 직접 호출할 수 있습니다.
+        """
+        for base_path, target in self._targets.items():
+            if self._stopping.is_set():
+                return
+            signature = file_signature(base_path)
+            with self._lock:
+                self._drop_stale(base_path, signature)
+                discarded, self._discarded = self._discarded, []
+                missing = target.high - len(self._ready[base_path])
+                if len(self._ready[base_path]) >= target.low:
+                    missing = 0
+            for path in discarded:
+                self._delete_quietly(path)
+            if signature is None:
+                if missing:
+                    logger.warning("Base image '%s' for the disk pool does not exist.", base_path)
+                continue
+            for _ in range(missing):
+                if self._stopping.is_set() or not self._build(base_path, signature):
+                    break
+
+    def _build(self, base_path: str, signature: FileSignature) -> bool:
+        overlay_path = os.path.join(self.staging_dir, f"{uuid.uuid4().hex}.qcow2")
+        try:
+            self._create_overlay(base_path, overlay_path)
+        except Exception as e:
+            logger.warning("Could not build pooled overlay for '%s': %s", base_path, e)
+            return False
+        if file_signature(base_path) != signature:
+            # 만드는 도중 기반 이미지가 바뀌었으면 이 오버레이는 쓰지 않음 (다음 채우기에서 새로 만듦)
+            self._delete_quietly(overlay_path)
+            return False
+        with self._lock:
+            self._ready[base_path].append((overlay_path, signature))
+        return True
+
+    def _drop_stale(self, base_path: str, signature: Optional[FileSignature]) -> int:
+        # self._lock 안에서 호출. 기반 이미지가 바뀐 오버레이를 폐기 목록으로 옮김
+        queue = self._ready[base_path]
+        stale = [path for path, built_from in queue if built_from != signature]
+        if stale:
+            logger.warning("Base image '%s' changed; discarding %d pooled overlays.", base_path, len(stale))
+            kept = [entry for entry in queue if entry[1] == signature]
+            queue.clear()
+            queue.extend(kept)
+            self._discarded.extend(stale)
+        return len(stale)
+
+    def _delete_quietly(self, path: str):
+        try:
+            self._delete_file(path)
+        except Exception as e:
+            logger.warning("Could not delete pooled overlay '%s': %s", path, e)
+
+    def _prepare(self) -> bool:
+        # staging_dir를 만들고 이전 실행에서 남은 오버레이를 지움
+        try:
+            self._make_dir(self.staging_dir)
+            names = os.listdir(self.staging_dir)
+        except Exception as e:
+            logger.warning("Could not prepare disk pool directory '%s': %s", self.staging_dir, e)
+            return False
+        for name in names:
+            if name.endswith(".qcow2"):
+                self._delete_quietly(os.path.join(self.staging_dir, name))
+        return True
+
+    def _run(self):
+        while not self._stopping.is_set():
+            if not self._prepared:
+                self._prepared = self._prepare()
+            if self._prepared:
+                self.refill()
+            self._wake.wait(self.check_interval)
+            self._wake.clear()
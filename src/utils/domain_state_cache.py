@@ -0,0 +1,272 @@
+# src/utils/domain_state_cache.py
+import logging
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+import libvirt
+
+from src.utils.libvirt_connection import LibvirtConnectionManager, libvirt_call_timer
+
+logger = logging.getLogger(__name__)
+
+
+def domain_state_name(state_code) -> str:
+    """libvirt 도메인 상태 코드를 API에서 사용하는 상태 문자열로 변환합니다."""
+    state_map = {
+        libvirt.VIR_DOMAIN_NOSTATE: 'NOSTATE',
+        libvirt.VIR_DOMAIN_RUNNING: 'RUNNING',
+        libvirt.VIR_DOMAIN_BLOCKED: 'BLOCKED',
+        libvirt.VIR_DOMAIN_PAUSED: 'PAUSED',
+        libvirt.VIR_DOMAIN_SHUTDOWN: 'SHUTDOWN',
+        libvirt.VIR_DOMAIN_SHUTOFF: 'SHUTOFF',
+        libvirt.VIR_DOMAIN_CRASHED: 'CRASHED',
+        libvirt.VIR_DOMAIN_PMSUSPENDED: 'PMSUSPENDED',
+    }
+    return state_map.get(state_code, 'UNKNOWN')
+
+
+# 라이프사이클 이벤트가 알려주는 도메인의 새 상태 (UNDEFINED는 캐시에서 제거)
+_EVENT_STATES = {
+    libvirt.VIR_DOMAIN_EVENT_DEFINED: 'SHUTOFF',
+    libvirt.VIR_DOMAIN_EVENT_STARTED: 'RUNNING',
+    libvirt.VIR_DOMAIN_EVENT_SUSPENDED: 'PAUSED',
+    libvirt.VIR_DOMAIN_EVENT_RESUMED: 'RUNNING',
+    libvirt.VIR_DOMAIN_EVENT_STOPPED: 'SHUTOFF',
+    libvirt.VIR_DOMAIN_EVENT_SHUTDOWN: 'SHUTDOWN',
+    libvirt.VIR_DOMAIN_EVENT_PMSUSPENDED: 'PMSUSPENDED',
+    libvirt.VIR_DOMAIN_EVENT_CRASHED: 'CRASHED',
+}
+
+
+class DomainInfo(NamedTuple):
+    name: str
+    state: str
+
+
+# 이벤트 콜백: (도메인 UUID, 도메인 이름, 라이프사이클 이벤트 코드)
+EventCallback = Callable[[str, str, int], None]
+
+
+_event_impl_lock = threading.Lock()
+_event_impl_registered = False
+
+
+def _register_event_impl():
+    """libvirt 기본 이벤트 루프 구현을 프로세스에서 한 번만 등록합니다."""
+    global _event_impl_registered
+    with _event_impl_lock:
+        if not _event_impl_registered:
+            libvirt.virEventRegisterDefaultImpl()
+            _event_impl_registered = True
+
+
+class LibvirtEventSource:
+    """
+    libvirt 도메인 라이프사이클 이벤트를 구독합니다.
+
+    libvirt는 이벤트 루프 구현이 등록된 뒤에 열린 연결로만 이벤트를 전달하므로, 이벤트 루프 구현은
+    생성 시점에 등록합니다. 따라서 이 객체는 libvirt 연결을 처음 열기 전(모듈 로드 시)에 만들어야 합니다.
+    이벤트 루프는 start()가 띄우는 전용 데몬 스레드에서 실행되며, 콜백도 그 스레드에서 호출됩니다.
+    """
+
+    def __init__(self):
+        self._thread: Optional[threading.Thread] = None
+        _register_event_impl()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="libvirt-event-loop", daemon=True)
+        self._thread.start()
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, conn, callback: EventCallback):
+        """conn에 라이프사이클 이벤트 콜백을 등록하고, 해제에 사용할 핸들을 반환합니다."""
+        def on_lifecycle(conn, domain, event, detail, opaque):
+            callback(domain.UUIDString(), domain.name(), event)
+
+        return conn.domainEventRegisterAny(None, libvirt.VIR_DOMAIN_EVENT_ID_LIFECYCLE, on_lifecycle, None)
+
+    def unsubscribe(self, conn, handle):
+        try:
+            conn.domainEventDeregisterAny(handle)
+        except libvirt.libvirtError:
+            pass  # 연결이 이미 끊어진 경우
+
+    def _run(self):
+        while True:
+            if libvirt.virEventRunDefaultImpl() < 0:
+                logger.warning("Libvirt event loop iteration failed.")
+                time.sleep(1.0)
+
+
+class DomainStateCache:
+    """
+    하이퍼바이저의 도메인 UUID -> (이름, 상태) 맵을 메모리에 유지하는 백그라운드 캐시입니다.
+
+    - 도메인 라이프사이클 이벤트를 구독하여 상태 변화를 바로 반영합니다.
+    - resync_interval마다 전체 스냅샷(getAllDomainStats)으로 맵을 교체하여, 놓친 이벤트나
+      재연결 중에 생긴 차이를 바로잡습니다. 이벤트 소스가 없으면 이 주기적 동기화만 사용합니다.
+    - 스냅샷을 받는 동안 도착한 이벤트는 스냅샷보다 새로운 정보이므로 교체 후 다시 적용합니다.
+
+    요청 경로에서는 get()으로 메모리만 읽으므로 하이퍼바이저 왕복이 없습니다.
+    as_of()는 캐시가 하이퍼바이저와 일치한다고 보장할 수 있는 시각을 반환합니다.
+    """
+
+    def __init__(self, conn_manager: LibvirtConnectionManager, event_source: Optional[LibvirtEventSource] = None,
+                 resync_interval: float = 30.0, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            conn_manager: 프로세스 전체에서 공유하는 libvirt 연결 관리자.
+            event_source: 라이프사이클 이벤트 소스. None이면 주기적 동기화만 사용합니다.
+            resync_interval: 전체 동기화 주기(초).
+            clock: 현재 시각(Unix 시간)을 반환하는 함수.
+        """
+        self.conn_manager = conn_manager
+        self.event_source = event_source
+        self.resync_interval = resync_interval
+        self.resync_count = 0
+        self.event_count = 0
+        self._clock = clock
+        self._domains: Dict[str, DomainInfo] = {}
+        self._synced_at: Optional[float] = None
+        self._events_during_resync: Optional[Dict[str, Optional[DomainInfo]]] = None
+        self._subscription: Optional[Tuple[object, object]] = None  # (연결, 구독 핸들)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """이벤트 소스를 시작하고, 백그라운드 동기화 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        if self.event_source is not None:
+            self.event_source.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="domain-state-cache", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            subscription, self._subscription = self._subscription, None
+        if subscription is not None:
+            self.event_source.unsubscribe(*subscription)
+
+    def is_ready(self) -> bool:
+        """전체 동기화가 한 번 이상 성공했으면 True를 반환합니다."""
+        return self._synced_at is not None
+
+    def get(self, uuid: str, default: str = 'UNKNOWN') -> str:
+        """도메인의 상태를 반환합니다. 하이퍼바이저에 없는 도메인이면 default를 반환합니다."""
+        info = self._domains.get(uuid)
+        return info.state if info is not None else default
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def as_of(self) -> Optional[float]:
+        """
+        캐시 내용이 하이퍼바이저와 일치한다고 볼 수 있는 시각(Unix 시간)을 반환합니다.
+
+        이벤트를 구독 중이면 변화가 바로 반영되므로 현재 시각을, 아니면 마지막 전체
+        동기화 시각을 반환합니다. 아직 동기화되지 않았으면 None입니다.
+        """
+        if self._synced_at is None:
+            return None
+        if self._subscription is not None and self.event_source.is_running():
+            return self._clock()
+        return self._synced_at
+
+    def update(self, uuid: str, name: str, state: str):
+        """도메인 상태를 반영합니다. (이벤트나 이 프로세스가 수행한 작업의 결과)"""
+        self._apply(uuid, DomainInfo(name, state))
+
+    def discard(self, uuid: str):
+        """삭제된 도메인을 캐시에서 제거합니다."""
+        self._apply(uuid, None)
+
+    def resync(self) -> int:
+        """
+        하이퍼바이저의 전체 도메인 스냅샷으로 캐시를 교체하고, 도메인 수를 반환합니다.
+
+        Raises:
+            ConnectionError: 하이퍼바이저에 연결할 수 없을 때.
+            libvirt.libvirtError: 스냅샷 조회에 실패했을 때.
+        """
+        conn = self.conn_manager.get()
+        self._ensure_subscribed(conn)
+
+        with self._lock:
+            self._events_during_resync = {}
+        try:
+            started_at = self._clock()
+            with libvirt_call_timer("getAllDomainStats"):
+                all_stats = conn.getAllDomainStats(libvirt.VIR_DOMAIN_STATS_STATE)
+            domains = {
+                domain.UUIDString(): DomainInfo(domain.name(), domain_state_name(stats.get("state.state")))
+                for domain, stats in all_stats
+            }
+        except BaseException:
+            with self._lock:
+                self._events_during_resync = None
+            raise
+
+        with self._lock:
+            for uuid, info in self._events_during_resync.items():
+                if info is None:
+                    domains.pop(uuid, None)
+                else:
+                    domains[uuid] = info
+            self._events_during_resync = None
+            self._domains = domains
+            self._synced_at = started_at
+            self.resync_count += 1
+        return len(domains)
+
+    def _on_event(self, uuid: str, name: str, event: int):
+        self.event_count += 1
+        if event == libvirt.VIR_DOMAIN_EVENT_UNDEFINED:
+            self.discard(uuid)
+        elif event in _EVENT_STATES:
+            self.update(uuid, name, _EVENT_STATES[event])
+
+    def _apply(self, uuid: str, info: Optional[DomainInfo]):
+        with self._lock:
+            # 읽기 스레드가 락 없이 조회할 수 있도록 맵을 제자리에서만 수정 (dict 단일 연산은 원자적)
+            if info is None:
+                self._domains.pop(uuid, None)
+            else:
+                self._domains[uuid] = info
+            if self._events_during_resync is not None:
+                self._events_during_resync[uuid] = info
+
+    def _ensure_subscribed(self, conn):
+        """재연결 등으로 연결이 바뀌었으면 새 연결에 이벤트를 다시 구독합니다."""
+        if self.event_source is None:
+            return
+        with self._lock:
+            subscription = self._subscription
+        if subscription is not None and subscription[0] is conn:
+            return
+        if subscription is not None:
+            self.event_source.unsubscribe(*subscription)
+        handle = self.event_source.subscribe(conn, self._on_event)
+        with self._lock:
+            self._subscription = (conn, handle)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.resync()
+            except (ConnectionError, libvirt.libvirtError) as e:
+                with self._lock:
+                    self._subscription = None  # 연결이 복구되면 다시 구독
+                logger.warning("Domain state resync failed: %s", e)
+            self._stop.wait(self.resync_interval)
@@ -0,0 +1,127 @@
+# src/utils/file_transfer.py
+import errno
+import os
+from typing import Optional
+
+from src.utils import metrics
+
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+
+# copy_file_range/sendfile 한 번에 넘기는 최대 크기 (커널 안에서 복사하므로 버퍼와 무관)
+_KERNEL_CHUNK_BYTES = 64 * 1024 * 1024
+
+# copy_file_range/sendfile을 이 파일 조합에 쓸 수 없다는 오류. (다른 파일 시스템, 미지원 커널/파일 종류 등)
+# 이때는 다음 방법으로 이어서 복사함
+_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF}
+
+_BYTES = metrics.counter("iaas_image_transfer_bytes_total", "Bytes written to image files by transfer method.",
+                         ("method",))
+
+
+def _pwrite_all(fd: int, data, offset: int):
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def write_stream(stream, fd: int, length: int, offset: int = 0, hasher=None,
+                 chunk_size: int = DEFAULT_CHUNK_BYTES) -> int:
+    """
+    stream에서 최대 length바이트를 chunk_size 단위로 읽어 fd의 offset 위치부터 씁니다.
+
+    버퍼 하나를 재사용하므로 메모리 사용량은 길이와 무관하게 chunk_size입니다.
+    (stream에 readinto가 있으면 버퍼로 바로 읽어 청크마다 bytes를 만들지 않음)
+    hasher(hashlib 객체)가 주어지면 쓰는 내용으로 함께 갱신합니다.
+
+    Returns:
+        쓴 바이트 수. 스트림이 먼저 끝나면 length보다 작습니다.
+    """
+    buffer = memoryview(bytearray(max(1, min(chunk_size, length))))
+    readinto = getattr(stream, "readinto", None)
+    written = 0
+    try:
+        while written < length:
+            size = min(len(buffer), length - written)
+            if readinto is not None:
+                chunk = buffer[:readinto(buffer[:size]) or 0]
+            else:
+                chunk = stream.read(size)
+            if not chunk:
+                break
+            if hasher is not None:
+                hasher.update(chunk)
+            _pwrite_all(fd, chunk, offset + written)
+            written += len(chunk)
+    finally:
+        _BYTES.labels("stream").inc(written)
+    return written
+
+
+def hash_file(fd: int, hasher, length: int, offset: int = 0, chunk_size: int = DEFAULT_CHUNK_BYTES):
+    """fd의 offset부터 length바이트를 읽어 hasher를 갱신합니다. (이어 받기 전에 이미 받은 부분을 해시할 때 사용)"""
+    buffer = memoryview(bytearray(max(1, min(chunk_size, length))))
+    done = 0
+    while done < length:
+        read = os.preadv(fd, [buffer[:min(len(buffer), length - done)]], offset + done)
+        if not read:
+            raise ValueError(f"File ended after {done} of {length} bytes.")
+        hasher.update(buffer[:read])
+        done += read
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int, buffer) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int, buffer) -> int:
+    # sendfile은 대상 파일의 현재 위치에 쓰므로 위치를 맞춤
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _read_write(src_fd: int, dst_fd: int, offset: int, count: int, buffer) -> int:
+    read = os.preadv(src_fd, [buffer[:min(len(buffer), count)]], offset)
+    _pwrite_all(dst_fd, buffer[:read], offset)
+    return read
+
+
+_COPY_METHODS = [
+    ("copy_file_range", _copy_file_range if hasattr(os, "copy_file_range") else None),
+    ("sendfile", _sendfile if hasattr(os, "sendfile") else None),
+    ("read_write", _read_write),
+]
+
+
+def copy_file(src_fd: int, dst_fd: int, length: int, chunk_size: int = DEFAULT_CHUNK_BYTES) -> str:
+    """
+    src_fd의 처음 length바이트를 dst_fd의 같은 위치로 복사하고, 사용한 방법의 이름을 반환합니다.
+
+    copy_file_range를 먼저 사용하며(같은 파일 시스템이면 커널 안에서 복사하고, 지원하면 블록을 공유),
+    쓸 수 없으면 sendfile, 그다음 버퍼를 이용한 읽기/쓰기로 이어서 복사합니다.
+
+    Raises:
+        ValueError: 복사 도중 원본이 length보다 짧아졌을 때.
+    """
+    buffer: Optional[memoryview] = None
+    copied = 0
+    for method, copy in _COPY_METHODS:
+        if copy is None:
+            continue
+        if method == "read_write":
+            buffer = memoryview(bytearray(max(1, min(chunk_size, length))))
+        counter = _BYTES.labels(method)
+        try:
+            while copied < length:
+                count = min(length - copied, _KERNEL_CHUNK_BYTES)
+                done = copy(src_fd, dst_fd, copied, count, buffer)
+                if not done:
+                    raise ValueError(f"Source file ended after {copied} of {length} bytes.")
+                copied += done
+                counter.inc(done)
+        except OSError as e:
+            if method == "read_write" or e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            continue
+        return method
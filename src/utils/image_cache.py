@@ -0,0 +1,145 @@
+# src/utils/image_cache.py
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+_LOOKUPS = metrics.counter("iaas_image_cache_lookups_total", "Image catalog cache lookups.", ("result",))
+_HITS = _LOOKUPS.labels("hit")
+_MISSES = _LOOKUPS.labels("miss")
+
+
+class ImageInfo(NamedTuple):
+    """
+    캐시에 보관하는 이미지 메타데이터입니다.
+
+    ORM 객체는 세션에 묶여 있어 요청 간에 공유할 수 없으므로 필요한 값만 복사해 둡니다.
+    """
+    name: str
+    filepath: str
+    min_disk_gb: Optional[int]
+    min_ram_mb: Optional[int]
+
+    @classmethod
+    def from_model(cls, image) -> "ImageInfo":
+        return cls(image.name, image.filepath, image.min_disk_gb, image.min_ram_mb)
+
+
+class ImageCatalogCache:
+    """
+    프로세스 전역 이미지 카탈로그 캐시입니다.
+
+    이미지 목록은 거의 바뀌지 않으므로, VM 생성마다 images 테이블을 조회하지 않고 이름으로 캐시에서 찾습니다.
+    - 메타데이터는 ttl초 동안 유지되며, 이 프로세스에서 이미지 레코드가 바뀌면(invalidate_on_change)
+      커밋 직후 무효화됩니다. 다른 프로세스의 변경은 ttl이 지나면 반영됩니다.
+    - 이미지 파일 존재 확인은 경로별로 file_ttl초 동안 재사용합니다. 다시 확인할 때 파일의
+      (장치, inode, 수정 시각)이 달라졌으면 기반 이미지가 교체된 것이므로 경고를 남깁니다.
+    - 없는 이미지나 파일은 캐시하지 않으므로, 새로 등록한 이미지는 바로 사용할 수 있습니다.
+    """
+
+    def __init__(self, ttl: float = 300.0, file_ttl: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl: 이미지 메타데이터를 재사용할 시간(초).
+            file_ttl: 이미지 파일 존재 확인 결과를 재사용할 시간(초).
+            clock: 단조 증가하는 현재 시각(초)을 반환하는 함수.
+        """
+        self.ttl = ttl
+        self.file_ttl = file_ttl
+        self._clock = clock
+        self._images: Dict[str, Tuple[float, ImageInfo]] = {}  # 이름 -> (만료 시각, 메타데이터)
+        self._files: Dict[str, Tuple[float, Tuple[int, int, int]]] = {}  # 경로 -> (만료 시각, 파일 식별 정보)
+        self._lock = threading.Lock()
+
+    def get_many(self, names: Iterable[str]) -> Tuple[Dict[str, ImageInfo], List[str]]:
+        """
+        캐시에 있는 이미지를 찾습니다.
+
+        Returns:
+            (이름 -> 메타데이터, 캐시에 없거나 만료된 이름 목록) 튜플.
+        """
+        now = self._clock()
+        found, missing = {}, []
+        for name in names:
+            entry = self._images.get(name)
+            if entry is not None and now < entry[0]:
+                found[name] = entry[1]
+                _HITS.inc()
+            else:
+                missing.append(name)
+                _MISSES.inc()
+        return found, missing
+
+    def put_many(self, images: Iterable[ImageInfo]):
+        expires_at = self._clock() + self.ttl
+        with self._lock:
+            for image in images:
+                self._images[image.name] = (expires_at, image)
+
+    def invalidate(self, name: Optional[str] = None):
+        """이름이 주어지면 그 이미지를, 아니면 캐시 전체를 무효화합니다."""
+        with self._lock:
+            if name is None:
+                self._images.clear()
+                self._files.clear()
+            else:
+                self._images.pop(name, None)
+
+    def invalidate_on_change(self, model_class):
+        """
+        이 프로세스에서 model_class(이미지 모델) 레코드가 추가/수정/삭제되면, 트랜잭션이 커밋된 뒤 해당 이미지를 무효화합니다.
+
+        flush 시점에 무효화하면 커밋 전에 다른 요청이 이전 행을 읽어 ttl 동안 다시 캐시할 수 있으므로,
+        flush에서는 바뀐 이름만 세션에 모아 두고 커밋 후에 무효화합니다. (롤백되면 버림)
+        """
+        key = ("image_cache.changed", id(self))
+
+        def collect(session, flush_context):
+            changed = session.info.setdefault(key, set())
+            for target in itertools.chain(session.new, session.dirty, session.deleted):
+                if isinstance(target, model_class):
+                    changed.add(target.name)
+                    # 이름이 바뀐 경우 이전 이름의 항목도 무효화
+                    changed.update(inspect(target).attrs.name.history.deleted or ())
+
+        def on_commit(session):
+            for name in session.info.pop(key, ()):
+                self.invalidate(name)
+
+        def on_rollback(session):
+            session.info.pop(key, None)
+
+        event.listen(Session, "after_flush", collect)
+        event.listen(Session, "after_commit", on_commit)
+        event.listen(Session, "after_rollback", on_rollback)
+
+    def file_exists(self, path: str) -> bool:
+        """이미지 파일이 존재하는지 확인합니다. 최근에 존재를 확인한 경로는 다시 stat하지 않습니다."""
+        now = self._clock()
+        entry = self._files.get(path)
+        if entry is not None and now < entry[0]:
+            return True
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._files.pop(path, None)
+            return False
+
+        signature = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+        if entry is not None and entry[1] != signature:
+            # 이미 만들어진 VM 디스크는 이전 내용을 기반으로 하므로 운영자가 알아야 함
+            logger.warning("Base image file '%s' was replaced or modified on disk.", path)
+        with self._lock:
+            self._files[path] = (now + self.file_ttl, signature)
+        return True
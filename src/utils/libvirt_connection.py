@@ -0,0 +1,90 @@
+# src/utils/libvirt_connection.py
+import threading
+
+import libvirt
+
+from src.utils import metrics, tracing
+
+LIBVIRT_CALL_SECONDS = metrics.histogram(
+    "iaas_libvirt_call_duration_seconds", "Latency of libvirt API calls.", ("call",)
+)
+
+
+def libvirt_call_timer(call: str) -> tracing.Span:
+    """
+    libvirt API 호출 하나의 소요 시간을 메트릭과 추적 span('libvirt.<call>')으로 기록하는 with 블록을 반환합니다.
+    (예: with libvirt_call_timer('defineXML'))
+    """
+    return tracing.span(f"libvirt.{call}", observe=LIBVIRT_CALL_SECONDS.labels(call).observe)
+
+
+class LibvirtConnectionManager:
+    """
+    프로세스 전체에서 공유하는 libvirt 연결을 관리합니다.
+
+    서버 시작 시 한 번 생성되며, 실제 연결은 처음 필요할 때 연결합니다.
+    libvirt 연결 객체는 스레드 간 공유가 가능하므로 하나의 연결을 재사용하고,
+    연결이 끊어진 경우 다음 요청 시 자동으로 재연결합니다.
+    """
+
+    def __init__(self, uri: str):
+        """
+        Args:
+            uri: 연결할 하이퍼바이저의 libvirt URI. (예: 'qemu:///system')
+        """
+        self.uri = uri
+        self.opened_count = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        정상 상태의 libvirt 연결을 반환합니다. 연결이 없거나 끊어졌으면 새로 엽니다.
+
+        Returns:
+            libvirt.virConnect 객체.
+
+        Raises:
+            ConnectionError: 하이퍼바이저에 연결할 수 없을 때.
+        """
+        conn = self._conn
+        if conn is not None and self._is_alive(conn):
+            return conn
+
+        with self._lock:
+            # 락을 기다리는 동안 다른 스레드가 이미 재연결했을 수 있음
+            if self._conn is not None and self._is_alive(self._conn):
+                return self._conn
+
+            self._close_quietly(self._conn)
+            self._conn = None
+            try:
+                with libvirt_call_timer("open"):
+                    self._conn = libvirt.open(self.uri)
+            except libvirt.libvirtError:
+                # TODO: 로깅 시스템 도입 후 로그 남기기
+                raise ConnectionError("Failed to open connection to the hypervisor.")
+            self.opened_count += 1
+            return self._conn
+
+    def close(self):
+        """관리 중인 연결을 닫습니다. 서버 종료 시 호출합니다."""
+        with self._lock:
+            self._close_quietly(self._conn)
+            self._conn = None
+
+    @staticmethod
+    def _is_alive(conn) -> bool:
+        try:
+            return bool(conn.isAlive())
+        except libvirt.libvirtError:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        if conn is None:
+            return
+        try:
+            conn.close()
+        except libvirt.libvirtError:
+            pass  # 이미 닫혔거나 할 수 없는 경우 무시
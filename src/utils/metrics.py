@@ -0,0 +1,326 @@
+# src/utils/metrics.py
+import bisect
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Prometheus 텍스트 노출 형식의 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 요청, 쿼리, 하이퍼바이저 호출처럼 수 ms ~ 수십 초 걸리는 작업에 맞춘 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+class _ThreadShards:
+    """
+    스레드별로 분리된 누적값 저장소입니다.
+
+    각 스레드는 자신만의 딕셔너리(레이블 값 -> 숫자 리스트)에만 쓰므로 기록 경로에서 락을 잡지 않습니다.
+    락은 스레드가 처음 기록할 때(샤드 등록)와 수집할 때만 사용하며, 종료된 스레드의 샤드는
+    수집 시점에 retired 샤드로 합쳐 버리므로 스레드가 계속 새로 만들어져도 샤드 수가 늘어나지 않습니다.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, Dict[LabelValues, List[float]]]] = []
+        self._retired: Dict[LabelValues, List[float]] = {}
+
+    def local(self) -> Dict[LabelValues, List[float]]:
+        try:
+            return self._local.values
+        except AttributeError:
+            values = {}
+            with self._lock:
+                self._shards.append((threading.current_thread(), values))
+            self._local.values = values
+            return values
+
+    def collect(self) -> Dict[LabelValues, List[float]]:
+        """모든 스레드의 누적값을 합친 사본을 반환합니다."""
+        with self._lock:
+            alive = []
+            for thread, values in self._shards:
+                if thread.is_alive():
+                    alive.append((thread, values))
+                else:
+                    _add_into(self._retired, values)
+            self._shards = alive
+            totals = {key: list(values) for key, values in self._retired.items()}
+            for _, values in alive:
+                # 다른 스레드가 기록 중일 수 있으므로 딕셔너리 사본을 순회 (copy()는 GIL 아래에서 원자적)
+                _add_into(totals, values.copy())
+        return totals
+
+
+def _add_into(target: Dict[LabelValues, List[float]], source: Dict[LabelValues, List[float]]):
+    for key, values in source.items():
+        existing = target.get(key)
+        if existing is None:
+            target[key] = list(values)
+        else:
+            for index, value in enumerate(values):
+                existing[index] += value
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+
+    def labels(self, *values):
+        """레이블 값이 결정된 자식 메트릭을 반환합니다. (자주 쓰는 레이블은 모듈 수준에서 미리 받아 두면 빠름)"""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"Metric '{self.name}' expects labels {self.labelnames}, got {key}.")
+            child = self._children.setdefault(key, self._new_child(key))
+        return child
+
+    def _new_child(self, key: LabelValues):
+        raise NotImplementedError
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, float]]:
+        """(접미사, 레이블 값, 값) 목록을 반환합니다."""
+        raise NotImplementedError
+
+
+class _Timer:
+    """with 블록의 실행 시간을 초 단위로 기록합니다. (예외로 끝나도 기록)"""
+    __slots__ = ("_observe", "_start")
+
+    def __init__(self, observe: Callable[[float], None]):
+        self._observe = observe
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._observe(time.perf_counter() - self._start)
+        return False
+
+
+class _CounterChild:
+    __slots__ = ("_shards", "_key")
+
+    def __init__(self, shards: _ThreadShards, key: LabelValues):
+        self._shards = shards
+        self._key = key
+
+    def inc(self, amount: float = 1.0):
+        values = self._shards.local()
+        counts = values.get(self._key)
+        if counts is None:
+            counts = values[self._key] = [0.0]
+        counts[0] += amount
+
+
+class Counter(_Metric):
+    """단조 증가하는 누적값입니다. 이름은 Prometheus 관례대로 '_total'로 끝나야 합니다."""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._shards = _ThreadShards()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def _new_child(self, key):
+        return _CounterChild(self._shards, key)
+
+    def samples(self):
+        for key, (value,) in sorted(self._shards.collect().items()):
+            yield "", key, value
+
+
+class _GaugeChild:
+    __slots__ = ("_gauge", "_key")
+
+    def __init__(self, gauge: "Gauge", key: LabelValues):
+        self._gauge = gauge
+        self._key = key
+
+    def set(self, value: float):
+        self._gauge._values[self._key] = value
+
+    def inc(self, amount: float = 1.0):
+        with self._gauge._lock:
+            self._gauge._values[self._key] = self._gauge._values.get(self._key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+
+class Gauge(_Metric):
+    """
+    현재 값을 나타내는 메트릭입니다.
+
+    fn을 주면 값은 수집 시점에 fn()을 호출해 읽습니다. fn은 숫자(레이블이 없을 때) 또는
+    {레이블 값 튜플: 숫자} 딕셔너리를 반환합니다. (예: 대기 중인 작업 수, 캐시 항목 수)
+    """
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 fn: Optional[Callable[[], Union[float, Dict[LabelValues, float]]]] = None):
+        super().__init__(name, documentation, labelnames)
+        self._fn = fn
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self.labels().dec(amount)
+
+    def _new_child(self, key):
+        return _GaugeChild(self, key)
+
+    def samples(self):
+        if self._fn is None:
+            values = dict(self._values)
+        else:
+            result = self._fn()
+            values = result if isinstance(result, dict) else {(): result}
+        for key, value in sorted(values.items()):
+            if value is not None:
+                yield "", tuple(str(label) for label in key), value
+
+
+class _HistogramChild:
+    __slots__ = ("_shards", "_key", "_buckets")
+
+    def __init__(self, shards: _ThreadShards, key: LabelValues, buckets: Tuple[float, ...]):
+        self._shards = shards
+        self._key = key
+        self._buckets = buckets
+
+    def observe(self, value: float):
+        values = self._shards.local()
+        counts = values.get(self._key)
+        if counts is None:
+            # [버킷별 개수..., +Inf 버킷 개수, 합계, 전체 개수]
+            counts = values[self._key] = [0.0] * (len(self._buckets) + 3)
+        counts[bisect.bisect_left(self._buckets, value)] += 1
+        counts[-2] += value
+        counts[-1] += 1
+
+    def time(self) -> _Timer:
+        return _Timer(self.observe)
+
+
+class Histogram(_Metric):
+    """고정 버킷에 관측값의 분포를 누적합니다. (버킷 경계는 생성 시 정해지며 le 이하를 셈)"""
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._shards = _ThreadShards()
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def time(self) -> _Timer:
+        return self.labels().time()
+
+    def _new_child(self, key):
+        return _HistogramChild(self._shards, key, self.buckets)
+
+    def samples(self):
+        for key, counts in sorted(self._shards.collect().items()):
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield "_bucket", key + (_format_value(bound),), cumulative
+            yield "_sum", key, counts[-2]
+            yield "_count", key, counts[-1]
+
+
+class MetricsRegistry:
+    """
+    메트릭을 이름으로 등록하고 Prometheus 텍스트 형식으로 내보냅니다.
+
+    같은 이름으로 다시 등록하면 기존 메트릭을 반환하므로, 여러 모듈이 같은 메트릭을
+    각자 선언해 사용할 수 있습니다. (종류나 레이블이 다르면 ValueError)
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+              fn: Optional[Callable[[], Union[float, Dict[LabelValues, float]]]] = None) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames, fn=fn)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def _register(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric '{name}' is already registered with a different type or labels.")
+            return metric
+
+    def render(self) -> str:
+        """등록된 모든 메트릭을 Prometheus 텍스트 노출 형식으로 만듭니다."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            labelnames = metric.labelnames
+            for suffix, key, value in metric.samples():
+                names = labelnames + ("le",) if suffix == "_bucket" else labelnames
+                labels = ",".join(f'{label}="{_escape_label(value)}"' for label, value in zip(names, key))
+                lines.append(f"{metric.name}{suffix}{{{labels}}} {_format_value(value)}" if labels
+                             else f"{metric.name}{suffix} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# 프로세스 전역 레지스트리 (GET /metrics가 내보냄)
+REGISTRY = MetricsRegistry()
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
@@ -0,0 +1,65 @@
+# src/utils/pagination.py
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+
+def normalize_limit(limit: Optional[int], default: int, maximum: int) -> int:
+    """
+    페이지 크기를 검증합니다. 지정하지 않으면 default를 사용합니다.
+
+    Raises:
+        ValueError: limit이 1 미만이거나 maximum을 넘을 때.
+    """
+    if limit is None:
+        return default
+    if not 1 <= limit <= maximum:
+        raise ValueError(f"'limit' must be between 1 and {maximum}.")
+    return limit
+
+
+def select_fields(fields: Optional[Sequence[str]], allowed: Sequence[str]) -> List[str]:
+    """
+    응답에 포함할 필드 목록을 검증합니다. 지정하지 않으면 allowed 전체를 사용합니다.
+
+    Raises:
+        ValueError: 허용되지 않은 필드가 있을 때.
+    """
+    if not fields:
+        return list(allowed)
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown field(s) {', '.join(unknown)}. Allowed fields: {', '.join(allowed)}.")
+    return list(dict.fromkeys(fields))
+
+
+class Page:
+    """
+    조회 결과 행을 최대 limit개까지 하나씩 변환하여 내보내는 목록 페이지입니다.
+
+    리포지토리는 limit + 1개를 조회하므로, 다음 페이지가 있는지 COUNT 쿼리 없이 알 수 있습니다.
+    행은 순회할 때 커서에서 읽히므로 결과 크기와 무관하게 메모리 사용량이 일정하며,
+    순회가 끝나면 다음 페이지가 있을 때 next_marker에 마지막으로 내보낸 행의 마커가 설정됩니다.
+    meta에 넣은 값은 응답 객체에 next_marker 뒤의 키로 함께 포함됩니다.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]], limit: int, marker_key: str,
+                 transform: Callable[[Dict[str, Any]], Dict[str, Any]] = dict):
+        self.next_marker: Optional[Any] = None
+        self.meta: Dict[str, Any] = {}
+        self._rows = rows
+        self._limit = limit
+        self._marker_key = marker_key
+        self._transform = transform
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        last = None
+        for count, row in enumerate(self._rows):
+            if count == self._limit:
+                self.next_marker = last[self._marker_key]
+                break
+            last = row
+            yield self._transform(row)
+
+    def to_dict(self, items_key: str) -> Dict[str, Any]:
+        """페이지 전체를 {items_key: [...], 'next_marker': ..., **meta} 딕셔너리로 만듭니다."""
+        items = list(self)
+        return {items_key: items, "next_marker": self.next_marker, **self.meta}
@@ -0,0 +1,181 @@
+# src/utils/password_hasher.py
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+# 해시 문자열 형식: '<알고리즘>$<파라미터>$<base64 salt>$<base64 해시>'
+#   scrypt$n=16384,r=8,p=1$...$...
+#   pbkdf2_sha256$i=600000$...$...
+# 구버전 형식(솔트 없는 SHA-256 16진수 64자)은 검증만 지원하며 needs_rehash()가 True를 반환합니다.
+_SALT_BYTES = 16
+_KEY_BYTES = 32
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+def _is_legacy_sha256(stored_hash: str) -> bool:
+    return len(stored_hash) == 64 and "$" not in stored_hash
+
+
+class PasswordHasher:
+    """
+    솔트와 작업 계수(work factor)를 사용하는 KDF로 비밀번호를 해시하고 검증합니다.
+
+    - 해시 문자열에 알고리즘과 파라미터가 기록되므로, 설정을 바꿔도 기존 해시를 검증할 수 있고
+      needs_rehash()로 재해시가 필요한지 알 수 있습니다.
+    - KDF는 크기가 제한된 전용 워커 풀에서 실행됩니다. 로그인 요청이 몰려도 동시에 실행되는
+      KDF 수(CPU와 scrypt 메모리 사용량)가 workers개로 제한되며, hashlib은 계산 중 GIL을
+      놓으므로 다른 요청 스레드는 계속 처리됩니다. workers=0이면 호출 스레드에서 바로 실행합니다.
+    - cache_ttl > 0이면 최근 검증에 성공한 자격 증명을 짧게 캐시하여, 같은 자격 증명으로
+      반복되는 토큰 요청(예: CI)이 매번 KDF를 실행하지 않게 합니다. 캐시 키는 프로세스별 무작위
+      키로 만든 HMAC이므로 평문 비밀번호나 재사용 가능한 해시는 메모리에 남지 않습니다.
+    """
+
+    def __init__(self, algorithm: str = "scrypt", scrypt_n: int = 2 ** 14, scrypt_r: int = 8, scrypt_p: int = 1,
+                 pbkdf2_iterations: int = 600_000, workers: int = 4,
+                 cache_ttl: float = 0.0, cache_max_entries: int = 1024):
+        """
+        Args:
+            algorithm: 새 해시에 사용할 알고리즘. 'scrypt' 또는 'pbkdf2_sha256'.
+            scrypt_n, scrypt_r, scrypt_p: scrypt 작업 계수. (메모리 사용량은 약 128 * n * r 바이트)
+            pbkdf2_iterations: PBKDF2-HMAC-SHA256 반복 횟수.
+            workers: KDF를 실행할 워커 스레드 수. 0이면 호출 스레드에서 실행합니다.
+            cache_ttl: 검증 성공 캐시의 유효 시간(초). 0이면 캐시를 사용하지 않습니다.
+            cache_max_entries: 검증 성공 캐시의 최대 항목 수.
+        """
+        if algorithm not in ("scrypt", "pbkdf2_sha256"):
+            raise ValueError(f"Unsupported password hash algorithm '{algorithm}'.")
+        self.algorithm = algorithm
+        self.scrypt_n, self.scrypt_r, self.scrypt_p = scrypt_n, scrypt_r, scrypt_p
+        self.pbkdf2_iterations = pbkdf2_iterations
+        self.cache_ttl = cache_ttl
+        self.cache_max_entries = cache_max_entries
+        self.kdf_count = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kdf-worker") if workers > 0 else None
+        self._cache_key = os.urandom(32)
+        self._cache: "OrderedDict[bytes, float]" = OrderedDict()
+        self._dummy_hash: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def hash(self, password: str) -> str:
+        """현재 설정의 알고리즘과 새 솔트로 비밀번호를 해시합니다."""
+        salt = os.urandom(_SALT_BYTES)
+        if self.algorithm == "scrypt":
+            n, r, p = self.scrypt_n, self.scrypt_r, self.scrypt_p
+            key = self._run_kdf(lambda: self._scrypt(password, salt, n, r, p))
+            params = f"n={n},r={r},p={p}"
+        else:
+            iterations = self.pbkdf2_iterations
+            key = self._run_kdf(lambda: self._pbkdf2(password, salt, iterations))
+            params = f"i={iterations}"
+        return f"{self.algorithm}${params}${_b64encode(salt)}${_b64encode(key)}"
+
+    def verify(self, password: str, stored_hash: str) -> bool:
+        """비밀번호가 저장된 해시(구버전 SHA-256 포함)와 일치하는지 확인합니다."""
+        if not stored_hash:
+            return False
+        if _is_legacy_sha256(stored_hash):
+            return hmac.compare_digest(hashlib.sha256(password.encode("utf-8")).hexdigest(), stored_hash)
+
+        cache_key = self._credential_key(password, stored_hash) if self.cache_ttl > 0 else None
+        if cache_key is not None and self._cache_hit(cache_key):
+            return True
+
+        try:
+            algorithm, params, salt_b64, key_b64 = stored_hash.split("$")
+            options = dict(item.split("=", 1) for item in params.split(","))
+            salt, expected = _b64decode(salt_b64), _b64decode(key_b64)
+            if algorithm == "scrypt":
+                n, r, p = int(options["n"]), int(options["r"]), int(options["p"])
+                key = self._run_kdf(lambda: self._scrypt(password, salt, n, r, p, len(expected)))
+            elif algorithm == "pbkdf2_sha256":
+                iterations = int(options["i"])
+                key = self._run_kdf(lambda: self._pbkdf2(password, salt, iterations, len(expected)))
+            else:
+                return False
+        except (ValueError, KeyError):
+            return False
+
+        matched = hmac.compare_digest(key, expected)
+        if matched and cache_key is not None:
+            self._cache_put(cache_key)
+        return matched
+
+    def dummy_hash(self) -> str:
+        """
+        현재 설정으로 해시한 임의 비밀번호의 해시를 반환합니다. (처음 호출할 때 한 번 만듦)
+
+        없는 사용자의 로그인도 이 해시로 verify()를 실행하면 실제 사용자와 같은 KDF 비용이 들어,
+        응답 시간으로 사용자 이름의 존재 여부가 드러나지 않습니다.
+        """
+        if self._dummy_hash is None:
+            dummy_hash = self.hash(_b64encode(os.urandom(16)))
+            with self._lock:
+                if self._dummy_hash is None:
+                    self._dummy_hash = dummy_hash
+        return self._dummy_hash
+
+    def needs_rehash(self, stored_hash: str) -> bool:
+        """저장된 해시가 현재 설정(알고리즘, 작업 계수)과 다르면 True를 반환합니다."""
+        if _is_legacy_sha256(stored_hash):
+            return True
+        if self.algorithm == "scrypt":
+            current = f"scrypt$n={self.scrypt_n},r={self.scrypt_r},p={self.scrypt_p}$"
+        else:
+            current = f"pbkdf2_sha256$i={self.pbkdf2_iterations}$"
+        return not stored_hash.startswith(current)
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=True)
+
+    def _run_kdf(self, fn: Callable[[], bytes]) -> bytes:
+        with self._lock:
+            self.kdf_count += 1
+        if self._executor is None:
+            return fn()
+        return self._executor.submit(fn).result()
+
+    @staticmethod
+    def _scrypt(password: str, salt: bytes, n: int, r: int, p: int, dklen: int = _KEY_BYTES) -> bytes:
+        return hashlib.scrypt(password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+                              maxmem=2 * 128 * n * r * p + 1024 * 1024, dklen=dklen)
+
+    @staticmethod
+    def _pbkdf2(password: str, salt: bytes, iterations: int, dklen: int = _KEY_BYTES) -> bytes:
+        return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations, dklen)
+
+    def _credential_key(self, password: str, stored_hash: str) -> bytes:
+        # 저장된 해시가 바뀌면(비밀번호 변경, 재해시) 이전 캐시 항목은 자연히 무효가 됨
+        return hmac.new(self._cache_key, f"{stored_hash}\0{password}".encode("utf-8"), hashlib.sha256).digest()
+
+    def _cache_hit(self, cache_key: bytes) -> bool:
+        with self._lock:
+            expires_at = self._cache.get(cache_key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._cache[cache_key]
+                return False
+            self._cache.move_to_end(cache_key)
+            return True
+
+    def _cache_put(self, cache_key: bytes):
+        with self._lock:
+            self._cache[cache_key] = time.monotonic() + self.cache_ttl
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
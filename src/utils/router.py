@@ -0,0 +1,72 @@
+# src/utils/router.py
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# 라우트 패턴의 앞부분 중 인덱스 키로 사용할 고정(literal) 세그먼트 수
+_INDEX_DEPTH = 2
+_REGEX_META = re.compile(r"[\\()\[\]{}.*+?|^$]")
+
+
+class MethodNotAllowedError(Exception):
+    """경로는 존재하지만 요청한 HTTP 메서드를 지원하지 않을 때"""
+    def __init__(self, allowed_methods: List[str]):
+        self.allowed_methods = allowed_methods
+        super().__init__(f"Method not allowed. Allowed: {', '.join(allowed_methods)}")
+
+
+class Router:
+    """
+    서버 시작 시 한 번만 구성되는 라우팅 테이블입니다.
+
+    라우트는 (세그먼트 개수, 앞쪽 고정 세그먼트)를 키로 버킷에 나뉘고, 버킷 안에서는
+    HTTP 메서드별로 미리 컴파일된 정규식 목록을 가집니다. 요청 경로는 문자열 분할만으로
+    버킷을 찾으므로, 전체 라우트를 순서대로 정규식 매칭하지 않고 소수의 후보만 검사합니다.
+    """
+
+    def __init__(self, routes: Iterable[Tuple[str, str, Callable]] = ()):
+        """
+        Args:
+            routes: (HTTP 메서드, 정규식 패턴, 핸들러) 튜플의 목록.
+                    패턴은 '^/v1/vms/([a-zA-Z0-9_-]+)$'처럼 세그먼트 단위로 작성하며,
+                    앞쪽 두 세그먼트는 정규식이 아닌 고정 문자열이어야 합니다.
+        """
+        self._buckets: Dict[Tuple[int, Tuple[str, ...]], Dict[str, List[Tuple[re.Pattern, Callable]]]] = {}
+        for method, pattern, handler in routes:
+            self.add(method, pattern, handler)
+
+    def add(self, method: str, pattern: str, handler: Callable):
+        """라우트를 하나 등록합니다."""
+        segments = pattern.lstrip("^").rstrip("$").split("/")
+        prefix = tuple(segments[1:_INDEX_DEPTH + 1])
+        if any(_REGEX_META.search(segment) for segment in prefix):
+            raise ValueError(f"Route pattern '{pattern}' must start with {_INDEX_DEPTH} literal segments.")
+
+        bucket = self._buckets.setdefault((len(segments), prefix), {})
+        bucket.setdefault(method, []).append((re.compile(pattern), handler))
+
+    def match(self, method: str, path: str) -> Optional[Tuple[Callable, Tuple[str, ...]]]:
+        """
+        요청 메서드와 경로에 맞는 핸들러를 찾습니다.
+
+        Returns:
+            (핸들러, 경로 파라미터 튜플). 일치하는 경로가 없으면 None.
+
+        Raises:
+            MethodNotAllowedError: 경로는 일치하지만 메서드가 다를 때.
+        """
+        segments = path.split("/")
+        bucket = self._buckets.get((len(segments), tuple(segments[1:_INDEX_DEPTH + 1])))
+        if not bucket:
+            return None
+
+        for regex, handler in bucket.get(method, ()):
+            if match := regex.match(path):
+                return handler, match.groups()
+
+        allowed = sorted(
+            route_method for route_method, entries in bucket.items()
+            if route_method != method and any(regex.match(path) for regex, _ in entries)
+        )
+        if allowed:
+            raise MethodNotAllowedError(allowed)
+        return None
@@ -0,0 +1,102 @@
+# src/utils/signed_token.py
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class TokenSignatureError(Exception):
+    """토큰 형식이 잘못되었거나 서명이 일치하지 않을 때"""
+    pass
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class TokenSigner:
+    """
+    HMAC-SHA256으로 서명한 자체 검증(stateless) 토큰을 만들고 검증합니다.
+
+    토큰은 '<base64url(JSON 페이로드)>.<base64url(서명)>' 형식이며, 페이로드에 필요한
+    정보가 모두 들어 있으므로 검증에 공유 저장소나 DB 조회가 필요 없습니다.
+    같은 비밀 키를 가진 모든 워커 프로세스가 토큰을 검증할 수 있습니다.
+    """
+
+    def __init__(self, secret: bytes):
+        if not secret:
+            raise ValueError("Token signing secret must not be empty.")
+        # 키 설정이 끝난 HMAC 객체를 복사해 쓰면 토큰마다 키를 다시 처리하지 않아도 됨
+        self._mac = hmac.new(secret, digestmod=hashlib.sha256)
+
+    def sign(self, payload: Dict[str, Any]) -> str:
+        """페이로드를 직렬화하고 서명한 토큰 문자열을 반환합니다."""
+        body = _b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        return f"{body}.{_b64encode(self._digest(body))}"
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        서명을 검증하고 페이로드를 반환합니다. (만료 여부는 호출자가 확인)
+
+        Raises:
+            TokenSignatureError: 형식이 잘못되었거나 서명이 일치하지 않을 때.
+        """
+        body, _, signature = token.partition(".")
+        if not body or not signature:
+            raise TokenSignatureError("Malformed token.")
+        try:
+            valid = hmac.compare_digest(_b64decode(signature), self._digest(body))
+        except ValueError:
+            raise TokenSignatureError("Malformed token.")
+        if not valid:
+            raise TokenSignatureError("Invalid token signature.")
+        try:
+            return json.loads(_b64decode(body).decode("utf-8"))
+        except ValueError:
+            raise TokenSignatureError("Malformed token payload.")
+
+    def _digest(self, body: str) -> bytes:
+        mac = self._mac.copy()
+        mac.update(body.encode("ascii"))
+        return mac.digest()
+
+
+class RevocationList:
+    """
+    로그아웃 등으로 만료 전에 폐기된 서명 토큰의 ID(jti)를 보관하는 프로세스 내 캐시입니다.
+
+    폐기 항목은 원래 토큰의 만료 시각까지만 필요하므로, 항목 수가 지난 정리 시점의 두 배가
+    될 때마다 만료된 항목을 정리합니다. (폐기된 토큰이 다시 유효해지지 않도록 만료 전의
+    항목은 제거하지 않습니다)
+    """
+
+    def __init__(self, purge_threshold: int = 1024):
+        self._revoked: Dict[str, float] = {}
+        self._purge_threshold = purge_threshold
+        self._min_purge_threshold = purge_threshold
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, expires_at: float):
+        """토큰 ID를 폐기 목록에 추가합니다. expires_at은 원래 토큰의 만료 시각(Unix 시간)입니다."""
+        with self._lock:
+            self._revoked[jti] = expires_at
+            if len(self._revoked) >= self._purge_threshold:
+                self._purge(time.time())
+                self._purge_threshold = max(self._min_purge_threshold, 2 * len(self._revoked))
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        return jti in self._revoked
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def _purge(self, now: float):
+        for jti in [jti for jti, expires_at in self._revoked.items() if expires_at <= now]:
+            del self._revoked[jti]
@@ -0,0 +1,434 @@
+# src/utils/storage_helper.py
+"""
+디스크 파일 작업을 대신 수행하는 권한 헬퍼 데몬과 그 클라이언트입니다.
+
+API 서버는 디스크 작업마다 'sudo qemu-img ...', 'sudo rm ...' 프로세스를 띄우는 대신,
+root로 한 번 실행해 둔 헬퍼에 Unix 소켓으로 요청을 보냅니다.
+
+프로토콜 (한 줄에 JSON 하나):
+    요청: {"id": 1, "op": "create_overlay", "args": {"source": "...", "target": "..."}}
+    응답: {"id": 1, "ok": true, "result": ...}
+          {"id": 1, "ok": false, "kind": "forbidden", "error": "..."}
+
+- 클라이언트는 응답을 기다리지 않고 여러 요청을 이어서 보낼 수 있으며(파이프라이닝),
+  헬퍼는 요청을 작업 스레드 풀에서 동시에 처리하고 끝나는 순서대로 응답합니다.
+- 헬퍼는 허용된 디렉터리 안의 경로만 다룹니다. 경로는 심볼릭 링크와 '..'을 풀어 확인한 뒤,
+  확인한 실제 경로로 작업합니다.
+
+헬퍼 실행:
+    sudo PYTHONPATH=. python3 -m src.utils.storage_helper --socket /run/iaas/storage-helper.sock \\
+        --allow /var/lib/libvirt/images --allow "$PWD/image-uploads" --group "$(id -gn)"
+"""
+import argparse
+import itertools
+import json
+import logging
+import os
+import shutil
+import signal
+import socket
+import socketserver
+import subprocess
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.utils import metrics, tracing
+
+logger = logging.getLogger(__name__)
+
+# 요청 한 줄의 최대 크기. 이보다 긴 줄을 보내면 연결을 끊음
+_MAX_LINE_BYTES = 64 * 1024
+
+_CALL_SECONDS = metrics.histogram(
+    "iaas_storage_helper_call_duration_seconds", "Latency of disk operations sent to the storage helper.", ("op",)
+)
+
+
+class StorageHelperError(Exception):
+    """
+    헬퍼가 디스크 작업을 거부했거나 실패했을 때, 또는 헬퍼와 통신할 수 없을 때.
+
+    kind: 'invalid'(잘못된 요청), 'forbidden'(허용되지 않은 경로), 'failed'(작업 실패),
+          'unavailable'(연결 실패, 연결 끊김, 응답 시간 초과)
+    """
+
+    def __init__(self, message: str, kind: str = "failed"):
+        super().__init__(message)
+        self.kind = kind
+
+
+# --------------------------------------------------------------------------
+## 헬퍼 데몬
+# --------------------------------------------------------------------------
+
+class _OperationError(Exception):
+    def __init__(self, kind: str, message: str):
+        super().__init__(message)
+        self.kind = kind
+
+
+class _HelperConnection(socketserver.StreamRequestHandler):
+    """연결 하나의 요청을 읽어 작업 풀에 넘기고, 끝나는 대로 응답을 씁니다."""
+
+    def handle(self):
+        write_lock = threading.Lock()
+        in_flight = threading.Semaphore(0)
+        submitted = 0
+
+        def reply(future: Future):
+            data = (json.dumps(future.result()) + "\n").encode()
+            try:
+                with write_lock:
+                    self.wfile.write(data)
+                    self.wfile.flush()
+            except OSError:
+                pass  # 클라이언트가 먼저 연결을 끊음
+            finally:
+                in_flight.release()
+
+        while True:
+            line = self.rfile.readline(_MAX_LINE_BYTES + 1)
+            if not line:
+                break
+            if len(line) > _MAX_LINE_BYTES:
+                logger.warning("Closing storage helper connection: request line too long.")
+                break
+            if not line.strip():
+                continue
+            try:
+                future = self.server.executor.submit(self.server.execute, line)
+            except RuntimeError:
+                break  # 헬퍼가 종료 중
+            submitted += 1
+            future.add_done_callback(reply)
+
+        # 연결이 닫히기 전에 이미 받은 요청의 응답을 모두 보냄
+        for _ in range(submitted):
+            in_flight.acquire()
+
+
+class StorageHelperServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    허용된 디렉터리 안의 디스크 파일에 대해 오버레이 생성, 삭제, 이동, 크기 변경, 정보 조회와
+    디렉터리 생성을 수행하는 Unix 소켓 서버입니다.
+
+    root로 실행하는 것을 전제로 하며, 작업은 sudo 없이 직접 수행합니다. (삭제는 프로세스 없이 os.remove)
+    연결마다 스레드 하나가 요청을 읽고, 실제 작업은 workers개의 작업 스레드가 동시에 처리합니다.
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, allowed_dirs: Sequence[str], workers: int = 8,
+                 qemu_img: str = "qemu-img", socket_mode: int = 0o660):
+        """
+        Args:
+            socket_path: 요청을 받을 Unix 소켓 경로. 이미 있으면 지우고 새로 만듭니다.
+            allowed_dirs: 작업을 허용할 디렉터리 목록. 이 디렉터리 아래의 파일만 다룹니다.
+            workers: 동시에 처리할 작업 수.
+            qemu_img: qemu-img 실행 파일 경로.
+            socket_mode: 소켓 파일 권한. 기본값은 소유자와 그룹만 접속 가능.
+        """
+        if not allowed_dirs:
+            raise ValueError("At least one allowed directory is required.")
+        self.allowed_dirs = [os.path.realpath(path) for path in allowed_dirs]
+        self.qemu_img = qemu_img
+        self.socket_mode = socket_mode
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="storage-op")
+        self._operations = {
+            "create_overlay": self._create_overlay,
+            "delete": self._delete,
+            "resize": self._resize,
+            "info": self._info,
+            "rename": self._rename,
+            "make_dir": self._make_dir,
+        }
+        super().__init__(socket_path, _HelperConnection)
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+        os.chmod(self.server_address, self.socket_mode)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+        try:
+            os.unlink(self.server_address)
+        except OSError:
+            pass
+
+    def execute(self, line: bytes) -> Dict[str, Any]:
+        """요청 한 줄을 처리하고 응답 객체를 반환합니다. 예외를 던지지 않습니다."""
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+                request_id = request["id"]
+                operation = self._operations[request["op"]]
+                args = request.get("args") or {}
+                result = operation(**args)
+            except (ValueError, KeyError, TypeError) as e:
+                raise _OperationError("invalid", f"Invalid request: {e}")
+        except _OperationError as e:
+            return {"id": request_id, "ok": False, "kind": e.kind, "error": str(e)}
+        except Exception as e:
+            logger.exception("Storage helper operation failed.")
+            return {"id": request_id, "ok": False, "kind": "failed", "error": str(e)}
+        return {"id": request_id, "ok": True, "result": result}
+
+    def check_path(self, path: Any) -> str:
+        """
+        경로가 허용된 디렉터리 안에 있는지 확인하고, 심볼릭 링크와 '..'을 푼 실제 경로를 반환합니다.
+
+        Raises:
+            _OperationError: 절대 경로가 아니거나 허용된 디렉터리 밖일 때.
+        """
+        if not isinstance(path, str) or not os.path.isabs(path):
+            raise _OperationError("invalid", f"Path must be an absolute path, got {path!r}.")
+        real_path = os.path.realpath(path)
+        for allowed in self.allowed_dirs:
+            if real_path != allowed and os.path.commonpath([real_path, allowed]) == allowed:
+                return real_path
+        raise _OperationError("forbidden", f"Path '{path}' is outside the allowed directories.")
+
+    def _run(self, command: List[str]) -> str:
+        try:
+            completed = subprocess.run(command, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            raise _OperationError("failed", (e.stderr or "").strip() or f"{command[0]} exited with {e.returncode}")
+        except FileNotFoundError:
+            raise _OperationError("failed", f"{command[0]} not found.")
+        return completed.stdout
+
+    def _create_overlay(self, source: str, target: str) -> None:
+        source, target = self.check_path(source), self.check_path(target)
+        self._run([self.qemu_img, "create", "-q", "-f", "qcow2", "-F", "qcow2", "-b", source, target])
+
+    def _delete(self, path: str) -> bool:
+        path = self.check_path(path)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            raise _OperationError("failed", f"Could not delete '{path}': {e}")
+        return True
+
+    def _rename(self, source: str, target: str) -> None:
+        source, target = self.check_path(source), self.check_path(target)
+        if os.path.lexists(target):
+            raise _OperationError("failed", f"Target '{target}' already exists.")
+        try:
+            # 같은 파일 시스템이면 rename, 다르면(예: 업로드 디렉터리) 복사 후 삭제
+            shutil.move(source, target)
+        except OSError as e:
+            raise _OperationError("failed", f"Could not move '{source}' to '{target}': {e}")
+
+    def _make_dir(self, path: str) -> None:
+        path = self.check_path(path)
+        try:
+            # API 서버가 목록을 읽을 수 있도록 755 권한으로 만듦
+            os.makedirs(path, mode=0o755, exist_ok=True)
+        except OSError as e:
+            raise _OperationError("failed", f"Could not create directory '{path}': {e}")
+
+    def _resize(self, path: str, size_gb: int) -> None:
+        path = self.check_path(path)
+        if not isinstance(size_gb, int) or isinstance(size_gb, bool) or size_gb < 1:
+            raise _OperationError("invalid", f"size_gb must be a positive integer, got {size_gb!r}.")
+        self._run([self.qemu_img, "resize", "-q", path, f"{size_gb}G"])
+
+    def _info(self, path: str) -> Dict[str, Any]:
+        path = self.check_path(path)
+        # 실행 중인 VM이 쓰고 있는 디스크도 조회할 수 있도록 공유 잠금(-U)으로 엶
+        output = self._run([self.qemu_img, "info", "-U", "--output=json", path])
+        try:
+            return json.loads(output)
+        except ValueError:
+            raise _OperationError("failed", "qemu-img info returned invalid JSON.")
+
+
+# --------------------------------------------------------------------------
+## 클라이언트
+# --------------------------------------------------------------------------
+
+class _Connection:
+    """헬퍼와의 소켓 하나와, 그 소켓으로 보낸 뒤 응답을 기다리는 요청들입니다."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.pending: Dict[int, Future] = {}
+        self.closed = False
+
+
+class StorageHelperClient:
+    """
+    권한 헬퍼에 디스크 작업을 요청하는 클라이언트입니다.
+
+    프로세스 전체에서 하나의 연결을 공유하며, 여러 스레드의 요청을 응답을 기다리지 않고 이어서 보냅니다.
+    응답은 전용 스레드가 받아 요청 id로 짝을 맞춥니다. 연결이 끊기면 기다리던 요청은 실패하고,
+    다음 요청 때 다시 연결합니다.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 120.0):
+        """
+        Args:
+            socket_path: 헬퍼의 Unix 소켓 경로.
+            timeout: 작업 하나의 응답을 기다릴 최대 시간(초).
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._conn: Optional[_Connection] = None
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def create_overlay(self, source_filepath: str, target_filepath: str):
+        """source_filepath를 backing file로 하는 qcow2 오버레이 디스크를 만듭니다."""
+        self._call("create_overlay", source=source_filepath, target=target_filepath)
+
+    def delete(self, path: str) -> bool:
+        """디스크 파일을 삭제합니다. 파일이 원래 없었으면 False를 반환합니다."""
+        return self._call("delete", path=path)
+
+    def rename(self, source_filepath: str, target_filepath: str):
+        """디스크 파일을 target_filepath로 옮깁니다. 대상 파일이 이미 있으면 실패합니다."""
+        self._call("rename", source=source_filepath, target=target_filepath)
+
+    def make_dir(self, dirpath: str):
+        """디렉터리를 만듭니다. 이미 있으면 아무것도 하지 않습니다."""
+        self._call("make_dir", path=dirpath)
+
+    def resize(self, path: str, size_gb: int):
+        """디스크의 가상 크기를 size_gb(GiB)로 바꿉니다."""
+        self._call("resize", path=path, size_gb=size_gb)
+
+    def info(self, path: str) -> Dict[str, Any]:
+        """'qemu-img info --output=json'의 결과를 반환합니다."""
+        return self._call("info", path=path)
+
+    def submit(self, op: str, **args) -> Future:
+        """작업 하나를 보내고 응답을 기다리지 않고 Future를 반환합니다."""
+        return self.submit_batch([(op, args)])[0]
+
+    def submit_batch(self, operations: Iterable[Tuple[str, Dict[str, Any]]]) -> List[Future]:
+        """
+        여러 작업을 한 번의 쓰기로 보내고, 작업 순서대로 Future 목록을 반환합니다.
+
+        헬퍼는 작업들을 동시에 처리하므로 끝나는 순서는 보낸 순서와 다를 수 있습니다.
+        Future는 결과를 돌려주거나 StorageHelperError로 실패합니다.
+        """
+        lines = []
+        futures = []
+        with self._lock:
+            conn = self._connect()
+            for op, args in operations:
+                request_id = next(self._ids)
+                future = Future()
+                conn.pending[request_id] = future
+                futures.append(future)
+                lines.append(json.dumps({"id": request_id, "op": op, "args": args}))
+            try:
+                conn.sock.sendall(("\n".join(lines) + "\n").encode())
+            except OSError as e:
+                self._fail_locked(conn, f"Lost connection to the storage helper: {e}")
+        return futures
+
+    def close(self):
+        """연결을 닫습니다. 응답을 기다리던 요청은 실패합니다."""
+        with self._lock:
+            if self._conn is not None:
+                self._fail_locked(self._conn, "Storage helper client was closed.")
+
+    def _call(self, op: str, **args):
+        with tracing.span(f"storage.{op}", observe=_CALL_SECONDS.labels(op).observe):
+            future = self.submit(op, **args)
+            try:
+                return future.result(self.timeout)
+            except FutureTimeoutError:
+                raise StorageHelperError(f"Storage helper did not answer '{op}' within {self.timeout}s.",
+                                         "unavailable")
+
+    def _connect(self) -> _Connection:
+        # self._lock 안에서 호출
+        if self._conn is not None:
+            return self._conn
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise StorageHelperError(f"Storage helper at '{self.socket_path}' is not reachable: {e}", "unavailable")
+        conn = _Connection(sock)
+        self._conn = conn
+        threading.Thread(target=self._read_responses, args=(conn,), name="storage-helper-reader",
+                         daemon=True).start()
+        return conn
+
+    def _read_responses(self, conn: _Connection):
+        reason = "Storage helper closed the connection."
+        try:
+            with conn.sock.makefile("rb") as stream:
+                for line in stream:
+                    response = json.loads(line)
+                    with self._lock:
+                        future = conn.pending.pop(response.get("id"), None)
+                    if future is None:
+                        continue
+                    if response.get("ok"):
+                        future.set_result(response.get("result"))
+                    else:
+                        future.set_exception(StorageHelperError(response.get("error", ""),
+                                                                response.get("kind", "failed")))
+        except (OSError, ValueError) as e:
+            reason = f"Lost connection to the storage helper: {e}"
+        with self._lock:
+            self._fail_locked(conn, reason)
+
+    def _fail_locked(self, conn: _Connection, reason: str):
+        # self._lock 안에서 호출. 연결을 버리고 응답을 기다리던 요청을 모두 실패시킴
+        if self._conn is conn:
+            self._conn = None
+        if not conn.closed:
+            conn.closed = True
+            try:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            conn.sock.close()
+        pending, conn.pending = conn.pending, {}
+        for future in pending.values():
+            future.set_exception(StorageHelperError(reason, "unavailable"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Privileged disk operation helper for the IaaS API server.")
+    parser.add_argument("--socket", required=True, help="Unix socket path to listen on.")
+    parser.add_argument("--allow", action="append", required=True,
+                        help="Directory whose files may be operated on. Repeat for several directories.")
+    parser.add_argument("--group", help="Group that owns the socket (the API server's group).")
+    parser.add_argument("--workers", type=int, default=8, help="Operations to run concurrently.")
+    parser.add_argument("--qemu-img", default="qemu-img", help="Path to the qemu-img binary.")
+    options = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    os.makedirs(os.path.dirname(os.path.abspath(options.socket)), exist_ok=True)
+    server = StorageHelperServer(options.socket, options.allow, workers=options.workers, qemu_img=options.qemu_img)
+    if options.group:
+        shutil.chown(options.socket, group=options.group)
+
+    def request_shutdown(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGINT, request_shutdown)
+    signal.signal(signal.SIGTERM, request_shutdown)
+    try:
+        logger.info("Storage helper listening on %s (allowed: %s)", options.socket, ", ".join(server.allowed_dirs))
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# src/utils/streaming.py
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.utils.pagination import Page
+
+# 스트리밍 응답에서 한 번에 내보낼 청크의 대략적인 크기
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# 한 번의 json.dumps 호출로 직렬화할 항목 수
+_ENCODE_BATCH_SIZE = 128
+
+
+def iter_json_page(items_key: str, page: Page, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    페이지를 {items_key: [...], "next_marker": ..., **page.meta} JSON으로 직렬화하며 청크 단위로 내보냅니다.
+
+    항목을 작은 묶음 단위로 직렬화해 chunk_size 정도가 모이면 내보내므로, 전체 JSON 문자열과
+    그 인코딩 결과를 메모리에 만들지 않습니다. next_marker는 항목을 모두 내보낸 뒤에 알 수 있으므로
+    항목 뒤에 쓰고, 페이지의 meta 키들을 이어서 씁니다.
+    """
+    buffer = [f'{{{json.dumps(items_key)}: ['.encode("utf-8")]
+    buffered = len(buffer[0])
+    batch: List[Dict[str, Any]] = []
+    first = True
+
+    def encode_batch() -> bytes:
+        # 항목 여러 개를 한 번의 json.dumps 호출로 직렬화하고 바깥 대괄호만 떼어냄
+        encoded = json.dumps(batch)[1:-1].encode("utf-8")
+        return encoded if first else b", " + encoded
+
+    for item in page:
+        batch.append(item)
+        if len(batch) < _ENCODE_BATCH_SIZE:
+            continue
+        encoded = encode_batch()
+        batch, first = [], False
+        buffer.append(encoded)
+        buffered += len(encoded)
+        if buffered >= chunk_size:
+            yield b"".join(buffer)
+            buffer, buffered = [], 0
+    if batch:
+        buffer.append(encode_batch())
+    trailer = json.dumps({"next_marker": page.next_marker, **page.meta})[1:]
+    buffer.append(f'], {trailer}'.encode("utf-8"))
+    yield b"".join(buffer)
+
+
+class StreamingBody:
+    """
+    WSGI 응답 본문으로 반환하는 청크 이터러블입니다.
+
+    서버는 본문을 모두 보내거나 전송이 중단되면 close()를 호출합니다. (PEP 3333)
+    본문을 만드는 동안 필요한 자원(예: DB 세션과 커서)은 그때까지 유지되어야 하므로,
+    정리 작업을 on_close로 넘겨 받아 close() 시점에 실행합니다. 순회 중 예외가 발생했다면
+    그 예외가, 아니면 None이 on_close에 전달됩니다.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], on_close: Callable[[Optional[Exception]], None]):
+        self._chunks = chunks
+        self._on_close = on_close
+        self._error: Optional[Exception] = None
+        self._closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            yield from self._chunks
+        except Exception as e:  # 순회를 중단한 경우(GeneratorExit)는 오류로 보지 않음
+            self._error = e
+            raise
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if hasattr(self._chunks, "close"):
+                self._chunks.close()
+        finally:
+            self._on_close(self._error)
@@ -0,0 +1,270 @@
+# src/utils/tracing.py
+import contextvars
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 현재 실행 흐름(요청 스레드, 또는 propagate로 넘겨받은 작업)에서 열려 있는 가장 안쪽 span
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("iaas_current_span", default=None)
+
+
+class Span:
+    """
+    추적(trace) 안의 작업 한 구간입니다.
+
+    with 블록으로 사용하며, 블록 안에서 시작한 span은 이 span의 자식이 됩니다.
+    진행 중인 추적이 없으면 아무것도 기록하지 않고 소요 시간만 잽니다.
+    observe를 주면 끝날 때 소요 시간(초)을 전달하므로, 메트릭 타이머를 겸할 수 있습니다.
+    """
+    __slots__ = ("trace", "name", "span_id", "parent_id", "attributes", "start", "duration", "error",
+                 "_observe", "_token")
+
+    def __init__(self, trace: Optional["Trace"], name: str, parent_id: Optional[str],
+                 attributes: Dict[str, Any], observe: Optional[Callable[[float], None]] = None):
+        self.trace = trace
+        self.name = name
+        self.span_id = format(random.getrandbits(64), "016x") if trace is not None else None
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start = 0.0
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        self._observe = observe
+        self._token = None
+
+    def set(self, **attributes):
+        """span에 속성을 추가합니다. (예: 결과 건수, 상태 코드)"""
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter()
+        if self.trace is not None:
+            self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.detach()
+        self.end(exc_type)
+        return False
+
+    def detach(self):
+        """
+        이 span을 현재 span에서 내립니다. 이후 시작하는 span은 이 span의 자식이 되지 않습니다.
+
+        응답 본문을 스트리밍하는 요청처럼 span을 시작한 흐름이 먼저 끝나고 span은 나중에
+        end()로 닫을 때 사용합니다.
+        """
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+
+    def end(self, exc_type: Optional[type] = None):
+        """span을 닫고 소요 시간을 기록합니다. 추적의 최상위 span이면 추적 전체를 마칩니다."""
+        self.duration = time.perf_counter() - self.start
+        if self._observe is not None:
+            self._observe(self.duration)
+        if self.trace is None:
+            return
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        if self.parent_id is None:
+            self.trace.finish()
+        else:
+            self.trace.add(self)
+
+
+class Trace:
+    """요청이나 백그라운드 작업 하나에서 기록된 span들의 모음입니다."""
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any], sampled: bool):
+        self.tracer = tracer
+        self.trace_id = uuid.uuid4().hex
+        self.sampled = sampled
+        self.started_at = time.time()
+        self.root = Span(self, name, None, attributes)
+        self.spans: List[Span] = []
+        self.dropped = 0
+
+    def add(self, span: Span):
+        # span이 아주 많은 작업(대량 쿼리 등)에서도 메모리를 제한하기 위해 상한을 넘으면 개수만 셈
+        if len(self.spans) < self.tracer.max_spans:
+            self.spans.append(span)  # 여러 스레드에서 호출될 수 있지만 list.append는 원자적
+        else:
+            self.dropped += 1
+
+    def finish(self):
+        self.tracer.finish(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """추적을 JSON으로 직렬화할 수 있는 딕셔너리로 변환합니다. (시각은 최상위 span 시작 기준 ms)"""
+        origin = self.root.start
+
+        def span_dict(span: Span) -> Dict[str, Any]:
+            item = {
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "name": span.name,
+                "start_ms": round((span.start - origin) * 1000, 3),
+                "duration_ms": round((span.duration or 0.0) * 1000, 3),
+            }
+            if span.attributes:
+                item["attributes"] = span.attributes
+            if span.error:
+                item["error"] = span.error
+            return item
+
+        return {
+            "trace_id": self.trace_id,
+            "name": self.root.name,
+            "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            "duration_ms": round((self.root.duration or 0.0) * 1000, 3),
+            "spans": [span_dict(span) for span in [self.root] + sorted(self.spans, key=lambda span: span.start)],
+            "dropped_spans": self.dropped,
+        }
+
+    def format_breakdown(self) -> str:
+        """span들을 시작 순서대로, 부모-자식 관계를 들여쓰기로 나타낸 여러 줄 문자열을 만듭니다."""
+        children: Dict[Optional[str], List[Span]] = {}
+        for span in sorted(self.spans, key=lambda span: span.start):
+            children.setdefault(span.parent_id, []).append(span)
+
+        lines = []
+
+        def walk(span: Span, depth: int):
+            offset_ms = (span.start - self.root.start) * 1000
+            duration_ms = (span.duration or 0.0) * 1000
+            error = f" !{span.error}" if span.error else ""
+            # SQL 문처럼 여러 줄인 값도 span 하나가 한 줄에 나오도록 공백을 합침
+            attributes = " ".join(f"{key}={' '.join(str(value).split())}" for key, value in span.attributes.items())
+            lines.append(f"  {offset_ms:9.1f}ms {duration_ms:9.1f}ms {'  ' * depth}{span.name}{error}"
+                         + (f"  {attributes}" if attributes else ""))
+            for child in children.get(span.span_id, ()):
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+        if self.dropped:
+            lines.append(f"  ... {self.dropped} more spans not recorded")
+        return "\n".join(lines)
+
+
+class JsonLinesExporter:
+    """
+    추적 하나를 JSON 한 줄로 파일에 덧붙입니다. 여러 스레드에서 호출해도 줄이 섞이지 않습니다.
+
+    파일은 처음 내보낼 때 엽니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def export(self, trace: Dict[str, Any]):
+        line = json.dumps(trace, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class Tracer:
+    """
+    추적을 시작하고, 끝난 추적을 표본 추출(sampling)해 내보내는 진입점입니다.
+
+    span은 표본 여부와 관계없이 항상 기록하므로, 표본에서 빠진 요청이라도 slow_threshold_ms보다
+    오래 걸렸으면 span 구성 전체를 느린 요청 로그로 남깁니다.
+    """
+
+    def __init__(self, exporter=None, sample_rate: float = 1.0, slow_threshold_ms: float = 0.0,
+                 max_spans: int = 1000, rng: Callable[[], float] = random.random):
+        """
+        Args:
+            exporter: export(trace_dict)를 제공하는 객체. None이면 추적을 내보내지 않습니다.
+            sample_rate: 추적을 내보낼 비율. (0.0 ~ 1.0)
+            slow_threshold_ms: 이 시간(ms) 이상 걸린 추적은 로그로 남깁니다. 0이면 남기지 않습니다.
+            max_spans: 추적 하나에 기록할 최대 span 수.
+            rng: 0 이상 1 미만의 난수를 반환하는 함수. (표본 추출용)
+        """
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self.max_spans = max_spans
+        self._rng = rng
+
+    def start_trace(self, name: str, **attributes) -> Span:
+        """새 추적의 최상위 span을 만듭니다. with 블록으로 사용하거나, 직접 __enter__/end를 호출합니다."""
+        sampled = self.exporter is not None and self._rng() < self.sample_rate
+        return Trace(self, name, attributes, sampled).root
+
+    def finish(self, trace: Trace):
+        duration_ms = (trace.root.duration or 0.0) * 1000
+        if self.slow_threshold_ms and duration_ms >= self.slow_threshold_ms:
+            logger.warning("Slow %s: %.1fms (trace %s)\n%s",
+                           trace.root.name, duration_ms, trace.trace_id, trace.format_breakdown())
+        if trace.sampled:
+            try:
+                self.exporter.export(trace.to_dict())
+            except Exception as e:
+                logger.warning("Failed to export trace %s: %s", trace.trace_id, e)
+
+    def close(self):
+        if self.exporter is not None and hasattr(self.exporter, "close"):
+            self.exporter.close()
+
+
+def span(name: str, observe: Optional[Callable[[float], None]] = None, **attributes) -> Span:
+    """현재 span의 자식 span을 만듭니다. (예: with tracing.span('provision.creating_disk'): ...)"""
+    parent = _current_span.get()
+    if parent is None:
+        return Span(None, name, None, attributes, observe)
+    return Span(parent.trace, name, parent.span_id, attributes, observe)
+
+
+def record_span(name: str, start: float, duration: float, **attributes):
+    """
+    이미 끝난 작업을 현재 span의 자식으로 기록합니다.
+
+    시작과 끝이 서로 다른 콜백에서 관찰되는 작업(예: SQLAlchemy 커서 이벤트)에 사용합니다.
+
+    Args:
+        start: 작업 시작 시각. (time.perf_counter 기준)
+        duration: 소요 시간(초).
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return
+    recorded = Span(parent.trace, name, parent.span_id, attributes)
+    recorded.start = start
+    recorded.duration = duration
+    parent.trace.add(recorded)
+
+
+def current_trace_id() -> Optional[str]:
+    """진행 중인 추적의 ID를 반환합니다. 없으면 None입니다."""
+    parent = _current_span.get()
+    return parent.trace.trace_id if parent is not None else None
+
+
+def propagate(fn: Callable) -> Callable:
+    """
+    현재 추적 문맥을 이어받아 fn을 실행하는 함수를 반환합니다.
+
+    스레드 풀에 작업을 넘길 때 사용하며, 넘기는 작업마다 따로 호출해야 합니다.
+    (하나의 문맥은 여러 스레드에서 동시에 실행할 수 없음)
+    """
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(fn, *args, **kwargs)
@@ -0,0 +1,266 @@
+# src/utils/wsgi_server.py
+import queue
+import socket
+import threading
+from wsgiref.simple_server import ServerHandler, WSGIRequestHandler, WSGIServer
+
+# 커넥션을 닫기 전에 읽고 버릴 수 있는 미소비 요청 본문의 최대 크기
+_MAX_DRAIN_BYTES = 64 * 1024
+
+
+class _RequestBody:
+    """
+    요청 본문을 Content-Length만큼만 읽을 수 있도록 제한하는 wsgi.input 래퍼입니다.
+
+    keep-alive 커넥션에서는 다음 요청이 같은 스트림에 이어지므로, 애플리케이션이
+    본문을 넘어서 읽거나 덜 읽어서 다음 요청이 깨지는 일을 막아야 합니다.
+    """
+    def __init__(self, rfile, content_length: int):
+        self._rfile = rfile
+        self.remaining = content_length
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self._rfile.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        """버퍼로 바로 읽습니다. (큰 본문을 청크마다 bytes를 만들지 않고 받을 때 사용)"""
+        if self.remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:self.remaining]
+        read = self._rfile.readinto(view) or 0
+        self.remaining -= read
+        return read
+
+    def readline(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self._rfile.readline(size)
+        self.remaining -= len(data)
+        return data
+
+    def readlines(self, hint: int = -1):
+        return list(iter(self.readline, b""))
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+    def drain(self) -> bool:
+        """남은 본문을 읽어 버립니다. 너무 크면 False를 반환하여 커넥션을 닫게 합니다."""
+        if self.remaining > _MAX_DRAIN_BYTES:
+            return False
+        while self.remaining > 0:
+            if not self.read(min(self.remaining, 8192)):
+                return False
+        return True
+
+
+class _KeepAliveServerHandler(ServerHandler):
+    """
+    HTTP/1.1 keep-alive를 지원하도록 응답 헤더를 정리하는 ServerHandler.
+
+    애플리케이션이 길이를 알 수 없는 본문(청크 이터러블)을 반환하면, HTTP/1.1 요청에는
+    chunked 전송 인코딩으로 응답하여 본문을 만드는 대로 보내면서도 커넥션을 유지합니다.
+    """
+
+    completed = False
+    chunked = False
+
+    def cleanup_headers(self):
+        super().cleanup_headers()
+        request_handler = self.request_handler
+        if 'Content-Length' not in self.headers and request_handler.request_version == 'HTTP/1.1':
+            self.headers['Transfer-Encoding'] = 'chunked'
+            self.chunked = True
+
+        if 'Content-Length' not in self.headers and not self.chunked:
+            # 본문 길이를 알 수 없으면 커넥션 종료로 응답의 끝을 알려야 함
+            request_handler.close_connection = True
+        elif request_handler.server.is_draining() or request_handler.server.has_backlog():
+            # 종료 중이거나 대기 중인 커넥션이 있으면 워커를 양보하기 위해 커넥션을 닫음
+            request_handler.close_connection = True
+
+        if request_handler.close_connection:
+            self.headers['Connection'] = 'close'
+        elif request_handler.request_version == 'HTTP/1.0':
+            self.headers['Connection'] = 'keep-alive'
+
+    def write(self, data):
+        if not self.status:
+            raise AssertionError("write() before start_response()")
+        if not self.headers_sent:
+            # 첫 블록 길이로 Content-Length를 정한 뒤(단일 블록 응답) 헤더를 보내야
+            # 길이를 모르는 본문만 chunked로 전송됨
+            self.bytes_sent = len(data)
+            self.send_headers()
+        else:
+            self.bytes_sent += len(data)
+        if self.chunked:
+            if not data:
+                return  # 빈 청크는 본문의 끝을 뜻하므로 보내지 않음
+            data = b"%x\r\n%s\r\n" % (len(data), data)
+        self._write(data)
+        self._flush()
+
+    def finish_content(self):
+        super().finish_content()
+        if self.chunked:
+            self._write(b"0\r\n\r\n")
+            self._flush()
+
+    def finish_response(self):
+        super().finish_response()
+        self.completed = True
+
+
+class KeepAliveRequestHandler(WSGIRequestHandler):
+    """
+    하나의 TCP 커넥션에서 여러 요청을 순서대로 처리하는 요청 핸들러입니다.
+
+    유휴 커넥션은 서버의 keepalive_timeout이 지나면 닫히며, 처리 대기 중인
+    커넥션이 쌓여 있으면 워커를 양보하기 위해 응답 후 바로 커넥션을 닫습니다.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        self.timeout = self.server.keepalive_timeout
+        super().setup()
+
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            self.handle_one_request()
+
+    def handle_one_request(self):
+        try:
+            self.raw_requestline = self.rfile.readline(65537)
+        except (socket.timeout, ConnectionError):
+            self.close_connection = True
+            return
+        if not self.raw_requestline:
+            self.close_connection = True
+            return
+        if len(self.raw_requestline) > 65536:
+            self.requestline = ''
+            self.request_version = ''
+            self.command = ''
+            self.send_error(414)
+            self.close_connection = True
+            return
+
+        if not self.parse_request():  # 에러 응답은 이미 전송됨
+            self.close_connection = True
+            return
+
+        environ = self.get_environ()
+        try:
+            content_length = int(environ.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            self.send_error(400, "Invalid Content-Length")
+            self.close_connection = True
+            return
+        request_body = _RequestBody(self.rfile, content_length)
+
+        handler = _KeepAliveServerHandler(
+            request_body, self.wfile, self.get_stderr(), environ,
+            multithread=True,
+        )
+        handler.http_version = self.request_version.split('/', 1)[-1]
+        handler.request_handler = self  # 로깅 및 커넥션 상태 공유용 역참조
+        handler.run(self.server.get_app())
+
+        if not handler.completed or not request_body.drain():
+            self.close_connection = True
+        self.wfile.flush()
+
+
+class ThreadPoolWSGIServer(WSGIServer):
+    """
+    고정 크기 워커 스레드 풀로 요청을 동시에 처리하는 운영용 WSGI 서버입니다.
+
+    - 수락한 커넥션은 크기가 제한된 대기열을 거쳐 워커에게 전달됩니다.
+    - 대기열이 가득 차면 즉시 '503 Service Unavailable'로 응답하여 과부하를 막습니다(backpressure).
+    - server_close()는 새 커넥션 수락을 멈추고, 처리 중인 요청이 끝날 때까지 기다립니다.
+    """
+    request_queue_size = 128  # listen() backlog
+
+    def __init__(self, server_address, app, workers: int = 16, max_pending: int = 64, keepalive_timeout: float = 5.0):
+        """
+        Args:
+            server_address: (호스트, 포트) 튜플.
+            app: 실행할 WSGI 애플리케이션.
+            workers: 요청을 처리할 워커 스레드 수.
+            max_pending: 워커를 기다릴 수 있는 최대 커넥션 수. 초과 시 503으로 거절합니다.
+            keepalive_timeout: 유휴 keep-alive 커넥션을 유지하는 시간(초).
+        """
+        super().__init__(server_address, KeepAliveRequestHandler)
+        self.set_app(app)
+        self.keepalive_timeout = keepalive_timeout
+        self.rejected_count = 0
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._draining = threading.Event()
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"wsgi-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def process_request(self, request, client_address):
+        try:
+            self._pending.put_nowait((request, client_address))
+        except queue.Full:
+            self.rejected_count += 1
+            self._reject(request)
+            self.shutdown_request(request)
+
+    def has_backlog(self) -> bool:
+        return not self._pending.empty()
+
+    def is_draining(self) -> bool:
+        return self._draining.is_set()
+
+    def server_close(self, timeout: float = 30.0):
+        """리스닝 소켓을 닫고, 대기 중이거나 처리 중인 요청이 끝날 때까지 워커를 기다립니다."""
+        super().server_close()
+        self._draining.set()
+        for _ in self._workers:
+            self._pending.put((None, None))
+        for worker in self._workers:
+            worker.join(timeout)
+
+    def _worker_loop(self):
+        while True:
+            request, client_address = self._pending.get()
+            if request is None:
+                return
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    @staticmethod
+    def _reject(request):
+        body = b'{"error": "Server is busy. Please retry later."}'
+        response = (
+            b"HTTP/1.1 503 Service Unavailable\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Retry-After: 1\r\n"
+            b"Connection: close\r\n"
+            b"Content-Length: " + str(len(body)).encode("ascii") + b"\r\n\r\n" + body
+        )
+        try:
+            request.sendall(response)
+        except OSError:
+            pass
+
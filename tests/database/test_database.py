@@ -0,0 +1,27 @@
+# tests/database/test_database.py
+from sqlalchemy import text
+
+from src.database.database import create_db_engine
+
+
+def test_sqlite_profile_applies_pragmas_on_connect(tmp_path):
+    """파일 SQLite 엔진은 커넥션이 열릴 때 설정된 PRAGMA를 적용해야 합니다."""
+    engine = create_db_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        journal_mode="WAL", synchronous="NORMAL", busy_timeout_ms=1234,
+        cache_size_kb=2048, mmap_size=1024 * 1024, pool_size=2, max_overflow=0,
+    )
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -2048
+    assert engine.pool.size() == 2
+    engine.dispose()
+
+
+def test_in_memory_url_skips_file_profile():
+    engine = create_db_engine("sqlite://")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "memory"
+    engine.dispose()
@@ -0,0 +1,122 @@
+# tests/database/test_migrations.py
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+
+from src.database import migrations
+
+# 마이그레이션 도입 이전(스키마 버전 0)에 create_all()이 만들던 스키마
+LEGACY_SCHEMA = """
+CREATE TABLE projects (id INTEGER NOT NULL, name VARCHAR NOT NULL, PRIMARY KEY (id));
+CREATE UNIQUE INDEX ix_projects_name ON projects (name);
+CREATE INDEX ix_projects_id ON projects (id);
+CREATE TABLE users (id INTEGER NOT NULL, username VARCHAR NOT NULL, password_hash VARCHAR NOT NULL, PRIMARY KEY (id));
+CREATE INDEX ix_users_id ON users (id);
+CREATE UNIQUE INDEX ix_users_username ON users (username);
+CREATE TABLE roles (id INTEGER NOT NULL, name VARCHAR NOT NULL, PRIMARY KEY (id), UNIQUE (name));
+CREATE INDEX ix_roles_id ON roles (id);
+CREATE TABLE images (
+    id INTEGER NOT NULL, name VARCHAR NOT NULL, filepath VARCHAR NOT NULL, min_disk_gb INTEGER, min_ram_mb INTEGER,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP, PRIMARY KEY (id), UNIQUE (name)
+);
+CREATE INDEX ix_images_id ON images (id);
+CREATE TABLE vms (
+    id INTEGER NOT NULL, name VARCHAR NOT NULL, uuid VARCHAR NOT NULL, state VARCHAR NOT NULL,
+    cpu_count INTEGER NOT NULL, ram_mb INTEGER NOT NULL, created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    project_id INTEGER NOT NULL, PRIMARY KEY (id), UNIQUE (uuid), FOREIGN KEY(project_id) REFERENCES projects (id)
+);
+CREATE UNIQUE INDEX ix_vms_name ON vms (name);
+CREATE INDEX ix_vms_id ON vms (id);
+CREATE TABLE user_project_roles (
+    user_id INTEGER NOT NULL, project_id INTEGER NOT NULL, role_id INTEGER NOT NULL,
+    PRIMARY KEY (user_id, project_id, role_id),
+    FOREIGN KEY(user_id) REFERENCES users (id), FOREIGN KEY(project_id) REFERENCES projects (id),
+    FOREIGN KEY(role_id) REFERENCES roles (id)
+);
+INSERT INTO projects (id, name) VALUES (1, 'default'), (2, 'other');
+INSERT INTO vms (name, uuid, state, cpu_count, ram_mb, project_id) VALUES ('web', 'uuid-1', 'RUNNING', 1, 512, 1);
+INSERT INTO images (name, filepath) VALUES ('ubuntu', '/var/lib/libvirt/images/ubuntu.qcow2');
+"""
+
+
+def make_engine(path):
+    return create_engine(f"sqlite:///{path}")
+
+
+def index_names(path):
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL").fetchall()
+    return {row[0] for row in rows}
+
+
+def table_columns(path):
+    with sqlite3.connect(path) as conn:
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        return {table: conn.execute(f"PRAGMA table_info({table})").fetchall() for table in tables}
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    path = tmp_path / "legacy.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript(LEGACY_SCHEMA)
+    return path
+
+
+def test_upgrade_migrates_legacy_db_in_place(legacy_db):
+    engine = make_engine(legacy_db)
+    assert migrations.get_schema_version(engine) == 0
+
+    assert migrations.upgrade(engine) == migrations.SCHEMA_VERSION
+    assert migrations.get_schema_version(engine) == migrations.SCHEMA_VERSION
+    engine.dispose()
+
+    with sqlite3.connect(legacy_db) as conn:
+        # 기존 데이터는 유지되고, VM 이름은 프로젝트 안에서만 고유해야 함
+        assert conn.execute("SELECT name FROM vms").fetchall() == [("web",)]
+        # 쿼터 사용량은 기존 VM으로 채워짐
+        assert conn.execute("SELECT project_id, instances, vcpus, ram_mb, disk_gb FROM project_usage").fetchall() == [
+            (1, 1, 1, 512, 0)
+        ]
+        # 기존 이미지는 파일 업로드 없이 바로 사용할 수 있음
+        assert conn.execute("SELECT name, status FROM images").fetchall() == [("ubuntu", "active")]
+        conn.execute("INSERT INTO vms (name, uuid, state, cpu_count, ram_mb, project_id) "
+                     "VALUES ('web', 'uuid-2', 'RUNNING', 1, 512, 2)")
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO vms (name, uuid, state, cpu_count, ram_mb, project_id) "
+                         "VALUES ('web', 'uuid-3', 'RUNNING', 1, 512, 1)")
+
+
+def test_migrated_and_fresh_schemas_have_the_same_indexes(legacy_db, tmp_path):
+    """마이그레이션 SQL과 모델 정의가 어긋나면 실패해야 합니다."""
+    fresh_db = tmp_path / "fresh.db"
+    for path in (legacy_db, fresh_db):
+        engine = make_engine(path)
+        migrations.upgrade(engine)
+        engine.dispose()
+
+    assert index_names(legacy_db) == index_names(fresh_db)
+    assert table_columns(legacy_db) == table_columns(fresh_db)
+    assert "ix_vms_name" not in index_names(fresh_db)
+
+
+def test_upgrade_is_idempotent(legacy_db):
+    engine = make_engine(legacy_db)
+    migrations.upgrade(engine)
+    before = index_names(legacy_db)
+
+    assert migrations.upgrade(engine) == migrations.SCHEMA_VERSION
+    assert index_names(legacy_db) == before
+    engine.dispose()
+
+
+def test_upgrade_refuses_newer_schema(tmp_path):
+    path = tmp_path / "newer.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute(f"PRAGMA user_version = {migrations.SCHEMA_VERSION + 1}")
+    engine = make_engine(path)
+
+    with pytest.raises(RuntimeError):
+        migrations.upgrade(engine)
+    engine.dispose()
@@ -0,0 +1,88 @@
+# tests/database/test_unit_of_work.py
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.database import Base
+from src.database import models
+from src.database.unit_of_work import UnitOfWork
+from src.repositories.sqlalchemy.sqlalchemy_project_repository import SqlalchemyProjectRepository
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def commits(engine):
+    """엔진에서 실행된 COMMIT 횟수를 기록합니다."""
+    recorded = []
+    event.listen(engine, "commit", lambda conn: recorded.append(1))
+    return recorded
+
+
+def project_names(session_factory):
+    db = session_factory()
+    try:
+        return [p.name for p in db.query(models.Project).order_by(models.Project.name)]
+    finally:
+        db.close()
+
+
+def test_multiple_repository_calls_commit_once(session_factory, commits):
+    """여러 리포지토리 쓰기는 flush만 하고, 작업 단위가 끝날 때 한 번만 커밋되어야 합니다."""
+    started = []
+    with UnitOfWork(session_factory) as uow:
+        repo = SqlalchemyProjectRepository(uow.session)
+        repo.create(models.Project(name="a"))
+        repo.create(models.Project(name="b"))
+        uow.after_commit(lambda: started.append(project_names(session_factory)))
+        assert commits == []
+
+    assert len(commits) == 1
+    assert started == [["a", "b"]]  # 커밋 후 콜백에서는 다른 세션에서도 보여야 함
+
+
+def test_exception_rolls_back_all_changes(session_factory, commits):
+    """작업 도중 예외가 나면 앞서 flush한 변경까지 모두 롤백되어야 합니다."""
+    discarded = []
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(session_factory) as uow:
+            SqlalchemyProjectRepository(uow.session).create(models.Project(name="a"))
+            uow.after_commit(lambda: pytest.fail("must not run"))
+            uow.after_rollback(lambda: discarded.append(True))
+            raise RuntimeError("boom")
+
+    assert commits == []
+    assert discarded == [True]
+    assert project_names(session_factory) == []
+
+
+def test_checkpoint_survives_later_rollback(session_factory):
+    """중간 커밋(체크포인트)한 변경은 이후 예외가 나도 유지되어야 합니다."""
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(session_factory) as uow:
+            repo = SqlalchemyProjectRepository(uow.session)
+            repo.create(models.Project(name="kept"))
+            uow.commit()
+            repo.create(models.Project(name="dropped"))
+            raise RuntimeError("boom")
+
+    assert project_names(session_factory) == ["kept"]
+
+
+def test_read_only_work_does_not_commit(session_factory, commits):
+    with UnitOfWork(session_factory) as uow:
+        SqlalchemyProjectRepository(uow.session).list_all()
+
+    assert commits == []
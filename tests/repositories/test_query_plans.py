@@ -0,0 +1,92 @@
+# tests/repositories/test_query_plans.py
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.database import migrations, models
+from src.repositories.sqlalchemy.sqlalchemy_project_repository import SqlalchemyProjectRepository
+from src.repositories.sqlalchemy.sqlalchemy_user_repository import SqlalchemyUserRepository
+from src.repositories.sqlalchemy.sqlalchemy_vm_repository import SqlalchemyVMRepository
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'plans.db'}")
+    migrations.upgrade(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    project = models.Project(name="default")
+    user, role = models.User(username="alice", password_hash="x"), models.Role(name="admin")
+    session.add_all([project, user, role])
+    session.flush()
+    session.add(models.UserProjectRole(user_id=user.id, project_id=project.id, role_id=role.id))
+    session.add_all([
+        models.VM(name=f"vm-{i}", uuid=f"uuid-{i}", state="RUNNING", cpu_count=1, ram_mb=512, project_id=project.id)
+        for i in range(3)
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def query_plans(engine, fn):
+    """fn이 실행한 SELECT 문마다 EXPLAIN QUERY PLAN 결과(detail 목록)를 반환합니다."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            plans.append([row[-1] for row in rows])
+    assert plans, "no SELECT statement was executed"
+    return plans
+
+
+def assert_no_full_scan(plans):
+    for details in plans:
+        for detail in details:
+            # 'SCAN anon_N'은 테이블이 아니라 이미 걸러진 서브쿼리 결과를 읽는 단계임
+            is_table_scan = detail.startswith("SCAN") and not detail.startswith("SCAN anon_")
+            assert not is_table_scan, f"full scan in query plan: {details}"
+            assert "TEMP B-TREE" not in detail, f"sort without index in query plan: {details}"
+
+
+@pytest.mark.parametrize("call", [
+    lambda repo: repo.find_by_name_and_project_id("vm-1", 1),
+    lambda repo: repo.find_by_names_and_project_id(["vm-1", "vm-2"], 1),
+    lambda repo: repo.list_by_project_id(1),
+    lambda repo: repo.count_by_project_id(1),
+    lambda repo: list(repo.list_page_by_project_id(1, 2, ["name", "uuid"], marker="uuid-2", name_prefix="vm-")),
+], ids=["find_by_name", "find_by_names", "list_by_project", "count_by_project", "list_page"])
+def test_vm_queries_use_project_indexes(engine, db, call):
+    assert_no_full_scan(query_plans(engine, lambda: call(SqlalchemyVMRepository(db))))
+
+
+@pytest.mark.parametrize("call", [
+    lambda db: list(SqlalchemyProjectRepository(db).list_page(2, ["id", "name"], marker="a")),
+    lambda db: list(SqlalchemyUserRepository(db).list_page(2, ["id", "username"], marker="a")),
+], ids=["projects", "users"])
+def test_name_ordered_pages_use_unique_name_index(engine, db, call):
+    assert_no_full_scan(query_plans(engine, lambda: call(db)))
+
+
+def test_list_members_uses_project_index(engine, db):
+    plans = query_plans(engine, lambda: SqlalchemyProjectRepository(db).list_members(1))
+
+    assert_no_full_scan(plans)
+    assert any("ix_user_project_roles_project_id" in detail for details in plans for detail in details)
@@ -0,0 +1,85 @@
+# tests/repositories/test_token_repository.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.repositories.memory.memory_token_repository import MemoryTokenRepository
+from src.repositories.sqlite.sqlite_token_repository import SqliteTokenRepository
+
+
+def token_data(project_id=1, expires_in=timedelta(hours=1)):
+    return {'user_id': 1, 'project_id': project_id, 'expires_at': datetime.now() + expires_in}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def token_repo(request, tmp_path):
+    """두 저장소 구현에 같은 테스트를 실행합니다."""
+    if request.param == "memory":
+        repo = MemoryTokenRepository()
+    else:
+        repo = SqliteTokenRepository(str(tmp_path / "tokens.db"))
+    yield repo
+    repo.close()
+
+
+def test_save_find_and_delete(token_repo):
+    """저장한 토큰은 같은 데이터로 조회되고, 삭제 후에는 조회되지 않아야 합니다."""
+    data = token_data(project_id=7)
+    token_repo.save("token-1", data)
+
+    found = token_repo.find("token-1")
+    assert found['project_id'] == 7
+    assert abs((found['expires_at'] - data['expires_at']).total_seconds()) < 0.001
+
+    assert token_repo.delete("token-1") is True
+    assert token_repo.find("token-1") is None
+    assert token_repo.delete("token-1") is False
+
+
+def test_purge_expired_removes_only_expired_tokens(token_repo):
+    """만료된 토큰만 정리되어야 합니다."""
+    token_repo.save("expired", token_data(expires_in=timedelta(seconds=-1)))
+    token_repo.save("live", token_data())
+
+    token_repo.purge_expired()
+
+    assert token_repo.count() == 1
+    assert token_repo.find("expired") is None
+    assert token_repo.find("live") is not None
+
+
+def test_memory_store_evicts_least_recently_used():
+    """최대 토큰 수를 넘으면 가장 오래 사용되지 않은 토큰부터 제거되어야 합니다."""
+    repo = MemoryTokenRepository(max_entries=2)
+    repo.save("a", token_data())
+    repo.save("b", token_data())
+    repo.find("a")  # 'a'를 최근 사용으로 갱신
+
+    repo.save("c", token_data())
+
+    assert repo.count() == 2
+    assert repo.find("b") is None
+    assert repo.find("a") is not None and repo.find("c") is not None
+
+
+def test_memory_store_sweeps_expired_tokens_on_save():
+    """저장할 때마다 만료된 토큰이 점진적으로 정리되어야 합니다."""
+    repo = MemoryTokenRepository(sweep_batch=10)
+    for i in range(5):
+        repo.save(f"expired-{i}", token_data(expires_in=timedelta(seconds=-1)))
+
+    repo.save("live", token_data())
+
+    assert repo.count() == 1
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    """같은 파일을 여는 다른 저장소(다른 워커 프로세스, 재시작 후)에서도 토큰이 조회되어야 합니다."""
+    db_path = str(tmp_path / "tokens.db")
+    writer = SqliteTokenRepository(db_path)
+    writer.save("shared", token_data(project_id=3))
+    writer.close()
+
+    reader = SqliteTokenRepository(db_path)
+    assert reader.find("shared")['project_id'] == 3
+    reader.close()
@@ -0,0 +1,67 @@
+# tests/repositories/test_user_repository.py
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.database import Base
+from src.database import models
+from src.repositories.sqlalchemy.sqlalchemy_user_repository import SqlalchemyUserRepository
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """사용자 하나가 'default' 프로젝트에 admin, member 역할로 속한 인메모리 DB 세션."""
+    session = sessionmaker(bind=engine)()
+    admin, member = models.Role(name="admin"), models.Role(name="member")
+    default, other = models.Project(name="default"), models.Project(name="other")
+    user = models.User(username="alice", password_hash="x")
+    session.add_all([admin, member, default, other, user])
+    session.flush()
+    session.add_all([
+        models.UserProjectRole(user_id=user.id, project_id=default.id, role_id=admin.id),
+        models.UserProjectRole(user_id=user.id, project_id=default.id, role_id=member.id),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def count_statements(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_login_context_resolves_user_project_and_roles_in_one_query(engine, db):
+    statements = count_statements(engine)
+
+    context = SqlalchemyUserRepository(db).find_login_context("alice", "default")
+
+    assert context.user.username == "alice"
+    assert context.project.name == "default"
+    assert context.roles == ["admin", "member"]
+    assert len(statements) == 1
+
+
+def test_login_context_for_non_member_has_no_roles(db):
+    context = SqlalchemyUserRepository(db).find_login_context("alice", "other")
+
+    assert context.project.name == "other"
+    assert context.roles == []
+
+
+def test_login_context_for_missing_user_or_project(db):
+    repo = SqlalchemyUserRepository(db)
+
+    assert repo.find_login_context("bob", "default") is None
+    context = repo.find_login_context("alice", "missing")
+    assert context.project is None and context.roles == []
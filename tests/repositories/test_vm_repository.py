@@ -0,0 +1,58 @@
+# tests/repositories/test_vm_repository.py
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.database import Base
+from src.database import models
+from src.repositories.sqlalchemy.sqlalchemy_vm_repository import SqlalchemyVMRepository
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([models.Project(id=1, name="default"), models.Project(id=2, name="other")])
+    # 같은 초에 생성된 VM이 여러 개여도(created_at 동률) 페이지 사이에서 빠지거나 겹치지 않아야 함
+    created = [datetime(2024, 1, 1, 10, 0, 0)] * 3 + [datetime(2024, 1, 1, 11, 0, 0)] * 2
+    session.add_all([
+        models.VM(name=f"web-{i}", uuid=f"uuid-{i}", state="RUNNING" if i % 2 else "ERROR",
+                  cpu_count=1, ram_mb=512, project_id=1, created_at=created_at)
+        for i, created_at in enumerate(created)
+    ])
+    session.add(models.VM(name="web-0", uuid="uuid-other", state="RUNNING", cpu_count=1, ram_mb=512, project_id=2))
+    session.add(models.VM(name="db_1", uuid="uuid-db", state="RUNNING", cpu_count=1, ram_mb=512, project_id=1,
+                          created_at=datetime(2024, 1, 1, 9, 0, 0)))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_keyset_pages_cover_project_once_in_newest_first_order(db):
+    repo = SqlalchemyVMRepository(db)
+    seen, marker = [], None
+    while True:
+        rows = list(repo.list_page_by_project_id(1, 2, ["uuid", "created_at"], marker=marker))
+        seen.extend(rows)
+        if len(rows) < 2:
+            break
+        marker = rows[-1]["uuid"]
+
+    assert [row["uuid"] for row in seen] == ["uuid-4", "uuid-3", "uuid-2", "uuid-1", "uuid-0", "uuid-db"]
+
+
+def test_page_filters_and_projection(db):
+    repo = SqlalchemyVMRepository(db)
+
+    rows = list(repo.list_page_by_project_id(1, 10, ["name"], state="RUNNING", name_prefix="web-",
+                                             created_after=datetime(2024, 1, 1, 10, 30)))
+
+    assert rows == [{"name": "web-3"}]
+    # 접두사의 '_'는 와일드카드가 아닌 문자 그대로 비교해야 함
+    assert list(repo.list_page_by_project_id(1, 10, ["name"], name_prefix="db_")) == [{"name": "db_1"}]
+    assert list(repo.list_page_by_project_id(1, 10, ["name"], name_prefix="db%")) == []
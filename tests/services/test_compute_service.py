@@ -6,7 +6,12 @@ from datetime import datetime
 
 from src.services.compute_service import ComputeService, VmNotFoundError, VmAlreadyExistsError, VmCreationError
 from src.services.image_service import ImageService
+from src.services.exceptions import QuotaExceededError
+from src.services.quota_service import QuotaService
+from src.services.scheduler import ComputeHost, Scheduler
 from src.repositories.interfaces import IVMRepository
+from src.utils.domain_state_cache import DomainStateCache
+from src.utils.libvirt_connection import LibvirtConnectionManager
 from src.database import models
 
 # ===================================================================
@@ -49,9 +54,8 @@ def mock_libvirt() -> MagicMock:
 @pytest.fixture
 def compute_service(mock_vm_repo: MagicMock, mock_image_service: MagicMock, mock_libvirt: MagicMock) -> ComputeService:
     """테스트에 사용될 ComputeService 인스턴스를 생성하고, 의존성을 주입합니다."""
-    # __del__ 메서드가 테스트 중에 libvirt 연결을 닫으려고 시도하는 것을 방지
-    with patch.object(ComputeService, '__del__', lambda x: None):
-        yield ComputeService(vm_repo=mock_vm_repo, image_service=mock_image_service)
+    conn_manager = LibvirtConnectionManager("qemu:///system")
+    return ComputeService(vm_repo=mock_vm_repo, image_service=mock_image_service, conn_manager=conn_manager)
 
 # ===================================================================
 #  create_vm 테스트 스위트
@@ -98,7 +102,7 @@ class TestCreateVm:
         assert result_uuid == "test-uuid"
 
         # 2. 의존 객체들의 메서드가 올바른 인자와 함께 호출되었는지 검증
-        mock_image_service.validate_image_and_get_path.assert_called_once_with(args["image_name"])
+        mock_image_service.validate_image_and_get_path.assert_called_once_with(args["image_name"], ram_mb=args["ram_mb"])
         mock_vm_repo.find_by_name_and_project_id.assert_called_once_with(args["vm_name"], args["project_id"])
         mock_image_service.create_vm_disk.assert_called_once_with(args["vm_name"], args["base_image_path"])
         
@@ -122,6 +126,161 @@ class TestCreateVm:
         # 검증: 예외가 발생했으므로, VM을 생성하는 create 메서드는 호출되지 않았어야 함
         mock_vm_repo.create.assert_not_called()
 
+    @patch("src.services.compute_service.generate_vm_xml")
+    def test_reserve_vm_records_building_state(self, mock_generate_xml, compute_service, mock_vm_repo, mock_image_service, mock_libvirt):
+        """reserve_vm은 하이퍼바이저를 건드리지 않고 'BUILDING' 상태의 VM만 기록해야 합니다."""
+        # === Arrange ===
+        args = self.VM_DEFAULTS
+        mock_image_service.validate_image_and_get_path.return_value = args["base_image_path"]
+        mock_vm_repo.find_by_name_and_project_id.return_value = None
+
+        # === Act ===
+        vm, source_filepath = compute_service.reserve_vm(**{k: v for k, v in args.items() if k in ['project_id', 'vm_name', 'cpu_count', 'ram_mb', 'image_name']})
+
+        # === Assert ===
+        assert vm.state == "BUILDING"
+        assert source_filepath == args["base_image_path"]
+        mock_vm_repo.create.assert_called_once_with(vm)
+        mock_image_service.create_vm_disk.assert_not_called()
+        mock_libvirt.defineXML.assert_not_called()
+
+    def test_reserve_vm_rejects_request_over_quota(self, mock_vm_repo, mock_image_service, mock_libvirt):
+        """쿼터를 넘는 요청은 호스트 용량을 확보하거나 VM을 기록하기 전에 거부되어야 합니다."""
+        # === Arrange ===
+        args = self.VM_DEFAULTS
+        quota_service = MagicMock(spec=QuotaService)
+        quota_service.reserve.side_effect = QuotaExceededError("Quota exceeded for project '1': instances.")
+        scheduler = MagicMock(spec=Scheduler)
+        service = ComputeService(mock_vm_repo, mock_image_service, LibvirtConnectionManager("qemu:///system"),
+                                 scheduler=scheduler, quota_service=quota_service)
+        mock_vm_repo.find_by_name_and_project_id.return_value = None
+        mock_image_service.find_images.return_value = {}
+
+        # === Act & Assert ===
+        with pytest.raises(QuotaExceededError):
+            service.reserve_vm(**{k: v for k, v in args.items() if k in ['project_id', 'vm_name', 'cpu_count', 'ram_mb', 'image_name']})
+
+        quota_service.reserve.assert_called_once_with(1, instances=1, vcpus=2, ram_mb=2048, disk_gb=0)
+        scheduler.select.assert_not_called()
+        mock_vm_repo.create.assert_not_called()
+
+    @patch("src.services.compute_service.generate_vm_xml")
+    def test_provision_vm_failure_rolls_back_and_marks_error(self, mock_generate_xml, compute_service, mock_vm_repo, mock_image_service, mock_libvirt):
+        """프로비저닝 중 VM 시작에 실패하면 도메인과 디스크를 롤백하고 'ERROR' 상태로 변경해야 합니다."""
+        # === Arrange ===
+        args = self.VM_DEFAULTS
+        vm = models.VM(name=args["vm_name"], uuid="test-uuid", state="BUILDING", cpu_count=2, ram_mb=2048, project_id=1)
+        mock_vm_repo.find_by_uuid.return_value = vm
+        mock_image_service.create_vm_disk.return_value = args["new_disk_path"]
+        mock_domain = MagicMock()
+        mock_domain.create.side_effect = libvirt.libvirtError("boot failed")
+        mock_domain.isActive.return_value = False
+        mock_libvirt.defineXML.return_value = mock_domain
+        steps = []
+
+        # === Act & Assert ===
+        with patch("src.services.compute_service.os.path.exists", return_value=True), pytest.raises(VmCreationError):
+            compute_service.provision_vm("test-uuid", args["base_image_path"], progress=steps.append)
+
+        assert steps == ["creating_disk", "defining_domain", "starting_domain"]
+        mock_domain.undefine.assert_called_once()
+        mock_image_service.delete_vm_disk.assert_called_once_with(args["new_disk_path"])
+        mock_vm_repo.update_state.assert_called_once_with(vm, "ERROR")
+
+# ===================================================================
+#  다중 호스트 배치 테스트 스위트
+# ===================================================================
+class TestScheduling:
+    @pytest.fixture
+    def hosts(self):
+        """용량이 다른 가짜 호스트 두 개와, 호스트별 libvirt 연결 관리자(모의 객체)."""
+        hosts = [ComputeHost("node-a", "test:///a", 8, 4096, 0), ComputeHost("node-b", "test:///b", 8, 8192, 0)]
+        return hosts, {host.name: MagicMock(spec=LibvirtConnectionManager) for host in hosts}
+
+    @patch("src.services.compute_service.generate_vm_xml")
+    def test_vm_is_built_on_the_selected_host(self, mock_generate_xml, hosts, mock_vm_repo, mock_image_service):
+        """여유 RAM이 가장 많은 호스트를 골라 VM 행에 기록하고, 그 호스트의 연결로 도메인을 정의해야 합니다."""
+        compute_hosts, connections = hosts
+        scheduler = Scheduler(compute_hosts)
+        service = ComputeService(mock_vm_repo, mock_image_service, connections["node-a"],
+                                 scheduler=scheduler, host_connections=connections)
+        mock_vm_repo.find_by_name_and_project_id.return_value = None
+        mock_vm_repo.find_by_uuid.side_effect = lambda uuid: vm
+        mock_image_service.find_images.return_value = {}
+        connections["node-b"].get.return_value.defineXML.return_value.create.return_value = 0
+
+        vm, source_filepath = service.reserve_vm(1, "vm-1", 2, 2048, "ubuntu")
+        service.provision_vm(vm.uuid, source_filepath)
+
+        assert vm.host == "node-b"
+        connections["node-b"].get.return_value.defineXML.assert_called_once()
+        connections["node-a"].get.assert_not_called()
+        assert {host["name"]: host["free_ram_mb"] for host in scheduler.hosts()} == {"node-a": 4096, "node-b": 6144}
+
+    @patch("src.services.compute_service.generate_vm_xml")
+    def test_failed_provisioning_releases_the_claim(self, mock_generate_xml, hosts, mock_vm_repo, mock_image_service):
+        """프로비저닝에 실패해 'ERROR'가 된 VM의 용량은 호스트에 반납되어야 합니다."""
+        compute_hosts, connections = hosts
+        scheduler = Scheduler(compute_hosts)
+        service = ComputeService(mock_vm_repo, mock_image_service, connections["node-a"],
+                                 scheduler=scheduler, host_connections=connections)
+        mock_vm_repo.find_by_name_and_project_id.return_value = None
+        mock_image_service.find_images.return_value = {}
+        connections["node-b"].get.return_value.defineXML.side_effect = libvirt.libvirtError("define failed")
+
+        vm, source_filepath = service.reserve_vm(1, "vm-1", 2, 2048, "ubuntu")
+        mock_vm_repo.find_by_uuid.return_value = vm
+        with pytest.raises(VmCreationError):
+            service.provision_vm(vm.uuid, source_filepath)
+
+        assert {host["name"]: host["free_ram_mb"] for host in scheduler.hosts()} == {"node-a": 4096, "node-b": 8192}
+
+    @patch("src.services.compute_service.generate_vm_xml")
+    def test_failed_state_update_after_start_marks_error_and_releases_the_claim(self, mock_generate_xml, hosts,
+                                                                                mock_vm_repo, mock_image_service):
+        """도메인을 시작한 뒤 'RUNNING' 기록에 실패해도 VM은 'ERROR'가 되고 용량을 반납해야 합니다."""
+        compute_hosts, connections = hosts
+        scheduler = Scheduler(compute_hosts)
+        service = ComputeService(mock_vm_repo, mock_image_service, connections["node-a"],
+                                 scheduler=scheduler, host_connections=connections)
+        mock_vm_repo.find_by_name_and_project_id.return_value = None
+        mock_image_service.find_images.return_value = {}
+        connections["node-b"].get.return_value.defineXML.return_value.create.return_value = 0
+
+        def update_state(vm, state):
+            if state == "RUNNING":
+                raise RuntimeError("database is locked")
+            vm.state = state
+
+        mock_vm_repo.update_state.side_effect = update_state
+        vm, source_filepath = service.reserve_vm(1, "vm-1", 2, 2048, "ubuntu")
+        mock_vm_repo.find_by_uuid.return_value = vm
+        with pytest.raises(VmCreationError):
+            service.provision_vm(vm.uuid, source_filepath)
+
+        assert vm.state == "ERROR"
+        connections["node-b"].get.return_value.defineXML.return_value.undefine.assert_called_once()
+        assert {host["name"]: host["free_ram_mb"] for host in scheduler.hosts()} == {"node-a": 4096, "node-b": 8192}
+
+    def test_vm_whose_provisioning_never_started_is_failed_and_releases_the_claim(self, hosts, mock_vm_repo,
+                                                                                   mock_image_service):
+        """작업을 시작하지 못한 VM은 프로비저닝 실패처럼 'ERROR'가 되고 용량을 반납해야 합니다."""
+        compute_hosts, connections = hosts
+        scheduler = Scheduler(compute_hosts)
+        service = ComputeService(mock_vm_repo, mock_image_service, connections["node-a"],
+                                 scheduler=scheduler, host_connections=connections)
+        mock_vm_repo.find_by_name_and_project_id.return_value = None
+        mock_image_service.find_images.return_value = {}
+        mock_vm_repo.update_state.side_effect = lambda vm, state: setattr(vm, "state", state)
+
+        vm, _ = service.reserve_vm(1, "vm-1", 2, 2048, "ubuntu")
+        mock_vm_repo.find_by_uuid.return_value = vm
+        service.fail_provisioning(vm.uuid)
+        service.fail_provisioning(vm.uuid)  # 이미 'ERROR'인 VM의 용량을 두 번 반납하지 않음
+
+        mock_vm_repo.update_state.assert_called_with(vm, "ERROR")
+        assert {host["name"]: host["free_ram_mb"] for host in scheduler.hosts()} == {"node-a": 4096, "node-b": 8192}
+
 # ===================================================================
 #  list_vms 테스트 스위트
 # ===================================================================
@@ -131,31 +290,143 @@ class TestListVms:
         # === Arrange ===
         project_id = 1
         # 시나리오: 리포지토리가 DB에서 2개의 VM 정보를 반환하는 상황을 시뮬레이션
-        db_vms = [
-            models.VM(name='test-vm-1', uuid='uuid-1', cpu_count=2, ram_mb=2048, created_at=datetime.now()),
-            models.VM(name='test-vm-2', uuid='uuid-2', cpu_count=1, ram_mb=1024, created_at=datetime.now())
+        mock_vm_repo.list_page_by_project_id.return_value = [
+            {'name': 'test-vm-1', 'uuid': 'uuid-1', 'cpu_count': 2, 'ram_mb': 2048, 'created_at': datetime.now()},
+            {'name': 'test-vm-2', 'uuid': 'uuid-2', 'cpu_count': 1, 'ram_mb': 1024, 'created_at': datetime.now()},
         ]
-        mock_vm_repo.list_by_project_id.return_value = db_vms
 
-        # 시나리오: libvirt는 각 VM에 대해 다른 상태(RUNNING, SHUTOFF)를 반환하도록 설정
-        mock_libvirt.lookupByUUIDString.side_effect = [
-            FakeDomain('test-vm-1', 'uuid-1', libvirt.VIR_DOMAIN_RUNNING),
-            FakeDomain('test-vm-2', 'uuid-2', libvirt.VIR_DOMAIN_SHUTOFF)
+        # 시나리오: libvirt 스냅샷이 각 VM에 대해 다른 상태(RUNNING, SHUTOFF)를 반환하도록 설정
+        mock_libvirt.getAllDomainStats.return_value = [
+            (FakeDomain('test-vm-1', 'uuid-1'), {'state.state': libvirt.VIR_DOMAIN_RUNNING}),
+            (FakeDomain('test-vm-2', 'uuid-2'), {'state.state': libvirt.VIR_DOMAIN_SHUTOFF}),
+            (FakeDomain('other-vm', 'uuid-other'), {'state.state': libvirt.VIR_DOMAIN_RUNNING}),
         ]
 
         # === Act ===
-        vms = compute_service.list_vms(project_id)
+        page = compute_service.list_vms(project_id, limit=10).to_dict('vms')
 
         # === Assert ===
-        # 1. 리포지토리 메서드가 올바른 project_id로 호출되었는지 검증
-        mock_vm_repo.list_by_project_id.assert_called_once_with(project_id)
+        # 1. 리포지토리는 다음 페이지 여부를 알기 위해 limit + 1개를 조회해야 함
+        args, kwargs = mock_vm_repo.list_page_by_project_id.call_args
+        assert args[:2] == (project_id, 11)
 
         # 2. 최종 반환된 결과가 DB 정보와 libvirt의 실시간 상태를 올바르게 조합했는지 검증
+        vms = page['vms']
         assert len(vms) == 2
         assert vms[0]['name'] == 'test-vm-1'
         assert vms[0]['state'] == 'RUNNING'
         assert vms[1]['name'] == 'test-vm-2'
         assert vms[1]['state'] == 'SHUTOFF'
+        assert page['next_marker'] is None
+
+        # 3. VM 개수와 무관하게 하이퍼바이저 호출은 스냅샷 한 번뿐이어야 함
+        mock_libvirt.getAllDomainStats.assert_called_once()
+        mock_libvirt.lookupByUUIDString.assert_not_called()
+
+    def test_list_vms_marks_missing_domain_unknown(self, compute_service, mock_vm_repo, mock_libvirt):
+        """하이퍼바이저 스냅샷에 없는 VM은 'UNKNOWN' 상태로 표시되는지 테스트합니다."""
+        # === Arrange ===
+        mock_vm_repo.list_page_by_project_id.return_value = [
+            {'name': 'lost-vm', 'uuid': 'uuid-lost', 'cpu_count': 1, 'ram_mb': 512, 'created_at': datetime.now()}
+        ]
+        mock_libvirt.getAllDomainStats.return_value = []
+
+        # === Act ===
+        page = compute_service.list_vms(1, limit=10).to_dict('vms')
+
+        # === Assert ===
+        assert page['vms'][0]['state'] == 'UNKNOWN'
+
+    def test_list_vms_returns_next_marker_when_more_rows_exist(self, compute_service, mock_vm_repo, mock_libvirt):
+        """limit보다 많은 행이 조회되면 마지막으로 반환한 VM의 UUID가 next_marker가 되어야 합니다."""
+        mock_vm_repo.list_page_by_project_id.return_value = [{'name': f'vm-{i}', 'uuid': f'uuid-{i}'} for i in range(3)]
+
+        page = compute_service.list_vms(1, limit=2, fields=['name']).to_dict('vms')
+
+        assert page == {'vms': [{'name': 'vm-0'}, {'name': 'vm-1'}], 'next_marker': 'uuid-1'}
+
+    def test_list_vms_projection_selects_only_requested_columns(self, compute_service, mock_vm_repo, mock_libvirt):
+        """'state'를 요청하지 않으면 하이퍼바이저를 조회하지 않고, 필요한 컬럼만 조회해야 합니다."""
+        mock_vm_repo.list_page_by_project_id.return_value = [{'name': 'vm-1', 'uuid': 'uuid-1'}]
+
+        page = compute_service.list_vms(1, limit=10, fields=['name']).to_dict('vms')
+
+        args, _ = mock_vm_repo.list_page_by_project_id.call_args
+        assert args[2] == ['name', 'uuid']  # uuid는 다음 페이지 마커로 항상 조회
+        assert page['vms'] == [{'name': 'vm-1'}]
+        mock_libvirt.getAllDomainStats.assert_not_called()
+
+    def test_list_vms_rejects_unknown_field_and_foreign_marker(self, compute_service, mock_vm_repo):
+        with pytest.raises(ValueError):
+            compute_service.list_vms(1, limit=10, fields=['password'])
+
+        mock_vm_repo.find_by_uuid.return_value = models.VM(uuid='uuid-x', project_id=2)
+        with pytest.raises(ValueError):
+            compute_service.list_vms(1, limit=10, marker='uuid-x')
+        mock_vm_repo.list_page_by_project_id.assert_not_called()
+
+    def test_list_vms_reads_state_cache_without_hypervisor_call(self, compute_service, mock_vm_repo, mock_libvirt):
+        """동기화된 상태 캐시가 있으면 하이퍼바이저를 조회하지 않고, 캐시 기준 시각을 함께 반환해야 합니다."""
+        cache = MagicMock(spec=DomainStateCache)
+        cache.is_ready.return_value = True
+        cache.get.side_effect = lambda uuid, default: {'uuid-1': 'PAUSED'}.get(uuid, default)
+        cache.as_of.return_value = 0.0
+        compute_service.state_cache = cache
+        mock_vm_repo.list_page_by_project_id.return_value = [{'name': 'vm-1', 'uuid': 'uuid-1'}]
+
+        page = compute_service.list_vms(1, limit=10, fields=['name', 'state']).to_dict('vms')
+
+        assert page == {'vms': [{'name': 'vm-1', 'state': 'PAUSED'}], 'next_marker': None,
+                        'state_as_of': '1970-01-01T00:00:00+00:00'}
+        mock_libvirt.getAllDomainStats.assert_not_called()
+
+    def test_list_vms_reads_state_from_each_vms_host(self, mock_vm_repo, mock_image_service):
+        """다른 호스트의 VM 상태는 그 호스트의 스냅샷에서 읽고, 호스트마다 한 번만 조회해야 합니다."""
+        connections = {name: MagicMock(spec=LibvirtConnectionManager) for name in ("node-a", "node-b")}
+        connections["node-a"].get.return_value.getAllDomainStats.return_value = [
+            (FakeDomain('vm-1', 'uuid-1'), {'state.state': libvirt.VIR_DOMAIN_RUNNING}),
+        ]
+        connections["node-b"].get.return_value.getAllDomainStats.return_value = [
+            (FakeDomain('vm-2', 'uuid-2'), {'state.state': libvirt.VIR_DOMAIN_PAUSED}),
+            (FakeDomain('vm-3', 'uuid-3'), {'state.state': libvirt.VIR_DOMAIN_SHUTOFF}),
+        ]
+        cache = MagicMock(spec=DomainStateCache)
+        cache.is_ready.return_value = True
+        cache.get.side_effect = lambda uuid, default: {'uuid-1': 'RUNNING'}.get(uuid, default)
+        cache.as_of.return_value = 0.0
+        service = ComputeService(mock_vm_repo, mock_image_service, connections["node-a"],
+                                 state_cache=cache, host_connections=connections)
+        mock_vm_repo.list_page_by_project_id.return_value = [
+            {'name': 'vm-1', 'uuid': 'uuid-1', 'host': 'node-a'},
+            {'name': 'vm-2', 'uuid': 'uuid-2', 'host': 'node-b'},
+            {'name': 'vm-3', 'uuid': 'uuid-3', 'host': 'node-b'},
+        ]
+
+        page = service.list_vms(1, limit=10, fields=['name', 'state']).to_dict('vms')
+
+        args, _ = mock_vm_repo.list_page_by_project_id.call_args
+        assert args[2] == ['name', 'uuid', 'host']
+        assert [vm['state'] for vm in page['vms']] == ['RUNNING', 'PAUSED', 'SHUTOFF']
+        connections["node-a"].get.assert_not_called()  # 기본 호스트는 캐시에서 읽음
+        connections["node-b"].get.return_value.getAllDomainStats.assert_called_once()
+
+    def test_list_vms_marks_vms_on_an_unreachable_host_unknown(self, mock_vm_repo, mock_image_service):
+        """연결할 수 없는 호스트의 VM은 페이지를 순회하는 도중 예외 없이 'UNKNOWN'으로 표시되어야 합니다."""
+        connections = {name: MagicMock(spec=LibvirtConnectionManager) for name in ("node-a", "node-b")}
+        connections["node-a"].get.return_value.getAllDomainStats.return_value = [
+            (FakeDomain('vm-1', 'uuid-1'), {'state.state': libvirt.VIR_DOMAIN_RUNNING}),
+        ]
+        connections["node-b"].get.side_effect = ConnectionError("Failed to open connection to the hypervisor.")
+        service = ComputeService(mock_vm_repo, mock_image_service, connections["node-a"],
+                                 host_connections=connections)
+        mock_vm_repo.list_page_by_project_id.return_value = [
+            {'name': 'vm-1', 'uuid': 'uuid-1', 'host': 'node-a'},
+            {'name': 'vm-2', 'uuid': 'uuid-2', 'host': 'node-b'},
+        ]
+
+        page = service.list_vms(1, limit=10, fields=['name', 'state']).to_dict('vms')
+
+        assert [vm['state'] for vm in page['vms']] == ['RUNNING', 'UNKNOWN']
 
 # ===================================================================
 #  destroy_vm 테스트 스위트
@@ -191,3 +462,73 @@ class TestDestroyVm:
         # VmNotFoundError 예외가 발생하는지 확인
         with pytest.raises(VmNotFoundError):
             compute_service.destroy_vm(project_id, vm_name)
+
+# ===================================================================
+#  일괄 생성/삭제 테스트 스위트
+# ===================================================================
+class TestBatch:
+    BASE_IMAGE_PATH = "/var/lib/libvirt/images/ubuntu-base.qcow2"
+
+    @patch("src.services.compute_service.generate_vm_xml")
+    def test_create_vms_reports_per_item_results(self, mock_generate_xml, compute_service, mock_vm_repo, mock_image_service, mock_libvirt):
+        """일괄 생성은 실패한 항목만 실패로 보고하고, 나머지는 한 번의 INSERT와 한 번의 상태 갱신으로 처리해야 합니다."""
+        # === Arrange ===
+        mock_image_service.validate_images_and_get_paths.return_value = (
+            {"ubuntu": self.BASE_IMAGE_PATH}, {"missing": "Image 'missing' not found."}
+        )
+        mock_image_service.check_requirements.side_effect = (
+            lambda name, ram_mb: "Image 'ubuntu' requires at least 1024 MB of RAM." if ram_mb < 1024 else None
+        )
+        mock_vm_repo.find_by_names_and_project_id.return_value = [models.VM(name="taken")]
+        mock_image_service.create_vm_disk.side_effect = lambda name, path: f"/tmp/{name}.qcow2"
+        mock_libvirt.defineXML.side_effect = lambda xml: FakeDomain("vm", "uuid")
+        specs = [
+            {"vm_name": "vm-1", "cpu_count": 1, "ram_mb": 1024, "image_name": "ubuntu"},
+            {"vm_name": "vm-2", "cpu_count": 1, "ram_mb": 512, "image_name": "missing"},
+            {"vm_name": "taken", "cpu_count": 1, "ram_mb": 1024, "image_name": "ubuntu"},
+            {"vm_name": "vm-1", "cpu_count": 1, "ram_mb": 512, "image_name": "ubuntu"},
+            {"vm_name": "vm-3", "cpu_count": 1, "ram_mb": 2048, "image_name": "ubuntu"},
+            {"vm_name": "vm-4", "cpu_count": 1, "ram_mb": 512, "image_name": "ubuntu"},
+        ]
+
+        # === Act ===
+        results = compute_service.create_vms(1, specs, concurrency=2)
+
+        # === Assert ===
+        assert [r["status"] for r in results] == ["created", "failed", "failed", "failed", "created", "failed"]
+        assert "1024 MB" in results[5]["error"]
+        mock_image_service.validate_images_and_get_paths.assert_called_once()
+        mock_vm_repo.find_by_names_and_project_id.assert_called_once()
+        mock_vm_repo.create_many.assert_called_once()
+        assert [vm.name for vm in mock_vm_repo.create_many.call_args.args[0]] == ["vm-1", "vm-3"]
+        mock_vm_repo.update_states.assert_called_once_with({results[0]["uuid"]: "RUNNING", results[4]["uuid"]: "RUNNING"})
+
+    def test_create_vms_reports_non_string_names_as_failed_items(self, compute_service, mock_vm_repo, mock_image_service):
+        """이름이 문자열이 아닌 항목은 배치 전체를 실패시키지 않고 그 항목만 실패로 보고해야 합니다."""
+        mock_image_service.validate_images_and_get_paths.return_value = ({}, {})
+        mock_vm_repo.find_by_names_and_project_id.return_value = []
+        specs = [
+            {"vm_name": ["vm-1"], "cpu_count": 1, "ram_mb": 512, "image_name": "ubuntu"},
+            {"vm_name": "vm-2", "cpu_count": 1, "ram_mb": 512, "image_name": {"name": "ubuntu"}},
+        ]
+
+        results = compute_service.create_vms(1, specs, concurrency=2)
+
+        assert [r["status"] for r in results] == ["failed", "failed"]
+        assert results[0]["name"] is None and results[1]["name"] == "vm-2"
+
+    def test_destroy_vms_reports_missing_names(self, compute_service, mock_vm_repo, mock_image_service, mock_libvirt):
+        """일괄 삭제는 찾은 VM만 한 번에 삭제하고, 없는 이름은 실패로 보고해야 합니다."""
+        # === Arrange ===
+        vm = models.VM(name="vm-1", uuid="uuid-1", project_id=1)
+        mock_vm_repo.find_by_names_and_project_id.return_value = [vm]
+        mock_libvirt.lookupByUUIDString.return_value = FakeDomain("vm-1", "uuid-1")
+
+        # === Act ===
+        results = compute_service.destroy_vms(1, ["vm-1", "ghost"], concurrency=4)
+
+        # === Assert ===
+        assert results[0] == {"name": "vm-1", "status": "deleted"}
+        assert results[1]["status"] == "failed"
+        mock_image_service.delete_vm_disk_by_name.assert_called_once_with("vm-1")
+        mock_vm_repo.delete_many.assert_called_once_with([vm])
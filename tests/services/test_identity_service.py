@@ -2,10 +2,13 @@
 import pytest
 from unittest.mock import MagicMock, patch, ANY
 import hashlib
+from datetime import datetime, timedelta
 
 from src.services.identity_service import IdentityService
 from src.services.exceptions import *
-from src.repositories.interfaces import IUserRepository, IProjectRepository, IRoleRepository, IVMRepository
+from src.repositories.interfaces import IUserRepository, IProjectRepository, IRoleRepository, IVMRepository, LoginContext
+from src.repositories.memory.memory_token_repository import MemoryTokenRepository
+from src.utils.signed_token import TokenSigner
 from src.database import models
 
 # ===================================================================
@@ -115,8 +118,7 @@ class TestProjectManagement:
 #  사용자 관리(User Management) 테스트
 # ===================================================================
 class TestUserManagement:
-    @patch('src.services.identity_service.hashlib.sha256')
-    def test_create_user_success(self, mock_sha256: MagicMock, identity_service: IdentityService, mock_user_repo: MagicMock):
+    def test_create_user_success(self, identity_service: IdentityService, mock_user_repo: MagicMock):
         """사용자 생성 성공 시나리오를 테스트합니다."""
         # === Arrange ===
         username, password = "testuser", "password123"
@@ -134,6 +136,10 @@ class TestUserManagement:
         # 검증: find_by_username과 create가 올바르게 호출되었는지 확인
         mock_user_repo.find_by_username.assert_called_once_with(username)
         mock_user_repo.create.assert_called_once_with(ANY) # models.User 객체
+        # 검증: 비밀번호는 솔트가 포함된 KDF 형식으로 저장되어야 함
+        created = mock_user_repo.create.call_args.args[0]
+        assert created.password_hash.startswith("scrypt$")
+        assert identity_service.password_hasher.verify(password, created.password_hash)
 
     def test_delete_user_success(self, identity_service: IdentityService, mock_user_repo: MagicMock):
         """사용자 삭제 성공을 테스트합니다."""
@@ -152,6 +158,15 @@ class TestUserManagement:
         mock_user_repo.find_by_id.assert_called_once_with(user_id)
         mock_user_repo.delete.assert_called_once_with(mock_user)
 
+    def test_list_users_pages_by_username(self, identity_service: IdentityService, mock_user_repo: MagicMock):
+        """limit + 1개를 조회하고, 다음 페이지가 있으면 마지막 사용자 이름을 마커로 반환해야 합니다."""
+        mock_user_repo.list_page.return_value = [{"id": i, "username": f"user-{i}"} for i in range(3)]
+
+        page = identity_service.list_users(limit=2, marker="alice", fields=["id"]).to_dict("users")
+
+        mock_user_repo.list_page.assert_called_once_with(3, ["id", "username"], marker="alice", username_prefix=None)
+        assert page == {"users": [{"id": 0}, {"id": 1}], "next_marker": "user-1"}
+
 # ===================================================================
 #  인증 및 권한 부여(Auth & Membership) 테스트
 # ===================================================================
@@ -165,10 +180,7 @@ class TestAuthAndMembership:
         # 시나리오: 사용자, 프로젝트가 존재하고, 사용자가 해당 프로젝트의 멤버임
         mock_user = models.User(id=1, username=username, password_hash=hashed_password)
         mock_project = models.Project(id=1, name=project_name)
-        mock_user.project_associations = [models.UserProjectRole(user_id=1, project_id=1, role_id=1)] # 멤버십 시뮬레이션
-
-        mock_user_repo.find_by_username.return_value = mock_user
-        mock_project_repo.find_by_name.return_value = mock_project
+        mock_user_repo.find_login_context.return_value = LoginContext(mock_user, mock_project, ["member"])  # 멤버십 시뮬레이션
 
         # === Act ===
         result = identity_service.authenticate(username, password, project_name)
@@ -176,14 +188,107 @@ class TestAuthAndMembership:
         # === Assert ===
         assert "token" in result
         assert "expires_at" in result
+        # 검증: 로그인은 한 번의 조회로 끝나고, 역할이 토큰에 담겨야 함
+        mock_user_repo.find_login_context.assert_called_once_with(username, project_name)
+        mock_project_repo.find_by_name.assert_not_called()
+        assert identity_service.validate_token(result["token"])["roles"] == ["member"]
+
+    def test_token_is_shared_through_injected_store(self, mock_user_repo: MagicMock, mock_project_repo: MagicMock, mock_role_repo: MagicMock, mock_vm_repo: MagicMock):
+        """요청마다 서비스가 새로 만들어져도, 같은 저장소를 주입하면 발급한 토큰을 검증할 수 있어야 합니다."""
+        # === Arrange ===
+        token_repo = MemoryTokenRepository()
+        password = "password123"
+        mock_user = models.User(id=1, username="testuser", password_hash=hashlib.sha256(password.encode('utf-8')).hexdigest())
+        mock_user_repo.find_login_context.return_value = LoginContext(mock_user, models.Project(id=1, name="default"), ["admin"])
+
+        issuer = IdentityService(mock_user_repo, mock_project_repo, mock_role_repo, mock_vm_repo, token_repo=token_repo)
+        validator = IdentityService(mock_user_repo, mock_project_repo, mock_role_repo, mock_vm_repo, token_repo=token_repo)
+
+        # === Act ===
+        token = issuer.authenticate("testuser", password, "default")["token"]
+
+        # === Assert ===
+        assert validator.validate_token(token)["project_id"] == 1
+
+    def test_expired_token_is_removed_from_store(self, mock_user_repo: MagicMock, mock_project_repo: MagicMock, mock_role_repo: MagicMock, mock_vm_repo: MagicMock):
+        """만료된 토큰은 검증에 실패하고 저장소에서 삭제되어야 합니다."""
+        # === Arrange ===
+        token_repo = MemoryTokenRepository()
+        token_repo.save("old-token", {'user_id': 1, 'project_id': 1, 'expires_at': datetime.now() + timedelta(seconds=30)})
+        service = IdentityService(mock_user_repo, mock_project_repo, mock_role_repo, mock_vm_repo, token_repo=token_repo)
+
+        # === Act & Assert ===
+        with patch('src.services.identity_service.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime.now() + timedelta(minutes=1)
+            with pytest.raises(TokenInvalidError, match="expired"):
+                service.validate_token("old-token")
+        assert token_repo.find("old-token") is None
+
+    def test_authenticate_rehashes_legacy_password(self, identity_service: IdentityService, mock_user_repo: MagicMock, mock_project_repo: MagicMock):
+        """구버전 SHA-256 해시 사용자는 로그인에 성공하면 현재 KDF 형식으로 다시 해시되어야 합니다."""
+        # === Arrange ===
+        password = "password123"
+        mock_user = models.User(id=1, username="testuser", password_hash=hashlib.sha256(password.encode('utf-8')).hexdigest())
+        mock_user_repo.find_login_context.return_value = LoginContext(mock_user, models.Project(id=1, name="default"), ["admin"])
+
+        # === Act ===
+        identity_service.authenticate("testuser", password, "default")
+
+        # === Assert ===
+        mock_user_repo.update.assert_called_once_with(mock_user)
+        assert mock_user.password_hash.startswith("scrypt$")
+        assert identity_service.password_hasher.verify(password, mock_user.password_hash)
 
     def test_authenticate_fails_with_wrong_password(self, identity_service: IdentityService, mock_user_repo: MagicMock):
         """잘못된 비밀번호로 인증 실패 시나리오를 테스트합니다."""
         # === Arrange ===
         username, password = "testuser", "wrong_password"
         # 시나리오: 사용자는 존재하지만, DB의 해시값과 다름
-        mock_user_repo.find_by_username.return_value = models.User(id=1, username=username, password_hash="correct_hash")
+        mock_user_repo.find_login_context.return_value = LoginContext(models.User(id=1, username=username, password_hash="correct_hash"), None, [])
+
+        # === Act & Assert ===
+        with pytest.raises(AuthenticationError, match="Invalid username or password"):
+            identity_service.authenticate(username, password, "default")
+
+    def test_authenticate_unknown_user_runs_the_kdf(self, identity_service: IdentityService, mock_user_repo: MagicMock):
+        """없는 사용자도 KDF를 실행하여, 응답 시간으로 사용자 이름의 존재 여부가 드러나지 않아야 합니다."""
+        # === Arrange ===
+        mock_user_repo.find_login_context.return_value = None
+        hasher = identity_service.password_hasher
+        hasher.dummy_hash()  # 더미 해시를 만드는 KDF는 첫 호출 때 한 번만 실행됨
+        kdf_runs = hasher.kdf_count
 
         # === Act & Assert ===
         with pytest.raises(AuthenticationError, match="Invalid username or password"):
-            identity_service.authenticate(username, password, "default")
\ No newline at end of file
+            identity_service.authenticate("nobody", "password123", "default")
+        assert hasher.kdf_count - kdf_runs == 1
+
+    def test_signed_token_is_validated_without_store(self, mock_user_repo: MagicMock, mock_project_repo: MagicMock, mock_role_repo: MagicMock, mock_vm_repo: MagicMock):
+        """서명 토큰 모드에서는 저장소를 거치지 않고 토큰을 검증하며, 폐기한 토큰은 거부해야 합니다."""
+        # === Arrange ===
+        token_repo = MagicMock(spec=MemoryTokenRepository)
+        password = "password123"
+        mock_user = models.User(id=1, username="testuser", password_hash=hashlib.sha256(password.encode('utf-8')).hexdigest())
+        mock_user_repo.find_login_context.return_value = LoginContext(mock_user, models.Project(id=3, name="default"), ["admin"])
+        service = IdentityService(mock_user_repo, mock_project_repo, mock_role_repo, mock_vm_repo,
+                                  token_repo=token_repo, token_signer=TokenSigner(b"secret"))
+
+        # === Act ===
+        token = service.authenticate("testuser", password, "default")["token"]
+        token_data = service.validate_token(token)
+        service.revoke_token(token)
+
+        # === Assert ===
+        assert token_data["project_id"] == 3
+        token_repo.save.assert_not_called()
+        token_repo.find.assert_not_called()
+        with pytest.raises(TokenInvalidError, match="revoked"):
+            service.validate_token(token)
+
+    def test_signed_token_with_bad_signature_is_rejected(self, identity_service: IdentityService):
+        """서명이 맞지 않는 토큰은 TokenInvalidError로 거부되어야 합니다."""
+        identity_service.token_signer = TokenSigner(b"secret")
+        forged = TokenSigner(b"attacker").sign({'u': 1, 'p': 1, 'e': 4102444800, 'j': 'x'})
+
+        with pytest.raises(TokenInvalidError):
+            identity_service.validate_token(forged)
@@ -0,0 +1,154 @@
+# tests/services/test_image_service.py
+import fcntl
+import hashlib
+import io
+import os
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.database import migrations
+from src.database.database import create_db_engine
+from src.repositories.sqlalchemy.sqlalchemy_image_repository import SqlalchemyImageRepository
+from src.services.exceptions import ImageAlreadyExistsError, ImageNotFoundError, ImageUploadConflictError
+from src.services.image_service import ImageService
+
+# qcow2 헤더로 시작하는 가짜 이미지 내용
+IMAGE_DATA = b"QFI\xfb" + os.urandom(300_000)
+IMAGE_SHA256 = hashlib.sha256(IMAGE_DATA).hexdigest()
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'images.db'}")
+    migrations.upgrade(engine)
+    with sessionmaker(bind=engine)() as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def import_dir(tmp_path):
+    path = tmp_path / "import"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def moves(monkeypatch):
+    """이미지 디렉터리로의 이동(sudo mv)을 기록하고, sudo 없이 rename으로 수행합니다."""
+    moves = []
+
+    def move_disk_file(source, target):
+        moves.append((source, target))
+        os.rename(source, target)
+
+    monkeypatch.setattr("src.services.image_service.move_disk_file", move_disk_file)
+    return moves
+
+
+@pytest.fixture
+def service(session, tmp_path, import_dir, moves):
+    (tmp_path / "images").mkdir()
+    return ImageService(SqlalchemyImageRepository(session), import_dirs=[str(import_dir)], upload_chunk_bytes=4096,
+                        image_dir=str(tmp_path / "images"), upload_dir=str(tmp_path / "uploads"))
+
+
+def test_upload_in_parts_activates_the_image_with_its_checksum(service, session, moves, tmp_path):
+    image = service.create_image("ubuntu", min_ram_mb=512)
+    session.commit()
+    assert image["status"] == "queued" and image["uploaded_bytes"] == 0
+    # 업로드가 끝나기 전에는 VM 생성에 사용할 수 없음
+    with pytest.raises(ImageNotFoundError):
+        service.validate_image_and_get_path("ubuntu")
+
+    part = service.upload_image_file(image["id"], io.BytesIO(IMAGE_DATA[:100_000]), 100_000, complete=False)
+    assert part["status"] == "queued" and part["uploaded_bytes"] == 100_000
+    rest = IMAGE_DATA[100_000:]
+    done = service.upload_image_file(image["id"], io.BytesIO(rest), len(rest), offset=100_000)
+    session.commit()
+
+    assert done["status"] == "active"
+    assert done["size_bytes"] == len(IMAGE_DATA)
+    assert done["checksum"] == IMAGE_SHA256
+    assert done["disk_format"] == "qcow2"
+    path = service.validate_image_and_get_path("ubuntu", ram_mb=512)
+    assert open(path, "rb").read() == IMAGE_DATA
+    # 서버가 쓸 수 있는 업로드 디렉터리에 받은 뒤, 권한 경로로 이미지 디렉터리에 옮김
+    assert moves == [(str(tmp_path / "uploads" / os.path.basename(path)) + ".part", path)]
+    assert os.path.dirname(path) == str(tmp_path / "images")
+    with pytest.raises(ImageUploadConflictError):
+        service.upload_image_file(image["id"], io.BytesIO(IMAGE_DATA), len(IMAGE_DATA))
+
+
+def test_interrupted_upload_resumes_from_the_received_offset(service, session):
+    image_id = service.create_image("ubuntu", checksum=IMAGE_SHA256)["id"]
+
+    # 연결이 끊겨 본문의 일부만 도착한 경우
+    with pytest.raises(ValueError, match="resume with offset=70000"):
+        service.upload_image_file(image_id, io.BytesIO(IMAGE_DATA[:70_000]), len(IMAGE_DATA))
+    assert service.get_image(image_id)["uploaded_bytes"] == 70_000
+
+    with pytest.raises(ImageUploadConflictError, match="offset 70000"):
+        service.upload_image_file(image_id, io.BytesIO(IMAGE_DATA), len(IMAGE_DATA))
+
+    rest = IMAGE_DATA[70_000:]
+    image = service.upload_image_file(image_id, io.BytesIO(rest), len(rest), offset=70_000)
+    assert image["status"] == "active" and image["checksum"] == IMAGE_SHA256
+
+
+def test_invalid_content_is_discarded(service):
+    image_id = service.create_image("ubuntu", checksum="0" * 64)["id"]
+
+    with pytest.raises(ValueError, match="not a qcow2 image"):
+        service.upload_image_file(image_id, io.BytesIO(b"raw bytes"), 9)
+    assert service.get_image(image_id)["uploaded_bytes"] == 0
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        service.upload_image_file(image_id, io.BytesIO(IMAGE_DATA), len(IMAGE_DATA))
+    assert service.get_image(image_id)["status"] == "queued"
+    assert service.get_image(image_id)["uploaded_bytes"] == 0
+
+
+def test_create_image_validates_input(service):
+    service.create_image("ubuntu")
+    with pytest.raises(ImageAlreadyExistsError):
+        service.create_image("ubuntu")
+    for kwargs in ({"name": ""}, {"name": "a", "disk_format": "vmdk"}, {"name": "a", "min_disk_gb": -1},
+                   {"name": "a", "checksum": "not-a-digest"}):
+        with pytest.raises(ValueError):
+            service.create_image(**kwargs)
+
+
+def test_concurrent_upload_of_the_same_image_is_rejected(service):
+    image = service.create_image("ubuntu")
+    os.makedirs(service.upload_dir)
+    with open(service._part_path(service._get_image(image["id"])), "wb") as other_upload:
+        fcntl.flock(other_upload, fcntl.LOCK_EX)
+        with pytest.raises(ImageUploadConflictError, match="in progress"):
+            service.upload_image_file(image["id"], io.BytesIO(IMAGE_DATA), len(IMAGE_DATA))
+
+
+def test_import_copies_a_local_file_from_an_allowed_directory(service, import_dir, tmp_path):
+    source = import_dir / "ubuntu.qcow2"
+    source.write_bytes(IMAGE_DATA)
+    outside = tmp_path / "outside.qcow2"
+    outside.write_bytes(IMAGE_DATA)
+    (import_dir / "link.qcow2").symlink_to(outside)
+    image_id = service.create_image("ubuntu")["id"]
+
+    for path in (str(outside), str(import_dir / "link.qcow2"), str(import_dir), "ubuntu.qcow2"):
+        with pytest.raises(ValueError):
+            service.check_import_path(path)
+
+    steps = []
+    image = service.import_image_file(image_id, str(source), steps.append)
+    assert steps == ["copying", "verifying"]
+    assert image["status"] == "active"
+    assert image["size_bytes"] == len(IMAGE_DATA) and image["checksum"] == IMAGE_SHA256
+    assert open(service.validate_image_and_get_path("ubuntu"), "rb").read() == IMAGE_DATA
+
+
+def test_import_is_disabled_without_allowed_directories(session, import_dir):
+    service = ImageService(SqlalchemyImageRepository(session))
+    with pytest.raises(ValueError, match="not enabled"):
+        service.check_import_path(str(import_dir / "ubuntu.qcow2"))
@@ -0,0 +1,103 @@
+# tests/services/test_quota_service.py
+import threading
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.database import migrations, models
+from src.database.database import create_db_engine
+from src.repositories.sqlalchemy.sqlalchemy_project_repository import SqlalchemyProjectRepository
+from src.repositories.sqlalchemy.sqlalchemy_quota_repository import SqlalchemyQuotaRepository
+from src.services.exceptions import ProjectNotFoundError, QuotaExceededError
+from src.services.quota_service import QuotaService
+
+DEFAULTS = {"instances": 3, "vcpus": 8, "ram_mb": 4096, "disk_gb": -1}
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'quota.db'}", pool_size=8, max_overflow=0)
+    migrations.upgrade(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        session.add_all([models.Project(id=1, name="default"), models.Project(id=2, name="other")])
+        session.commit()
+    yield factory
+    engine.dispose()
+
+
+def make_service(session):
+    return QuotaService(SqlalchemyQuotaRepository(session), SqlalchemyProjectRepository(session), DEFAULTS)
+
+
+def test_reservations_count_until_released_and_rollback_cancels_them(session_factory):
+    with session_factory() as session:
+        service = make_service(session)
+        service.reserve(1, vcpus=2, ram_mb=1024, disk_gb=40)
+        service.reserve(1, vcpus=2, ram_mb=1024)
+        session.commit()
+
+        service.reserve(1, vcpus=2, ram_mb=1024)
+        session.rollback()  # VM 기록과 함께 롤백된 예약은 사용량에 남지 않음
+
+        quotas = service.get_quotas(1)["quotas"]
+        assert quotas["instances"] == {"limit": 3, "in_use": 2}
+        assert quotas["ram_mb"] == {"limit": 4096, "in_use": 2048}
+        assert quotas["disk_gb"] == {"limit": -1, "in_use": 40}
+
+        service.release(1, vcpus=2, ram_mb=1024, disk_gb=40)
+        session.commit()
+        assert service.get_quotas(1)["quotas"]["instances"]["in_use"] == 1
+        assert service.get_quotas(2)["quotas"]["instances"]["in_use"] == 0
+
+
+def test_exceeding_any_resource_is_rejected_with_details(session_factory):
+    with session_factory() as session:
+        service = make_service(session)
+        service.reserve(1, vcpus=4, ram_mb=2048)
+
+        with pytest.raises(QuotaExceededError, match="ram_mb"):
+            service.reserve(1, vcpus=1, ram_mb=4096)
+        assert service.get_quotas(1)["quotas"]["vcpus"]["in_use"] == 4
+
+        service.set_quotas(1, {"ram_mb": -1, "vcpus": None})
+        service.reserve(1, vcpus=1, ram_mb=4096)
+        assert service.get_limits(1) == {"instances": 3, "vcpus": 8, "ram_mb": -1, "disk_gb": -1}
+
+
+def test_invalid_quota_updates_are_rejected(session_factory):
+    with session_factory() as session:
+        service = make_service(session)
+        with pytest.raises(ValueError):
+            service.set_quotas(1, {"floating_ips": 5})
+        with pytest.raises(ValueError):
+            service.set_quotas(1, {"instances": -2})
+        with pytest.raises(ProjectNotFoundError):
+            service.get_quotas(99)
+
+
+def test_concurrent_reservations_cannot_pass_the_limit(session_factory):
+    accepted, rejected = [], []
+    barrier = threading.Barrier(8)
+
+    def create():
+        with session_factory() as session:
+            service = make_service(session)
+            barrier.wait()
+            try:
+                service.reserve(1, vcpus=1, ram_mb=256)
+                session.commit()
+                accepted.append(1)
+            except QuotaExceededError:
+                session.rollback()
+                rejected.append(1)
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(accepted) == 3 and len(rejected) == 5
+    with session_factory() as session:
+        assert make_service(session).get_quotas(1)["quotas"]["instances"]["in_use"] == 3
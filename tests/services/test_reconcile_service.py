@@ -0,0 +1,184 @@
+# tests/services/test_reconcile_service.py
+import libvirt
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.database import Base
+from src.database import models
+from src.database.unit_of_work import UnitOfWork
+from src.repositories.sqlalchemy.sqlalchemy_drift_repository import SqlalchemyVMDriftRepository
+from src.repositories.sqlalchemy.sqlalchemy_vm_repository import SqlalchemyVMRepository
+from src.services.reconcile_service import ReconcileService, ReconcileStats
+
+
+class FakeDomain:
+    def __init__(self, name, uuid, state_code):
+        self._name = name
+        self._uuid = uuid
+        self.state_code = state_code
+        self.undefined = False
+
+    def name(self): return self._name
+    def UUIDString(self): return self._uuid
+    def isActive(self): return self.state_code == libvirt.VIR_DOMAIN_RUNNING
+    def destroy(self): self.state_code = libvirt.VIR_DOMAIN_SHUTOFF
+    def undefine(self): self.undefined = True
+
+
+class FakeConnection:
+    def __init__(self, domains):
+        self.domains = domains
+        self.lookups = 0
+
+    def getAllDomainStats(self, stats, flags=0):
+        return [(domain, {"state.state": domain.state_code, "vcpu.current": 2, "balloon.maximum": 1024 * 1024})
+                for domain in self.domains if not domain.undefined]
+
+    def lookupByUUIDString(self, uuid):
+        self.lookups += 1
+        raise AssertionError("reconcile must reuse the snapshot's domain objects")
+
+
+class FakeConnManager:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def get(self):
+        return self.conn
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    session = factory()
+    session.add(models.Project(id=1, name="default"))
+    session.add_all([
+        models.VM(name="in-sync", uuid="uuid-ok", state="RUNNING", cpu_count=1, ram_mb=512, project_id=1),
+        models.VM(name="stopped", uuid="uuid-stopped", state="RUNNING", cpu_count=1, ram_mb=512, project_id=1),
+        models.VM(name="lost", uuid="uuid-lost", state="RUNNING", cpu_count=1, ram_mb=512, project_id=1),
+        models.VM(name="building", uuid="uuid-building", state="BUILDING", cpu_count=1, ram_mb=512, project_id=1),
+    ])
+    session.commit()
+    session.close()
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def conn():
+    return FakeConnection([
+        FakeDomain("in-sync", "uuid-ok", libvirt.VIR_DOMAIN_RUNNING),
+        FakeDomain("stopped", "uuid-stopped", libvirt.VIR_DOMAIN_SHUTOFF),
+        FakeDomain("orphan", "uuid-ghost", libvirt.VIR_DOMAIN_RUNNING),
+    ])
+
+
+def run(session_factory, conn, **kwargs):
+    with UnitOfWork(session_factory) as unit_of_work:
+        service = ReconcileService(
+            SqlalchemyVMRepository(unit_of_work.session), SqlalchemyVMDriftRepository(unit_of_work.session),
+            FakeConnManager(conn), unit_of_work, **kwargs,
+        )
+        return service.reconcile()
+
+
+def vm_states(session_factory):
+    session = session_factory()
+    try:
+        return {vm.uuid: vm.state for vm in session.query(models.VM)}
+    finally:
+        session.close()
+
+
+def drift_rows(session_factory):
+    session = session_factory()
+    try:
+        return sorted((d.kind, d.vm_uuid, d.action, d.resolved_at is None) for d in session.query(models.VMDrift))
+    finally:
+        session.close()
+
+
+def test_detects_drift_in_both_directions_and_syncs_state(session_factory, conn):
+    result = run(session_factory, conn)
+
+    assert [vm["uuid"] for vm in result["ghost_vms"]] == ["uuid-ghost"]
+    assert [vm["uuid"] for vm in result["missing_vms"]] == ["uuid-lost"]
+    assert result["state_drift"] == [{"name": "stopped", "uuid": "uuid-stopped", "db_state": "RUNNING",
+                                      "hypervisor_state": "SHUTOFF", "action": "state_synced"}]
+    # BUILDING VM은 도메인이 없어도 불일치가 아님
+    assert vm_states(session_factory)["uuid-stopped"] == "SHUTOFF"
+    assert drift_rows(session_factory) == [
+        ("ghost", "uuid-ghost", "reported", True),
+        ("missing", "uuid-lost", "reported", True),
+        ("state", "uuid-stopped", "state_synced", False),
+    ]
+    assert conn.lookups == 0
+
+
+def test_open_drift_is_not_duplicated_and_clears_when_gone(session_factory, conn):
+    run(session_factory, conn)
+    run(session_factory, conn)
+    assert len(drift_rows(session_factory)) == 3
+
+    conn.domains = [domain for domain in conn.domains if domain.UUIDString() != "uuid-ghost"]
+    run(session_factory, conn)
+
+    assert ("ghost", "uuid-ghost", "cleared", False) in drift_rows(session_factory)
+
+
+def test_destructive_policies_apply_only_to_confirmed_drift(session_factory, conn):
+    """되돌릴 수 없는 조치는 같은 불일치가 연속된 두 번의 검사에서 발견되었을 때만 적용해야 합니다."""
+    policies = {"ghost_policy": "destroy", "missing_policy": "mark_error"}
+    first = run(session_factory, conn, **policies)
+    assert first["ghost_vms"][0]["action"] == "reported"
+    assert vm_states(session_factory)["uuid-lost"] == "RUNNING"
+
+    second = run(session_factory, conn, **policies)
+
+    assert second["ghost_vms"][0]["action"] == "destroyed"
+    assert second["missing_vms"][0]["action"] == "marked_error"
+    assert conn.domains[2].undefined
+    assert vm_states(session_factory)["uuid-lost"] == "ERROR"
+    assert all(not is_open for _, _, _, is_open in drift_rows(session_factory))
+
+
+def test_adopt_registers_ghost_in_configured_project(session_factory, conn):
+    run(session_factory, conn, ghost_policy="adopt", adopt_project_id=1)
+    result = run(session_factory, conn, ghost_policy="adopt", adopt_project_id=1)
+
+    assert result["ghost_vms"][0]["action"] == "adopted"
+    session = session_factory()
+    adopted = session.query(models.VM).filter_by(uuid="uuid-ghost").one()
+    assert (adopted.name, adopted.state, adopted.cpu_count, adopted.ram_mb) == ("orphan", "RUNNING", 2, 1024)
+    session.close()
+
+
+def test_state_update_skips_vm_changed_since_scan(session_factory):
+    """조회 이후 다른 요청이 상태를 바꾼 VM은 덮어쓰지 않아야 합니다."""
+    session = session_factory()
+    repo = SqlalchemyVMRepository(session)
+    changed = repo.compare_and_set_states({"uuid-ok": ("BUILDING", "ERROR"), "uuid-stopped": ("RUNNING", "SHUTOFF")})
+    session.commit()
+    session.close()
+
+    assert changed == 1
+    assert vm_states(session_factory)["uuid-ok"] == "RUNNING"
+
+
+def test_stats_and_policy_validation(session_factory, conn):
+    stats = ReconcileStats()
+    run(session_factory, conn, stats=stats)
+
+    snapshot = stats.to_dict()
+    assert snapshot["runs"] == 1
+    assert snapshot["last_drifts"] == {"ghost_vms": 1, "missing_vms": 1, "state_drift": 1}
+    assert snapshot["actions_total"] == {"reported": 2, "state_synced": 1}
+
+    with pytest.raises(ValueError):
+        run(session_factory, conn, ghost_policy="adopt")
+    with pytest.raises(ValueError):
+        run(session_factory, conn, missing_policy="delete")
@@ -0,0 +1,97 @@
+# tests/services/test_scheduler.py
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.exceptions import NoValidHostError
+from src.services.scheduler import ComputeHost, PlacementRequest, Scheduler, discover_capacity
+
+
+def make_hosts(*specs):
+    """(이름, vCPU, RAM(MB), 디스크(GB)) 목록으로 가짜 호스트를 만듭니다."""
+    return [ComputeHost(name, f"test:///{name}", vcpus, ram_mb, disk_gb) for name, vcpus, ram_mb, disk_gb in specs]
+
+
+def test_positive_ram_weight_spreads_and_negative_weight_stacks():
+    hosts = make_hosts(("a", 8, 8192, 100), ("b", 8, 16384, 100))
+
+    spread = Scheduler(hosts, anti_affinity="off")
+    assert [spread.select(PlacementRequest(1, 1, 4096)).host for _ in range(3)] == ["b", "b", "a"]
+
+    stack = Scheduler(hosts, ram_weight=-1.0, anti_affinity="off")
+    assert [stack.select(PlacementRequest(1, 1, 4096)).host for _ in range(3)] == ["a", "a", "b"]
+
+
+def test_filters_apply_overcommit_ratios_and_raise_when_nothing_fits():
+    scheduler = Scheduler(make_hosts(("a", 2, 4096, 20)), cpu_allocation_ratio=2.0, anti_affinity="off")
+
+    for _ in range(4):
+        scheduler.select(PlacementRequest(1, 1, 1024, 5))
+    (host,) = scheduler.hosts()
+    assert host["free_vcpus"] == 0 and host["free_ram_mb"] == 0 and host["free_disk_gb"] == 0
+
+    with pytest.raises(NoValidHostError):
+        scheduler.select(PlacementRequest(1, 1, 1))
+
+
+def test_anti_affinity_prefers_other_hosts_and_hard_policy_refuses_to_share():
+    hosts = make_hosts(("a", 8, 16384, 0), ("b", 8, 8192, 0))
+
+    soft = Scheduler(hosts, anti_affinity="soft")
+    assert [soft.select(PlacementRequest(7, 1, 1024)).host for _ in range(3)] == ["a", "b", "a"]
+
+    hard = Scheduler(hosts, anti_affinity="hard")
+    assert {hard.select(PlacementRequest(7, 1, 1024)).host for _ in range(2)} == {"a", "b"}
+    with pytest.raises(NoValidHostError):
+        hard.select(PlacementRequest(7, 1, 1024))
+    assert hard.select(PlacementRequest(8, 1, 1024)).host == "a"  # 다른 프로젝트는 영향 없음
+
+
+def test_concurrent_claims_never_oversubscribe_a_host():
+    scheduler = Scheduler(make_hosts(("a", 64, 10240, 0), ("b", 64, 10240, 0)), anti_affinity="off")
+    placed, rejected = [], []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        for _ in range(5):
+            try:
+                placed.append(scheduler.select(PlacementRequest(1, 1, 1024)))
+            except NoValidHostError:
+                rejected.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(placed) == 20 and len(rejected) == 20
+    assert all(host["free_ram_mb"] == 0 for host in scheduler.hosts())
+
+
+def test_usage_is_rebuilt_from_rows_and_released_claims_are_reusable():
+    scheduler = Scheduler(make_hosts(("a", 4, 4096, 0), ("b", 4, 4096, 0)), anti_affinity="off")
+    # 호스트가 기록되지 않은 VM(None)은 기본 호스트에, 모르는 호스트의 VM은 무시
+    scheduler.load_usage([(None, 1, 2, 3072, 0, 1), ("b", 1, 1, 1024, 0, 1), ("gone", 1, 4, 4096, 0, 1)])
+
+    hosts = {host["name"]: host for host in scheduler.hosts()}
+    assert hosts["a"]["free_ram_mb"] == 1024 and hosts["b"]["free_ram_mb"] == 3072
+
+    claim = scheduler.select(PlacementRequest(1, 1, 3072))
+    assert claim.host == "b"
+    with pytest.raises(NoValidHostError):
+        scheduler.select(PlacementRequest(1, 1, 2048))
+    scheduler.release(claim)
+    assert scheduler.select(PlacementRequest(1, 1, 2048)).host == "b"
+
+
+def test_missing_capacity_is_read_from_the_hypervisor():
+    conn = MagicMock()
+    conn.getInfo.return_value = ["x86_64", 32768, 16, 2400, 1, 1, 8, 2]
+    conn.storagePoolLookupByName.return_value.info.return_value = [2, 500 * 1024 ** 3, 0, 0]
+
+    host = discover_capacity(ComputeHost("a", "test:///a", vcpus=8), conn)
+
+    assert (host.vcpus, host.ram_mb, host.disk_gb) == (8, 32768, 500)
@@ -0,0 +1,117 @@
+# tests/services/test_task_manager.py
+import threading
+import time
+
+import pytest
+
+from src.services.task_manager import TaskManager, Task
+from src.services.exceptions import TaskNotFoundError, TaskQueueFullError
+
+
+@pytest.fixture
+def task_manager():
+    """테스트용 TaskManager를 생성하고, 테스트가 끝나면 워커 풀을 정리합니다."""
+    manager = TaskManager(max_workers=4, max_pending=200)
+    yield manager
+    manager.shutdown(wait=True)
+
+
+def wait_until_finished(manager, task_id, project_id=1, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        task = manager.get(task_id, project_id)
+        if task['status'] in (Task.SUCCEEDED, Task.FAILED):
+            return task
+        time.sleep(0.01)
+    raise AssertionError(f"Task {task_id} did not finish in time.")
+
+
+def test_task_reports_progress_and_success(task_manager):
+    """작업은 진행 단계를 기록하고, 성공 시 SUCCEEDED 상태가 되어야 합니다."""
+    def job(progress):
+        progress("creating_disk")
+        progress("starting_domain")
+
+    task = task_manager.create('create_vm', project_id=1, resource_id='vm-uuid')
+    task_manager.start(task, job)
+
+    result = wait_until_finished(task_manager, task.id)
+    assert result['status'] == Task.SUCCEEDED
+    assert result['steps_done'] == ['creating_disk', 'starting_domain']
+    assert result['resource_id'] == 'vm-uuid'
+
+
+def test_task_records_error_on_failure(task_manager):
+    """작업 함수가 예외를 던지면 FAILED 상태와 에러 메시지가 기록되어야 합니다."""
+    def job(progress):
+        progress("creating_disk")
+        raise RuntimeError("qemu-img failed")
+
+    task = task_manager.create('create_vm', project_id=1)
+    task_manager.start(task, job)
+
+    result = wait_until_finished(task_manager, task.id)
+    assert result['status'] == Task.FAILED
+    assert result['step'] == 'creating_disk'
+    assert 'qemu-img failed' in result['error']
+
+
+def test_100_concurrent_submissions_do_not_block_callers(task_manager):
+    """워커 수보다 훨씬 많은 작업이 동시에 들어와도 요청 스레드는 즉시 반환되어야 합니다."""
+    release = threading.Event()
+    submit_durations = []
+    lock = threading.Lock()
+
+    def submit():
+        start = time.perf_counter()
+        task = task_manager.create('create_vm', project_id=1)
+        task_manager.start(task, lambda progress: release.wait(5))
+        with lock:
+            submit_durations.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=submit) for _ in range(100)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    release.set()
+
+    assert len(submit_durations) == 100
+    assert max(submit_durations) < 0.5
+
+
+def test_create_raises_when_queue_is_full():
+    """대기/실행 중인 작업이 max_pending에 도달하면 TaskQueueFullError가 발생해야 합니다."""
+    manager = TaskManager(max_workers=1, max_pending=1)
+    task = manager.create('create_vm', project_id=1)
+
+    with pytest.raises(TaskQueueFullError):
+        manager.create('create_vm', project_id=1)
+
+    # 자리를 반납하면 다시 작업을 받을 수 있어야 함
+    manager.discard(task)
+    manager.create('create_vm', project_id=1)
+    manager.shutdown()
+
+
+def test_get_hides_other_projects_tasks(task_manager):
+    """다른 프로젝트의 작업은 조회할 수 없어야 합니다."""
+    task = task_manager.create('create_vm', project_id=1)
+
+    with pytest.raises(TaskNotFoundError):
+        task_manager.get(task.id, project_id=2)
+
+
+def test_start_after_shutdown_fails_the_task_and_releases_its_slot():
+    """워커 풀이 종료된 뒤 시작한 작업은 FAILED로 기록되고 대기열 자리를 반납해야 합니다."""
+    manager = TaskManager(max_workers=1, max_pending=1)
+    task = manager.create('create_vm', project_id=1)
+    manager.shutdown(wait=True)
+
+    with pytest.raises(RuntimeError):
+        manager.start(task, lambda progress: None)
+
+    result = manager.get(task.id, 1)
+    assert result['status'] == Task.FAILED
+    assert 'could not be started' in result['error']
+    assert manager.active_count() == 0
@@ -0,0 +1,140 @@
+# tests/utils/test_disk_pool.py
+import os
+from collections import deque
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.image_service import ImageService
+from src.utils.disk_pool import OverlayPool, PoolTarget
+
+
+class FakeQemuImg:
+    """오버레이 대신 기반 이미지 경로를 내용으로 갖는 파일을 만드는 가짜 qemu-img."""
+
+    def __init__(self):
+        self.created = []
+
+    def __call__(self, base_path, overlay_path):
+        with open(overlay_path, "w") as f:
+            f.write(base_path)
+        self.created.append(overlay_path)
+
+
+def make_dir(path):
+    os.makedirs(path, exist_ok=True)
+
+
+@pytest.fixture
+def base_image(tmp_path):
+    path = tmp_path / "ubuntu.qcow2"
+    path.write_bytes(b"base")
+    return str(path)
+
+
+@pytest.fixture
+def pool(tmp_path, base_image):
+    qemu_img = FakeQemuImg()
+    pool = OverlayPool(str(tmp_path / "pool"), create_overlay=qemu_img, delete_file=os.remove,
+                       move_file=os.rename, make_dir=make_dir)
+    # 백그라운드 스레드 없이 refill()을 직접 호출해 검사
+    pool._targets = {base_image: PoolTarget(high=3, low=2)}
+    pool._ready = {base_image: deque()}
+    os.makedirs(pool.staging_dir)
+    pool.qemu_img = qemu_img
+    return pool
+
+
+def test_take_moves_a_ready_overlay_and_refills_below_the_low_watermark(pool, base_image, tmp_path):
+    pool.refill()
+    assert pool.ready_counts() == {base_image: 3}
+
+    target = tmp_path / "vm-1.qcow2"
+    assert pool.take(base_image, str(target))
+    assert target.read_text() == base_image
+    pool.refill()
+    assert len(pool.qemu_img.created) == 3  # 2개 남음 = low 이상이므로 채우지 않음
+
+    assert pool.take(base_image, str(tmp_path / "vm-2.qcow2"))
+    pool.refill()
+    assert pool.ready_counts() == {base_image: 3} and len(pool.qemu_img.created) == 5
+
+    assert not pool.take(str(tmp_path / "other.qcow2"), str(tmp_path / "vm-3.qcow2"))
+
+
+def test_overlays_of_a_changed_base_image_are_discarded_and_rebuilt(pool, base_image, tmp_path):
+    pool.refill()
+    stale = list(pool.qemu_img.created)
+    stat = os.stat(base_image)
+    os.utime(base_image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert not pool.take(base_image, str(tmp_path / "vm-1.qcow2"))
+    pool.refill()
+
+    assert not any(os.path.exists(path) for path in stale)
+    assert pool.ready_counts() == {base_image: 3}
+    assert pool.take(base_image, str(tmp_path / "vm-1.qcow2"))
+
+
+def test_failed_rename_falls_back_and_discards_the_overlay(pool, base_image, tmp_path):
+    pool.refill()
+
+    assert not pool.take(base_image, str(tmp_path / "missing-dir" / "vm-1.qcow2"))
+    pool.refill()
+    # 옮기지 못한 오버레이는 삭제되고, 남은 2개는 low 이상이므로 그대로
+    assert sorted(os.listdir(pool.staging_dir)) == sorted(
+        os.path.basename(path) for path in pool.qemu_img.created[1:]
+    )
+
+
+def test_background_thread_cleans_leftovers_and_fills_the_pool(tmp_path, base_image):
+    staging = tmp_path / "pool"
+    staging.mkdir()
+    (staging / "leftover.qcow2").write_text("old")
+    # 첫 디렉터리 준비는 실패(예: 권한 헬퍼가 아직 뜨지 않음)하고 다음 주기에 성공
+    prepare = MagicMock(side_effect=[OSError("helper unavailable"), None, None])
+    pool = OverlayPool(str(staging), create_overlay=FakeQemuImg(), delete_file=os.remove,
+                       move_file=os.rename, make_dir=prepare, check_interval=0.01)
+
+    pool.start({base_image: PoolTarget.from_config({"high": 2})})
+    try:
+        for _ in range(200):
+            if pool.ready_counts()[base_image] == 2:
+                break
+            pool._wake.wait(0.01)
+    finally:
+        pool.stop()
+
+    assert pool.ready_counts() == {base_image: 2}
+    assert "leftover.qcow2" not in os.listdir(staging)
+    assert prepare.call_count == 2
+    with pytest.raises(ValueError):
+        PoolTarget.from_config({"high": 2, "low": 3})
+
+
+def test_image_service_uses_pooled_overlay_without_running_qemu_img(base_image):
+    disk_pool = MagicMock(spec=OverlayPool)
+    disk_pool.take.return_value = True
+    service = ImageService(MagicMock(), disk_pool=disk_pool)
+
+    with patch("src.services.image_service.subprocess.run") as run:
+        path = service.create_vm_disk("vm-1", base_image)
+        run.assert_not_called()
+
+        disk_pool.take.return_value = False
+        service.create_vm_disk("vm-2", base_image)
+        run.assert_called_once()
+
+    assert path == os.path.join(service.image_base_dir, "vm-1.qcow2")
+    disk_pool.take.assert_any_call(base_image, path)
+
+
+def test_failed_move_discards_the_overlay(pool, base_image, tmp_path):
+    """오버레이를 옮기지 못하면 False를 반환하고, 그 오버레이는 다음 채우기에서 지워야 합니다."""
+    pool.refill()
+    pool._move_file = MagicMock(side_effect=PermissionError("denied"))
+
+    assert not pool.take(base_image, str(tmp_path / "vm-1.qcow2"))
+    pool.refill()
+    assert len(os.listdir(pool.staging_dir)) == 2  # 남은 2개는 low 이상이므로 채우지 않음
+    assert not os.path.exists(pool.qemu_img.created[0])
@@ -0,0 +1,181 @@
+# tests/utils/test_domain_state_cache.py
+import time
+
+import libvirt
+import pytest
+
+from src.utils import domain_state_cache
+from src.utils.domain_state_cache import DomainStateCache, LibvirtEventSource
+
+
+class FakeDomain:
+    def __init__(self, name, uuid):
+        self._name = name
+        self._uuid = uuid
+
+    def name(self): return self._name
+    def UUIDString(self): return self._uuid
+
+
+class FakeConnection:
+    """getAllDomainStats 스냅샷을 돌려주는 가짜 libvirt 연결. during_snapshot은 스냅샷 도중에 실행됩니다."""
+    def __init__(self, domains):
+        self.domains = domains  # [(name, uuid, state_code)]
+        self.during_snapshot = None
+        self.snapshot_calls = 0
+
+    def getAllDomainStats(self, stats, flags=0):
+        self.snapshot_calls += 1
+        snapshot = [(FakeDomain(name, uuid), {"state.state": code}) for name, uuid, code in self.domains]
+        if self.during_snapshot:
+            self.during_snapshot()
+        return snapshot
+
+
+class FakeConnManager:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def get(self):
+        return self.conn
+
+
+class FakeEventSource:
+    """테스트에서 직접 라이프사이클 이벤트를 발생시키는 이벤트 소스."""
+    def __init__(self):
+        self.running = True
+        self.subscriptions = {}  # 연결 -> 콜백
+        self.unsubscribed = []
+
+    def start(self): pass
+    def is_running(self): return self.running
+
+    def subscribe(self, conn, callback):
+        self.subscriptions[conn] = callback
+        return len(self.subscriptions)
+
+    def unsubscribe(self, conn, handle):
+        self.unsubscribed.append(conn)
+        del self.subscriptions[conn]
+
+    def emit(self, conn, uuid, name, event):
+        self.subscriptions[conn](uuid, name, event)
+
+
+@pytest.fixture
+def conn():
+    return FakeConnection([("vm-1", "uuid-1", libvirt.VIR_DOMAIN_RUNNING),
+                           ("vm-2", "uuid-2", libvirt.VIR_DOMAIN_SHUTOFF)])
+
+
+@pytest.fixture
+def events():
+    return FakeEventSource()
+
+
+@pytest.fixture
+def cache(conn, events):
+    return DomainStateCache(FakeConnManager(conn), event_source=events, clock=lambda: 1000.0)
+
+
+def test_resync_loads_snapshot(cache, conn):
+    """전체 동기화 전에는 준비되지 않은 상태이고, 동기화 후에는 스냅샷의 상태를 반환해야 합니다."""
+    assert not cache.is_ready()
+    assert cache.as_of() is None
+
+    assert cache.resync() == 2
+
+    assert cache.is_ready()
+    assert cache.get("uuid-1") == "RUNNING"
+    assert cache.get("uuid-2") == "SHUTOFF"
+    assert cache.get("uuid-missing") == "UNKNOWN"
+    assert conn.snapshot_calls == 1
+
+
+def test_lifecycle_events_update_cache_without_snapshot(cache, conn, events):
+    """라이프사이클 이벤트는 하이퍼바이저 조회 없이 캐시에 바로 반영되어야 합니다."""
+    cache.resync()
+
+    events.emit(conn, "uuid-2", "vm-2", libvirt.VIR_DOMAIN_EVENT_STARTED)
+    events.emit(conn, "uuid-1", "vm-1", libvirt.VIR_DOMAIN_EVENT_SUSPENDED)
+    events.emit(conn, "uuid-3", "vm-3", libvirt.VIR_DOMAIN_EVENT_DEFINED)
+    events.emit(conn, "uuid-3", "vm-3", libvirt.VIR_DOMAIN_EVENT_UNDEFINED)
+
+    assert cache.get("uuid-2") == "RUNNING"
+    assert cache.get("uuid-1") == "PAUSED"
+    assert cache.get("uuid-3") == "UNKNOWN"
+    assert conn.snapshot_calls == 1
+
+
+def test_events_during_resync_win_over_snapshot(cache, conn, events):
+    """스냅샷을 받는 동안 도착한 이벤트는 (더 새로운 정보이므로) 스냅샷으로 덮어쓰지 않아야 합니다."""
+    cache.resync()
+    conn.during_snapshot = lambda: (
+        events.emit(conn, "uuid-1", "vm-1", libvirt.VIR_DOMAIN_EVENT_STOPPED),
+        events.emit(conn, "uuid-2", "vm-2", libvirt.VIR_DOMAIN_EVENT_UNDEFINED),
+    )
+
+    cache.resync()
+
+    assert cache.get("uuid-1") == "SHUTOFF"
+    assert cache.get("uuid-2") == "UNKNOWN"
+
+
+def test_as_of_depends_on_event_subscription(conn, events):
+    """이벤트를 구독 중이면 현재 시각, 아니면 마지막 전체 동기화 시각이 기준이 되어야 합니다."""
+    now = [100.0]
+    cache = DomainStateCache(FakeConnManager(conn), event_source=events, clock=lambda: now[0])
+    cache.resync()
+    now[0] = 130.0
+    assert cache.as_of() == 130.0
+
+    events.running = False
+    assert cache.as_of() == 100.0
+
+    polling = DomainStateCache(FakeConnManager(conn), clock=lambda: now[0])
+    polling.resync()
+    now[0] = 160.0
+    assert polling.as_of() == 130.0
+
+
+def test_resubscribes_when_connection_changes(conn, events):
+    """재연결로 연결 객체가 바뀌면 이전 구독을 해제하고 새 연결에 다시 구독해야 합니다."""
+    manager = FakeConnManager(conn)
+    cache = DomainStateCache(manager, event_source=events)
+    cache.resync()
+    cache.resync()
+    assert list(events.subscriptions) == [conn]
+
+    new_conn = FakeConnection([("vm-1", "uuid-1", libvirt.VIR_DOMAIN_SHUTOFF)])
+    manager.conn = new_conn
+    cache.resync()
+
+    assert events.unsubscribed == [conn]
+    assert list(events.subscriptions) == [new_conn]
+    assert cache.get("uuid-1") == "SHUTOFF"
+    assert cache.get("uuid-2") == "UNKNOWN"
+
+
+def test_background_thread_syncs_and_stops(cache, events):
+    """start()하면 백그라운드에서 첫 동기화를 수행하고, stop()하면 이벤트 구독을 해제해야 합니다."""
+    cache.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while not cache.is_ready() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert cache.get("uuid-1") == "RUNNING"
+    finally:
+        cache.stop()
+    assert events.subscriptions == {}
+
+
+def test_event_source_registers_event_impl_once_on_creation(monkeypatch):
+    """이벤트 루프 구현은 start() 전, 연결을 열기 전인 생성 시점에 한 번만 등록되어야 합니다."""
+    calls = []
+    monkeypatch.setattr(domain_state_cache, "_event_impl_registered", False)
+    monkeypatch.setattr(libvirt, "virEventRegisterDefaultImpl", lambda: calls.append(True))
+
+    LibvirtEventSource()
+    assert calls == [True]
+    LibvirtEventSource()
+    assert calls == [True]
@@ -0,0 +1,92 @@
+# tests/utils/test_file_transfer.py
+import errno
+import hashlib
+import io
+import os
+
+import pytest
+
+from src.utils import file_transfer
+from src.utils.file_transfer import copy_file, hash_file, write_stream
+
+DATA = bytes(range(256)) * 1000  # 256,000 바이트
+
+
+class ReadOnlyStream:
+    """readinto가 없고, 요청보다 적게 돌려줄 수 있는 스트림 (소켓처럼)."""
+
+    def __init__(self, data: bytes, max_read: int = 7000):
+        self._stream = io.BytesIO(data)
+        self.max_read = max_read
+
+    def read(self, size: int) -> bytes:
+        return self._stream.read(min(size, self.max_read))
+
+
+@pytest.fixture
+def target(tmp_path):
+    fd = os.open(tmp_path / "target", os.O_RDWR | os.O_CREAT)
+    yield fd
+    os.close(fd)
+
+
+@pytest.mark.parametrize("stream", [io.BytesIO(DATA), ReadOnlyStream(DATA)], ids=["readinto", "read"])
+def test_write_stream_writes_in_chunks_at_the_offset_and_hashes(stream, target):
+    os.pwrite(target, b"head", 0)
+    hasher = hashlib.sha256()
+
+    assert write_stream(stream, target, len(DATA), offset=4, hasher=hasher, chunk_size=4096) == len(DATA)
+    assert os.pread(target, len(DATA) + 10, 0) == b"head" + DATA
+    assert hasher.hexdigest() == hashlib.sha256(DATA).hexdigest()
+
+
+def test_write_stream_stops_when_the_stream_ends_early(target):
+    assert write_stream(io.BytesIO(DATA[:1000]), target, len(DATA), chunk_size=256) == 1000
+    assert os.fstat(target).st_size == 1000
+
+
+def test_hash_file_reads_the_given_range(target):
+    os.pwrite(target, DATA, 0)
+    hasher = hashlib.sha256()
+    hash_file(target, hasher, 5000, offset=100, chunk_size=512)
+    assert hasher.hexdigest() == hashlib.sha256(DATA[100:5100]).hexdigest()
+    with pytest.raises(ValueError):
+        hash_file(target, hashlib.sha256(), len(DATA) + 1)
+
+
+def test_copy_file_falls_back_and_continues_where_the_previous_method_stopped(tmp_path, target, monkeypatch):
+    source = tmp_path / "source"
+    source.write_bytes(DATA)
+    calls = []
+
+    def partial_then_unsupported(src_fd, dst_fd, offset, count, buffer):
+        # 첫 호출은 일부만 복사하고, 다음 호출에서 이 파일 조합을 지원하지 않는다고 실패
+        calls.append(offset)
+        if offset:
+            raise OSError(errno.EXDEV, "cross-device")
+        return file_transfer._read_write(src_fd, dst_fd, offset, 1000, memoryview(bytearray(1000)))
+
+    def unsupported(*args):
+        raise OSError(errno.ENOSYS, "not implemented")
+
+    monkeypatch.setattr(file_transfer, "_COPY_METHODS", [
+        ("copy_file_range", partial_then_unsupported),
+        ("sendfile", unsupported),
+        ("read_write", file_transfer._read_write),
+    ])
+    with open(source, "rb") as f:
+        assert copy_file(f.fileno(), target, len(DATA), chunk_size=4096) == "read_write"
+    assert calls == [0, 1000]
+    assert os.pread(target, len(DATA) + 1, 0) == DATA
+
+
+def test_copy_file_uses_the_kernel_copy_when_available(tmp_path, target):
+    source = tmp_path / "source"
+    source.write_bytes(DATA)
+    with open(source, "rb") as f:
+        method = copy_file(f.fileno(), target, len(DATA))
+    assert method in ("copy_file_range", "sendfile")
+    assert os.pread(target, len(DATA) + 1, 0) == DATA
+
+    with open(source, "rb") as f, pytest.raises(ValueError):
+        copy_file(f.fileno(), target, len(DATA) + 10)
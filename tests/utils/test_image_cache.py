@@ -0,0 +1,114 @@
+# tests/utils/test_image_cache.py
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database import migrations, models
+from src.repositories.sqlalchemy.sqlalchemy_image_repository import SqlalchemyImageRepository
+from src.services.exceptions import ImageRequirementError
+from src.services.image_service import ImageService
+from src.utils.image_cache import ImageCatalogCache, ImageInfo
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    path = tmp_path / "ubuntu.qcow2"
+    path.write_bytes(b"qcow2")
+    return path
+
+
+def test_cached_images_skip_the_repository_until_ttl(image_file):
+    clock = FakeClock()
+    cache = ImageCatalogCache(ttl=60, clock=clock)
+    repo = MagicMock()
+    repo.find_by_name.return_value = models.Image(name="ubuntu", filepath=str(image_file), min_ram_mb=512)
+    service = ImageService(repo, cache=cache)
+
+    for _ in range(3):
+        assert service.validate_image_and_get_path("ubuntu") == str(image_file)
+    assert repo.find_by_name.call_count == 1
+
+    clock.now += 61
+    service.validate_image_and_get_path("ubuntu")
+    assert repo.find_by_name.call_count == 2
+
+
+def test_minimum_ram_is_enforced():
+    cache = ImageCatalogCache(clock=FakeClock())
+    cache.put_many([ImageInfo("ubuntu", "/dev/null", 20, 1024)])
+    service = ImageService(MagicMock(), cache=cache)
+
+    with pytest.raises(ImageRequirementError):
+        service.validate_image_and_get_path("ubuntu", ram_mb=512)
+    assert service.validate_image_and_get_path("ubuntu", ram_mb=1024) == "/dev/null"
+    assert "20 GB" in service.check_requirements("ubuntu", ram_mb=2048, disk_gb=10)
+    assert service.check_requirements("unknown", ram_mb=1) is None
+
+
+def test_file_checks_are_reused_and_missing_files_are_not_cached(image_file):
+    clock = FakeClock()
+    cache = ImageCatalogCache(file_ttl=30, clock=clock)
+
+    assert cache.file_exists(str(image_file))
+    image_file.unlink()
+    assert cache.file_exists(str(image_file))  # TTL 안에서는 다시 stat하지 않음
+
+    clock.now += 31
+    assert not cache.file_exists(str(image_file))
+    image_file.write_bytes(b"qcow2")
+    assert cache.file_exists(str(image_file))
+
+
+def test_image_changes_in_this_process_invalidate_the_cache(tmp_path, image_file):
+    engine = create_engine(f"sqlite:///{tmp_path / 'images.db'}")
+    migrations.upgrade(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(models.Image(name="ubuntu", filepath=str(image_file), min_ram_mb=512))
+    session.commit()
+
+    cache = ImageCatalogCache(clock=FakeClock())
+    cache.invalidate_on_change(models.Image)
+    service = ImageService(SqlalchemyImageRepository(session), cache=cache)
+    service.validate_image_and_get_path("ubuntu", ram_mb=512)
+
+    image = session.query(models.Image).filter_by(name="ubuntu").one()
+    image.min_ram_mb = 2048
+    session.flush()
+    # 커밋 전에는 무효화하지 않음 (다른 요청이 이전 행을 읽어 다시 캐시하는 일을 막음)
+    assert cache.get_many(["ubuntu"])[0]["ubuntu"].min_ram_mb == 512
+    session.commit()
+
+    with pytest.raises(ImageRequirementError):
+        service.validate_image_and_get_path("ubuntu", ram_mb=512)
+    session.close()
+    engine.dispose()
+
+
+def test_rolled_back_changes_do_not_invalidate_the_cache(tmp_path, image_file):
+    engine = create_engine(f"sqlite:///{tmp_path / 'images.db'}")
+    migrations.upgrade(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(models.Image(name="ubuntu", filepath=str(image_file)))
+    session.commit()
+
+    cache = ImageCatalogCache(clock=FakeClock())
+    cache.invalidate_on_change(models.Image)
+    cache.put_many([ImageInfo("ubuntu", str(image_file), None, None)])
+    session.query(models.Image).filter_by(name="ubuntu").one().name = "ubuntu-renamed"
+    session.flush()
+    session.rollback()
+    session.commit()
+
+    assert "ubuntu" in cache.get_many(["ubuntu"])[0]
+    session.close()
+    engine.dispose()
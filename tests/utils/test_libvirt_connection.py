@@ -0,0 +1,60 @@
+# tests/utils/test_libvirt_connection.py
+import pytest
+import libvirt
+from unittest.mock import MagicMock, patch
+
+from src.utils.libvirt_connection import LibvirtConnectionManager
+
+
+@pytest.fixture
+def mock_open() -> MagicMock:
+    """libvirt.open을 모킹하여 호출될 때마다 새로운 가짜 연결을 반환합니다."""
+    with patch("src.utils.libvirt_connection.libvirt.open") as mock_open:
+        mock_open.side_effect = lambda uri: MagicMock(name=f"conn-{mock_open.call_count}")
+        yield mock_open
+
+
+def test_connection_is_opened_lazily_and_reused(mock_open):
+    """연결은 첫 get() 호출 시에만 열리고, 이후에는 같은 연결을 재사용해야 합니다."""
+    manager = LibvirtConnectionManager("qemu:///system")
+    mock_open.assert_not_called()
+
+    first = manager.get()
+    second = manager.get()
+
+    assert first is second
+    mock_open.assert_called_once_with("qemu:///system")
+    assert manager.opened_count == 1
+
+
+def test_reconnects_when_connection_is_dead(mock_open):
+    """연결이 끊어진 경우 다음 get() 호출에서 기존 연결을 닫고 재연결해야 합니다."""
+    manager = LibvirtConnectionManager("qemu:///system")
+    dead_conn = manager.get()
+    dead_conn.isAlive.return_value = 0
+
+    new_conn = manager.get()
+
+    assert new_conn is not dead_conn
+    dead_conn.close.assert_called_once()
+    assert manager.opened_count == 2
+
+
+def test_open_failure_raises_connection_error(mock_open):
+    """하이퍼바이저에 연결할 수 없으면 ConnectionError가 발생해야 합니다."""
+    mock_open.side_effect = libvirt.libvirtError("connection refused")
+    manager = LibvirtConnectionManager("qemu:///system")
+
+    with pytest.raises(ConnectionError):
+        manager.get()
+
+
+def test_close_releases_connection(mock_open):
+    """close() 호출 시 연결을 닫고, 이후 get()은 새 연결을 열어야 합니다."""
+    manager = LibvirtConnectionManager("qemu:///system")
+    conn = manager.get()
+
+    manager.close()
+
+    conn.close.assert_called_once()
+    assert manager.get() is not conn
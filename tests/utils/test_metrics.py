@@ -0,0 +1,90 @@
+# tests/utils/test_metrics.py
+import threading
+
+import pytest
+
+from src.utils.metrics import MetricsRegistry
+
+
+def test_counter_sums_across_threads_including_finished_ones():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", ("route",))
+
+    def work():
+        for _ in range(1000):
+            requests.labels("list_vms").inc()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    requests.labels("list_vms").inc(5)
+
+    # 종료된 스레드의 값은 수집 시 retired 샤드로 합쳐지며, 다시 수집해도 중복으로 세지 않아야 함
+    assert 'requests_total{route="list_vms"} 4005' in registry.render()
+    assert 'requests_total{route="list_vms"} 4005' in registry.render()
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert lines == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.65",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_histogram_timer_records_even_when_block_raises():
+    registry = MetricsRegistry()
+    latency = registry.histogram("call_seconds", "Calls.", ("call",))
+
+    with pytest.raises(RuntimeError):
+        with latency.labels("create").time():
+            raise RuntimeError("boom")
+
+    assert 'call_seconds_count{call="create"} 1' in registry.render()
+
+
+def test_gauge_reads_callback_at_collection_time():
+    registry = MetricsRegistry()
+    pending = [3]
+    registry.gauge("tasks_active", "Active tasks.", fn=lambda: pending[0])
+    registry.gauge("cache_domains", "Domains.", ("state",), fn=lambda: {("RUNNING",): 2, ("SHUTOFF",): None})
+
+    pending[0] = 7
+    text = registry.render()
+
+    assert "tasks_active 7" in text
+    assert 'cache_domains{state="RUNNING"} 2' in text
+    assert "SHUTOFF" not in text  # 값이 None인 항목은 내보내지 않음
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.gauge("names", "Names.", ("name",)).labels('a"b\\c\nd').set(1)
+
+    assert 'names{name="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+
+def test_reregistering_returns_same_metric_and_rejects_conflicts():
+    registry = MetricsRegistry()
+    first = registry.counter("errors_total", "Errors.", ("kind",))
+
+    assert registry.counter("errors_total", "Errors.", ("kind",)) is first
+    with pytest.raises(ValueError):
+        registry.gauge("errors_total", "Errors.", ("kind",))
+    with pytest.raises(ValueError):
+        registry.counter("errors_total", "Errors.", ("other",))
+    with pytest.raises(ValueError):
+        first.labels("a", "b")
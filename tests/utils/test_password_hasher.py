@@ -0,0 +1,65 @@
+# tests/utils/test_password_hasher.py
+import hashlib
+
+import pytest
+
+from src.utils.password_hasher import PasswordHasher
+
+# 테스트 속도를 위해 작업 계수를 낮춘 설정
+FAST = dict(scrypt_n=2 ** 10, pbkdf2_iterations=1000, workers=0)
+
+
+@pytest.mark.parametrize("algorithm", ["scrypt", "pbkdf2_sha256"])
+def test_hash_records_parameters_and_verifies(algorithm):
+    """해시 문자열에는 알고리즘과 파라미터가 기록되고, 같은 비밀번호로만 검증되어야 합니다."""
+    hasher = PasswordHasher(algorithm=algorithm, **FAST)
+    stored = hasher.hash("s3cret")
+
+    assert stored.startswith(f"{algorithm}$")
+    assert hasher.verify("s3cret", stored)
+    assert not hasher.verify("wrong", stored)
+    assert stored != hasher.hash("s3cret")  # 매번 새 솔트 사용
+
+
+def test_legacy_sha256_hash_verifies_and_needs_rehash():
+    hasher = PasswordHasher(**FAST)
+    legacy = hashlib.sha256(b"admin").hexdigest()
+
+    assert hasher.verify("admin", legacy)
+    assert not hasher.verify("other", legacy)
+    assert hasher.needs_rehash(legacy)
+
+
+def test_needs_rehash_when_work_factor_changes():
+    """작업 계수가 바뀌면 기존 해시는 재해시 대상이지만, 여전히 검증은 되어야 합니다."""
+    old = PasswordHasher(**FAST).hash("s3cret")
+    stronger = PasswordHasher(scrypt_n=2 ** 11, workers=0)
+
+    assert not PasswordHasher(**FAST).needs_rehash(old)
+    assert stronger.needs_rehash(old)
+    assert stronger.verify("s3cret", old)
+
+
+def test_malformed_hash_is_rejected():
+    assert not PasswordHasher(**FAST).verify("s3cret", "scrypt$garbage")
+
+
+def test_verified_credential_cache_skips_kdf():
+    """검증 캐시가 켜져 있으면 같은 자격 증명의 반복 검증은 KDF를 다시 실행하지 않아야 합니다."""
+    hasher = PasswordHasher(cache_ttl=60, **FAST)
+    stored = hasher.hash("s3cret")
+    kdf_runs = hasher.kdf_count
+
+    for _ in range(10):
+        assert hasher.verify("s3cret", stored)
+    assert not hasher.verify("wrong", stored)
+
+    assert hasher.kdf_count - kdf_runs == 2  # 최초 성공 1회 + 실패 1회
+
+
+def test_kdf_runs_in_worker_pool():
+    hasher = PasswordHasher(scrypt_n=2 ** 10, workers=2)
+    try:
+        assert hasher.verify("s3cret", hasher.hash("s3cret"))
+    finally:
+        hasher.shutdown()
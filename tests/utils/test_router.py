@@ -0,0 +1,49 @@
+# tests/utils/test_router.py
+import pytest
+
+from src.utils.router import Router, MethodNotAllowedError
+
+
+def list_vms(): pass
+def create_vm(): pass
+def delete_vm(): pass
+def assign_role(): pass
+
+
+@pytest.fixture
+def router() -> Router:
+    """테스트용 라우트 몇 개를 등록한 Router를 생성합니다."""
+    return Router([
+        ('GET', r'^/v1/vms$', list_vms),
+        ('POST', r'^/v1/vms$', create_vm),
+        ('DELETE', r'^/v1/vms/([a-zA-Z0-9_-]+)$', delete_vm),
+        ('PUT', r'^/v1/projects/([0-9]+)/users/([0-9]+)/roles/([a-zA-Z]+)$', assign_role),
+    ])
+
+
+def test_match_returns_handler_and_path_args(router):
+    """메서드와 경로가 일치하면 핸들러와 경로 파라미터를 반환해야 합니다."""
+    assert router.match('GET', '/v1/vms') == (list_vms, ())
+    assert router.match('DELETE', '/v1/vms/my-vm') == (delete_vm, ('my-vm',))
+    assert router.match('PUT', '/v1/projects/1/users/2/roles/admin') == (assign_role, ('1', '2', 'admin'))
+
+
+def test_match_returns_none_for_unknown_path(router):
+    """등록되지 않은 경로는 None을 반환해야 합니다."""
+    assert router.match('GET', '/v1/unknown') is None
+    assert router.match('DELETE', '/v1/vms/bad.name') is None
+    assert router.match('PUT', '/v1/projects/abc/users/2/roles/admin') is None
+
+
+def test_match_raises_405_with_allowed_methods(router):
+    """경로는 존재하지만 메서드가 다르면 허용 메서드 목록과 함께 MethodNotAllowedError가 발생해야 합니다."""
+    with pytest.raises(MethodNotAllowedError) as exc_info:
+        router.match('PATCH', '/v1/vms')
+
+    assert exc_info.value.allowed_methods == ['GET', 'POST']
+
+
+def test_add_rejects_pattern_without_literal_prefix():
+    """앞쪽 세그먼트가 정규식이면 인덱싱할 수 없으므로 등록을 거부해야 합니다."""
+    with pytest.raises(ValueError):
+        Router([('GET', r'^/v1/([a-z]+)$', list_vms)])
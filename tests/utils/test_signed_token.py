@@ -0,0 +1,48 @@
+# tests/utils/test_signed_token.py
+import time
+
+import pytest
+
+from src.utils.signed_token import RevocationList, TokenSignatureError, TokenSigner
+
+
+@pytest.fixture
+def signer() -> TokenSigner:
+    return TokenSigner(b"test-secret")
+
+
+def test_sign_and_verify_round_trip(signer):
+    """서명한 토큰은 같은 키로 검증하면 원래 페이로드를 돌려줘야 합니다."""
+    token = signer.sign({"u": 1, "p": 2, "e": 1700000000, "j": "abc"})
+    assert signer.verify(token) == {"u": 1, "p": 2, "e": 1700000000, "j": "abc"}
+
+
+def test_tampered_payload_is_rejected(signer):
+    """페이로드를 바꾼 토큰은 서명 검증에 실패해야 합니다."""
+    token = signer.sign({"u": 1, "p": 2})
+    forged_body = signer.sign({"u": 1, "p": 99}).split(".")[0]
+    with pytest.raises(TokenSignatureError):
+        signer.verify(forged_body + "." + token.split(".")[1])
+
+
+@pytest.mark.parametrize("token", ["", "no-dot", ".sig", "body."])
+def test_malformed_token_is_rejected(signer, token):
+    with pytest.raises(TokenSignatureError):
+        signer.verify(token)
+
+
+def test_token_signed_with_other_secret_is_rejected(signer):
+    token = TokenSigner(b"other-secret").sign({"u": 1})
+    with pytest.raises(TokenSignatureError):
+        signer.verify(token)
+
+
+def test_revocation_list_purges_only_expired_entries():
+    """폐기 목록은 정리 시 만료된 항목만 제거하고, 아직 유효한 토큰의 폐기는 유지해야 합니다."""
+    revoked = RevocationList(purge_threshold=2)
+    revoked.revoke("expired", time.time() - 1)
+    revoked.revoke("live", time.time() + 60)
+
+    assert not revoked.is_revoked("expired")
+    assert revoked.is_revoked("live")
+    assert len(revoked) == 1
@@ -0,0 +1,162 @@
+# tests/utils/test_storage_helper.py
+import os
+import threading
+import time
+
+import pytest
+
+from src.services.image_service import ImageService
+from src.utils.storage_helper import StorageHelperClient, StorageHelperError, StorageHelperServer
+
+# 인자를 기록하고 마지막 인자(대상 파일)를 만드는 가짜 qemu-img.
+# FAKE_QEMU_DELAY만큼 기다리며, 대상 파일 이름에 'fail'이 있으면 실패합니다.
+FAKE_QEMU_IMG = """#!/bin/sh
+for last; do :; done
+sleep "${FAKE_QEMU_DELAY:-0}"
+case "$last" in *fail*) echo "simulated failure" >&2; exit 1;; esac
+case "$1" in
+  create) echo "$@" > "$last";;
+  resize) echo "$@" >> "$3";;
+  info) echo '{"filename": "'"$last"'", "format": "qcow2"}';;
+esac
+"""
+
+
+@pytest.fixture
+def images(tmp_path):
+    path = tmp_path / "images"
+    path.mkdir()
+    (path / "base.qcow2").write_bytes(b"base")
+    return path
+
+
+@pytest.fixture
+def start_helper(tmp_path, images):
+    """테스트 종료 시 헬퍼와 클라이언트를 정리하도록 헬퍼 시작 함수를 제공합니다."""
+    qemu_img = tmp_path / "qemu-img"
+    qemu_img.write_text(FAKE_QEMU_IMG)
+    qemu_img.chmod(0o755)
+    started = []
+
+    def _start(workers=4):
+        socket_path = str(tmp_path / "helper.sock")
+        server = StorageHelperServer(socket_path, [str(images)], workers=workers, qemu_img=str(qemu_img))
+        threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        client = StorageHelperClient(socket_path, timeout=5)
+        started.append((server, client))
+        return server, client
+
+    yield _start
+    for server, client in started:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_operations_run_in_the_helper_without_sudo(start_helper, images):
+    server, client = start_helper()
+    base, disk = str(images / "base.qcow2"), str(images / "vm-1.qcow2")
+
+    client.create_overlay(base, disk)
+    assert open(disk).read().split() == ["create", "-q", "-f", "qcow2", "-F", "qcow2", "-b", base, disk]
+    client.resize(disk, 20)
+    assert open(disk).read().splitlines()[-1] == f"resize -q {disk} 20G"
+    assert client.info(disk) == {"filename": disk, "format": "qcow2"}
+
+    staging = str(images / "pool")
+    client.make_dir(staging)
+    client.make_dir(staging)
+    assert os.path.isdir(staging)
+    moved = os.path.join(staging, "vm-1.qcow2")
+    client.rename(disk, moved)
+    with pytest.raises(StorageHelperError, match="already exists"):
+        client.rename(str(images / "base.qcow2"), moved)
+    disk = moved
+
+    assert client.delete(disk) is True
+    assert not os.path.exists(disk)
+    assert client.delete(disk) is False
+
+
+def test_paths_outside_the_allowed_directories_are_rejected(start_helper, images, tmp_path):
+    server, client = start_helper()
+    outside = tmp_path / "secret"
+    outside.write_text("keep")
+    (images / "link.qcow2").symlink_to(outside)
+
+    for path in [str(outside), str(images / ".." / "secret"), str(images / "link.qcow2"), str(images)]:
+        with pytest.raises(StorageHelperError) as excinfo:
+            client.delete(path)
+        assert excinfo.value.kind == "forbidden"
+    with pytest.raises(StorageHelperError) as excinfo:
+        client.create_overlay(str(images / "base.qcow2"), "relative.qcow2")
+    assert excinfo.value.kind == "invalid"
+    with pytest.raises(StorageHelperError) as excinfo:
+        client.resize(str(images / "base.qcow2"), -1)
+    assert excinfo.value.kind == "invalid"
+    assert outside.read_text() == "keep"
+
+
+def test_failures_carry_the_command_error(start_helper, images):
+    server, client = start_helper()
+
+    with pytest.raises(StorageHelperError) as excinfo:
+        client.create_overlay(str(images / "base.qcow2"), str(images / "fail.qcow2"))
+    assert excinfo.value.kind == "failed"
+    assert "simulated failure" in str(excinfo.value)
+    with pytest.raises(StorageHelperError) as excinfo:
+        client.submit("format_disk", path=str(images / "base.qcow2")).result(5)
+    assert excinfo.value.kind == "invalid"
+
+
+def test_pipelined_batch_runs_concurrently_and_matches_responses(start_helper, images, monkeypatch):
+    monkeypatch.setenv("FAKE_QEMU_DELAY", "0.3")
+    server, client = start_helper(workers=4)
+    base = str(images / "base.qcow2")
+    operations = [("create_overlay", {"source": base, "target": str(images / f"vm-{i}.qcow2")}) for i in range(4)]
+    operations.append(("create_overlay", {"source": base, "target": str(images / "fail.qcow2")}))
+
+    started = time.monotonic()
+    futures = client.submit_batch(operations)
+    for future in futures[:4]:
+        assert future.result(5) is None
+    with pytest.raises(StorageHelperError):
+        futures[4].result(5)
+    elapsed = time.monotonic() - started
+
+    # 0.3초짜리 작업 5개를 4개씩 동시에 처리하므로, 순차 처리(1.5초)보다 훨씬 빨라야 함
+    assert elapsed < 1.2
+    assert sorted(os.listdir(images)) == ["base.qcow2"] + [f"vm-{i}.qcow2" for i in range(4)]
+
+
+def test_client_fails_pending_requests_and_reconnects_after_the_helper_restarts(start_helper, images, tmp_path):
+    server, client = start_helper()
+    assert client.delete(str(images / "missing.qcow2")) is False
+
+    server.shutdown()
+    server.server_close()
+    with pytest.raises(StorageHelperError) as excinfo:
+        client.delete(str(images / "missing.qcow2"))
+    assert excinfo.value.kind == "unavailable"
+
+    restarted = StorageHelperServer(str(tmp_path / "helper.sock"), [str(images)])
+    threading.Thread(target=restarted.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    try:
+        assert client.delete(str(images / "missing.qcow2")) is False
+    finally:
+        restarted.shutdown()
+        restarted.server_close()
+
+
+def test_image_service_sends_disk_operations_to_the_helper(start_helper, images):
+    server, client = start_helper()
+    service = ImageService(image_repo=None, storage=client)
+    service.image_base_dir = str(images)
+
+    disk = service.create_vm_disk("vm-1", str(images / "base.qcow2"))
+    assert os.path.exists(disk)
+    assert service.delete_vm_disk(disk) is True
+    assert not os.path.exists(disk)
+
+    with pytest.raises(Exception, match="Failed to create CoW disk for vm-fail"):
+        service.create_vm_disk("vm-fail", str(images / "base.qcow2"))
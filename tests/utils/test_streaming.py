@@ -0,0 +1,73 @@
+# tests/utils/test_streaming.py
+import json
+
+import pytest
+
+from src.utils.pagination import Page
+from src.utils.streaming import StreamingBody, iter_json_page
+
+
+def test_json_page_matches_json_dumps_and_is_chunked():
+    rows = [{"name": f"vm-{i}", "uuid": f"uuid-{i}"} for i in range(1001)]
+    page = Page(iter(rows), 1000, "uuid")
+
+    chunks = list(iter_json_page("vms", page, chunk_size=256))
+
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == {"vms": rows[:1000], "next_marker": "uuid-999"}
+
+
+def test_empty_page_is_valid_json():
+    body = b"".join(iter_json_page("users", Page(iter([]), 10, "username")))
+
+    assert json.loads(body) == {"users": [], "next_marker": None}
+
+
+def test_page_reads_rows_lazily():
+    """행은 순회할 때 하나씩 소비되어야 하며, limit + 1번째 행까지만 읽어야 합니다."""
+    consumed = []
+
+    def rows():
+        for i in range(1000):
+            consumed.append(i)
+            yield {"id": i}
+
+    page = Page(rows(), 3, "id")
+    assert consumed == []
+    assert [row["id"] for row in page] == [0, 1, 2]
+    assert consumed == [0, 1, 2, 3]
+    assert page.next_marker == 2
+
+
+def test_streaming_body_reports_error_on_close():
+    results = []
+
+    def failing():
+        yield b"["
+        raise RuntimeError("cursor failed")
+
+    body = StreamingBody(failing(), results.append)
+    with pytest.raises(RuntimeError):
+        list(body)
+    body.close()
+    body.close()
+
+    assert len(results) == 1 and isinstance(results[0], RuntimeError)
+
+
+def test_streaming_body_closes_source_when_abandoned():
+    results, closed = [], []
+
+    def chunks():
+        try:
+            yield b"a"
+            yield b"b"
+        finally:
+            closed.append(True)
+
+    body = StreamingBody(chunks(), results.append)
+    next(iter(body))
+    body.close()
+
+    assert closed == [True]
+    assert results == [None]
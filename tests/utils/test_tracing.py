@@ -0,0 +1,101 @@
+# tests/utils/test_tracing.py
+import json
+import logging
+import threading
+
+from src.utils import tracing
+
+
+class ListExporter:
+    def __init__(self):
+        self.traces = []
+
+    def export(self, trace):
+        self.traces.append(trace)
+
+
+def test_spans_nest_under_the_current_span():
+    exporter = ListExporter()
+    tracer = tracing.Tracer(exporter=exporter)
+
+    with tracer.start_trace("POST create_vm", path="/v1/vms"):
+        with tracing.span("provision.creating_disk"):
+            with tracing.span("subprocess.qemu-img create"):
+                pass
+        with tracing.span("libvirt.defineXML"):
+            pass
+
+    (trace,) = exporter.traces
+    root, disk, qemu, define = trace["spans"]
+    assert root["name"] == "POST create_vm" and root["parent_id"] is None
+    assert root["attributes"] == {"path": "/v1/vms"}
+    assert disk["parent_id"] == root["span_id"]
+    assert qemu["parent_id"] == disk["span_id"]
+    assert define["parent_id"] == root["span_id"]
+    assert tracing.current_trace_id() is None
+
+
+def test_span_without_trace_only_observes_duration():
+    durations = []
+
+    with tracing.span("libvirt.create", observe=durations.append) as span:
+        pass
+
+    assert span.trace is None
+    assert len(durations) == 1 and durations[0] >= 0
+
+
+def test_unsampled_trace_is_not_exported_but_slow_one_is_logged(caplog):
+    exporter = ListExporter()
+    tracer = tracing.Tracer(exporter=exporter, sample_rate=0.5, slow_threshold_ms=0.001, rng=lambda: 0.9)
+
+    with caplog.at_level(logging.WARNING, logger="src.utils.tracing"):
+        with tracer.start_trace("POST create_vm"):
+            tracing.record_span("db.insert", 0.0, 0.002, statement="INSERT INTO vms ...")
+            with tracing.span("db.commit"):
+                pass
+
+    assert exporter.traces == []
+    (record,) = caplog.records
+    assert "Slow POST create_vm" in record.getMessage()
+    assert "db.insert" in record.getMessage() and "db.commit" in record.getMessage()
+
+
+def test_propagate_carries_trace_into_worker_threads():
+    exporter = ListExporter()
+    tracer = tracing.Tracer(exporter=exporter)
+
+    with tracer.start_trace("POST batch_create_vms") as root:
+        workers = []
+        for index in range(3):
+            def work(index=index):
+                with tracing.span("provision.creating_disk", index=index):
+                    pass
+            workers.append(threading.Thread(target=tracing.propagate(work)))
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    spans = exporter.traces[0]["spans"][1:]
+    assert len(spans) == 3
+    assert all(span["parent_id"] == root.span_id for span in spans)
+
+
+def test_json_lines_exporter_appends_one_trace_per_line(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = tracing.JsonLinesExporter(str(path))
+    tracer = tracing.Tracer(exporter=exporter, max_spans=1)
+
+    for name in ("GET list_vms", "DELETE delete_vm"):
+        with tracer.start_trace(name):
+            with tracing.span("db.select"):
+                pass
+            with tracing.span("db.delete"):
+                pass
+    tracer.close()
+
+    traces = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [trace["name"] for trace in traces] == ["GET list_vms", "DELETE delete_vm"]
+    assert [len(trace["spans"]) for trace in traces] == [2, 2]  # 최상위 span + 상한 1개
+    assert all(trace["dropped_spans"] == 1 for trace in traces)
@@ -0,0 +1,173 @@
+# tests/utils/test_wsgi_server.py
+import http.client
+import threading
+import time
+
+import pytest
+
+from src.utils.wsgi_server import ThreadPoolWSGIServer
+
+
+def make_app(delay: float = 0.0, gate: threading.Event = None):
+    """요청 본문 길이를 응답하는 테스트용 WSGI 앱. delay만큼 대기하거나 gate가 열릴 때까지 기다립니다."""
+    def app(environ, start_response):
+        if gate is not None:
+            gate.wait(5)
+        if delay:
+            time.sleep(delay)
+        body = environ['wsgi.input'].read()
+        payload = f'{{"received": {len(body)}}}'.encode()
+        start_response('200 OK', [('Content-Type', 'application/json'), ('Content-Length', str(len(payload)))])
+        return [payload]
+    return app
+
+
+@pytest.fixture
+def start_server():
+    """테스트 종료 시 서버를 정리하도록 서버 시작 함수를 제공합니다."""
+    servers = []
+
+    def _start(app, **kwargs):
+        server = ThreadPoolWSGIServer(('127.0.0.1', 0), app, **kwargs)
+        threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield _start
+    for server in servers:
+        server.shutdown()
+        server.server_close(timeout=2)
+
+
+def request(port, method='GET', path='/', body=None):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    conn.request(method, path, body=body)
+    response = conn.getresponse()
+    data = response.read()
+    conn.close()
+    return response.status, data
+
+
+def test_requests_are_processed_concurrently(start_server):
+    """느린 요청이 여러 개 들어와도 워커 수만큼 동시에 처리되어야 합니다."""
+    server = start_server(make_app(delay=0.3), workers=4)
+    port = server.server_address[1]
+
+    threads = [threading.Thread(target=request, args=(port,)) for _ in range(4)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 직렬 처리라면 1.2초 이상 걸림
+    assert time.perf_counter() - start < 0.9
+
+
+def test_keep_alive_reuses_connection(start_server):
+    """HTTP/1.1 요청은 같은 TCP 커넥션에서 연속으로 처리되어야 합니다."""
+    server = start_server(make_app(), workers=2)
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=5)
+
+    conn.request('POST', '/', body=b'12345')
+    first = conn.getresponse()
+    assert first.read() == b'{"received": 5}'
+    sock = conn.sock
+
+    conn.request('GET', '/')
+    second = conn.getresponse()
+    assert second.read() == b'{"received": 0}'
+    assert conn.sock is sock
+    conn.close()
+
+
+def test_unread_body_does_not_corrupt_next_request(start_server):
+    """앱이 요청 본문을 읽지 않아도 다음 요청이 정상적으로 파싱되어야 합니다."""
+    def app(environ, start_response):
+        start_response('204 No Content', [('Content-Length', '0')])
+        return [b'']
+
+    server = start_server(app, workers=1)
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=5)
+    for _ in range(3):
+        conn.request('POST', '/', body=b'{"ignored": true}')
+        response = conn.getresponse()
+        response.read()
+        assert response.status == 204
+    conn.close()
+
+
+def test_single_block_body_without_content_length_gets_its_length(start_server):
+    """앱이 Content-Length를 주지 않아도 단일 블록 본문은 길이와 함께 전송되어 다음 응답이 깨지지 않아야 합니다."""
+    def app(environ, start_response):
+        body = environ['wsgi.input'].read()
+        start_response('200 OK', [('Content-Type', 'application/json')])
+        return [b'{"received": %d}' % len(body)]
+
+    server = start_server(app, workers=1)
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=5)
+    conn.request('POST', '/', body=b'12345')
+    first = conn.getresponse()
+    assert first.getheader('Content-Length') == '15'
+    assert first.getheader('Transfer-Encoding') is None
+    assert first.read() == b'{"received": 5}'
+    sock = conn.sock
+
+    conn.request('GET', '/')
+    assert conn.getresponse().read() == b'{"received": 0}'
+    assert conn.sock is sock
+    conn.close()
+
+
+def test_streamed_body_uses_chunked_encoding_and_keeps_connection(start_server):
+    """길이를 모르는 본문은 chunked로 전송되고, 커넥션은 다음 요청에 재사용되어야 합니다."""
+    closed = []
+
+    class Body:
+        def __iter__(self):
+            yield b'{"items": ['
+            yield b''  # 빈 청크가 본문을 조기에 끝내면 안 됨
+            yield b'1, 2'
+            yield b']}'
+
+        def close(self):
+            closed.append(True)
+
+    def app(environ, start_response):
+        start_response('200 OK', [('Content-Type', 'application/json')])
+        return Body()
+
+    server = start_server(app, workers=1)
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=5)
+    conn.request('GET', '/')
+    first = conn.getresponse()
+    assert first.getheader('Transfer-Encoding') == 'chunked'
+    assert first.read() == b'{"items": [1, 2]}'
+    sock = conn.sock
+
+    conn.request('GET', '/')
+    assert conn.getresponse().read() == b'{"items": [1, 2]}'
+    assert conn.sock is sock
+    assert closed == [True, True]
+    conn.close()
+
+
+def test_rejects_with_503_when_queue_is_full(start_server):
+    """워커와 대기열이 모두 찬 상태에서 들어온 요청은 503으로 즉시 거절되어야 합니다."""
+    gate = threading.Event()
+    server = start_server(make_app(gate=gate), workers=1, max_pending=1)
+    port = server.server_address[1]
+
+    # 1번 요청은 워커가 처리 중, 2번 요청은 대기열에서 대기
+    blocked = [threading.Thread(target=request, args=(port,)) for _ in range(2)]
+    for t in blocked:
+        t.start()
+        time.sleep(0.2)
+
+    status, _ = request(port)
+    gate.set()
+    for t in blocked:
+        t.join()
+
+    assert status == 503
+    assert server.rejected_count == 1